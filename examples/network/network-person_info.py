@@ -16,6 +16,7 @@ from context_text.shared.context_text_base import ContextTextBase
 # context_analysis imports
 from context_analysis.models import Reliability_Ties
 from context_analysis.network.network_person_info import NetworkPersonInfo
+from context_analysis.network.network_person_summary import NetworkPersonSummary
 
 # declare variables
 my_info_instance = None
@@ -87,6 +88,9 @@ coder_type = "OpenCalais_REST_API_v2"
 #my_reliability_instance.limit_to_automated_coder_type = "OpenCalais_REST_API_v2"
 my_info_instance.automated_coder_type_include_list.append( coder_type )
 
+# accumulate ties in scipy.sparse matrices (faster for large sets of articles).
+#my_info_instance.use_sparse_backend = True
+
 #===============================================================================
 # process articles
 #===============================================================================
@@ -94,37 +98,27 @@ my_info_instance.automated_coder_type_include_list.append( coder_type )
 # process articles
 my_info_instance.process_articles( tag_list )
 
+# or, keep a snapshot of ties per article, and on later runs only re-process
+#     articles whose Article_Data changed since the snapshot was saved.
+#my_info_instance.process_articles( tag_list, snapshot_path_IN = "network_person_info-" + label + ".npz", incremental_IN = True )
+
 #output lists of counts of sources and shared source by author
 
 # declare variables - looking at data
 coder_index_to_data_dict = None
 coder_index = -1
-coder_data_dict = None
-coder_author_id_list = None
-coder_author_source_count_list = None
-coder_author_shared_count_list = None
-coder_author_article_count_list = None
-mean_source_count = -1
-mean_shared_count = -1
-mean_article_count = -1
-author_index = -1
-shared_count = -1
-temp_author_id_list = []
-temp_source_count_list = []
-temp_shared_count_list = []
-temp_article_count_list = []
+coder_summary = None
+shared_summary = None
+column_name = ""
 
 # for each index, get authors.
 coder_index_to_data_dict = my_info_instance.coder_index_to_data_map
         
 # loop over the dictionary to process each index.
-for coder_index, coder_data_dict in six.iteritems( coder_index_to_data_dict ):
+for coder_index in sorted( coder_index_to_data_dict.keys() ):
 
-    # get data for coder
-    coder_author_id_list = coder_data_dict.get( NetworkPersonInfo.PROP_CODER_AUTHOR_ID_LIST, None )
-    coder_author_source_count_list = coder_data_dict.get( NetworkPersonInfo.PROP_CODER_AUTHOR_SOURCE_COUNT_LIST, None )
-    coder_author_shared_count_list = coder_data_dict.get( NetworkPersonInfo.PROP_CODER_AUTHOR_SHARED_COUNT_LIST, None )
-    coder_author_article_count_list = coder_data_dict.get( NetworkPersonInfo.PROP_CODER_AUTHOR_ARTICLE_COUNT_LIST, None )
+    # get summary for coder - numpy arrays of author IDs and counts.
+    coder_summary = my_info_instance.get_index_summary( coder_index )
 
     # output
     print( "" )
@@ -133,75 +127,46 @@ for coder_index, coder_data_dict in six.iteritems( coder_index_to_data_dict ):
 
     print( "" )
     print( "==> All authors" )
-    print( "- author ID list = " + str( coder_author_id_list ) )    
-    print( "- author source count list = " + str( coder_author_source_count_list ) )    
-    print( "- author shared count list = " + str( coder_author_shared_count_list ) )    
-    print( "- author article count list = " + str( coder_author_article_count_list ) )    
+    print( "- author ID list = " + str( coder_summary.author_id_array.tolist() ) )    
+    print( "- author source count list = " + str( coder_summary.source_count_array.tolist() ) )    
+    print( "- author shared count list = " + str( coder_summary.shared_count_array.tolist() ) )    
+    print( "- author article count list = " + str( coder_summary.article_count_array.tolist() ) )    
 
     # and some computations
 
     # author count
-    print( "- author count = " + str( len( coder_author_id_list ) ) )
-    
-    # mean source count per author
-    mean_source_count = float( sum( coder_author_source_count_list ) ) / len( coder_author_source_count_list )
-    print( "- mean source count per author = " + str( mean_source_count ) )
-    
-    # mean shared count per author
-    mean_shared_count = float( sum( coder_author_shared_count_list ) ) / len( coder_author_shared_count_list )
-    print( "- mean shared count per author = " + str( mean_shared_count ) )
-    
-    # mean article count per author
-    mean_article_count = float( sum( coder_author_article_count_list ) ) / len( coder_author_article_count_list )
-    print( "- mean article count per author = " + str( mean_article_count ) )
+    print( "- author count = " + str( len( coder_summary ) ) )
     
-    # the same, but just for those with shared sources.
-    author_index = -1
-    temp_author_id_list = []
-    temp_source_count_list = []
-    temp_shared_count_list = []
-    temp_article_count_list = []
-
-    for shared_count in coder_author_shared_count_list:
+    # mean and median source, shared, and article count per author
+    for column_name in [ NetworkPersonSummary.COLUMN_SOURCE_COUNT, NetworkPersonSummary.COLUMN_SHARED_COUNT, NetworkPersonSummary.COLUMN_ARTICLE_COUNT ]:
     
-        # increment index
-        author_index += 1
-        
-        # greater than 0?
-        if ( shared_count > 0 ):
+        print( "- mean " + column_name + " per author = " + str( coder_summary.get_mean( column_name ) ) + "; median = " + str( coder_summary.get_median( column_name ) ) + "; 90th percentile = " + str( coder_summary.get_percentile( column_name, 90 ) ) )
         
-            # yes, add info to temp lists.
-            temp_author_id_list.append( coder_author_id_list[ author_index ] )
-            temp_source_count_list.append( coder_author_source_count_list[ author_index ] )
-            temp_shared_count_list.append( coder_author_shared_count_list[ author_index ] )
-            temp_article_count_list.append( coder_author_article_count_list[ author_index ] )
-            
-        #-- END check to see if shared count > 0 --#
+    #-- END loop over count columns --#
     
-    #-- END loop over shared_count_list --#
+    # the same, but just for those with shared sources.
+    shared_summary = coder_summary.filter_shared()
 
     print( "" )
     print( "==> Authors with shared sources" )
-    print( "- author ID list = " + str( temp_author_id_list ) )    
-    print( "- author source count list = " + str( temp_source_count_list ) )    
-    print( "- author shared count list = " + str( temp_shared_count_list ) )    
-    print( "- author article count list = " + str( temp_article_count_list ) )    
+    print( "- author ID list = " + str( shared_summary.author_id_array.tolist() ) )    
+    print( "- author source count list = " + str( shared_summary.source_count_array.tolist() ) )    
+    print( "- author shared count list = " + str( shared_summary.shared_count_array.tolist() ) )    
+    print( "- author article count list = " + str( shared_summary.article_count_array.tolist() ) )    
 
     # and some computations
 
     # author count
-    print( "- author count = " + str( len( temp_author_id_list ) ) )
+    print( "- author count = " + str( len( shared_summary ) ) )
     
-    # mean source count per author with shared sources
-    mean_source_count = float( sum( temp_source_count_list ) ) / len( temp_source_count_list )
-    print( "- mean source count per author with shared sources = " + str( mean_source_count ) )
+    # mean and median source, shared, and article count per author with shared sources
+    for column_name in [ NetworkPersonSummary.COLUMN_SOURCE_COUNT, NetworkPersonSummary.COLUMN_SHARED_COUNT, NetworkPersonSummary.COLUMN_ARTICLE_COUNT ]:
     
-    # mean shared count per author with shared sources
-    mean_shared_count = float( sum( temp_shared_count_list ) ) / len( temp_shared_count_list )
-    print( "- mean shared count per author with shared sources = " + str( mean_shared_count ) )
+        print( "- mean " + column_name + " per author with shared sources = " + str( shared_summary.get_mean( column_name ) ) + "; median = " + str( shared_summary.get_median( column_name ) ) )
+        
+    #-- END loop over count columns --#
     
-    # mean article count per author
-    mean_article_count = float( sum( temp_article_count_list ) ) / len( temp_article_count_list )
-    print( "- mean article count per author = " + str( mean_article_count ) )
+    # or, as a pandas DataFrame.
+    #print( shared_summary.to_data_frame().describe() )
     
-#-- END loop over coders. --#
\ No newline at end of file
+#-- END loop over coders. --#
@@ -78,15 +78,20 @@ class ReliabilityNamesFilterForm( FormParent ):
         ( RELIABILITY_NAMES_FILTER_TYPE_ONLY_DISAGREE, "Disagree (only rows with disagreement between coders)" ),
     )
     
+    # name of input that holds key of last row of previous page (not a form
+    #     field, so it isn't included in the filter's hidden inputs).
+    INPUT_NAME_PAGE_AFTER_KEY = "reliability_names_page_after_key"
+    
     # label
     reliability_names_label = forms.CharField( required = True, label = "Label" )
-    reliability_names_coder_count = forms.CharField( required = True, label = "Coders to compare (1 through ==>)" )
+    reliability_names_coder_count = forms.IntegerField( required = True, min_value = 1, label = "Coders to compare (1 through ==>)" )
     reliability_names_filter_type = forms.ChoiceField( required = True, choices = RELIABILITY_NAMES_FILTER_TYPE_CHOICES )
     reliability_names_id_in_list = forms.CharField( required = False, label = "[Lookup] - Reliability_Names IDs (comma-delimited)" )
     reliability_names_tag_in_list = forms.CharField( required = False, label = "[Lookup] - Reliability_Names tags (comma-delimited)" )    
     reliability_names_article_id_in_list = forms.CharField( required = False, label = "[Lookup] - Associated Article IDs (comma-delimited)" )
     reliability_names_only_first_name = forms.BooleanField( required = False, label = "[Lookup] - Person has first name, no other name parts." )
     reliability_names_include_optional_fields = forms.BooleanField( required = False, label = "[Disagree] - Include optional fields?" )
+    reliability_names_page_size = forms.IntegerField( required = False, min_value = 1, label = "Rows per page (blank = 100)" )
 
 #-- END ReliabilityNamesFilterForm --#
 
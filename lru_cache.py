@@ -0,0 +1,233 @@
+from __future__ import unicode_literals
+from __future__ import division
+
+'''
+Copyright 2017 Jonathan Morgan
+
+This file is part of http://github.com/jonathanmorgan/context_analysis.
+
+context_analysis is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+
+context_analysis is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with http://github.com/jonathanmorgan/context_analysis. If not, see http://www.gnu.org/licenses/.
+'''
+
+#==============================================================================#
+# ! imports
+#==============================================================================#
+
+# python built-in libraries
+import collections
+import threading
+
+
+#-------------------------------------------------------------------------------
+# ! class definitions
+#-------------------------------------------------------------------------------
+
+
+class LRUCache( object ):
+
+    '''
+    Small thread-safe least-recently-used cache: an OrderedDict, least
+        recently used first, guarded by a lock.  get() marks an entry most
+        recently used; set() adds or replaces an entry as most recently used,
+        then drops least recently used entries until the cache holds at most
+        max_size entries (None or 0 = unbounded).  "in" and len() do not
+        change the order.
+    '''
+
+
+    #---------------------------------------------------------------------------
+    # instance methods
+    #---------------------------------------------------------------------------
+
+
+    def __init__( self, max_size_IN = None ):
+
+        '''
+        Accepts optional maximum number of entries (None or 0 = unbounded).
+        '''
+
+        # declare instance variables
+        self.m_cache_dict = collections.OrderedDict()
+        self.m_lock = threading.Lock()
+        self.max_size = max_size_IN
+
+    #-- END method __init__() --#
+
+
+    def __contains__( self, key_IN ):
+
+        # return reference
+        is_cached_OUT = False
+
+        with self.m_lock:
+
+            is_cached_OUT = ( key_IN in self.m_cache_dict )
+
+        #-- END with self.m_lock --#
+
+        return is_cached_OUT
+
+    #-- END method __contains__() --#
+
+
+    def __len__( self ):
+
+        # return reference
+        count_OUT = -1
+
+        with self.m_lock:
+
+            count_OUT = len( self.m_cache_dict )
+
+        #-- END with self.m_lock --#
+
+        return count_OUT
+
+    #-- END method __len__() --#
+
+
+    def clear( self ):
+
+        '''
+        Removes all entries.
+        '''
+
+        with self.m_lock:
+
+            self.m_cache_dict.clear()
+
+        #-- END with self.m_lock --#
+
+    #-- END method clear() --#
+
+
+    def get( self, key_IN, default_IN = None ):
+
+        '''
+        Accepts key and optional default.  Returns cached value (and marks it
+            most recently used), or the default if not cached.
+        '''
+
+        # return reference
+        value_OUT = None
+
+        with self.m_lock:
+
+            if ( key_IN in self.m_cache_dict ):
+
+                # found - mark as most recently used.
+                self.m_cache_dict.move_to_end( key_IN )
+                value_OUT = self.m_cache_dict[ key_IN ]
+
+            else:
+
+                value_OUT = default_IN
+
+            #-- END check to see if cached --#
+
+        #-- END with self.m_lock --#
+
+        return value_OUT
+
+    #-- END method get() --#
+
+
+    def pop( self, key_IN, default_IN = None ):
+
+        '''
+        Accepts key and optional default.  Removes the key's entry and returns
+            its value, or returns the default if not cached.
+        '''
+
+        # return reference
+        value_OUT = None
+
+        with self.m_lock:
+
+            value_OUT = self.m_cache_dict.pop( key_IN, default_IN )
+
+        #-- END with self.m_lock --#
+
+        return value_OUT
+
+    #-- END method pop() --#
+
+
+    def pop_matching( self, key_test_function_IN ):
+
+        '''
+        Accepts function that accepts a key and returns True or False.
+            Removes every entry whose key it returns True for.  Returns count
+            of entries removed.
+        '''
+
+        # return reference
+        count_OUT = 0
+
+        # declare variables
+        cache_key = None
+        matching_key_list = None
+
+        with self.m_lock:
+
+            matching_key_list = [ cache_key for cache_key in self.m_cache_dict if ( key_test_function_IN( cache_key ) == True ) ]
+            for cache_key in matching_key_list:
+
+                self.m_cache_dict.pop( cache_key, None )
+
+            #-- END loop over matching keys --#
+
+        #-- END with self.m_lock --#
+
+        count_OUT = len( matching_key_list )
+
+        return count_OUT
+
+    #-- END method pop_matching() --#
+
+
+    def set( self, key_IN, value_IN, max_size_IN = None ):
+
+        '''
+        Accepts key, value, and optional maximum size that overrides
+            self.max_size.  Adds value to cache as most recently used, then
+            trims least recently used entries until cache is no larger than the
+            maximum size.
+        '''
+
+        # declare variables
+        max_size = None
+
+        # which maximum size?
+        max_size = max_size_IN
+        if ( max_size is None ):
+
+            max_size = self.max_size
+
+        #-- END check to see if max size passed in --#
+
+        with self.m_lock:
+
+            self.m_cache_dict[ key_IN ] = value_IN
+            self.m_cache_dict.move_to_end( key_IN )
+            if ( ( max_size is not None ) and ( max_size > 0 ) ):
+
+                while ( len( self.m_cache_dict ) > max_size ):
+
+                    # remove least recently used.
+                    self.m_cache_dict.popitem( last = False )
+
+                #-- END loop to trim cache --#
+
+            #-- END check to see if cache bounded --#
+
+        #-- END with self.m_lock --#
+
+    #-- END method set() --#
+
+
+#-- END class LRUCache --#
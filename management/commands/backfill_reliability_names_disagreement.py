@@ -0,0 +1,72 @@
+from __future__ import unicode_literals
+
+'''
+Copyright 2016 Jonathan Morgan
+
+This file is part of http://github.com/jonathanmorgan/context_analysis.
+
+context_analysis is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+
+context_analysis is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with http://github.com/jonathanmorgan/context_analysis. If not, see http://www.gnu.org/licenses/.
+'''
+
+'''
+Usage:
+
+# all labels
+python manage.py backfill_reliability_names_disagreement
+
+# one or more labels, only rows not computed yet.
+python manage.py backfill_reliability_names_disagreement --label prelim_month --only-uncomputed
+'''
+
+# django imports
+from django.core.management.base import BaseCommand
+
+# context_analysis imports
+from context_analysis.models import Reliability_Names
+
+
+class Command( BaseCommand ):
+
+    help = "Computes stored disagreement flags for existing Reliability_Names rows."
+
+
+    def add_arguments( self, parser ):
+
+        parser.add_argument( "--label", action = "append", dest = "label_list", default = None, help = "label to backfill (can repeat; default is all labels)." )
+        parser.add_argument( "--only-uncomputed", action = "store_true", dest = "only_uncomputed", default = False, help = "only update rows whose flags have not been computed." )
+        parser.add_argument( "--batch-size", type = int, dest = "batch_size", default = Reliability_Names.DEFAULT_DISAGREE_BATCH_SIZE, help = "rows per bulk_update()." )
+
+    #-- END method add_arguments() --#
+
+
+    def handle( self, *args, **options ):
+
+        # declare variables
+        label_list = None
+        current_label = None
+        update_count = -1
+
+        # labels - None = all.
+        label_list = options.get( "label_list", None )
+        if ( label_list is None ):
+
+            label_list = [ None ]
+
+        #-- END check to see if labels --#
+
+        for current_label in label_list:
+
+            update_count = Reliability_Names.backfill_disagreement_flags( label_IN = current_label,
+                                                                          only_uncomputed_IN = options.get( "only_uncomputed", False ),
+                                                                          batch_size_IN = options.get( "batch_size", None ) )
+            self.stdout.write( "Updated disagreement flags for " + str( update_count ) + " Reliability_Names rows ( label: " + str( current_label ) + " )." )
+
+        #-- END loop over labels --#
+
+    #-- END method handle() --#
+
+#-- END class Command --#
@@ -0,0 +1,59 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('context_analysis', '0036_auto_20201218_1723'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reliability_names',
+            name='disagree_detected_mask',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='reliability_names',
+            name='disagree_person_id_mask',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='reliability_names',
+            name='disagree_person_type_mask',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='reliability_names',
+            name='disagree_first_quote_graf_mask',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='reliability_names',
+            name='disagree_first_quote_index_mask',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='reliability_names',
+            name='disagree_organization_hash_mask',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='reliability_names',
+            name='disagree_coder_count',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='reliability_names',
+            name='disagree_optional_coder_count',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='reliability_names',
+            index=models.Index(fields=['label', 'disagree_coder_count'], name='rn_label_disagree_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reliability_names',
+            index=models.Index(fields=['label', 'disagree_optional_coder_count'], name='rn_label_disagree_opt_idx'),
+        ),
+    ]
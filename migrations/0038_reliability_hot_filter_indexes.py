@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('context_analysis', '0037_reliability_names_disagreement_flags'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reliability_names',
+            index=models.Index(fields=['label', 'article', 'person_type', 'person_last_name', 'person_first_name', 'person_name', 'person'], name='rn_label_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reliability_names',
+            index=models.Index(fields=['article', 'person_type', 'person_last_name', 'person_first_name', 'person_name', 'person'], name='rn_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reliability_names_eval',
+            index=models.Index(fields=['label', 'event_type', 'status'], name='rne_label_event_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reliability_names_eval',
+            index=models.Index(fields=['-last_modified'], name='rne_last_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reliability_names_results',
+            index=models.Index(fields=['label', 'coder1', 'coder2'], name='rnr_label_coders_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('context_analysis', '0038_reliability_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reliability_names_coder_data',
+            name='label',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='reliability_names_coder_data',
+            name='coder_index',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='reliability_names_coder_data',
+            index=models.Index(fields=['label', 'coder_index'], name='rncd_label_coder_index_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reliability_names_coder_data',
+            index=models.Index(fields=['reliability_names', 'coder_index'], name='rncd_rn_coder_index_idx'),
+        ),
+    ]
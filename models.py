@@ -22,16 +22,33 @@ along with http://github.com/jonathanmorgan/context_analysis.  If not, see
 <http://www.gnu.org/licenses/>.
 '''
 
+# python built-in libraries
+import collections
+import decimal
+import json
+import operator
+
 # imports - six
 import six
 from six.moves import range
 
+# numpy
+import numpy
+
 # taggit tagging APIs
 from taggit.managers import TaggableManager
 
 # django imports
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db import models
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import Max
+from django.db.models import Q
+import django.utils.timezone
 
 # django encoding imports (for supporting 2 and 3).
 import django.utils.encoding
@@ -42,6 +59,9 @@ from python_utilities.logging.logging_helper import LoggingHelper
 from python_utilities.status.status_container import StatusContainer
 from python_utilities.strings.string_helper import StringHelper
 
+# context_analysis imports
+from context_analysis.lru_cache import LRUCache
+
 # context imports
 from context.shared.person_details import PersonDetails
 
@@ -205,6 +225,61 @@ class Reliability_Names( models.Model ):
     DEFAULT_AGREEMENT_FIELD_SUFFIX_LIST = [ FIELD_NAME_SUFFIX_DETECTED, FIELD_NAME_SUFFIX_PERSON_ID, FIELD_NAME_SUFFIX_PERSON_TYPE, ]
     OPTIONAL_AGREEMENT_FIELD_SUFFIX_LIST = [ FIELD_NAME_SUFFIX_FIRST_QUOTE_GRAF, FIELD_NAME_SUFFIX_FIRST_QUOTE_INDEX, FIELD_NAME_SUFFIX_ORGANIZATION_HASH ]
 
+    # stored disagreement flags - one bitmask field per agreement suffix
+    #     ( "disagree_<suffix>_mask" ), bit ( index - 1 ) set if coder at index
+    #     has a non-NULL value that differs from a non-NULL value of a lower
+    #     coder (same as "!=" in lookup_disagreements()'s raw SQL, where
+    #     NULL never disagrees).  Coders 1 through N disagree if
+    #     any of the lowest N bits is set.  The "disagree_coder_count" and
+    #     "disagree_optional_coder_count" fields hold the lowest N for which
+    #     there is a disagreement ( 0 = none, None = not computed yet ).
+    FIELD_NAME_DISAGREE_PREFIX = "disagree_"
+    FIELD_NAME_DISAGREE_SUFFIX = "_mask"
+    FIELD_NAME_DISAGREE_CODER_COUNT = "disagree_coder_count"
+    FIELD_NAME_DISAGREE_OPTIONAL_CODER_COUNT = "disagree_optional_coder_count"
+    DEFAULT_DISAGREE_BATCH_SIZE = 1000
+
+    # batch size for bulk_create() and bulk_update() in the bulk_*() methods.
+    DEFAULT_BULK_BATCH_SIZE = 1000
+
+    # precomputed coder field names, so we aren't building strings in loops:
+    # - INDEX_SUFFIX_TO_FIELD_NAME_MAP - ( index, suffix ) to field name (what
+    #     build_field_name() returns).
+    # - INDEX_SUFFIX_TO_ATTNAME_MAP - same, except coder foreign keys map to
+    #     their "_id" attribute, so reading them doesn't load the User.
+    INDEX_SUFFIX_TO_FIELD_NAME_MAP = {}
+    INDEX_SUFFIX_TO_ATTNAME_MAP = {}
+    for temp_index in range( 1, MAX_INDEX + 1 ):
+    
+        for temp_suffix in ALL_FIELD_NAME_SUFFIX_LIST:
+        
+            temp_field_name = FIELD_NAME_PREFIX_CODER + str( temp_index )
+            if ( temp_suffix != "" ):
+            
+                temp_field_name += "_" + temp_suffix
+                
+            #-- END check to see if suffix --#
+            
+            INDEX_SUFFIX_TO_FIELD_NAME_MAP[ ( temp_index, temp_suffix ) ] = temp_field_name
+            if ( FIELD_NAME_SUFFIX_TO_TYPE_MAP.get( temp_suffix, None ) == FIELD_TYPE_FOREIGN_KEY ):
+            
+                INDEX_SUFFIX_TO_ATTNAME_MAP[ ( temp_index, temp_suffix ) ] = temp_field_name + "_id"
+                
+            else:
+            
+                INDEX_SUFFIX_TO_ATTNAME_MAP[ ( temp_index, temp_suffix ) ] = temp_field_name
+                
+            #-- END check to see if foreign key --#
+            
+        #-- END loop over suffixes --#
+        
+    #-- END loop over indexes --#
+    del temp_index, temp_suffix, temp_field_name
+    
+    # operator.attrgetter()s for get_coder_value_matrix(), by
+    #     ( suffix tuple, coder count ) - built the first time they are used.
+    coder_value_getter_cache = {}
+
     # property names for building disagreement output (if ues this elsewhere,
     #     make Disagreement and DisagreementDetail objects).
     PROP_NAME_INDEX = "index"
@@ -229,8 +304,29 @@ class Reliability_Names( models.Model ):
     
     # DEFAULT ORDER
     DEFAULT_ORDER_COLUMN_LIST = [ "article", "person_type", "person_last_name", "person_first_name", "person_name", "person" ]
+    DEFAULT_ORDER_ID_COLUMN_LIST = [ "article_id", "person_type", "person_last_name", "person_first_name", "person_name", "person_id" ]
     DEFAULT_ORDER_BY = " ORDER BY article_id, person_type, person_last_name, person_first_name, person_name, person_id"
     
+    # keyset paging - default order plus ID, so every row has a unique key.
+    KEYSET_COLUMN_LIST = DEFAULT_ORDER_ID_COLUMN_LIST + [ "id" ]
+    DEFAULT_PAGE_SIZE = 100
+    
+    # estimate_count() - planner estimates under this are replaced by count().
+    DEFAULT_EXACT_COUNT_LIMIT = 10000
+    
+    # generate_export_rows() - row columns, then these for each coder.
+    EXPORT_COLUMN_LIST = [ "id", "label", "article_id", "person_id", "person_name", "person_type" ]
+    EXPORT_CODER_FIELD_NAME_SUFFIX_LIST = [
+        FIELD_NAME_SUFFIX_CODER,
+        FIELD_NAME_SUFFIX_DETECTED,
+        FIELD_NAME_SUFFIX_PERSON_ID,
+        FIELD_NAME_SUFFIX_PERSON_TYPE,
+        FIELD_NAME_SUFFIX_FIRST_QUOTE_GRAF,
+        FIELD_NAME_SUFFIX_FIRST_QUOTE_INDEX,
+        FIELD_NAME_SUFFIX_ORGANIZATION_HASH,
+    ]
+    DEFAULT_EXPORT_CHUNK_SIZE = 2000
+    
     # person type values
     PERSON_TYPE_SUBJECT = PersonDetails.PERSON_TYPE_SUBJECT
     PERSON_TYPE_SOURCE = PersonDetails.PERSON_TYPE_SOURCE
@@ -364,6 +460,17 @@ class Reliability_Names( models.Model ):
     coder10_organization_hash = models.CharField( max_length = 255, blank = True, null = True )
     label = models.CharField( max_length = 255, blank = True, null = True )
     notes = models.TextField( blank = True, null = True )
+
+    # stored disagreement flags - see update_disagreement_flags().
+    disagree_detected_mask = models.IntegerField( blank = True, null = True )
+    disagree_person_id_mask = models.IntegerField( blank = True, null = True )
+    disagree_person_type_mask = models.IntegerField( blank = True, null = True )
+    disagree_first_quote_graf_mask = models.IntegerField( blank = True, null = True )
+    disagree_first_quote_index_mask = models.IntegerField( blank = True, null = True )
+    disagree_organization_hash_mask = models.IntegerField( blank = True, null = True )
+    disagree_coder_count = models.IntegerField( blank = True, null = True )
+    disagree_optional_coder_count = models.IntegerField( blank = True, null = True )
+
     create_date = models.DateTimeField( auto_now_add = True )
     last_modified = models.DateTimeField( auto_now = True )
 
@@ -379,6 +486,15 @@ class Reliability_Names( models.Model ):
     class Meta:
 
         ordering = [ "article", "person_type", "person_last_name", "person_first_name", "person_name", "person" ]
+        indexes = [
+            # filter on label (or label and article), ordered by default order.
+            models.Index( fields = [ "label", "article", "person_type", "person_last_name", "person_first_name", "person_name", "person" ], name = "rn_label_order_idx" ),
+            # default order, no label.
+            models.Index( fields = [ "article", "person_type", "person_last_name", "person_first_name", "person_name", "person" ], name = "rn_order_idx" ),
+            # lookup_disagreements() using stored flags.
+            models.Index( fields = [ "label", "disagree_coder_count" ], name = "rn_label_disagree_idx" ),
+            models.Index( fields = [ "label", "disagree_optional_coder_count" ], name = "rn_label_disagree_opt_idx" ),
+        ]
         
     #-- END nested Meta class --#
 
@@ -389,39 +505,566 @@ class Reliability_Names( models.Model ):
 
 
     @classmethod
-    def build_field_name( cls, index_IN, suffix_IN, *args, **kwargs ):
+    def backfill_disagreement_flags( cls, label_IN = None, only_uncomputed_IN = False, batch_size_IN = None ):
         
         '''
-        Accepts index and suffix, uses them to construct field name.
+        Accepts optional label (if None, all labels), flag for whether to only
+            update rows whose flags have not been computed yet, and batch
+            size.  Computes the stored disagreement flags for each matching row
+            and writes them with bulk_update(), a batch at a time.  Returns
+            count of rows updated.
         '''
         
         # return reference
-        value_OUT = ""
+        count_OUT = 0
         
-        # construct field name
-        value_OUT = cls.FIELD_NAME_PREFIX_CODER + str( index_IN )
+        # declare variables
+        batch_size = -1
+        row_qs = None
+        field_name_list = None
+        current_row = None
+        update_list = []
+        
+        # batch size
+        batch_size = batch_size_IN
+        if ( ( batch_size is None ) or ( batch_size <= 0 ) ):
+        
+            batch_size = cls.DEFAULT_DISAGREE_BATCH_SIZE
+            
+        #-- END check to see if batch size --#
+        
+        # rows to update
+        row_qs = cls.objects.all()
+        if ( label_IN is not None ):
+        
+            row_qs = row_qs.filter( label = label_IN )
+            
+        #-- END check to see if label --#
         
-        # is there a suffix?
-        if ( ( suffix_IN is not None ) and ( suffix_IN != "" ) ):
+        if ( only_uncomputed_IN == True ):
         
-            # yes.  does it begin with an underscore?
-            if ( suffix_IN.startswith( "_" ) == False ):
+            row_qs = row_qs.filter( **{ cls.FIELD_NAME_DISAGREE_OPTIONAL_CODER_COUNT + "__isnull" : True } )
             
-                # no.  Add one.
-                value_OUT += "_"
+        #-- END check to see if only uncomputed --#
+        
+        # order by primary key, not the default ordering (avoids joins).
+        row_qs = row_qs.order_by( "pk" )
+        
+        # loop, updating a batch at a time.
+        field_name_list = cls.get_disagree_field_name_list()
+        update_list = []
+        for current_row in row_qs.iterator( chunk_size = batch_size ):
+        
+            current_row.update_disagreement_flags()
+            update_list.append( current_row )
+            
+            if ( len( update_list ) >= batch_size ):
+            
+                cls.objects.bulk_update( update_list, field_name_list )
+                count_OUT += len( update_list )
+                update_list = []
                 
-            #-- END check to see if underscore --#
+            #-- END check to see if batch full --#
+        
+        #-- END loop over rows --#
+        
+        # anything left?
+        if ( len( update_list ) > 0 ):
+        
+            cls.objects.bulk_update( update_list, field_name_list )
+            count_OUT += len( update_list )
             
-            # add the suffix.
-            value_OUT += suffix_IN
+        #-- END check to see if anything left --#
         
-        #-- END check to see if suffix --#
+        return count_OUT
+        
+    #-- END class method backfill_disagreement_flags() --#
+
+
+    @classmethod
+    def build_field_name( cls, index_IN, suffix_IN, *args, **kwargs ):
+        
+        '''
+        Accepts index and suffix, uses them to construct field name.  Looks in
+            INDEX_SUFFIX_TO_FIELD_NAME_MAP first, only builds the name if it
+            isn't there.
+        '''
+        
+        # return reference
+        value_OUT = ""
+        
+        # precomputed?
+        value_OUT = cls.INDEX_SUFFIX_TO_FIELD_NAME_MAP.get( ( index_IN, suffix_IN ), None )
+        if ( value_OUT is None ):
+        
+            # construct field name
+            value_OUT = cls.FIELD_NAME_PREFIX_CODER + str( index_IN )
+            
+            # is there a suffix?
+            if ( ( suffix_IN is not None ) and ( suffix_IN != "" ) ):
+            
+                # yes.  does it begin with an underscore?
+                if ( suffix_IN.startswith( "_" ) == False ):
+                
+                    # no.  Add one.
+                    value_OUT += "_"
+                    
+                #-- END check to see if underscore --#
+                
+                # add the suffix.
+                value_OUT += suffix_IN
+            
+            #-- END check to see if suffix --#
+            
+        #-- END check to see if precomputed --#
         
         return value_OUT
         
     #-- END class method build_field_name() --#
+
+
+    @classmethod
+    def build_disagree_field_name( cls, suffix_IN ):
+        
+        '''
+        Accepts agreement field suffix, returns name of the field that holds
+            the stored disagreement bitmask for that suffix.
+        '''
+        
+        # return reference
+        value_OUT = ""
+        
+        value_OUT = cls.FIELD_NAME_DISAGREE_PREFIX + suffix_IN + cls.FIELD_NAME_DISAGREE_SUFFIX
+        
+        return value_OUT
+        
+    #-- END class method build_disagree_field_name() --#
+
+
+    @classmethod
+    def get_disagree_field_name_list( cls ):
+        
+        '''
+        Returns list of the names of all the stored disagreement flag fields
+            (the bitmasks plus the coder count fields), for use in
+            bulk_update() or update_fields.
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        # declare variables
+        field_name_suffix = ""
+        
+        for field_name_suffix in ( cls.DEFAULT_AGREEMENT_FIELD_SUFFIX_LIST + cls.OPTIONAL_AGREEMENT_FIELD_SUFFIX_LIST ):
+        
+            list_OUT.append( cls.build_disagree_field_name( field_name_suffix ) )
+            
+        #-- END loop over agreement suffixes --#
+        
+        list_OUT.append( cls.FIELD_NAME_DISAGREE_CODER_COUNT )
+        list_OUT.append( cls.FIELD_NAME_DISAGREE_OPTIONAL_CODER_COUNT )
+        
+        return list_OUT
+        
+    #-- END class method get_disagree_field_name_list() --#
         
     
+    @classmethod
+    def bulk_delete_records( cls, id_list_IN, label_IN = None ):
+        
+        '''
+        Accepts list of Reliability_Names IDs and optional label for the audit
+            rows.  In one transaction:
+            - loads the rows and the Article_Data, Article_Author, and
+                Article_Subject they refer to in a few queries.
+            - creates an EVENT_TYPE_DELETE Reliability_Names_Eval row for each
+                with Reliability_Names_Eval.create_from_reliability_names_list()
+                (is_deleted = True, not linked to the row being deleted).
+            - builds the detail string for each audit row (has to happen
+                before the delete).
+            - deletes all the rows with one QuerySet.delete().
+            Returns StatusContainer with the detail strings as messages.
+        '''
+        
+        # return reference
+        status_OUT = StatusContainer()
+        
+        # declare variables
+        me = "bulk_delete_records"
+        reliability_names_list = None
+        related_map = None
+        field_value_list = None
+        eval_list = None
+        reliability_names_instance = None
+        eval_instance = None
+        detail_string = ""
+        delete_count = -1
+        delete_count_map = None
+        
+        with transaction.atomic():
+        
+            # load rows, then related rows.
+            reliability_names_list = cls.load_instance_list( id_list_IN )
+            related_map = Reliability_Names_Eval.load_related_for_reliability_names_list( reliability_names_list )
+            
+            # audit rows
+            field_value_list = [ { "notes" : "Deleting Reliability_Names row with ID " + str( reliability_names_instance.id ) } for reliability_names_instance in reliability_names_list ]
+            eval_list = Reliability_Names_Eval.create_from_reliability_names_list(
+                    reliability_names_list,
+                    label_IN = label_IN,
+                    event_type_IN = Reliability_Names_Eval.EVENT_TYPE_DELETE,
+                    is_deleted_IN = True,
+                    field_value_list_IN = field_value_list,
+                    related_map_IN = related_map
+                )
+            
+            # detail strings, while the rows still exist.
+            for reliability_names_instance, eval_instance in zip( reliability_names_list, eval_list ):
+            
+                detail_string = Reliability_Names_Eval.build_detail_string_from_rn_id(
+                        reliability_names_instance.id,
+                        rne_instance_IN = eval_instance,
+                        reliability_names_instance_IN = reliability_names_instance,
+                        related_map_IN = related_map
+                    )
+                status_OUT.add_message( detail_string )
+                
+            #-- END loop over rows --#
+            
+            # delete them all.
+            delete_count, delete_count_map = cls.objects.filter( pk__in = [ reliability_names_instance.id for reliability_names_instance in reliability_names_list ] ).delete()
+            
+        #-- END with transaction.atomic() --#
+        
+        status_OUT.set_status_code( StatusContainer.STATUS_CODE_SUCCESS )
+        
+        return status_OUT
+        
+    #-- END classmethod bulk_delete_records() --#
+
+
+    @classmethod
+    def bulk_merge_records( cls,
+                            merge_id_pair_list_IN,
+                            delete_from_record_IN = False,
+                            label_IN = None,
+                            do_create_eval_IN = True ):
+        
+        '''
+        Accepts list of ( merge from ID, merge into ID ) tuples of
+            Reliability_Names IDs, and the same delete flag as merge_records().
+            In one transaction:
+            - loads all the rows with one query.
+            - merges each pair with merge_instances() (pairs that have data in
+                the same index in both records are left alone, and the status
+                is set to error).  Pairs with an ID that has no row are skipped
+                (no audit row) - a message names the missing ID(s), and the
+                status is set to error.
+            - writes the updated INTO rows with one bulk_update(), then
+                rebuilds their Reliability_Names_Coder_Data.
+            - if do_create_eval_IN, creates an EVENT_TYPE_MERGE
+                Reliability_Names_Eval row for each pair's INTO with
+                Reliability_Names_Eval.create_from_reliability_names_list(), and
+                links the FROM and INTO Article_Data with bulk_create().
+            - if delete_from_record_IN, deletes the merged FROM rows with one
+                QuerySet.delete().
+            Returns StatusContainer with a message per pair, the
+            merge_instances() messages, and, if audit rows were created, the
+            summary string for each.
+        '''
+        
+        # return reference
+        status_OUT = StatusContainer()
+        
+        # declare variables
+        me = "bulk_merge_records"
+        id_list = None
+        instance_map = None
+        related_map = None
+        error_count = -1
+        merge_from_id = -1
+        merge_into_id = -1
+        merge_from_instance = None
+        merge_into_instance = None
+        merge_status = None
+        merge_status_code = None
+        pair_message_list = None
+        message = ""
+        updated_into_list = []
+        updated_into_id_set = set()
+        delete_from_id_list = []
+        eval_into_list = []
+        eval_field_value_list = []
+        eval_from_ad_id_list = []
+        eval_to_ad_id_list = []
+        eval_list = None
+        eval_instance = None
+        from_ad_link_list = []
+        to_ad_link_list = []
+        update_field_name_list = None
+        current_field = None
+        now_datetime = None
+        article_data_id_list = None
+        article_data_id = None
+        missing_id_list = None
+        current_id = -1
+        
+        with transaction.atomic():
+        
+            # load all the rows (with person, for merge notes).
+            id_list = [ merge_from_id for merge_from_id, merge_into_id in merge_id_pair_list_IN ]
+            id_list.extend( [ merge_into_id for merge_from_id, merge_into_id in merge_id_pair_list_IN ] )
+            instance_map = cls.objects.select_related( "person" ).in_bulk( list( set( id_list ) ) )
+            
+            # related rows for audit, before merge (covers both records).
+            if ( do_create_eval_IN == True ):
+            
+                related_map = Reliability_Names_Eval.load_related_for_reliability_names_list( list( six.itervalues( instance_map ) ) )
+            
+            #-- END check to see if audit rows --#
+            
+            # merge each pair.
+            error_count = 0
+            for merge_from_id, merge_into_id in merge_id_pair_list_IN:
+            
+                # both rows there?
+                missing_id_list = [ current_id for current_id in ( merge_from_id, merge_into_id ) if ( current_id not in instance_map ) ]
+                if ( len( missing_id_list ) > 0 ):
+                
+                    # no - skip pair.
+                    message = "Status = \"" + str( StatusContainer.STATUS_CODE_ERROR ) + "\": can't merge Reliability_Names record " + str( merge_from_id ) + " into Reliability_Names record " + str( merge_into_id ) + " - no record(s) with ID(s) " + str( missing_id_list )
+                    status_OUT.add_message( message )
+                    error_count += 1
+                    
+                else:
+                
+                    merge_from_instance = instance_map[ merge_from_id ]
+                    merge_into_instance = instance_map[ merge_into_id ]
+                    
+                    # Article_Data IDs before the merge, for the audit row.
+                    if ( do_create_eval_IN == True ):
+                    
+                        eval_from_ad_id_list.append( list( six.itervalues( merge_from_instance.get_field_values( cls.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID, default_IN = None, omit_empty_IN = True, empty_values_IN = ( None, ) ) ) ) )
+                        eval_to_ad_id_list.append( list( six.itervalues( merge_into_instance.get_field_values( cls.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID, default_IN = None, omit_empty_IN = True, empty_values_IN = ( None, ) ) ) ) )
+                        
+                    #-- END check to see if audit rows --#
+                    
+                    # merge.
+                    merge_status = cls.merge_instances( merge_from_instance, merge_into_instance )
+                    merge_status_code = merge_status.get_status_code()
+                    pair_message_list = [ "Status = \"" + str( merge_status_code ) + "\": merging person data from Reliability_Names record " + str( merge_from_id ) + " into Reliability_Names record " + str( merge_into_id ) ]
+                    pair_message_list.extend( merge_status.get_message_list() )
+                    for message in pair_message_list:
+                    
+                        status_OUT.add_message( message )
+                        
+                    #-- END loop over pair messages --#
+                    
+                    if ( merge_status_code == StatusContainer.STATUS_CODE_SUCCESS ):
+                    
+                        # keep track of INTO to write, FROM to delete.
+                        if ( merge_into_id not in updated_into_id_set ):
+                        
+                            updated_into_id_set.add( merge_into_id )
+                            updated_into_list.append( merge_into_instance )
+                            
+                        #-- END check to see if INTO already in list --#
+                        
+                        if ( delete_from_record_IN == True ):
+                        
+                            delete_from_id_list.append( merge_from_id )
+                            
+                        #-- END check to see if we delete. --#
+                        
+                    else:
+                    
+                        error_count += 1
+                    
+                    #-- END check to see if merge succeeded --#
+                    
+                    # audit row info.
+                    eval_into_list.append( merge_into_instance )
+                    eval_field_value_list.append( { "notes" : "; ".join( pair_message_list ), "merged_from_reliability_names_id" : merge_from_id, "merged_to_reliability_names_id" : merge_into_id } )
+                    
+                #-- END check to see if both rows exist --#
+                
+            #-- END loop over pairs --#
+            
+            # write the INTOs (bulk_update() doesn't touch auto_now fields, and
+            #     disagreement flags were updated by copy_index_values()).
+            if ( len( updated_into_list ) > 0 ):
+            
+                now_datetime = django.utils.timezone.now()
+                for merge_into_instance in updated_into_list:
+                
+                    merge_into_instance.last_modified = now_datetime
+                    
+                #-- END loop over updated INTOs --#
+                
+                update_field_name_list = [ current_field.name for current_field in cls._meta.concrete_fields if ( current_field.primary_key == False ) ]
+                cls.objects.bulk_update( updated_into_list, update_field_name_list, batch_size = cls.DEFAULT_BULK_BATCH_SIZE )
+                Reliability_Names_Coder_Data.create_for_reliability_names_list( updated_into_list )
+                
+            #-- END check to see if any updated --#
+            
+            # audit rows.
+            if ( ( do_create_eval_IN == True ) and ( len( eval_into_list ) > 0 ) ):
+            
+                eval_list = Reliability_Names_Eval.create_from_reliability_names_list(
+                        eval_into_list,
+                        label_IN = label_IN,
+                        event_type_IN = Reliability_Names_Eval.EVENT_TYPE_MERGE,
+                        field_value_list_IN = eval_field_value_list,
+                        related_map_IN = related_map
+                    )
+                    
+                # merged from and to Article_Data
+                for eval_instance, article_data_id_list in zip( eval_list, eval_from_ad_id_list ):
+                
+                    from_ad_link_list.extend( [ ( eval_instance.id, article_data_id ) for article_data_id in article_data_id_list if ( article_data_id in related_map[ Reliability_Names_Eval.RELATED_MAP_KEY_ARTICLE_DATA ] ) ] )
+                    
+                #-- END loop over FROM Article_Data --#
+                
+                for eval_instance, article_data_id_list in zip( eval_list, eval_to_ad_id_list ):
+                
+                    to_ad_link_list.extend( [ ( eval_instance.id, article_data_id ) for article_data_id in article_data_id_list if ( article_data_id in related_map[ Reliability_Names_Eval.RELATED_MAP_KEY_ARTICLE_DATA ] ) ] )
+                    
+                #-- END loop over INTO Article_Data --#
+                
+                Reliability_Names_Eval.bulk_create_m2m_links( "merged_from_ad", from_ad_link_list )
+                Reliability_Names_Eval.bulk_create_m2m_links( "merged_to_ad", to_ad_link_list )
+                
+                # summary strings, from the rows and related rows already
+                #     loaded.
+                for eval_instance, merge_into_instance in zip( eval_list, eval_into_list ):
+                
+                    status_OUT.add_message( Reliability_Names_Eval.render_summary_string( merge_into_instance, related_map, rne_instance_IN = eval_instance ) )
+                    
+                #-- END loop over audit rows --#
+                
+            #-- END check to see if audit rows --#
+            
+            # delete FROMs?
+            if ( len( delete_from_id_list ) > 0 ):
+            
+                cls.objects.filter( pk__in = delete_from_id_list ).delete()
+                
+            #-- END check to see if any to delete --#
+            
+        #-- END with transaction.atomic() --#
+        
+        # status
+        if ( error_count == 0 ):
+        
+            status_OUT.set_status_code( StatusContainer.STATUS_CODE_SUCCESS )
+            
+        else:
+        
+            status_OUT.set_status_code( StatusContainer.STATUS_CODE_ERROR )
+            
+        #-- END check to see if errors --#
+        
+        return status_OUT
+        
+    #-- END classmethod bulk_merge_records() --#
+
+
+    @classmethod
+    def bulk_update_tags( cls, id_list_IN, tag_list_IN, do_remove_IN = False, label_IN = None ):
+        
+        '''
+        Accepts list of Reliability_Names IDs, list of tag names, flag for
+            whether to remove (True) or add (False, the default), and optional
+            label for the audit rows.  In one transaction:
+            - adds the tags each row doesn't have yet with one bulk_create()
+                into taggit's through table, or removes the tags from all the
+                rows with one QuerySet.delete().
+            - creates an EVENT_TYPE_ADD_TAGS or EVENT_TYPE_REMOVE_TAGS
+                Reliability_Names_Eval row for each with
+                Reliability_Names_Eval.create_from_reliability_names_list().
+            Returns list of Reliability_Names_Eval instances, in ID list order.
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        # declare variables
+        me = "bulk_update_tags"
+        reliability_names_list = None
+        reliability_names_id_list = None
+        tag_through_model = None
+        tag_model = None
+        content_type = None
+        tag_instance_list = None
+        tag_name = ""
+        existing_link_set = None
+        link_list = None
+        reliability_names_id = -1
+        tag_instance = None
+        event_type = None
+        notes = ""
+        
+        # taggit models
+        tag_through_model = cls._meta.get_field( "tags" ).through
+        tag_model = tag_through_model._meta.get_field( "tag" ).remote_field.model
+        
+        with transaction.atomic():
+        
+            # load rows.
+            reliability_names_list = cls.load_instance_list( id_list_IN )
+            reliability_names_id_list = [ reliability_names_instance.id for reliability_names_instance in reliability_names_list ]
+            content_type = ContentType.objects.get_for_model( cls )
+            
+            if ( do_remove_IN == True ):
+            
+                # remove from all rows at once.
+                tag_through_model.objects.filter( content_type = content_type, object_id__in = reliability_names_id_list, tag__name__in = tag_list_IN ).delete()
+                event_type = Reliability_Names_Eval.EVENT_TYPE_REMOVE_TAGS
+                notes = "Removed tag(s): " + ", ".join( tag_list_IN )
+                
+            else:
+            
+                # get or create tags, then link the ones not already linked.
+                tag_instance_list = [ tag_model.objects.get_or_create( name = tag_name )[ 0 ] for tag_name in tag_list_IN ]
+                existing_link_set = set( tag_through_model.objects.filter( content_type = content_type, object_id__in = reliability_names_id_list, tag__in = tag_instance_list ).values_list( "object_id", "tag_id" ) )
+                link_list = []
+                for reliability_names_id in reliability_names_id_list:
+                
+                    for tag_instance in tag_instance_list:
+                    
+                        if ( ( reliability_names_id, tag_instance.id ) not in existing_link_set ):
+                        
+                            link_list.append( tag_through_model( content_type = content_type, object_id = reliability_names_id, tag = tag_instance ) )
+                            existing_link_set.add( ( reliability_names_id, tag_instance.id ) )
+                            
+                        #-- END check to see if already linked --#
+                        
+                    #-- END loop over tags --#
+                    
+                #-- END loop over IDs --#
+                
+                tag_through_model.objects.bulk_create( link_list, batch_size = cls.DEFAULT_BULK_BATCH_SIZE )
+                event_type = Reliability_Names_Eval.EVENT_TYPE_ADD_TAGS
+                notes = "Added tag(s): " + ", ".join( tag_list_IN )
+                
+            #-- END check to see if add or remove --#
+            
+            # audit rows
+            list_OUT = Reliability_Names_Eval.create_from_reliability_names_list(
+                    reliability_names_list,
+                    label_IN = label_IN,
+                    notes_IN = notes,
+                    event_type_IN = event_type
+                )
+                
+        #-- END with transaction.atomic() --#
+        
+        return list_OUT
+        
+    #-- END classmethod bulk_update_tags() --#
+
+
     @classmethod
     def delete_reliabilty_names_for_article( cls, article_id_IN, label_IN = None, do_delete_IN = True ):
         
@@ -515,8 +1158,14 @@ class Reliability_Names( models.Model ):
                 # updated?
                 if ( is_updated == True ):
                 
-                    # updated.  Save.
-                    current_record.save()
+                    # updated.  Save, and keep label on long-format coder
+                    #     data in sync.
+                    with transaction.atomic():
+                    
+                        current_record.save()
+                        Reliability_Names_Coder_Data.objects.filter( reliability_names = current_record ).update( label = current_record.label )
+                        
+                    #-- END with transaction.atomic() --#
                     current_record_string = "- updated: " + current_record_string
                     
                 else:
@@ -538,540 +1187,425 @@ class Reliability_Names( models.Model ):
 
 
     @classmethod
-    def lookup_disagreements( cls,
-                              label_IN = "",
-                              coder_count_IN = -1,
-                              include_optional_IN = False,
-                              order_by_IN = None,
-                              *args,
-                              **kwargs ):
+    def estimate_count( cls, qs_IN, exact_count_limit_IN = None ):
+        
+        '''
+        Accepts QuerySet of Reliability_Names and optional limit below which to
+            return an exact count (defaults to DEFAULT_EXACT_COUNT_LIMIT).  On
+            PostgreSQL, reads the planner's row estimate from EXPLAIN, and only
+            runs count() if the estimate is under the limit (or could not be
+            read).  Elsewhere, runs count().  Returns tuple of count and flag
+            that is True if the count is an estimate.
+        '''
         
         # return reference
-        qs_OUT = None
+        count_OUT = -1
+        is_estimate_OUT = False
         
         # declare variables
-        my_label = ""
-        my_coder_count = -1
-        current_outer_index = -1
-        current_inner_index = -1
-
-        # declare variables - building up SQL statement.
-        sql_string = ""
-        sql_temp_string = ""
-        sql_detected_list = []
-        sql_person_id_list = []
-        sql_person_type_list = []
-        sql_quote_graf_list = []
-        sql_quote_index_list = []
-        sql_org_hash_list = []
-        sql_raw_params_list = []
+        exact_count_limit = -1
+        plan_json = None
         
-        # do we have a label?
-        if ( ( label_IN is not None ) and ( label_IN != "" ) ):
-
-            # yes - use it.
-            my_label = label_IN
-        
-        #-- END check to see if label --#
-        
-        # got coder_count_IN?
-        if ( ( coder_count_IN is not None ) and ( coder_count_IN != "" ) and ( int( coder_count_IN ) > 2 ) ):
+        # limit
+        exact_count_limit = cls.DEFAULT_EXACT_COUNT_LIMIT if ( exact_count_limit_IN is None ) else exact_count_limit_IN
         
-            # yes, and is at least 2.  Use it.
-            my_coder_count = int( coder_count_IN )
+        if ( connection.vendor == "postgresql" ):
         
+            # planner estimate
+            plan_json = qs_IN.explain( format = "json" )
+            count_OUT = cls.get_plan_row_estimate( plan_json )
+            is_estimate_OUT = True
+            
+            # no estimate, or small enough to count?
+            if ( ( count_OUT is None ) or ( count_OUT < exact_count_limit ) ):
+            
+                count_OUT = qs_IN.count()
+                is_estimate_OUT = False
+                
+            #-- END check to see if estimate under limit --#
+            
         else:
         
-            # no, or not at least 2.  Default to 2.
-            my_coder_count = 2
+            # no cheap estimate - count.
+            count_OUT = qs_IN.count()
+            is_estimate_OUT = False
             
-        #-- END check to see if coder count passed in. --#
+        #-- END check to see if PostgreSQL --#
         
-        # loop over coders we've been asked to compare
-        sql_detected_list = []
-        sql_person_id_list = []
-        sql_person_type_list = []
-        sql_quote_graf_list = []
-        sql_quote_index_list = []
-        sql_org_hash_list = []
-        for current_outer_index in range( 1, my_coder_count + 1 ):
+        return count_OUT, is_estimate_OUT
         
-            # loop over indices past the current one, adding SQL fragments to
-            #     our SQL lists for comparison of current to subsequent.
-            for current_inner_index in range( current_outer_index + 1, my_coder_count + 1 ):
+    #-- END classmethod estimate_count() --#
 
-                # add inequality comparison for detected.
-                column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_DETECTED
-                sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
-                sql_detected_list.append( sql_temp_string )
-                
-                # add inequality comparison for lookup.
-                column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_PERSON_ID
-                sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
-                sql_person_id_list.append( sql_temp_string )
-                
-                # add inequality comparison for type.
-                column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_PERSON_TYPE
-                sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
-                sql_person_type_list.append( sql_temp_string )
-                
-                # include optional?
-                if ( include_optional_IN == True ):
-                
-                    # add inequality comparison for first_quote_graf
-                    column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_FIRST_QUOTE_GRAF
-                    sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
-                    sql_quote_graf_list.append( sql_temp_string )
-                
-                    # add inequality comparison for first_quote_index
-                    column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_FIRST_QUOTE_INDEX
-                    sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
-                    sql_quote_index_list.append( sql_temp_string )
-                
-                    # add inequality comparison for organization_hash
-                    column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_ORGANIZATION_HASH
-                    sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
-                    sql_org_hash_list.append( sql_temp_string )
-                                
-                #-- END check to see if include optional --#
 
-            #-- END loop over rest of indices past current --#
+    @classmethod
+    def get_plan_row_estimate( cls, plan_json_IN ):
         
-        #-- END loop over coders to compare --#
+        '''
+        Accepts output of QuerySet.explain( format = "json" ) on PostgreSQL.
+            Returns the top plan node's "Plan Rows" estimate as an int, or None
+            if it can't be read.  Handles both the single plan object Django
+            4.2+ returns and the one-item list of plans PostgreSQL itself
+            returns.
+        '''
+        
+        # return reference
+        count_OUT = None
         
-        # build SQL string
-        sql_string = "SELECT * FROM context_analysis_reliability_names WHERE "
+        # declare variables
+        plan_data = None
         
-        # got a label?
-        if ( ( my_label is not None ) and ( my_label != "" ) ):
-
-            # yes.  Add to WHERE clause.
-            sql_string += " label = %s AND ( "
+        try:
+        
+            plan_data = json.loads( plan_json_IN )
+            if ( isinstance( plan_data, list ) == True ):
             
-            # and add value to params list.
-            sql_raw_params_list.append( my_label )
-
-        #-- END check to see if label set --#
+                plan_data = plan_data[ 0 ]
+                
+            #-- END check to see if list of plans --#
+            
+            count_OUT = int( plan_data[ "Plan" ][ "Plan Rows" ] )
+            
+        except ( ValueError, TypeError, KeyError, IndexError ):
+        
+            # not a plan we understand - caller will count().
+            count_OUT = None
+            
+        #-- END try-except around parsing plan --#
         
-        # append detected comparisons
-        sql_temp_string = " OR ".join( sql_detected_list )
-        sql_string += " ( " + sql_temp_string + " )"
+        return count_OUT
         
-        # append person id comparisons
-        sql_temp_string = " OR ".join( sql_person_id_list )
-        sql_string += " OR ( " + sql_temp_string + " )"
+    #-- END classmethod get_plan_row_estimate() --#
+
 
-        # append person type comparisons
-        sql_temp_string = " OR ".join( sql_person_type_list )
-        sql_string += " OR ( " + sql_temp_string + " )"
+    @classmethod
+    def generate_export_rows( cls, qs_IN, coder_count_IN = None, chunk_size_IN = None ):
         
-        # got first_quote_graf?
-        if ( ( sql_quote_graf_list is not None ) and ( len( sql_quote_graf_list ) > 0 ) ):
+        '''
+        Accepts QuerySet (or RawQuerySet, from lookup_disagreements()) of
+            Reliability_Names, optional count of coders to include (defaults to
+            MAX_INDEX), and optional chunk size for iterator() (defaults to
+            DEFAULT_EXPORT_CHUNK_SIZE).  Generator - yields a header list, then
+            a list of values per row (EXPORT_COLUMN_LIST, then
+            EXPORT_CODER_FIELD_NAME_SUFFIX_LIST for each coder), reading rows a
+            chunk at a time so the full list is never in memory.
+        '''
         
-            # append person type comparisons
-            sql_temp_string = " OR ".join( sql_person_type_list )
-            sql_string += " OR ( " + sql_temp_string + " )"
-            
-        #-- END check to see if first_quote_graf list --#
-            
-        # got first_quote_index?
-        if ( ( sql_quote_index_list is not None ) and ( len( sql_quote_index_list ) > 0 ) ):
+        # declare variables
+        coder_count = -1
+        chunk_size = -1
+        header_list = None
+        current_index = -1
+        field_name_suffix = ""
+        row_iterator = None
+        reliability_names_instance = None
+        row_list = None
+        coder_value_list = None
         
-            # append person type comparisons
-            sql_temp_string = " OR ".join( sql_quote_index_list )
-            sql_string += " OR ( " + sql_temp_string + " )"
-            
-        #-- END check to see if first_quote_graf list --#
-            
-        # got organization_hash?
-        if ( ( sql_org_hash_list is not None ) and ( len( sql_org_hash_list ) > 0 ) ):
+        # defaults
+        coder_count = cls.MAX_INDEX if ( coder_count_IN is None ) else int( coder_count_IN )
+        chunk_size = cls.DEFAULT_EXPORT_CHUNK_SIZE if ( chunk_size_IN is None ) else chunk_size_IN
         
-            # append person type comparisons
-            sql_temp_string = " OR ".join( sql_org_hash_list )
-            sql_string += " OR ( " + sql_temp_string + " )"
+        # header
+        header_list = list( cls.EXPORT_COLUMN_LIST )
+        for current_index in range( 1, coder_count + 1 ):
+        
+            for field_name_suffix in cls.EXPORT_CODER_FIELD_NAME_SUFFIX_LIST:
             
-        #-- END check to see if first_quote_graf list --#
+                header_list.append( cls.INDEX_SUFFIX_TO_ATTNAME_MAP[ ( current_index, field_name_suffix ) ] )
+                
+            #-- END loop over suffixes --#
             
-        # got a label?
-        if ( ( my_label is not None ) and ( my_label != "" ) ):
-
-            # yes.  Close parentheses.
-            sql_string += " )"
-
-        #-- END check to see if label set --#
+        #-- END loop over coders --#
         
-        # ORDER BY
-        if ( ( order_by_IN is not None ) and ( order_by_IN != "" ) ):
+        yield header_list
         
-            # custom order by passed in - use it.
-            sql_string += " " + order_by_IN
+        # rows (RawQuerySet.iterator() doesn't take a chunk size).
+        if ( isinstance( qs_IN, models.QuerySet ) == True ):
         
+            row_iterator = qs_IN.iterator( chunk_size = chunk_size )
+            
         else:
-
-            # no custom order by passed in.  go with default.
-            sql_string += cls.DEFAULT_ORDER_BY
+        
+            row_iterator = qs_IN.iterator()
             
-        #-- END check to see if custom ORDER BY passed in. --#
+        #-- END check to see if QuerySet --#
         
-        # execute raw query
-        qs_OUT = cls.objects.raw( sql_string, sql_raw_params_list )
-
-        return qs_OUT        
-    
-    #-- END class method lookup_disagreements() --#
+        for reliability_names_instance in row_iterator:
+        
+            row_list = [ getattr( reliability_names_instance, column_name ) for column_name in cls.EXPORT_COLUMN_LIST ]
+            for coder_value_list in reliability_names_instance.get_coder_value_matrix( cls.EXPORT_CODER_FIELD_NAME_SUFFIX_LIST, coder_count_IN = coder_count ):
+            
+                row_list.extend( coder_value_list )
+                
+            #-- END loop over coders --#
+            
+            yield row_list
+            
+        #-- END loop over rows --#
+        
+    #-- END classmethod generate_export_rows() --#
 
 
     @classmethod
-    def merge_records( cls,
-                       merge_from_id_IN,
-                       merge_into_id_IN,
-                       delete_from_record_IN = False,
-                       *args,
-                       **kwargs ):
+    def get_keyset_filter( cls, after_key_IN ):
         
         '''
-        Accepts IDs of two Reliability_Names rows.  Loads each into an instance.
-            Then, loops over the indices.  For each index, checks to see if that
-            index is empty in the FROM record.  If yes, moves on.  If no, checks
-            to see if the index is empty in the TO record.  If yes, adds index
-            to list of indexes to copy values FROM INTO.  If ever an index has
-            data in both FROM and TO, does not change anything, returns an error
-            message.
+        Accepts list of KEYSET_COLUMN_LIST values from the last row of the
+            previous page (see get_keyset_key()).  Returns Q that matches rows
+            that come after it when ordered by KEYSET_COLUMN_LIST ascending,
+            nulls last (row-value comparison spelled out column by column,
+            since columns other than ID can be NULL).
         '''
         
         # return reference
-        status_OUT = StatusContainer()
-
-        # declare variables
-        me = "merge_records"
-        debug_message = ""
-        status_message = ""
-        merge_from_instance = None
-        merge_into_instance = None
-        merge_index_list = []
-        error_index_list = []
-        is_from_index_empty = False
-        is_into_index_empty = False
-        error_count = -1
-        current_index = -1
-        
-        # load instances.
-        merge_from_instance = Reliability_Names.objects.get( pk = merge_from_id_IN )
-        merge_into_instance = Reliability_Names.objects.get( pk = merge_into_id_IN )
+        q_OUT = None
         
-        # loop over indexes
-        merge_index_list = []
-        error_index_list = []
-        for current_index in range( 1, cls.MAX_INDEX + 1 ):
+        # declare variables
+        equal_q = None
+        column_index = -1
+        column_name = ""
+        column_value = None
+        greater_q = None
         
-            debug_message = "In " + me + ": current index = " + str( current_index )
-            output_debug( debug_message, me, logger_name_IN = cls.LOGGER_NAME )
+        # for each column, all earlier columns equal and this one greater.
+        equal_q = Q()
+        for column_index, column_name in enumerate( cls.KEYSET_COLUMN_LIST ):
         
-            # check to see if FROM index is empty.
-            is_from_index_empty = merge_from_instance.is_index_empty( current_index )
-            if ( is_from_index_empty == False ):
+            column_value = after_key_IN[ column_index ]
             
-                debug_message = "In " + me + ": FROM not empty."
-                output_debug( debug_message, me, indent_with_IN = "----> ", logger_name_IN = cls.LOGGER_NAME )
+            # greater (nulls last - NULL is after any value, nothing is after
+            #     NULL).
+            if ( column_value is not None ):
             
-                # not empty in FROM.  Empty in INTO?
-                is_into_index_empty = merge_into_instance.is_index_empty( current_index )
-                if ( is_into_index_empty == True ):
+                greater_q = Q( **{ column_name + "__gt" : column_value } ) | Q( **{ column_name + "__isnull" : True } )
+                if ( q_OUT is None ):
                 
-                    # Add index to merge list.
-                    merge_index_list.append( current_index )
+                    q_OUT = equal_q & greater_q
                     
-                    debug_message = "In " + me + ": INTO is empty."
-                    output_debug( debug_message, me, indent_with_IN = "----> ", logger_name_IN = cls.LOGGER_NAME )
-                
                 else:
                 
-                    # Both are populated.  ERROR.
-                    error_index_list.append( current_index )
+                    q_OUT = q_OUT | ( equal_q & greater_q )
                     
-                    debug_message = "In " + me + ": INTO not empty."
-                    output_debug( debug_message, me, indent_with_IN = "----> ", logger_name_IN = cls.LOGGER_NAME )
+                #-- END check to see if first Q --#
                 
-                #-- END check to see if INTO is empty at current index. --#
+                equal_q = equal_q & Q( **{ column_name : column_value } )
                 
             else:
             
-                debug_message = "In " + me + ": FROM is empty."
-                output_debug( debug_message, me, indent_with_IN = "----> ", logger_name_IN = cls.LOGGER_NAME )
+                equal_q = equal_q & Q( **{ column_name + "__isnull" : True } )
+                
+            #-- END check to see if NULL --#
             
-            #-- END check to see if FROM is empty at current index. --#
+        #-- END loop over keyset columns --#
         
-        #-- END loop over indices --#
+        # nothing after? (can't happen - ID is never NULL)
+        if ( q_OUT is None ):
         
-        # errors?
-        error_count = len( error_index_list )
-        if ( error_count == 0 ):
-
-            # no errors, for each index to merge, copy values from FROM into
-            #     INTO for all of a given index's fields.
-            for current_index in merge_index_list:
-            
-                # copy values from FROM into INTO.
-                merge_into_instance.copy_index_values( current_index, merge_from_instance )
-            
-            #-- END loop over indices. --#
-            
-            # add details of Person from FROM into notes for INTO.
-            status_message = "Reliability_Names." + str( me ) + "() merged data from indexes " + str( merge_index_list ) + " in Reliability_Names ID = " + str( merge_from_instance.id ) + " ( Person: " +  str( merge_from_instance.person ) + " ) into this record ( Reliability_Names ID = " + str( merge_into_instance.id ) + " )."
-            
-            if ( ( merge_into_instance.notes is not None ) and ( merge_into_instance.notes != "" ) ):
+            q_OUT = Q( pk__in = [] )
             
-                # notes aren't empty - append a newline and a dash.
-                merge_into_instance.notes += "\n- "
-                merge_into_instance.notes += status_message
-                
-            else:
-            
-                # else empty, so set to empty string so we can append below one way or the othst
-                merge_into_instance.notes = status_message
-            
-            #-- END check to see if merge_into_instance.notes are empty. --#
-            
-            # save changes to INTO.
-            merge_into_instance.save()
-            
-            # delete FROM?
-            if ( delete_from_record_IN == True ):
-            
-                # delete the FROM record
-                merge_from_instance.delete()
-                
-            #-- END check to see if we delete. --#
-            
-            # set status to success and return message.
-            status_OUT.set_status_code( StatusContainer.STATUS_CODE_SUCCESS )
-            status_OUT.add_message( status_message )
-        
-        else:
-
-            # there were errors.  Log status appropriately, then do nothing.
-            status_OUT.set_status_code( StatusContainer.STATUS_CODE_ERROR )
-            status_message = "There is data present in both records for the following indices: " + str( error_index_list ) + ", and so nothing was changed and you'll have to sort that out manually at this point."
-            status_OUT.add_message( status_message )
+        #-- END check to see if any Q --#
         
-        #-- END check for errors. --#
-
-        return status_OUT
+        return q_OUT
         
-    #-- END classmethod merge_records() --#
+    #-- END classmethod get_keyset_filter() --#
 
 
-    #----------------------------------------------------------------------------
-    # ! ==> instance methods
-    #----------------------------------------------------------------------------
-
+    @classmethod
+    def get_keyset_key( cls, instance_IN ):
+        
+        '''
+        Accepts Reliability_Names instance.  Returns list of its values for
+            KEYSET_COLUMN_LIST, to pass to get_keyset_page() as the key of the
+            last row seen (JSON-serializable, for passing between requests).
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        list_OUT = [ getattr( instance_IN, column_name ) for column_name in cls.KEYSET_COLUMN_LIST ]
+        
+        return list_OUT
+        
+    #-- END classmethod get_keyset_key() --#
 
-    def __str__( self ):
 
+    @classmethod
+    def get_keyset_page( cls, qs_IN, page_size_IN = None, after_key_IN = None ):
+        
+        '''
+        Accepts QuerySet of Reliability_Names, optional page size (defaults to
+            DEFAULT_PAGE_SIZE), and optional key of the last row of the
+            previous page (from get_keyset_key()).  Orders by
+            KEYSET_COLUMN_LIST (the default ordering, plus ID to break ties),
+            filters to rows after the key, and retrieves one page (plus one
+            row, to see if there is another page) - no OFFSET, so later pages
+            cost the same as the first.  Returns tuple of list of instances and
+            key for the next page (None if this is the last page).
+        '''
+        
         # return reference
-        string_OUT = ""
+        list_OUT = []
+        next_key_OUT = None
         
         # declare variables
-        temp_string = ""
-        current_index = -1
-        attr_name = None
-        attr_value = None
-        coder_instance = None
-        is_detected = None
-        person_id = None
-        
-        # start with stuff we should always have.
-        if ( self.id ):
+        page_size = -1
+        qs = None
         
-            string_OUT += str( self.id )
-            
-        #-- END check to see if ID. --#
+        # page size
+        page_size = cls.DEFAULT_PAGE_SIZE if ( ( page_size_IN is None ) or ( page_size_IN <= 0 ) ) else page_size_IN
         
-        # got a label?
-        if ( self.label ):
+        # order, then filter to after key.
+        qs = qs_IN.order_by( *[ F( column_name ).asc( nulls_last = True ) for column_name in cls.KEYSET_COLUMN_LIST ] )
+        if ( ( after_key_IN is not None ) and ( len( after_key_IN ) == len( cls.KEYSET_COLUMN_LIST ) ) ):
         
-            # got a label
-            string_OUT += " - label: " + self.label
+            qs = qs.filter( cls.get_keyset_filter( after_key_IN ) )
             
-        #-- END check for label --#
+        #-- END check to see if key --#
         
-        # got an article?
-        if ( self.article ):
+        # one page, plus one to check for more.
+        list_OUT = list( qs[ : page_size + 1 ] )
+        if ( len( list_OUT ) > page_size ):
         
-            # yes - output ID.
-            string_OUT += " - article ID: " + str( self.article.id )
+            list_OUT = list_OUT[ : page_size ]
+            next_key_OUT = cls.get_keyset_key( list_OUT[ -1 ] )
             
-        #-- END check to see if article. --#
+        #-- END check to see if another page --#
         
-        # got person_name?
-        if ( self.person_name ):
+        return list_OUT, next_key_OUT
         
-            # yes, append it
-            string_OUT += " - " + self.person_name
-            
-        #-- END check to see if person_name --#
-            
-        # got person?
-        if ( self.person ):
+    #-- END classmethod get_keyset_page() --#
+
+
+    @classmethod
+    def parse_keyset_key( cls, key_json_IN ):
         
-            # yes, append ID in parens.
-            string_OUT += " ( " + str( self.person.id ) + " )"
-            
-        #-- END check to see if we have a person. --#
+        '''
+        Accepts JSON string of a key from get_keyset_key() (as passed between
+            requests).  Returns the key list, or None if empty, malformed, or
+            not a list of one scalar value per KEYSET_COLUMN_LIST column (so a
+            bad key just means the first page).
+        '''
         
-        # got coder details?
-        if ( ( self.coder1 ) or ( self.coder2 ) or ( self.coder3 ) ):
+        # return reference
+        list_OUT = None
         
-            # yes.  Output a summary of coding.
-            string_OUT += " - coders: "
+        if ( ( key_json_IN is not None ) and ( key_json_IN != "" ) ):
+        
+            try:
             
-            temp_string = ""
-            
-            # loop over range from 1 to 10.
-            for current_index in range( 1, 11 ):
-            
-                # get attribute values.
-
-                # ==> coder instance - build field name, then retrieve it.
-                
-                # build attribute name
-                attr_name = self.FIELD_NAME_PREFIX_CODER + str( current_index )
-                if ( ( self.FIELD_NAME_SUFFIX_CODER is not None ) and ( self.FIELD_NAME_SUFFIX_CODER != "" ) ):
-                
-                    attr_name += "_" + self.FIELD_NAME_SUFFIX_CODER
-                    
-                #-- END check to see if there is a coder suffix. --#
-                
-                # get value
-                coder_instance = getattr( self, attr_name, None )
+                list_OUT = json.loads( key_json_IN )
                 
-                # ==> detected flag - build field name, then retrieve it.
-                
-                # build attribute name
-                attr_name = self.FIELD_NAME_PREFIX_CODER + str( current_index ) + "_" + self.FIELD_NAME_SUFFIX_DETECTED
-                
-                # get value
-                is_detected = getattr( self, attr_name, None )
-                
-                # ==> person ID - build field name, then retrieve it.
-                
-                # build attribute name
-                attr_name = self.FIELD_NAME_PREFIX_CODER + str( current_index ) + "_" + self.FIELD_NAME_SUFFIX_PERSON_ID
-                
-                # get value
-                person_id = getattr( self, attr_name, None )
+            except ValueError:
+            
+                list_OUT = None
                 
-                # got a coder?
-                if ( coder_instance ):
+            #-- END try-except around parsing key --#
+            
+            if ( ( isinstance( list_OUT, list ) == False ) or ( len( list_OUT ) != len( cls.KEYSET_COLUMN_LIST ) ) ):
+            
+                list_OUT = None
                 
-                    # yes - output details for coder.
-                    string_OUT += "[" + str( current_index ) + "]"
-                    temp_string += " ==> [" + str( current_index ) + "] - coder=" + str( coder_instance.id ) + "; detected=" + str( is_detected ) + "; person=" + str( person_id )
-                    
-                #-- END check to see if coder instance. --#
+            elif ( any( ( ( value is not None ) and ( isinstance( value, ( six.integer_types, float, six.string_types ) ) == False ) ) for value in list_OUT ) == True ):
+            
+                list_OUT = None
                 
-            #-- END loop over coders --#
+            #-- END check to see if key is the right shape --#
             
-            string_OUT += ": " + temp_string
+        #-- END check to see if key passed in --#
         
-        return string_OUT
+        return list_OUT
+        
+    #-- END classmethod parse_keyset_key() --#
 
-    #-- END method __str__() --#
-    
-    
-    def copy_index_values( self, index_IN, copy_from_instance_IN, *args, **kwargs ):
+
+    @classmethod
+    def load_instance_list( cls, id_list_IN ):
         
         '''
-        Accepts index whose contents we want to copy and the record instance
-            from which we want to copy.  Loops through all the suffixes, builds
-            field name for the requested index for each suffix, then reads the
-            values for each field from the FROM instance passed in and stores
-            those values in the same field in this instance.  Returns status in
-            a StatusContainer.
+        Accepts list of Reliability_Names IDs.  Loads them with one in_bulk()
+            query.  Returns list of instances in ID list order (IDs with no
+            row, and repeats, are skipped).
         '''
         
         # return reference
-        status_OUT = StatusContainer()
+        list_OUT = []
         
         # declare variables
-        me = "copy_index_values"
-        suffix_list = []
-        field_name_suffix = ""
-        field_name = ""
-        field_value = ""
-        
-        # get list of all suffixes
-        suffix_list = self.ALL_FIELD_NAME_SUFFIX_LIST
+        instance_map = None
+        reliability_names_id = -1
+        seen_id_set = set()
         
-        # loop over the suffixes
-        for field_name_suffix in suffix_list:
+        instance_map = cls.objects.in_bulk( list( set( id_list_IN ) ) )
+        for reliability_names_id in id_list_IN:
         
-            # build field/column name.
-            field_name = self.build_field_name( index_IN, field_name_suffix )
-            
-            # get field value from FROM instance.
-            field_value = copy_from_instance_IN.get_field_value( index_IN, field_name_suffix )
+            if ( ( reliability_names_id in instance_map ) and ( reliability_names_id not in seen_id_set ) ):
             
-            # set field value in self
-            setattr( self, field_name, field_value )
+                seen_id_set.add( reliability_names_id )
+                list_OUT.append( instance_map[ reliability_names_id ] )
+                
+            #-- END check to see if row for ID --#
             
-        #-- END loop over field name/column name suffixes --#
+        #-- END loop over IDs --#
         
-        status_OUT.set_status_code( StatusContainer.STATUS_CODE_SUCCESS )
+        return list_OUT
         
-        return status_OUT
-                
-    #-- END method copy_index_values() --#
+    #-- END classmethod load_instance_list() --#
 
 
-    def find_disagreement( self, coder_count_IN = -1, comparison_suffix_list_IN = None, include_optional_IN = False ):
+    @classmethod
+    def lookup_disagreements( cls,
+                              label_IN = "",
+                              coder_count_IN = -1,
+                              include_optional_IN = False,
+                              order_by_IN = None,
+                              use_stored_flags_IN = False,
+                              *args,
+                              **kwargs ):
         
         '''
-        Accepts count of coders we want to include in search for disagreements,
-            optional list of suffixes to examine, and if no list present,
-            another optional parameter that tells whether we want to include
-            non-essential fields (1st quote graf and index, and organization
-            hash).  Returns a list of suffixes where there was a disagreement.
-            If list is empty, no disagreement.
+        Accepts label, count of coders to compare, and flag for whether to
+            include optional fields.  Returns rows with disagreements among
+            coders 1 through coder count.  If use_stored_flags_IN is True and
+            all the rows for the label have had their stored disagreement
+            flags computed, returns a QuerySet that filters on the indexed
+            flag columns.  Otherwise, falls back to a RawQuerySet that
+            compares all the coder columns (order_by_IN only applies to the
+            raw query - for the QuerySet, call order_by() on the result).
+            Both return the same rows - as with SQL "!=", a NULL never
+            disagrees with anything, and update_disagreement_flags() sets
+            the stored flags the same way.
         '''
         
         # return reference
-        disagree_list_OUT = []
+        qs_OUT = None
         
         # declare variables
+        my_label = ""
         my_coder_count = -1
         current_outer_index = -1
         current_inner_index = -1
-        comparison_suffix_list = []
-        field_name_suffix = ""
-        field_name_1 = ""
-        field_name_2 = ""
-        field_value_1 = ""
-        field_value_2 = ""
-        
-        # got a suffix list passed in?
-        if ( comparison_suffix_list_IN is not None ):
+        flag_field_name = ""
+        uncomputed_qs = None
+
+        # declare variables - building up SQL statement.
+        sql_string = ""
+        sql_temp_string = ""
+        sql_detected_list = []
+        sql_person_id_list = []
+        sql_person_type_list = []
+        sql_quote_graf_list = []
+        sql_quote_index_list = []
+        sql_org_hash_list = []
+        sql_raw_params_list = []
         
+        # do we have a label?
+        if ( ( label_IN is not None ) and ( label_IN != "" ) ):
+
             # yes - use it.
-            comparison_suffix_list = comparison_suffix_list_IN
-            
-        else:
+            my_label = label_IN
+        
+        #-- END check to see if label --#
         
-            # no.  Use default.
-            
-            # init comparison suffix list
-            comparison_suffix_list = self.DEFAULT_AGREEMENT_FIELD_SUFFIX_LIST
-            
-            # include optional?
-            if ( include_optional_IN == True ):
-            
-                # Yes. add the optional list to our comparison suffix list.
-                comparison_suffix_list.extend( self.OPTIONAL_AGREEMENT_FIELD_SUFFIX_LIST )
-            
-            #-- END check to see if we include optional. --#
-            
-        #-- END check to see if suffix list passed in. --#
-
         # got coder_count_IN?
         if ( ( coder_count_IN is not None ) and ( coder_count_IN != "" ) and ( int( coder_count_IN ) > 2 ) ):
         
@@ -1085,169 +1619,846 @@ class Reliability_Names( models.Model ):
             
         #-- END check to see if coder count passed in. --#
         
-        # loop over coders we've been asked to compare
-        for current_outer_index in range( 1, my_coder_count + 1 ):
+        # stored flags?
+        if ( use_stored_flags_IN == True ):
         
-            # loop over indices past the current one, the "to whom" we will
-            #     compare.
-            for current_inner_index in range( current_outer_index + 1, my_coder_count + 1 ):
-
-                # loop over the list of fields to compare (contains the
-                #     suffixes).
-                for field_name_suffix in comparison_suffix_list:
-
-                    # do inequality comparison for detected.
-                    
-                    # make field/column names.
-                    field_name_1 = self.build_field_name( current_outer_index, field_name_suffix )
-                    field_name_2 = self.build_field_name( current_inner_index, field_name_suffix )
+            # which flag?
+            if ( include_optional_IN == True ):
+            
+                flag_field_name = cls.FIELD_NAME_DISAGREE_OPTIONAL_CODER_COUNT
+                
+            else:
+            
+                flag_field_name = cls.FIELD_NAME_DISAGREE_CODER_COUNT
+                
+            #-- END check to see if include optional --#
+            
+            # any rows that have not been computed yet?
+            uncomputed_qs = cls.objects.filter( **{ flag_field_name + "__isnull" : True } )
+            if ( ( my_label is not None ) and ( my_label != "" ) ):
 
-                    # get field values
-                    field_value_1 = getattr( self, field_name_1 )
-                    field_value_2 = getattr( self, field_name_2 )
+                uncomputed_qs = uncomputed_qs.filter( label = my_label )
 
-                    # check for disagreement.
-                    if ( field_value_1 != field_value_2 ):
-                    
-                        # not the same - check to see if field_name_suffix is
-                        #     already in the list.
-                        if ( field_name_suffix not in disagree_list_OUT ):
-                        
-                            # add it to the list.
-                            disagree_list_OUT.append( field_name_suffix )
-                            
-                        #-- END check to see if suffix in list. --#
-                    
-                    #-- END check to see if values are the same --#
-                
-                #-- END check to see if field values are different --#
+            #-- END check to see if label set --#
+            
+            if ( uncomputed_qs.exists() == False ):
+            
+                # all computed - disagreement among first N coders if lowest
+                #     N with disagreement is between 1 and N.
+                qs_OUT = cls.objects.filter( **{ flag_field_name + "__gt" : 0, flag_field_name + "__lte" : my_coder_count } )
+                if ( ( my_label is not None ) and ( my_label != "" ) ):
 
-            #-- END loop over rest of indices past current --#
-        
-        #-- END loop over coders to compare --#
+                    qs_OUT = qs_OUT.filter( label = my_label )
 
-        return disagree_list_OUT
-        
-    #-- END method find_disagreement() --#
-     
+                #-- END check to see if label set --#
 
-    def get_field_value( self, index_IN, field_name_suffix_IN, default_IN = None, *args, **kwargs ):
-        
-        '''
-        Accepts index and suffix of field we want to get a value for.  Builds
-            field name for the requested index and suffix, then reads the
-            value for that field and returns it.
-        '''
-        
-        # return reference
-        value_OUT = None
+                qs_OUT = qs_OUT.order_by( *cls.DEFAULT_ORDER_ID_COLUMN_LIST )
+            
+            #-- END check to see if flags computed --#
+            
+        #-- END check to see if use stored flags --#
         
-        # declare variables
-        me = "get_field_value"
-        field_name = ""
-        field_value = ""
+        # no stored flags - compare coder columns in raw SQL.
+        if ( qs_OUT is None ):
         
-        # build field/column name.
-        field_name = self.build_field_name( index_IN, field_name_suffix_IN )
+            # loop over coders we've been asked to compare
+            sql_detected_list = []
+            sql_person_id_list = []
+            sql_person_type_list = []
+            sql_quote_graf_list = []
+            sql_quote_index_list = []
+            sql_org_hash_list = []
+            for current_outer_index in range( 1, my_coder_count + 1 ):
         
-        # get field value from FROM instance.
-        value_OUT = getattr( self, field_name, default_IN )
+                # loop over indices past the current one, adding SQL fragments to
+                #     our SQL lists for comparison of current to subsequent.
+                for current_inner_index in range( current_outer_index + 1, my_coder_count + 1 ):
+
+                    # add inequality comparison for detected.
+                    column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_DETECTED
+                    sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
+                    sql_detected_list.append( sql_temp_string )
                 
-        return value_OUT
+                    # add inequality comparison for lookup.
+                    column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_PERSON_ID
+                    sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
+                    sql_person_id_list.append( sql_temp_string )
                 
-    #-- END method get_field_value() --#
-
+                    # add inequality comparison for type.
+                    column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_PERSON_TYPE
+                    sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
+                    sql_person_type_list.append( sql_temp_string )
+                
+                    # include optional?
+                    if ( include_optional_IN == True ):
+                
+                        # add inequality comparison for first_quote_graf
+                        column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_FIRST_QUOTE_GRAF
+                        sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
+                        sql_quote_graf_list.append( sql_temp_string )
+                
+                        # add inequality comparison for first_quote_index
+                        column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_FIRST_QUOTE_INDEX
+                        sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
+                        sql_quote_index_list.append( sql_temp_string )
+                
+                        # add inequality comparison for organization_hash
+                        column_name_suffix = "_" + cls.FIELD_NAME_SUFFIX_ORGANIZATION_HASH
+                        sql_temp_string = "( " + cls.FIELD_NAME_PREFIX_CODER + str( current_outer_index ) + column_name_suffix + " != " + cls.FIELD_NAME_PREFIX_CODER + str( current_inner_index ) + column_name_suffix + " )"
+                        sql_org_hash_list.append( sql_temp_string )
+                                
+                    #-- END check to see if include optional --#
 
-    def get_field_values( self, field_name_suffix_IN, default_IN = None, omit_empty_IN = True, empty_values_IN = ( None, ) ):
+                #-- END loop over rest of indices past current --#
         
-        '''
-        Accepts a field_name_suffix and optional:
-        - default_IN - default field value in case field name doesn't exist (defaults to None)
-        - omit_empty_IN - boolean flag telling whether we want function to omit empty values from output (defaults to True).
-        - empty_values_IN - tuple or list of values that should be considered empty.  Defaults to just None.  For number, could include 0 and -1, for string include "", etc.'
+            #-- END loop over coders to compare --#
         
-        Loops over all available indexes.  For each, tries to get value for the
-            field name with that index.  If not omitting empty, stores the value
-            in dictionary mapped to current index (coder number).  If omitting
-            empty, only adds to dictionary if value is not in the values listed
-            in variable empty_values_IN.
+            # build SQL string
+            sql_string = "SELECT * FROM context_analysis_reliability_names WHERE "
         
-        Returns dictionary of all values found in current record, with each
-            mapped in a dictionary to their index/coder number.
-        '''
+            # got a label?
+            if ( ( my_label is not None ) and ( my_label != "" ) ):
+
+                # yes.  Add to WHERE clause.
+                sql_string += " label = %s AND ( "
+            
+                # and add value to params list.
+                sql_raw_params_list.append( my_label )
+
+            #-- END check to see if label set --#
         
-        # return reference
-        dictionary_OUT = {}
+            # append detected comparisons
+            sql_temp_string = " OR ".join( sql_detected_list )
+            sql_string += " ( " + sql_temp_string + " )"
         
-        # declare variables.
-        coder_number = -1
-        coder_number_string = None
-        current_field_name = ""
-        current_field_value = ""
+            # append person id comparisons
+            sql_temp_string = " OR ".join( sql_person_id_list )
+            sql_string += " OR ( " + sql_temp_string + " )"
+
+            # append person type comparisons
+            sql_temp_string = " OR ".join( sql_person_type_list )
+            sql_string += " OR ( " + sql_temp_string + " )"
         
-        # loop over indexes 1 through 10.
-        for coder_number in range( 1, 11 ):
+            # got first_quote_graf?
+            if ( ( sql_quote_graf_list is not None ) and ( len( sql_quote_graf_list ) > 0 ) ):
         
-            # Make field name
-            coder_number_string = str( coder_number )
-            current_field_name = ""
+                # append first quote graf comparisons
+                sql_temp_string = " OR ".join( sql_quote_graf_list )
+                sql_string += " OR ( " + sql_temp_string + " )"
             
-            # build field name.
-            current_field_name = Reliability_Names.build_field_name( coder_number, field_name_suffix_IN )
+            #-- END check to see if first_quote_graf list --#
             
-            # get the value
-            current_field_value = getattr( self, current_field_name, default_IN )
+            # got first_quote_index?
+            if ( ( sql_quote_index_list is not None ) and ( len( sql_quote_index_list ) > 0 ) ):
+        
+                # append person type comparisons
+                sql_temp_string = " OR ".join( sql_quote_index_list )
+                sql_string += " OR ( " + sql_temp_string + " )"
             
-            # omitting empty?
-            if ( omit_empty_IN == True ):
+            #-- END check to see if first_quote_graf list --#
             
-                # empty?
-                if ( current_field_value not in empty_values_IN ):
-                
-                    # not empty - add to dictionary.
-                    dictionary_OUT[ coder_number ] = current_field_value
-                    
-                #-- END check to see if empty --#
-                    
-            else:
+            # got organization_hash?
+            if ( ( sql_org_hash_list is not None ) and ( len( sql_org_hash_list ) > 0 ) ):
+        
+                # append person type comparisons
+                sql_temp_string = " OR ".join( sql_org_hash_list )
+                sql_string += " OR ( " + sql_temp_string + " )"
             
-                # add to dictionary
-                dictionary_OUT[ coder_number ] = current_field_value
-                
-            #-- END check to see if omitting empty. --#
-    
-        #-- END loop over coder numbers. --#
+            #-- END check to see if first_quote_graf list --#
+            
+            # got a label?
+            if ( ( my_label is not None ) and ( my_label != "" ) ):
+
+                # yes.  Close parentheses.
+                sql_string += " )"
+
+            #-- END check to see if label set --#
         
-        return dictionary_OUT
+            # ORDER BY
+            if ( ( order_by_IN is not None ) and ( order_by_IN != "" ) ):
         
-    #-- END method get_field_values() --#
+                # custom order by passed in - use it.
+                sql_string += " " + order_by_IN
+        
+            else:
+
+                # no custom order by passed in.  go with default.
+                sql_string += cls.DEFAULT_ORDER_BY
+            
+            #-- END check to see if custom ORDER BY passed in. --#
+        
+            # execute raw query
+            qs_OUT = cls.objects.raw( sql_string, sql_raw_params_list )
+
+        #-- END check to see if QuerySet from stored flags --#
+
+        return qs_OUT        
     
+    #-- END class method lookup_disagreements() --#
 
 
-    def has_disagreement( self, coder_count_IN = -1, comparison_suffix_list_IN = None, include_optional_IN = False ):
+    @classmethod
+    def merge_instances( cls, merge_from_instance_IN, merge_into_instance_IN ):
         
         '''
-        Accepts count of coders we want to include in search for disagreements,
-        
+        Accepts FROM and INTO Reliability_Names instances.  Loops over the
+            indices.  For each index, checks to see if that index is empty in
+            the FROM record.  If yes, moves on.  If no, checks to see if the
+            index is empty in the TO record.  If yes, adds index to list of
+            indexes to copy values FROM INTO.  If ever an index has data in
+            both FROM and TO, does not change anything, returns an error
+            message.  Otherwise, copies the values and adds a note to INTO.
+            Does not save either instance - that is up to the caller.
+            Returns StatusContainer.
         '''
         
         # return reference
-        value_OUT = False
-        
+        status_OUT = StatusContainer()
+
         # declare variables
-        disagree_list = None
-        
-        # call find_disagreement to get list of suffixes where there is
-        #     disagreement.
-        disagree_list = self.find_disagreement( 
-                coder_count_IN = coder_count_IN,
-                comparison_suffix_list_IN = comparison_suffix_list_IN,
-                include_optional_IN = include_optional_IN
-            )
-            
-        # anything in list?  If so, disagreement.  If not, agree!
-        if ( ( disagree_list is not None ) and ( isinstance( disagree_list, list ) == True ) and ( len( disagree_list ) > 0 ) ):
-        
+        me = "merge_instances"
+        debug_message = ""
+        status_message = ""
+        merge_from_instance = None
+        merge_into_instance = None
+        merge_index_list = []
+        error_index_list = []
+        is_from_index_empty = False
+        is_into_index_empty = False
+        error_count = -1
+        current_index = -1
+        
+        # instances.
+        merge_from_instance = merge_from_instance_IN
+        merge_into_instance = merge_into_instance_IN
+        
+        # loop over indexes
+        merge_index_list = []
+        error_index_list = []
+        for current_index in range( 1, cls.MAX_INDEX + 1 ):
+        
+            debug_message = "In " + me + ": current index = " + str( current_index )
+            output_debug( debug_message, me, logger_name_IN = cls.LOGGER_NAME )
+        
+            # check to see if FROM index is empty.
+            is_from_index_empty = merge_from_instance.is_index_empty( current_index )
+            if ( is_from_index_empty == False ):
+            
+                debug_message = "In " + me + ": FROM not empty."
+                output_debug( debug_message, me, indent_with_IN = "----> ", logger_name_IN = cls.LOGGER_NAME )
+            
+                # not empty in FROM.  Empty in INTO?
+                is_into_index_empty = merge_into_instance.is_index_empty( current_index )
+                if ( is_into_index_empty == True ):
+                
+                    # Add index to merge list.
+                    merge_index_list.append( current_index )
+                    
+                    debug_message = "In " + me + ": INTO is empty."
+                    output_debug( debug_message, me, indent_with_IN = "----> ", logger_name_IN = cls.LOGGER_NAME )
+                
+                else:
+                
+                    # Both are populated.  ERROR.
+                    error_index_list.append( current_index )
+                    
+                    debug_message = "In " + me + ": INTO not empty."
+                    output_debug( debug_message, me, indent_with_IN = "----> ", logger_name_IN = cls.LOGGER_NAME )
+                
+                #-- END check to see if INTO is empty at current index. --#
+                
+            else:
+            
+                debug_message = "In " + me + ": FROM is empty."
+                output_debug( debug_message, me, indent_with_IN = "----> ", logger_name_IN = cls.LOGGER_NAME )
+            
+            #-- END check to see if FROM is empty at current index. --#
+        
+        #-- END loop over indices --#
+        
+        # errors?
+        error_count = len( error_index_list )
+        if ( error_count == 0 ):
+
+            # no errors, for each index to merge, copy values from FROM into
+            #     INTO for all of a given index's fields.
+            for current_index in merge_index_list:
+            
+                # copy values from FROM into INTO.
+                merge_into_instance.copy_index_values( current_index, merge_from_instance )
+            
+            #-- END loop over indices. --#
+            
+            # add details of Person from FROM into notes for INTO.
+            status_message = "Reliability_Names.merge_records() merged data from indexes " + str( merge_index_list ) + " in Reliability_Names ID = " + str( merge_from_instance.id ) + " ( Person: " +  str( merge_from_instance.person ) + " ) into this record ( Reliability_Names ID = " + str( merge_into_instance.id ) + " )."
+            
+            if ( ( merge_into_instance.notes is not None ) and ( merge_into_instance.notes != "" ) ):
+            
+                # notes aren't empty - append a newline and a dash.
+                merge_into_instance.notes += "\n- "
+                merge_into_instance.notes += status_message
+                
+            else:
+            
+                # else empty, so set to empty string so we can append below one way or the othst
+                merge_into_instance.notes = status_message
+            
+            #-- END check to see if merge_into_instance.notes are empty. --#
+            
+            # set status to success and return message.
+            status_OUT.set_status_code( StatusContainer.STATUS_CODE_SUCCESS )
+            status_OUT.add_message( status_message )
+        
+        else:
+
+            # there were errors.  Log status appropriately, then do nothing.
+            status_OUT.set_status_code( StatusContainer.STATUS_CODE_ERROR )
+            status_message = "There is data present in both records for the following indices: " + str( error_index_list ) + ", and so nothing was changed and you'll have to sort that out manually at this point."
+            status_OUT.add_message( status_message )
+        
+        #-- END check for errors. --#
+
+        return status_OUT
+        
+    #-- END classmethod merge_instances() --#
+
+
+    @classmethod
+    def merge_records( cls,
+                       merge_from_id_IN,
+                       merge_into_id_IN,
+                       delete_from_record_IN = False,
+                       *args,
+                       **kwargs ):
+        
+        '''
+        Accepts IDs of two Reliability_Names rows.  Loads each into an instance.
+            Then, calls merge_instances() to copy the data for each index that
+            is populated in FROM and empty in INTO from FROM INTO.  If ever an
+            index has data in both FROM and TO, does not change anything,
+            returns an error message.  For many pairs at once, see
+            bulk_merge_records().
+        '''
+        
+        # return reference
+        status_OUT = None
+
+        # declare variables
+        me = "merge_records"
+        merge_from_instance = None
+        merge_into_instance = None
+        
+        # load instances.
+        merge_from_instance = Reliability_Names.objects.get( pk = merge_from_id_IN )
+        merge_into_instance = Reliability_Names.objects.get( pk = merge_into_id_IN )
+        
+        # merge
+        status_OUT = cls.merge_instances( merge_from_instance, merge_into_instance )
+        if ( status_OUT.get_status_code() == StatusContainer.STATUS_CODE_SUCCESS ):
+
+            # save changes to INTO, and update its long-format coder data
+            #     (FROM's is deleted with it, if deleted).
+            with transaction.atomic():
+            
+                merge_into_instance.save()
+                Reliability_Names_Coder_Data.create_for_reliability_names_list( [ merge_into_instance ] )
+                
+            #-- END with transaction.atomic() --#
+            
+            # delete FROM?
+            if ( delete_from_record_IN == True ):
+            
+                # delete the FROM record
+                merge_from_instance.delete()
+                
+            #-- END check to see if we delete. --#
+            
+        #-- END check for errors. --#
+
+        return status_OUT
+        
+    #-- END classmethod merge_records() --#
+
+
+    #----------------------------------------------------------------------------
+    # ! ==> instance methods
+    #----------------------------------------------------------------------------
+
+
+    def __str__( self ):
+
+        # return reference
+        string_OUT = ""
+        
+        # declare variables
+        temp_string = ""
+        current_index = -1
+        coder_value_matrix = None
+        coder_values = None
+        coder_id = None
+        is_detected = None
+        person_id = None
+        
+        # start with stuff we should always have.
+        if ( self.id ):
+        
+            string_OUT += str( self.id )
+            
+        #-- END check to see if ID. --#
+        
+        # got a label?
+        if ( self.label ):
+        
+            # got a label
+            string_OUT += " - label: " + self.label
+            
+        #-- END check for label --#
+        
+        # got an article? (ID, so we don't load the Article)
+        if ( self.article_id ):
+        
+            # yes - output ID.
+            string_OUT += " - article ID: " + str( self.article_id )
+            
+        #-- END check to see if article. --#
+        
+        # got person_name?
+        if ( self.person_name ):
+        
+            # yes, append it
+            string_OUT += " - " + self.person_name
+            
+        #-- END check to see if person_name --#
+            
+        # got person?
+        if ( self.person_id ):
+        
+            # yes, append ID in parens.
+            string_OUT += " ( " + str( self.person_id ) + " )"
+            
+        #-- END check to see if we have a person. --#
+        
+        # coder ID, detected, and person ID for each index, in one pass.
+        coder_value_matrix = self.get_coder_value_matrix( [ self.FIELD_NAME_SUFFIX_CODER, self.FIELD_NAME_SUFFIX_DETECTED, self.FIELD_NAME_SUFFIX_PERSON_ID ] )
+        
+        # got coder details?
+        if ( ( coder_value_matrix[ 0 ][ 0 ] ) or ( coder_value_matrix[ 1 ][ 0 ] ) or ( coder_value_matrix[ 2 ][ 0 ] ) ):
+        
+            # yes.  Output a summary of coding.
+            string_OUT += " - coders: "
+            
+            temp_string = ""
+            
+            # loop over indexes
+            for current_index, coder_values in enumerate( coder_value_matrix, 1 ):
+            
+                # get values.
+                coder_id, is_detected, person_id = coder_values
+                
+                # got a coder?
+                if ( coder_id ):
+                
+                    # yes - output details for coder.
+                    string_OUT += "[" + str( current_index ) + "]"
+                    temp_string += " ==> [" + str( current_index ) + "] - coder=" + str( coder_id ) + "; detected=" + str( is_detected ) + "; person=" + str( person_id )
+                    
+                #-- END check to see if coder ID. --#
+                
+            #-- END loop over coders --#
+            
+            string_OUT += ": " + temp_string
+        
+        return string_OUT
+
+    #-- END method __str__() --#
+    
+    
+    def copy_index_values( self, index_IN, copy_from_instance_IN, *args, **kwargs ):
+        
+        '''
+        Accepts index whose contents we want to copy and the record instance
+            from which we want to copy.  Loops through all the suffixes, builds
+            field name for the requested index for each suffix, then reads the
+            values for each field from the FROM instance passed in and stores
+            those values in the same field in this instance, then updates
+            the stored disagreement flags.  Does not save, and does not update
+            the row's Reliability_Names_Coder_Data - callers that save need to
+            call Reliability_Names_Coder_Data.create_for_reliability_names_list()
+            for the rows they change.  Returns status in a StatusContainer.
+        '''
+        
+        # return reference
+        status_OUT = StatusContainer()
+        
+        # declare variables
+        me = "copy_index_values"
+        suffix_list = []
+        field_name_suffix = ""
+        attribute_name = ""
+        field_value = ""
+        
+        # get list of all suffixes
+        suffix_list = self.ALL_FIELD_NAME_SUFFIX_LIST
+        
+        # loop over the suffixes
+        for field_name_suffix in suffix_list:
+        
+            # precomputed attribute name (coder by ID, so User not loaded).
+            attribute_name = self.INDEX_SUFFIX_TO_ATTNAME_MAP[ ( index_IN, field_name_suffix ) ]
+            
+            # get field value from FROM instance.
+            field_value = getattr( copy_from_instance_IN, attribute_name )
+            
+            # set field value in self
+            setattr( self, attribute_name, field_value )
+            
+        #-- END loop over field name/column name suffixes --#
+        
+        # coder values changed - update disagreement flags.
+        self.update_disagreement_flags()
+        
+        status_OUT.set_status_code( StatusContainer.STATUS_CODE_SUCCESS )
+        
+        return status_OUT
+                
+    #-- END method copy_index_values() --#
+
+
+    def find_disagreement( self, coder_count_IN = -1, comparison_suffix_list_IN = None, include_optional_IN = False ):
+        
+        '''
+        Accepts count of coders we want to include in search for disagreements,
+            optional list of suffixes to examine, and if no list present,
+            another optional parameter that tells whether we want to include
+            non-essential fields (1st quote graf and index, and organization
+            hash).  Returns a list of suffixes where there was a disagreement.
+            If list is empty, no disagreement.
+        '''
+        
+        # return reference
+        disagree_list_OUT = []
+        
+        # declare variables
+        my_coder_count = -1
+        current_outer_index = -1
+        current_inner_index = -1
+        comparison_suffix_list = []
+        coder_value_matrix = None
+        suffix_position = -1
+        field_name_suffix = ""
+        field_value_1 = ""
+        field_value_2 = ""
+        
+        # got a suffix list passed in?
+        if ( comparison_suffix_list_IN is not None ):
+        
+            # yes - use it.
+            comparison_suffix_list = comparison_suffix_list_IN
+            
+        else:
+        
+            # no.  Use default.
+            
+            # init comparison suffix list (copy, so extend() doesn't change
+            #     the class-level list).
+            comparison_suffix_list = list( self.DEFAULT_AGREEMENT_FIELD_SUFFIX_LIST )
+            
+            # include optional?
+            if ( include_optional_IN == True ):
+            
+                # Yes. add the optional list to our comparison suffix list.
+                comparison_suffix_list.extend( self.OPTIONAL_AGREEMENT_FIELD_SUFFIX_LIST )
+            
+            #-- END check to see if we include optional. --#
+            
+        #-- END check to see if suffix list passed in. --#
+
+        # got coder_count_IN?
+        if ( ( coder_count_IN is not None ) and ( coder_count_IN != "" ) and ( int( coder_count_IN ) > 2 ) ):
+        
+            # yes, and is at least 2.  Use it.
+            my_coder_count = int( coder_count_IN )
+        
+        else:
+        
+            # no, or not at least 2.  Default to 2.
+            my_coder_count = 2
+            
+        #-- END check to see if coder count passed in. --#
+        
+        # get values for coders and suffixes in one pass.
+        coder_value_matrix = self.get_coder_value_matrix( comparison_suffix_list, my_coder_count )
+        
+        # loop over coders we've been asked to compare
+        for current_outer_index in range( 1, my_coder_count + 1 ):
+        
+            # loop over indices past the current one, the "to whom" we will
+            #     compare.
+            for current_inner_index in range( current_outer_index + 1, my_coder_count + 1 ):
+
+                # loop over the list of fields to compare (contains the
+                #     suffixes).
+                for suffix_position, field_name_suffix in enumerate( comparison_suffix_list ):
+
+                    # get field values
+                    field_value_1 = coder_value_matrix[ current_outer_index - 1 ][ suffix_position ]
+                    field_value_2 = coder_value_matrix[ current_inner_index - 1 ][ suffix_position ]
+
+                    # check for disagreement.
+                    if ( field_value_1 != field_value_2 ):
+                    
+                        # not the same - check to see if field_name_suffix is
+                        #     already in the list.
+                        if ( field_name_suffix not in disagree_list_OUT ):
+                        
+                            # add it to the list.
+                            disagree_list_OUT.append( field_name_suffix )
+                            
+                        #-- END check to see if suffix in list. --#
+                    
+                    #-- END check to see if values are the same --#
+                
+                #-- END check to see if field values are different --#
+
+            #-- END loop over rest of indices past current --#
+        
+        #-- END loop over coders to compare --#
+
+        return disagree_list_OUT
+        
+    #-- END method find_disagreement() --#
+     
+
+    def get_coder_value_matrix( self, field_name_suffix_list_IN = None, coder_count_IN = None ):
+        
+        '''
+        Accepts optional list of field name suffixes (defaults to
+            ALL_FIELD_NAME_SUFFIX_LIST) and optional count of coders (defaults
+            to MAX_INDEX).  Reads all the values in one pass with a cached
+            operator.attrgetter() built from INDEX_SUFFIX_TO_ATTNAME_MAP.
+            Returns list with one list per coder index (index 1 at position
+            0), each with one value per suffix, in suffix list order.  Coder
+            foreign keys are returned as the User ID, not the User.
+        '''
+        
+        # return reference
+        matrix_OUT = []
+        
+        # declare variables
+        suffix_tuple = None
+        coder_count = -1
+        cache_key = None
+        value_getter = None
+        current_index = -1
+        field_name_suffix = ""
+        value_list = None
+        suffix_count = -1
+        
+        # defaults
+        suffix_tuple = self.ALL_FIELD_NAME_SUFFIX_LIST if ( field_name_suffix_list_IN is None ) else field_name_suffix_list_IN
+        suffix_tuple = tuple( suffix_tuple )
+        coder_count = self.MAX_INDEX if ( coder_count_IN is None ) else coder_count_IN
+        
+        # getter for this suffix list and coder count.
+        cache_key = ( suffix_tuple, coder_count )
+        value_getter = self.coder_value_getter_cache.get( cache_key, None )
+        if ( value_getter is None ):
+        
+            value_getter = operator.attrgetter( *[ ( self.INDEX_SUFFIX_TO_ATTNAME_MAP.get( ( current_index, field_name_suffix ), None ) or self.build_field_name( current_index, field_name_suffix ) ) for current_index in range( 1, coder_count + 1 ) for field_name_suffix in suffix_tuple ] )
+            self.coder_value_getter_cache[ cache_key ] = value_getter
+            
+        #-- END check to see if getter cached --#
+        
+        # get values (attrgetter() of one name returns value, not a tuple).
+        value_list = value_getter( self )
+        suffix_count = len( suffix_tuple )
+        if ( ( coder_count * suffix_count ) == 1 ):
+        
+            value_list = ( value_list, )
+            
+        #-- END check to see if single value --#
+        
+        # one list per coder.
+        matrix_OUT = [ list( value_list[ current_index : current_index + suffix_count ] ) for current_index in range( 0, coder_count * suffix_count, suffix_count ) ]
+        
+        return matrix_OUT
+        
+    #-- END method get_coder_value_matrix() --#
+
+
+    def get_field_value( self, index_IN, field_name_suffix_IN, default_IN = None, *args, **kwargs ):
+        
+        '''
+        Accepts index and suffix of field we want to get a value for.  Builds
+            field name for the requested index and suffix, then reads the
+            value for that field and returns it.
+        '''
+        
+        # return reference
+        value_OUT = None
+        
+        # declare variables
+        me = "get_field_value"
+        field_name = ""
+        field_value = ""
+        
+        # build field/column name.
+        field_name = self.build_field_name( index_IN, field_name_suffix_IN )
+        
+        # get field value from FROM instance.
+        value_OUT = getattr( self, field_name, default_IN )
+                
+        return value_OUT
+                
+    #-- END method get_field_value() --#
+
+
+    def get_field_values( self, field_name_suffix_IN, default_IN = None, omit_empty_IN = True, empty_values_IN = ( None, ) ):
+        
+        '''
+        Accepts a field_name_suffix and optional:
+        - default_IN - default field value in case field name doesn't exist (defaults to None)
+        - omit_empty_IN - boolean flag telling whether we want function to omit empty values from output (defaults to True).
+        - empty_values_IN - tuple or list of values that should be considered empty.  Defaults to just None.  For number, could include 0 and -1, for string include "", etc.'
+        
+        Reads the suffix's values for all available indexes in one pass with
+            get_coder_value_matrix() (so coder foreign keys are the User ID,
+            and a suffix that isn't a coder field gets default_IN for every
+            index).  If not omitting empty, stores each value in dictionary
+            mapped to its index (coder number).  If omitting empty, only adds
+            to dictionary if value is not in the values listed in variable
+            empty_values_IN.
+        
+        Returns dictionary of all values found in current record, with each
+            mapped in a dictionary to their index/coder number.
+        '''
+        
+        # return reference
+        dictionary_OUT = {}
+        
+        # declare variables.
+        coder_value_list = None
+        value_list = None
+        coder_number = -1
+        current_field_value = ""
+        
+        # all the values, one pass.
+        if ( ( 1, field_name_suffix_IN ) in self.INDEX_SUFFIX_TO_ATTNAME_MAP ):
+        
+            coder_value_list = [ value_list[ 0 ] for value_list in self.get_coder_value_matrix( [ field_name_suffix_IN ] ) ]
+            
+        else:
+        
+            # not a coder field.
+            coder_value_list = [ default_IN ] * self.MAX_INDEX
+            
+        #-- END check to see if coder field --#
+        
+        # loop over indexes 1 through MAX_INDEX.
+        for coder_number, current_field_value in enumerate( coder_value_list, 1 ):
+        
+            # omitting empty?
+            if ( omit_empty_IN == True ):
+            
+                # empty?
+                if ( current_field_value not in empty_values_IN ):
+                
+                    # not empty - add to dictionary.
+                    dictionary_OUT[ coder_number ] = current_field_value
+                    
+                #-- END check to see if empty --#
+                    
+            else:
+            
+                # add to dictionary
+                dictionary_OUT[ coder_number ] = current_field_value
+                
+            #-- END check to see if omitting empty. --#
+    
+        #-- END loop over coder numbers. --#
+        
+        return dictionary_OUT
+        
+    #-- END method get_field_values() --#
+    
+
+
+    def has_disagreement( self, coder_count_IN = -1, comparison_suffix_list_IN = None, include_optional_IN = False, use_stored_flags_IN = False ):
+        
+        '''
+        Accepts count of coders we want to include in search for disagreements,
+            optional list of suffixes to examine, flag for whether to include
+            optional fields, and flag for whether to use the stored
+            disagreement flags.  If use_stored_flags_IN is True, no suffix
+            list is passed, and the flags have been computed, checks the stored
+            flags (which, like lookup_disagreements(), ignore NULL values).
+            Otherwise, calls find_disagreement().  Returns True if
+            disagreement, False if not.
+        '''
+        
+        # return reference
+        value_OUT = False
+        
+        # declare variables
+        disagree_list = None
+        my_coder_count = -1
+        flag_field_name = ""
+        disagree_coder_count = None
+        
+        # stored flags?
+        if ( ( use_stored_flags_IN == True ) and ( comparison_suffix_list_IN is None ) ):
+        
+            if ( include_optional_IN == True ):
+            
+                flag_field_name = self.FIELD_NAME_DISAGREE_OPTIONAL_CODER_COUNT
+                
+            else:
+            
+                flag_field_name = self.FIELD_NAME_DISAGREE_CODER_COUNT
+                
+            #-- END check to see if include optional --#
+            
+            disagree_coder_count = getattr( self, flag_field_name, None )
+            
+        #-- END check to see if use stored flags --#
+        
+        # got stored value?
+        if ( disagree_coder_count is not None ):
+        
+            # same coder count defaulting as find_disagreement().
+            if ( ( coder_count_IN is not None ) and ( coder_count_IN != "" ) and ( int( coder_count_IN ) > 2 ) ):
+            
+                my_coder_count = int( coder_count_IN )
+                
+            else:
+            
+                my_coder_count = 2
+                
+            #-- END check to see if coder count passed in. --#
+            
+            # put in disagree_list, so the check below works the same.
+            disagree_list = []
+            if ( ( disagree_coder_count > 0 ) and ( disagree_coder_count <= my_coder_count ) ):
+            
+                disagree_list.append( flag_field_name )
+                
+            #-- END check to see if disagreement among first N coders --#
+        
+        else:
+
+            # call find_disagreement to get list of suffixes where there is
+            #     disagreement.
+            disagree_list = self.find_disagreement( 
+                    coder_count_IN = coder_count_IN,
+                    comparison_suffix_list_IN = comparison_suffix_list_IN,
+                    include_optional_IN = include_optional_IN
+                )
+                
+        #-- END check to see if stored value --#
+            
+        # anything in list?  If so, disagreement.  If not, agree!
+        if ( ( disagree_list is not None ) and ( isinstance( disagree_list, list ) == True ) and ( len( disagree_list ) > 0 ) ):
+        
             # list has something in it.  There is disagreement.  Return True.
             value_OUT = True
             
@@ -1281,8 +2492,14 @@ class Reliability_Names( models.Model ):
         field_value = None
         field_type = ""
         
-        # make field/column name.
-        field_name = self.build_field_name( index_IN, field_name_suffix_IN )
+        # make field/column name (precomputed attribute name if we have it,
+        #     so coder foreign key is checked by ID).
+        field_name = self.INDEX_SUFFIX_TO_ATTNAME_MAP.get( ( index_IN, field_name_suffix_IN ), None )
+        if ( field_name is None ):
+        
+            field_name = self.build_field_name( index_IN, field_name_suffix_IN )
+            
+        #-- END check to see if precomputed --#
         
         # get field value
         field_value = getattr( self, field_name )
@@ -1441,6 +2658,113 @@ class Reliability_Names( models.Model ):
         return is_empty_OUT
         
     #-- END method is_index_empty() --#
+
+
+    def save( self, *args, **kwargs ):
+        
+        '''
+        Updates the stored disagreement flags, then calls parent save().  If
+            update_fields is passed, adds the flag fields to it.
+        '''
+        
+        # declare variables
+        update_fields = None
+        
+        # update flags.
+        self.update_disagreement_flags()
+        
+        # limited to certain fields?
+        update_fields = kwargs.get( "update_fields", None )
+        if ( update_fields is not None ):
+        
+            # yes - include flags.
+            update_fields = list( update_fields )
+            update_fields.extend( self.get_disagree_field_name_list() )
+            kwargs[ "update_fields" ] = update_fields
+            
+        #-- END check to see if update_fields --#
+        
+        # call parent save().
+        super( Reliability_Names, self ).save( *args, **kwargs )
+        
+    #-- END method save() --#
+
+
+    def update_disagreement_flags( self ):
+        
+        '''
+        Computes the stored disagreement flags from the coder fields and sets
+            them in this instance (does not save).  For each agreement suffix,
+            sets bit ( index - 1 ) in the suffix's mask if the coder at index
+            has a value that is not None and differs from a non-None value of
+            a lower coder (so coders 1 through N disagree if any of the lowest
+            N bits is set - same as the pairwise "!=" comparisons in
+            lookup_disagreements()'s raw SQL, where NULL never disagrees with
+            anything).  Then sets the disagree_coder_count and
+            disagree_optional_coder_count fields to the lowest coder count
+            that has a disagreement, 0 if none.  Called by save(), and needs
+            to be called before bulk_create() or bulk_update().
+        '''
+        
+        # declare variables
+        suffix_list = None
+        coder_value_matrix = None
+        suffix_position = -1
+        field_name_suffix = ""
+        seen_value_set = None
+        current_index = -1
+        current_value = None
+        current_mask = 0
+        default_mask = 0
+        all_mask = 0
+        
+        # all values, one pass.
+        suffix_list = self.DEFAULT_AGREEMENT_FIELD_SUFFIX_LIST + self.OPTIONAL_AGREEMENT_FIELD_SUFFIX_LIST
+        coder_value_matrix = self.get_coder_value_matrix( suffix_list )
+        
+        # loop over suffixes.
+        default_mask = 0
+        all_mask = 0
+        for suffix_position, field_name_suffix in enumerate( suffix_list ):
+        
+            # compare each coder to the non-None values of lower coders.
+            current_mask = 0
+            seen_value_set = set()
+            for current_index in range( 1, self.MAX_INDEX + 1 ):
+            
+                current_value = coder_value_matrix[ current_index - 1 ][ suffix_position ]
+                if ( current_value is not None ):
+                
+                    if ( len( seen_value_set - { current_value } ) > 0 ):
+                    
+                        current_mask |= ( 1 << ( current_index - 1 ) )
+                        
+                    #-- END check to see if different from a lower coder --#
+                    
+                    seen_value_set.add( current_value )
+                    
+                #-- END check to see if value is None --#
+                
+            #-- END loop over indexes --#
+            
+            setattr( self, self.build_disagree_field_name( field_name_suffix ), current_mask )
+            
+            # combined masks
+            all_mask |= current_mask
+            if ( field_name_suffix in self.DEFAULT_AGREEMENT_FIELD_SUFFIX_LIST ):
+            
+                default_mask |= current_mask
+                
+            #-- END check to see if default suffix --#
+            
+        #-- END loop over suffixes --#
+        
+        # lowest coder count with a disagreement is position of lowest set bit
+        #     plus 1 ( ( mask & -mask ) isolates lowest set bit; 0 if none ).
+        self.disagree_coder_count = ( default_mask & -default_mask ).bit_length()
+        self.disagree_optional_coder_count = ( all_mask & -all_mask ).bit_length()
+        
+    #-- END method update_disagreement_flags() --#
      
 
 #= END Reliability_Names model ===============================================#
@@ -1472,6 +2796,29 @@ class Reliability_Names_Eval( models.Model ):
     # default status message
     STATUS_MESSAGE_DEFAULT = "MISSED"
     
+    # batch size for bulk_create() in create_from_reliability_names_list().
+    DEFAULT_BULK_BATCH_SIZE = 1000
+    
+    # keys in map returned by load_related_for_reliability_names_list(), and
+    #     the Reliability_Names fields it reads for each coder.
+    RELATED_MAP_KEY_ARTICLE_DATA = "article_data"
+    RELATED_MAP_KEY_ARTICLE_AUTHOR = "article_author"
+    RELATED_MAP_KEY_ARTICLE_SUBJECT = "article_subject"
+    RELATED_FIELD_NAME_SUFFIX_LIST = [
+        Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID,
+        Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE,
+        Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_PERSON_ID
+    ]
+    
+    # rendered detail and summary strings - types, and LRU cache used by
+    #     build_strings_for_rn_id_list(), keyed on ( Reliability_Names ID,
+    #     last_modified, Reliability_Names_Eval ID, rendering options ).
+    RENDER_TYPE_DETAIL = "detail"
+    RENDER_TYPE_SUMMARY = "summary"
+    DEFAULT_RENDER_CACHE_MAX_SIZE = 10000
+    render_cache = LRUCache()
+    render_cache_max_size = DEFAULT_RENDER_CACHE_MAX_SIZE
+    
     # event type
     EVENT_TYPE_DELETE = "delete"
     EVENT_TYPE_MERGE = "merge"
@@ -1583,6 +2930,10 @@ class Reliability_Names_Eval( models.Model ):
     class Meta:
         ordering = [ '-last_modified' ]
         #ordering = [ 'id', 'label', 'article', 'person_name', 'status' ]
+        indexes = [
+            models.Index( fields = [ "label", "event_type", "status" ], name = "rne_label_event_status_idx" ),
+            models.Index( fields = [ "-last_modified" ], name = "rne_last_modified_idx" ),
+        ]
 
 
     #----------------------------------------------------------------------------
@@ -1591,209 +2942,315 @@ class Reliability_Names_Eval( models.Model ):
 
 
     @classmethod
-    def build_detail_string_from_rn_id( cls,
-                                        reliability_names_id_IN,
-                                        delimiter_IN = "|",
-                                        prefix_IN = "| ",
-                                        suffix_IN = " |",
-                                        default_status_IN = "CORRECT",
-                                        protocol_IN = "http",
-                                        host_IN = "research.local",
-                                        app_path_IN = "research/",
-                                        rne_instance_IN = None ):
-    
+    def build_detail_string_from_rn_id( cls,
+                                        reliability_names_id_IN,
+                                        delimiter_IN = "|",
+                                        prefix_IN = "| ",
+                                        suffix_IN = " |",
+                                        default_status_IN = "CORRECT",
+                                        protocol_IN = "http",
+                                        host_IN = "research.local",
+                                        app_path_IN = "research/",
+                                        rne_instance_IN = None,
+                                        reliability_names_instance_IN = None,
+                                        related_map_IN = None ):
+    
+        '''
+        Accepts Reliability_Names instance, and optional delimiter, prefix, and
+            suffix.  Retrieves the Article_Data, and Article_Subject(s) that the
+            Reliability_Name refers to.  Uses information from all to build a detail
+            string.  If the Reliability_Names instance and/or a map from
+            load_related_for_reliability_names_list() are passed in, uses them
+            rather than retrieving rows.  For many rows at once, see
+            build_strings_for_rn_id_list().
+        '''
+        
+        # return reference
+        detail_string_OUT = None
+        
+        # declare variables
+        reliability_names_id = -1
+        reliability_names_qs = None
+        reliability_names_instance = None
+        related_map = None
+        
+        # get information for output
+        reliability_names_id = reliability_names_id_IN
+        if ( ( reliability_names_id is not None ) and ( reliability_names_id > 0 ) ):
+        
+            # get Reliability_Names instane.
+            if ( reliability_names_instance_IN is not None ):
+            
+                # instance passed in.  Use it.
+                reliability_names_instance = reliability_names_instance_IN
+                
+            else:
+            
+                reliability_names_qs = Reliability_Names.objects.all()
+                reliability_names_instance = reliability_names_qs.get( pk = reliability_names_id )
+                
+            #-- END check to see if instance passed in --#
+            
+            # get related rows.
+            related_map = related_map_IN
+            if ( related_map is None ):
+            
+                related_map = cls.load_related_for_reliability_names_list( [ reliability_names_instance ] )
+                
+            #-- END check to see if related map passed in --#
+            
+            # render
+            detail_string_OUT = cls.render_detail_string(
+                    reliability_names_instance,
+                    related_map,
+                    delimiter_IN = delimiter_IN,
+                    prefix_IN = prefix_IN,
+                    suffix_IN = suffix_IN,
+                    default_status_IN = default_status_IN,
+                    protocol_IN = protocol_IN,
+                    host_IN = host_IN,
+                    app_path_IN = app_path_IN,
+                    rne_instance_IN = rne_instance_IN
+                )
+    
+        else:
+        
+            # no ID passed in.  Return None.
+            detail_string_OUT = None
+        
+        #-- END check to see if Reliabilty_Names ID passed in. --#
+        
+        return detail_string_OUT
+    
+    #-- END method build_detail_string_from_rn_id() --#
+
+
+    @classmethod
+    def build_strings_for_rn_id_list( cls,
+                                      reliability_names_id_list_IN,
+                                      render_type_IN = RENDER_TYPE_DETAIL,
+                                      delimiter_IN = "|",
+                                      prefix_IN = "| ",
+                                      suffix_IN = " |",
+                                      default_status_IN = "CORRECT",
+                                      protocol_IN = "http",
+                                      host_IN = "research.local",
+                                      app_path_IN = "research/",
+                                      default_error_IN = "MISSED",
+                                      rne_instance_map_IN = None,
+                                      use_cache_IN = True ):
+        
+        '''
+        Accepts list of Reliability_Names IDs, render type (RENDER_TYPE_DETAIL
+            or RENDER_TYPE_SUMMARY), the same rendering options as
+            build_detail_string_from_rn_id() and
+            build_summary_string_from_rn_id(), and an optional map of
+            Reliability_Names ID to Reliability_Names_Eval (for the admin link).
+            Renders a string for each ID:
+            - gets ID and last_modified of all the rows in one query.
+            - if use_cache_IN, returns strings already in the render cache for
+                the same ID, last_modified, Eval, and options.
+            - loads the rest, and all their related rows, in a few queries,
+                renders them, and adds them to the cache.
+            Returns OrderedDict of ID to string, in ID list order (None for IDs
+            with no row).
+
+        Postconditions: cache holds at most render_cache_max_size strings, least
+            recently used dropped first.  Edits to a Reliability_Names row
+            change its last_modified, so are picked up, but edits to its
+            Article_Data or Article_Person are not - use clear_render_cache().
+        '''
+        
+        # return reference
+        map_OUT = collections.OrderedDict()
+        
+        # declare variables
+        me = "build_strings_for_rn_id_list"
+        option_tuple = None
+        last_modified_map = None
+        reliability_names_id = -1
+        rne_instance = None
+        rne_id = None
+        cache_key = None
+        cached_string = None
+        miss_id_list = []
+        reliability_names_list = None
+        related_map = None
+        reliability_names_instance = None
+        rendered_string = None
+        
+        # options that change the output are part of the cache key.
+        option_tuple = ( render_type_IN, delimiter_IN, prefix_IN, suffix_IN, default_status_IN, protocol_IN, host_IN, app_path_IN, default_error_IN )
+        
+        # IDs and last modified dates, one query.
+        last_modified_map = dict( Reliability_Names.objects.filter( pk__in = list( set( reliability_names_id_list_IN ) ) ).values_list( "id", "last_modified" ) )
+        
+        # check cache.
+        for reliability_names_id in reliability_names_id_list_IN:
+        
+            map_OUT[ reliability_names_id ] = None
+            if ( reliability_names_id in last_modified_map ):
+            
+                cached_string = None
+                if ( use_cache_IN == True ):
+                
+                    rne_id = cls.get_rne_id_from_map( rne_instance_map_IN, reliability_names_id )
+                    cache_key = ( reliability_names_id, last_modified_map[ reliability_names_id ], rne_id, option_tuple )
+                    cached_string = cls.get_cached_render_string( cache_key )
+                    
+                #-- END check to see if using cache --#
+                
+                if ( cached_string is not None ):
+                
+                    map_OUT[ reliability_names_id ] = cached_string
+                    
+                else:
+                
+                    miss_id_list.append( reliability_names_id )
+                    
+                #-- END check to see if cached --#
+                
+            #-- END check to see if row for ID --#
+            
+        #-- END loop over IDs --#
+        
+        # render the rest.
+        if ( len( miss_id_list ) > 0 ):
+        
+            reliability_names_list = Reliability_Names.load_instance_list( miss_id_list )
+            related_map = cls.load_related_for_reliability_names_list( reliability_names_list )
+            for reliability_names_instance in reliability_names_list:
+            
+                reliability_names_id = reliability_names_instance.id
+                rne_instance = None
+                if ( rne_instance_map_IN is not None ):
+                
+                    rne_instance = rne_instance_map_IN.get( reliability_names_id, None )
+                    
+                #-- END check to see if Eval map --#
+                
+                if ( render_type_IN == cls.RENDER_TYPE_SUMMARY ):
+                
+                    rendered_string = cls.render_summary_string( reliability_names_instance,
+                                                                 related_map,
+                                                                 delimiter_IN = delimiter_IN,
+                                                                 prefix_IN = prefix_IN,
+                                                                 suffix_IN = suffix_IN,
+                                                                 default_status_IN = default_status_IN,
+                                                                 protocol_IN = protocol_IN,
+                                                                 host_IN = host_IN,
+                                                                 app_path_IN = app_path_IN,
+                                                                 default_error_IN = default_error_IN,
+                                                                 rne_instance_IN = rne_instance )
+                    
+                else:
+                
+                    rendered_string = cls.render_detail_string( reliability_names_instance,
+                                                                related_map,
+                                                                delimiter_IN = delimiter_IN,
+                                                                prefix_IN = prefix_IN,
+                                                                suffix_IN = suffix_IN,
+                                                                default_status_IN = default_status_IN,
+                                                                protocol_IN = protocol_IN,
+                                                                host_IN = host_IN,
+                                                                app_path_IN = app_path_IN,
+                                                                rne_instance_IN = rne_instance )
+                    
+                #-- END check to see which type of string --#
+                
+                map_OUT[ reliability_names_id ] = rendered_string
+                
+                # cache it.
+                if ( use_cache_IN == True ):
+                
+                    rne_id = cls.get_rne_id_from_map( rne_instance_map_IN, reliability_names_id )
+                    cache_key = ( reliability_names_id, reliability_names_instance.last_modified, rne_id, option_tuple )
+                    cls.set_cached_render_string( cache_key, rendered_string )
+                    
+                #-- END check to see if using cache --#
+                
+            #-- END loop over rows to render --#
+            
+        #-- END check to see if any not cached --#
+        
+        return map_OUT
+    
+    #-- END classmethod build_strings_for_rn_id_list() --#
+
+
+    @classmethod
+    def build_summary_string_from_rn_id( cls,
+                                         reliability_names_id_IN,
+                                         delimiter_IN = "|",
+                                         prefix_IN = "| ",
+                                         suffix_IN = " |",
+                                         default_status_IN = "CORRECT",
+                                         protocol_IN = "http",
+                                         host_IN = "research.local",
+                                         app_path_IN = "research/",
+                                         default_error_IN = "MISSED",
+                                         rne_instance_IN = None,
+                                         reliability_names_instance_IN = None,
+                                         related_map_IN = None ):
+        
         '''
         Accepts Reliability_Names instance, and optional delimiter, prefix, and
             suffix.  Retrieves the Article_Data, and Article_Subject(s) that the
-            Reliability_Name refers to.  Uses information from all to build a detail
-            string. 
+            Reliability_Name refers to.  Uses information from all to build a 
+            delimited summary string.  If the Reliability_Names instance and/or
+            a map from load_related_for_reliability_names_list() are passed in,
+            uses them rather than retrieving rows.  For many rows at once, see
+            build_strings_for_rn_id_list().
         '''
         
         # return reference
         detail_string_OUT = None
         
         # declare variables
-        rne_instance = None
-        detail_string_list = []
-        detail_string = ""
         reliability_names_id = -1
         reliability_names_qs = None
         reliability_names_instance = None
-        related_article = None
-        article_id = -1
-        index_list = []
-        current_index = -1
-        
-        # declare variables - retrieve information from Reliability_Names row.
-        current_suffix = ""
-        article_data_id = -1
-        article_data_qs = None
-        article_data_instance = None
-        person_type_column_name = ""
-        person_type = ""
-        article_person_id_column_name = ""
-        article_person_id = -1
-        article_person_qs = None
-        article_person_instance = None
-        person_name = None
-        person_verbatim_name = None
-        person_lookup_name = None
-        person_title = None
-        person_organization = None
-        
-        # do we have Reliability_Names_Eval (rne) instance?
-        if ( rne_instance_IN is not None ):
-        
-            # we do.  Use it.
-            rne_instance = rne_instance_IN
-            
-        #-- END check to see if Reliability_Names_Eval instance --#
+        related_map = None
         
         # get information for output
         reliability_names_id = reliability_names_id_IN
         if ( ( reliability_names_id is not None ) and ( reliability_names_id > 0 ) ):
         
             # get Reliability_Names instane.
-            reliability_names_qs = Reliability_Names.objects.all()
-            reliability_names_instance = reliability_names_qs.get( pk = reliability_names_id )
+            if ( reliability_names_instance_IN is not None ):
             
-            # get related article.
-            related_article = reliability_names_instance.article
-            article_id = related_article.id
+                # instance passed in.  Use it.
+                reliability_names_instance = reliability_names_instance_IN
+                
+            else:
             
-            # Get info for all with related Article_Data.
+                reliability_names_qs = Reliability_Names.objects.all()
+                reliability_names_instance = reliability_names_qs.get( pk = reliability_names_id )
+                
+            #-- END check to see if instance passed in --#
             
-            # initialize
-            index_list = [ 1, 2, 3, 4, 5, 6, 7, 8, 9, 10 ]
-            for current_index in index_list:
+            # get related rows.
+            related_map = related_map_IN
+            if ( related_map is None ):
             
-                # see if there is an Article_Data ID.
-                current_suffix = Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID
-                article_data_id = reliability_names_instance.get_field_value( current_index, current_suffix )
-                if ( article_data_id is not None ):
-                
-                    # we have an ID value, try to get Article_Data...
-                    article_data_qs = Article_Data.objects.all()
-                    article_data_instance = article_data_qs.get( pk = article_data_id )
-                    
-                    # ...person_type...
-                    current_suffix = Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE
-                    person_type = reliability_names_instance.get_field_value( current_index, current_suffix )
-    
-                    # ...and based on Type, Article_Subject or Article_Author.
-                    # is there also a person ID?
-                    current_suffix = Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_PERSON_ID
-                    article_person_id = reliability_names_instance.get_field_value( current_index, current_suffix )
-                    if ( ( article_person_id is not None ) and ( article_person_id > 0 ) ):
-                    
-                        # get Article_Subject or Article_Author
-                        if ( person_type == Reliability_Names.PERSON_TYPE_AUTHOR ):
-                        
-                            # author.
-                            article_person_qs = Article_Author.objects.all()
-                            article_person_instance = article_person_qs.get( pk = article_person_id )
-                            
-                        elif ( ( person_type == Reliability_Names.SUBJECT_TYPE_MENTIONED )
-                            or ( person_type == Reliability_Names.SUBJECT_TYPE_QUOTED ) ):
-                            
-                            # subject.
-                            article_person_qs = Article_Subject.objects.all()
-                            article_person_instance = article_person_qs.get( pk = article_person_id )
-                        
-                        else:
-                        
-                            article_person_instance = None
-    
-                        #-- END check of person type. --#
-                    
-                    #-- END check to see if article_person_id --#
-                
-                    # build detail string.
-                    detail_string = prefix_IN
-                    
-                    # ==> Reliability_Names_Eval ID?
-                    if ( rne_instance is not None ):
-
-                        # make it a link
-                        # example: http://research.local/research/admin/context_analysis/reliability_names_eval/6/change/
-                        detail_string += "<a href=\""
-                        detail_string += str( protocol_IN ) + "://"
-                        detail_string += str( host_IN ) + "/" + str( app_path_IN )
-                        detail_string += "admin/context_analysis/reliability_names_eval/"
-                        detail_string += str( rne_instance.id )
-                        detail_string += "/change/\">"
-                        detail_string += str( rne_instance.id )
-                        detail_string += "</a>"
-                        
-                        # and add a delimiter
-                        detail_string += " " + delimiter_IN + " "
-                        
-                    #-- END check to see if Reliability_Names_Eval ID --#
-            
-                    # ==> Reliability_Names ID
-                    detail_string += str( reliability_names_id )
-                    detail_string += " " + delimiter_IN + " "
-                    
-                    # ==> Article ID and link
-                    detail_string += "Article ["
-                    detail_string += str( article_id )
-                    detail_string += "](" + str( protocol_IN ) + "://" + str( host_IN ) + "/" + str( app_path_IN ) + "context/text/article/article_data/view_with_text/?article_id="
-                    detail_string += str( article_id )
-                    detail_string += ")"
-                    detail_string += " " + delimiter_IN + " "
-
-                    # ==> Article_Data ID and link
-                    detail_string += "Article_Data ["
-                    detail_string += str( article_data_id )
-                    detail_string += "](" + str( protocol_IN ) + "://" + str( host_IN ) + "/" + str( app_path_IN ) + "context/text/article/article_data/view/?article_id="
-                    detail_string += str( article_id )
-                    detail_string += "&article_data_id_select="
-                    detail_string += str( article_data_id )
-                    detail_string += ") " + delimiter_IN + " "
-                    
-                    # ==> Person instance
-                    detail_string += StringHelper.object_to_unicode_string( article_person_instance )
-                    
-                    #------------------------------------------#
-                    # got a name?
-                    person_name = article_person_instance.name
-                    if ( ( person_name is not None ) and ( person_name != "" ) ):
-                        detail_string += " ==> name: " + person_name
-                    #-- END check to see if name captured. --#
-                    
-                    # lookup name different from verbatim name?
-                    person_verbatim_name = article_person_instance.verbatim_name
-                    person_lookup_name = article_person_instance.lookup_name
-                    if ( ( person_lookup_name is not None ) and ( person_lookup_name != "" ) and ( person_lookup_name != person_verbatim_name ) ):
-                        detail_string += " ====> verbatim name: " + person_verbatim_name
-                        detail_string += " ====> lookup name: " + person_lookup_name
-                    #-- END check to see if name captured. --#
-                    
-                    person_title = article_person_instance.title
-                    if ( ( person_title is not None ) and ( person_title != "" ) ):
-                        detail_string += " ==> title: " + person_title
-                    #-- END check to see if name captured. --#
-                    
-                    # got an organization string?
-                    person_organization = article_person_instance.organization_string
-                    if ( ( person_organization is not None ) and ( person_organization != "" ) ):
-                        detail_string += " ==> organization: " + person_organization
-                    #-- END check to see if name captured. --#
-                    
-                    # add status
-                    detail_string += " " + delimiter_IN + " " + default_status_IN
-    
-                    detail_string += suffix_IN
-                    
-                    # add to list
-                    detail_string_list.append( detail_string )
+                related_map = cls.load_related_for_reliability_names_list( [ reliability_names_instance ] )
                 
-                #-- END check to see if Article_Data ID. --#
-                            
-            #-- END loop over indexes. --#
+            #-- END check to see if related map passed in --#
             
-            # tie all populated together.
-            detail_string_OUT = "\n".join( detail_string_list )
+            # render
+            detail_string_OUT = cls.render_summary_string(
+                    reliability_names_instance,
+                    related_map,
+                    delimiter_IN = delimiter_IN,
+                    prefix_IN = prefix_IN,
+                    suffix_IN = suffix_IN,
+                    default_status_IN = default_status_IN,
+                    protocol_IN = protocol_IN,
+                    host_IN = host_IN,
+                    app_path_IN = app_path_IN,
+                    default_error_IN = default_error_IN,
+                    rne_instance_IN = rne_instance_IN
+                )
     
         else:
         
@@ -1804,221 +3261,302 @@ class Reliability_Names_Eval( models.Model ):
         
         return detail_string_OUT
     
-    #-- END method build_detail_string_from_rn_id() --#
+    #-- END method build_summary_string_from_rn_id() --#
 
 
     @classmethod
-    def build_summary_string_from_rn_id( cls,
-                                         reliability_names_id_IN,
-                                         delimiter_IN = "|",
-                                         prefix_IN = "| ",
-                                         suffix_IN = " |",
-                                         default_status_IN = "CORRECT",
-                                         protocol_IN = "http",
-                                         host_IN = "research.local",
-                                         app_path_IN = "research/",
-                                         default_error_IN = "MISSED",
-                                         rne_instance_IN = None ):
+    def clear_render_cache( cls, reliability_names_id_IN = None ):
         
         '''
-        Accepts Reliability_Names instance, and optional delimiter, prefix, and
-            suffix.  Retrieves the Article_Data, and Article_Subject(s) that the
-            Reliability_Name refers to.  Uses information from all to build a 
-            delimited summary string.
+        Invalidates the render cache used by build_strings_for_rn_id_list().
+            If a Reliability_Names ID is passed in, removes just that row's
+            strings.  If not, clears the whole cache.
+        '''
+        
+        # ID passed in?
+        if ( reliability_names_id_IN is not None ):
+        
+            # yes - just remove that row's strings.
+            cls.render_cache.pop_matching( lambda cache_key : cache_key[ 0 ] == reliability_names_id_IN )
+            
+        else:
+        
+            # no - clear everything.
+            cls.render_cache.clear()
+            
+        #-- END check to see if ID --#
+        
+    #-- END classmethod clear_render_cache() --#
+
+
+    @classmethod
+    def get_cached_render_string( cls, cache_key_IN ):
+        
+        '''
+        Accepts render cache key.  Returns cached string (and marks it most
+            recently used), or None if not cached.
+        '''
+        
+        # return reference
+        value_OUT = None
+        
+        value_OUT = cls.render_cache.get( cache_key_IN )
+        
+        return value_OUT
+        
+    #-- END classmethod get_cached_render_string() --#
+
+
+    @classmethod
+    def get_rne_id_from_map( cls, rne_instance_map_IN, reliability_names_id_IN ):
+        
+        '''
+        Accepts optional map of Reliability_Names ID to Reliability_Names_Eval
+            and a Reliability_Names ID.  Returns ID of the Eval for that row,
+            or None if no map or no Eval.
+        '''
+        
+        # return reference
+        value_OUT = None
+        
+        # declare variables
+        rne_instance = None
+        
+        if ( rne_instance_map_IN is not None ):
+        
+            rne_instance = rne_instance_map_IN.get( reliability_names_id_IN, None )
+            if ( rne_instance is not None ):
+            
+                value_OUT = rne_instance.id
+                
+            #-- END check to see if Eval for ID --#
+            
+        #-- END check to see if map --#
+        
+        return value_OUT
+        
+    #-- END classmethod get_rne_id_from_map() --#
+
+
+    @classmethod
+    def render_detail_string( cls,
+                              reliability_names_instance_IN,
+                              related_map_IN,
+                              delimiter_IN = "|",
+                              prefix_IN = "| ",
+                              suffix_IN = " |",
+                              default_status_IN = "CORRECT",
+                              protocol_IN = "http",
+                              host_IN = "research.local",
+                              app_path_IN = "research/",
+                              rne_instance_IN = None ):
+        
+        '''
+        Accepts Reliability_Names instance, map from
+            load_related_for_reliability_names_list() that includes its related
+            rows, and the rendering options of build_detail_string_from_rn_id().
+            Builds the detail string - one line per coder with Article_Data -
+            from lists of parts joined once, with no database access.  Returns
+            the string.
         '''
         
         # return reference
         detail_string_OUT = None
         
         # declare variables
-        detail_string_list = []
-        detail_string = ""
         reliability_names_id = -1
-        reliability_names_qs = None
-        reliability_names_instance = None
-        person_name = ""
-        related_article = None
         article_id = -1
-        index_list = []
-        current_index = -1
-        
-        # declare variables - retrieve information from Reliability_Names row.
-        current_suffix = ""
+        base_url = ""
+        separator = ""
+        line_prefix = ""
+        detail_string_list = []
+        part_list = None
         article_data_id = -1
-        article_data_qs = None
-        article_data_instance = None
-        article_data_coder_id = -1
-        article_data_id_list = []
-        person_type_column_name = ""
         person_type = ""
-        article_person_id_column_name = ""
         article_person_id = -1
-        article_person_qs = None
         article_person_instance = None
+        person_name = None
+        person_verbatim_name = None
+        person_lookup_name = None
+        person_title = None
+        person_organization = None
         
-        # declare variables - output rendering.
-        article_data_link_list = []
-        article_data_link = ""
+        # shared values
+        reliability_names_id = reliability_names_instance_IN.id
+        article_id = reliability_names_instance_IN.article_id
+        base_url = str( protocol_IN ) + "://" + str( host_IN ) + "/" + str( app_path_IN )
+        separator = " " + delimiter_IN + " "
         
-        # do we have Reliability_Names_Eval (rne) instance?
+        # start of each line is the same: prefix, Reliability_Names_Eval link,
+        #     Reliability_Names ID, and Article link.
+        part_list = [ prefix_IN ]
         if ( rne_instance_IN is not None ):
-        
-            # we do.  Use it.
-            rne_instance = rne_instance_IN
+
+            # example: http://research.local/research/admin/context_analysis/reliability_names_eval/6/change/
+            part_list.extend( [ "<a href=\"", base_url, "admin/context_analysis/reliability_names_eval/", str( rne_instance_IN.id ), "/change/\">", str( rne_instance_IN.id ), "</a>", separator ] )
             
-        #-- END check to see if Reliability_Names_Eval instance --#
+        #-- END check to see if Reliability_Names_Eval --#
         
-        # get information for output
-        reliability_names_id = reliability_names_id_IN
-        if ( ( reliability_names_id is not None ) and ( reliability_names_id > 0 ) ):
+        part_list.extend( [ str( reliability_names_id ), separator ] )
+        part_list.extend( [ "Article [", str( article_id ), "](", base_url, "context/text/article/article_data/view_with_text/?article_id=", str( article_id ), ")", separator ] )
+        line_prefix = "".join( part_list )
         
-            # get Reliability_Names instane.
-            reliability_names_qs = Reliability_Names.objects.all()
-            reliability_names_instance = reliability_names_qs.get( pk = reliability_names_id )
-
-            # get person name
-            person_name = reliability_names_instance.person_name
-            
-            # get related article.
-            related_article = reliability_names_instance.article
-            article_id = related_article.id
-            
-            # Get list of related Article_Data ids.
-            article_data_id_list = []
-            article_data_link_list = []
-            
-            # initialize
-            index_list = [ 1, 2, 3, 4, 5, 6, 7, 8, 9, 10 ]
-            for current_index in index_list:
-            
-                # see if there is an Article_Data ID.
-                current_suffix = Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID
-                article_data_id = reliability_names_instance.get_field_value( current_index, current_suffix )
-                if ( article_data_id is not None ):
+        # one line per coder with Article_Data.
+        for article_data_id, person_type, article_person_id in reliability_names_instance_IN.get_coder_value_matrix( cls.RELATED_FIELD_NAME_SUFFIX_LIST ):
         
-                    # add to list
-                    article_data_id_list.append( article_data_id )
-    
-                    # we have an ID value, try to get Article_Data...
-                    article_data_qs = Article_Data.objects.all()
-                    article_data_instance = article_data_qs.get( pk = article_data_id )
-                    article_data_coder_id = article_data_instance.coder_id
-                    
-                    # ...person_type...
-                    current_suffix = Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE
-                    person_type = reliability_names_instance.get_field_value( current_index, current_suffix )
-    
-                    # ...and based on Type, Article_Subject or Article_Author.
-                    # is there also a person ID?
-                    current_suffix = Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_PERSON_ID
-                    article_person_id = reliability_names_instance.get_field_value( current_index, current_suffix )
-                    if ( ( article_person_id is not None ) and ( article_person_id > 0 ) ):
-                    
-                        # get Article_Subject or Article_Author
-                        if ( person_type == Reliability_Names.PERSON_TYPE_AUTHOR ):
-                        
-                            # author.
-                            article_person_qs = Article_Author.objects.all()
-                            article_person_instance = article_person_qs.get( pk = article_person_id )
-                            
-                        elif ( ( person_type == Reliability_Names.SUBJECT_TYPE_MENTIONED )
-                            or ( person_type == Reliability_Names.SUBJECT_TYPE_QUOTED ) ):
-                            
-                            # subject.
-                            article_person_qs = Article_Subject.objects.all()
-                            article_person_instance = article_person_qs.get( pk = article_person_id )
-                        
-                        else:
-                        
-                            article_person_instance = None
-    
-                        #-- END check of person type. --#
+            if ( article_data_id is not None ):
+            
+                # ==> Article_Data ID and link
+                part_list = [ line_prefix ]
+                part_list.extend( [ "Article_Data [", str( article_data_id ), "](", base_url, "context/text/article/article_data/view/?article_id=", str( article_id ), "&article_data_id_select=", str( article_data_id ), ")", separator ] )
+                
+                # ==> Person instance
+                article_person_instance = cls.get_article_person_from_related_map( related_map_IN, person_type, article_person_id )
+                part_list.append( StringHelper.object_to_unicode_string( article_person_instance ) )
+                if ( article_person_instance is not None ):
+                
+                    # got a name?
+                    person_name = article_person_instance.name
+                    if ( ( person_name is not None ) and ( person_name != "" ) ):
+                        part_list.extend( [ " ==> name: ", person_name ] )
+                    #-- END check to see if name captured. --#
                     
-                    #-- END check to see if article_person_id --#
+                    # lookup name different from verbatim name?
+                    person_verbatim_name = article_person_instance.verbatim_name
+                    person_lookup_name = article_person_instance.lookup_name
+                    if ( ( person_lookup_name is not None ) and ( person_lookup_name != "" ) and ( person_lookup_name != person_verbatim_name ) ):
+                        part_list.extend( [ " ====> verbatim name: ", person_verbatim_name, " ====> lookup name: ", person_lookup_name ] )
+                    #-- END check to see if name captured. --#
                     
-                    # create link (very basic for now):
-                    article_data_link = "[" + str( article_data_id ) + " (coder=" + str( article_data_coder_id ) + ")]"
-                    article_data_link += "(" + str( protocol_IN ) + "://" + str( host_IN ) + "/" + str( app_path_IN ) + "context/text/article/article_data/view/?article_id="
-                    article_data_link += str( article_id )
-                    article_data_link += "&article_data_id_select="
-                    article_data_link += str( article_data_id )
-                    article_data_link += ")"
+                    person_title = article_person_instance.title
+                    if ( ( person_title is not None ) and ( person_title != "" ) ):
+                        part_list.extend( [ " ==> title: ", person_title ] )
+                    #-- END check to see if name captured. --#
                     
-                    # add to list.
-                    article_data_link_list.append( article_data_link )
-    
-                #-- END check to see if Article_Data ID. --#
-                            
-            #-- END loop over indexes. --#
-            
-            # build detail string.
-            detail_string = prefix_IN
-            
-            # ==> Reliability_Names_Eval ID?
-            if ( rne_instance is not None ):
-
-                # make it a link
-                # example: http://research.local/research/admin/context_analysis/reliability_names_eval/6/change/
-                detail_string += "<a href=\""
-                detail_string += str( protocol_IN ) + "://"
-                detail_string += str( host_IN ) + "/" + str( app_path_IN )
-                detail_string += "admin/context_analysis/reliability_names_eval/"
-                detail_string += str( rne_instance.id )
-                detail_string += "/change/\">"
-                detail_string += str( rne_instance.id )
-                detail_string += "</a>"
+                    # got an organization string?
+                    person_organization = article_person_instance.organization_string
+                    if ( ( person_organization is not None ) and ( person_organization != "" ) ):
+                        part_list.extend( [ " ==> organization: ", person_organization ] )
+                    #-- END check to see if name captured. --#
+                    
+                #-- END check to see if Article_Person --#
                 
-                # and add a delimiter
-                detail_string += " " + delimiter_IN + " "
+                # add status
+                part_list.extend( [ separator, default_status_IN, suffix_IN ] )
                 
-            #-- END check to see if Reliability_Names_Eval ID --#
-            
-            # ==> Reliability_Names ID
-            detail_string += str( reliability_names_id )
-    
-            detail_string += " " + delimiter_IN + " "
-            
-            # ==> person name
-            detail_string += person_name
-            
-            detail_string += " " + delimiter_IN + " "
-    
-            # ==> Article ID and link
-            detail_string += "Article "
-            detail_string += "[" + str( article_id ) + "]"
-            detail_string += "(" + str( protocol_IN ) + "://" + str( host_IN ) + "/" + str( app_path_IN ) + "context/text/article/article_data/view_with_text/?article_id="
-            detail_string += str( article_id )
-            detail_string += ")"
-            
-            detail_string += " " + delimiter_IN + " "
-    
-            # ==> Article_Data IDs and links
-            detail_string += "Article_Data: "
-            detail_string += "; ".join( article_data_link_list )
+                # add to list
+                detail_string_list.append( "".join( part_list ) )
+                
+            #-- END check to see if Article_Data ID. --#
             
-            # ==> status
-            detail_string += " " + delimiter_IN + " " + default_status_IN
+        #-- END loop over coders --#
+        
+        # tie all populated together.
+        detail_string_OUT = "\n".join( detail_string_list )
+        
+        return detail_string_OUT
+        
+    #-- END classmethod render_detail_string() --#
+
+
+    @classmethod
+    def render_summary_string( cls,
+                               reliability_names_instance_IN,
+                               related_map_IN,
+                               delimiter_IN = "|",
+                               prefix_IN = "| ",
+                               suffix_IN = " |",
+                               default_status_IN = "CORRECT",
+                               protocol_IN = "http",
+                               host_IN = "research.local",
+                               app_path_IN = "research/",
+                               default_error_IN = "MISSED",
+                               rne_instance_IN = None ):
+        
+        '''
+        Accepts Reliability_Names instance, map from
+            load_related_for_reliability_names_list() that includes its related
+            rows, and the rendering options of
+            build_summary_string_from_rn_id().  Builds the summary string from
+            a list of parts joined once, with no database access.  Returns the
+            string.
+        '''
+        
+        # return reference
+        detail_string_OUT = None
+        
+        # declare variables
+        reliability_names_id = -1
+        article_id = -1
+        base_url = ""
+        separator = ""
+        article_data_map = None
+        article_data_link_list = []
+        coder_value_list = None
+        article_data_id = None
+        article_data_instance = None
+        article_data_coder_id = None
+        part_list = None
+        
+        # shared values
+        reliability_names_id = reliability_names_instance_IN.id
+        article_id = reliability_names_instance_IN.article_id
+        base_url = str( protocol_IN ) + "://" + str( host_IN ) + "/" + str( app_path_IN )
+        separator = " " + delimiter_IN + " "
+        
+        # Article_Data links (very basic for now).
+        article_data_map = related_map_IN[ cls.RELATED_MAP_KEY_ARTICLE_DATA ]
+        for coder_value_list in reliability_names_instance_IN.get_coder_value_matrix( [ Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID ] ):
+        
+            article_data_id = coder_value_list[ 0 ]
+            if ( article_data_id is not None ):
             
-            # ==> error
-            detail_string += " " + delimiter_IN + " " + default_error_IN
+                article_data_instance = article_data_map.get( article_data_id, None )
+                article_data_coder_id = None if ( article_data_instance is None ) else article_data_instance.coder_id
+                article_data_link_list.append( "".join( [ "[", str( article_data_id ), " (coder=", str( article_data_coder_id ), ")](", base_url, "context/text/article/article_data/view/?article_id=", str( article_id ), "&article_data_id_select=", str( article_data_id ), ")" ] ) )
+                
+            #-- END check to see if Article_Data ID. --#
             
-            # ==> notes
-            detail_string += " " + delimiter_IN + " None"
+        #-- END loop over coders --#
+        
+        # build summary string.
+        part_list = [ prefix_IN ]
+        
+        # ==> Reliability_Names_Eval ID?
+        if ( rne_instance_IN is not None ):
+
+            # example: http://research.local/research/admin/context_analysis/reliability_names_eval/6/change/
+            part_list.extend( [ "<a href=\"", base_url, "admin/context_analysis/reliability_names_eval/", str( rne_instance_IN.id ), "/change/\">", str( rne_instance_IN.id ), "</a>", separator ] )
             
-            detail_string += suffix_IN
-    
-            detail_string_OUT = detail_string
-    
-        else:
+        #-- END check to see if Reliability_Names_Eval ID --#
         
-            # no ID passed in.  Return None.
-            detail_string_OUT = None
+        # ==> Reliability_Names ID, person name, Article ID and link
+        part_list.extend( [ str( reliability_names_id ), separator ] )
+        part_list.extend( [ str( reliability_names_instance_IN.person_name ), separator ] )
+        part_list.extend( [ "Article [", str( article_id ), "](", base_url, "context/text/article/article_data/view_with_text/?article_id=", str( article_id ), ")", separator ] )
         
-        #-- END check to see if Reliabilty_Names ID passed in. --#
+        # ==> Article_Data IDs and links, status, error, notes
+        part_list.extend( [ "Article_Data: ", "; ".join( article_data_link_list ) ] )
+        part_list.extend( [ separator, default_status_IN, separator, default_error_IN, separator, "None", suffix_IN ] )
+        
+        detail_string_OUT = "".join( part_list )
         
         return detail_string_OUT
-    
-    #-- END method build_summary_string_from_rn_id() --#
+        
+    #-- END classmethod render_summary_string() --#
+
+
+    @classmethod
+    def set_cached_render_string( cls, cache_key_IN, value_IN ):
+        
+        '''
+        Accepts render cache key and string.  Adds string to cache as most
+            recently used, then trims cache to render_cache_max_size.
+        '''
+        
+        cls.render_cache.set( cache_key_IN, value_IN, max_size_IN = cls.render_cache_max_size )
+        
+    #-- END classmethod set_cached_render_string() --#
 
 
     @classmethod
@@ -2035,42 +3573,31 @@ class Reliability_Names_Eval( models.Model ):
         '''
         Accepts Reliability_Names ID and a few optional parameters.  Uses
             information from it to populate a Reliability_Names_Eval
-            instance.
+            instance.  Related Article_Data, Article_Author, and
+            Article_Subject are loaded with one in_bulk() per type, and
+            article_datas and persons are set with one add() each.  For many
+            rows at once, see create_from_reliability_names_list().
         '''
         
         # return reference
         instance_OUT = None
         
         # declare variables
-        detail_string_list = []
-        detail_string = ""
         reliability_names_id = -1
         reliability_names_qs = None
         reliability_names_instance = None
-        related_article = None
         article_id = -1
-        index_list = []
-        current_index = -1
-        master_person_instance = None
         master_person_name = None
         
         # declare variables - retrieve information from Reliability_Names row.
-        current_suffix = ""
+        related_map = None
+        article_data_list = None
+        person_list = None
         article_data_id = -1
-        article_data_qs = None
         article_data_instance = None
-        person_type_column_name = ""
         person_type = ""
-        article_person_id_column_name = ""
         article_person_id = -1
-        article_person_qs = None
         article_person_instance = None
-        current_person = None
-        person_name = None
-        person_verbatim_name = None
-        person_lookup_name = None
-        person_title = None
-        person_organization = None
         
         # get information for output
         reliability_names_id = reliability_names_id_IN
@@ -2107,19 +3634,6 @@ class Reliability_Names_Eval( models.Model ):
 
             #-- END notes --#
             
-            # ==> tags?
-            if ( ( tag_list_IN is not None ) and ( len( tag_list_IN ) > 0 ) ):
-            
-                # loop over tags.
-                for tag_value in tag_list_IN:
-                
-                    # add tag.
-                    instance_OUT.tags.add( tag_value )
-                
-                #-- END loop over tags --#
-            
-            #-- END tags. --#
-            
             # get Reliability_Names instance.
             if ( reliability_names_instance_IN is not None ):
             
@@ -2138,20 +3652,11 @@ class Reliability_Names_Eval( models.Model ):
             instance_OUT.reliability_names = reliability_names_instance
             instance_OUT.original_reliability_names_id = reliability_names_id
 
-            # get related article.
-            related_article = reliability_names_instance.article
-            article_id = related_article.id
-            
-            # ==> related article
-            if ( related_article is not None ):
-
-                # we have a related article.  Store it.
-                instance_OUT.article = related_article
-                
-            #-- END related article --#
+            # ==> related article (by ID, so we don't load the Article)
+            article_id = reliability_names_instance.article_id
+            instance_OUT.article_id = article_id
             
             # person information
-            master_person_instance = reliability_names_instance.person
             master_person_name = reliability_names_instance.person_name
             
             # ==> person information
@@ -2164,79 +3669,62 @@ class Reliability_Names_Eval( models.Model ):
             
             # save so we can add related Article_Data and Person.
             instance_OUT.save()
-
-            # Get info for all coders that have related Article_Data.
             
-            # initialize
-            index_list = [ 1, 2, 3, 4, 5, 6, 7, 8, 9, 10 ]
-            for current_index in index_list:
+            # ==> tags (need an ID first)
+            if ( ( tag_list_IN is not None ) and ( len( tag_list_IN ) > 0 ) ):
+            
+                instance_OUT.tags.add( *tag_list_IN )
+                
+            #-- END tags. --#
+
+            # Get info for all coders that have related Article_Data - collect
+            #     the IDs across all indexes, then load each type with one
+            #     in_bulk() rather than a get() per index.
+            related_map = cls.load_related_for_reliability_names_list( [ reliability_names_instance ] )
+            article_data_list = []
+            person_list = []
+            for article_data_id, person_type, article_person_id in reliability_names_instance.get_coder_value_matrix( cls.RELATED_FIELD_NAME_SUFFIX_LIST ):
             
                 # see if there is an Article_Data ID.
-                current_suffix = Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID
-                article_data_id = reliability_names_instance.get_field_value( current_index, current_suffix )
+                article_data_instance = None
                 if ( article_data_id is not None ):
                 
-                    # we have an ID value, try to get Article_Data...
-                    article_data_qs = Article_Data.objects.all()
-                    article_data_instance = article_data_qs.get( pk = article_data_id )
+                    article_data_instance = related_map[ cls.RELATED_MAP_KEY_ARTICLE_DATA ].get( article_data_id, None )
                     
-                    # ==> Add to set of Article_Datas.
-                    instance_OUT.article_datas.add( article_data_instance )
+                #-- END check to see if Article_Data ID --#
+                
+                if ( article_data_instance is not None ):
+                
+                    # ==> Add to list of Article_Datas.
+                    article_data_list.append( article_data_instance )
                     
-                    # ...person_type...
-                    current_suffix = Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE
-                    person_type = reliability_names_instance.get_field_value( current_index, current_suffix )
-    
                     # ...and based on Type, Article_Subject or Article_Author.
-                    # is there also a person ID?
-                    current_suffix = Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_PERSON_ID
-                    article_person_id = reliability_names_instance.get_field_value( current_index, current_suffix )
-                    if ( ( article_person_id is not None ) and ( article_person_id > 0 ) ):
-                    
-                        # get Article_Subject or Article_Author
-                        if ( person_type == Reliability_Names.PERSON_TYPE_AUTHOR ):
-                        
-                            # author.
-                            article_person_qs = Article_Author.objects.all()
-                            article_person_instance = article_person_qs.get( pk = article_person_id )
-                            
-                        elif ( ( person_type == Reliability_Names.SUBJECT_TYPE_MENTIONED )
-                            or ( person_type == Reliability_Names.SUBJECT_TYPE_QUOTED ) ):
-                            
-                            # subject.
-                            article_person_qs = Article_Subject.objects.all()
-                            article_person_instance = article_person_qs.get( pk = article_person_id )
-                        
-                        else:
-                        
-                            article_person_instance = None
-    
-                        #-- END check of person type. --#
-                    
-                    #-- END check to see if article_person_id --#
-                    
-                    # got an Article_Person of one type or another?
-                    current_person = None
-                    if ( article_person_instance is not None ):
-                    
-                        current_person = article_person_instance.person
-                    
-                    #-- END check to see if Article_Person instance --#
+                    article_person_instance = cls.get_article_person_from_related_map( related_map, person_type, article_person_id )
                     
                     # ==> persons
-                    if ( current_person is not None ):
+                    if ( ( article_person_instance is not None ) and ( article_person_instance.person_id is not None ) ):
                 
-                        # add to persons.
-                        instance_OUT.persons.add( current_person )
+                        # add to list of persons (by ID, so no Person load).
+                        person_list.append( article_person_instance.person_id )
                         
                     #-- END check to see if associated person. --#
                 
-                #-- END check to see if Article_Data ID. --#
+                #-- END check to see if Article_Data. --#
                             
-            #-- END loop over indexes. --#
-
-            # and, save again, just to be sure.
-            instance_OUT.save()
+            #-- END loop over coders. --#
+            
+            # one add() per relation.
+            if ( len( article_data_list ) > 0 ):
+            
+                instance_OUT.article_datas.add( *article_data_list )
+                
+            #-- END check to see if Article_Data --#
+            
+            if ( len( person_list ) > 0 ):
+            
+                instance_OUT.persons.add( *person_list )
+                
+            #-- END check to see if persons --#
     
         else:
         
@@ -2418,13 +3906,314 @@ class Reliability_Names_Eval( models.Model ):
             # no ID passed in.  Return None.
             instance_OUT = None
         
-        #-- END check to see if Reliabilty_Names ID passed in. --#
+        #-- END check to see if Reliabilty_Names ID passed in. --#
+        
+        return instance_OUT
+    
+    #-- END method create_from_reliability_data() --#
+    
+    
+    @classmethod
+    def bulk_create_m2m_links( cls, field_name_IN, id_pair_list_IN, batch_size_IN = None ):
+        
+        '''
+        Accepts name of a ManyToManyField on this model and a list of
+            ( Reliability_Names_Eval ID, related ID ) tuples.  Creates the rows
+            in the field's through table with one bulk_create() (repeated pairs
+            are only created once).  Returns list of through instances created.
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        # declare variables
+        batch_size = None
+        m2m_field = None
+        through_model = None
+        from_attname = ""
+        to_attname = ""
+        seen_pair_set = set()
+        id_pair = None
+        
+        # batch size
+        batch_size = cls.DEFAULT_BULK_BATCH_SIZE if ( batch_size_IN is None ) else batch_size_IN
+        
+        # through model and its columns.
+        m2m_field = cls._meta.get_field( field_name_IN )
+        through_model = m2m_field.remote_field.through
+        from_attname = through_model._meta.get_field( m2m_field.m2m_field_name() ).attname
+        to_attname = through_model._meta.get_field( m2m_field.m2m_reverse_field_name() ).attname
+        
+        # build rows
+        for id_pair in id_pair_list_IN:
+        
+            if ( id_pair not in seen_pair_set ):
+            
+                seen_pair_set.add( id_pair )
+                list_OUT.append( through_model( **{ from_attname : id_pair[ 0 ], to_attname : id_pair[ 1 ] } ) )
+                
+            #-- END check to see if pair already added --#
+            
+        #-- END loop over pairs --#
+        
+        # write
+        through_model.objects.bulk_create( list_OUT, batch_size = batch_size )
+        
+        return list_OUT
+    
+    #-- END classmethod bulk_create_m2m_links() --#
+
+
+    @classmethod
+    def create_from_reliability_names_list( cls,
+                                            reliability_names_list_IN,
+                                            label_IN = None,
+                                            status_IN = "CORRECT",
+                                            status_message_IN = "MISSED",
+                                            notes_IN = None,
+                                            event_type_IN = None,
+                                            is_deleted_IN = False,
+                                            field_value_list_IN = None,
+                                            related_map_IN = None ):
+        
+        '''
+        Accepts list of Reliability_Names instances and the same optional
+            parameters as create_from_reliability_names(), plus:
+            - is_deleted_IN - if True, sets is_deleted and leaves
+                reliability_names empty, for rows about to be deleted.
+            - field_value_list_IN - optional list, parallel to the
+                Reliability_Names list, of dictionaries of field name to value
+                to set on each audit row (notes, merged_*_id, etc.).
+            - related_map_IN - map returned by
+                load_related_for_reliability_names_list().  Loaded if not
+                passed in.
+            Creates one Reliability_Names_Eval per Reliability_Names with
+            bulk_create(), then links article_datas and persons with one
+            bulk_create() each.  Call inside a transaction.  Returns list of
+            instances, in the order of the list passed in.
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        # declare variables
+        related_map = None
+        reliability_names_instance = None
+        instance = None
+        list_index = -1
+        field_value_map = None
+        field_name = ""
+        field_value = None
+        article_data_link_list = []
+        person_link_list = []
+        article_data_id = -1
+        person_type = ""
+        article_person_id = -1
+        article_person_instance = None
+        
+        # related rows
+        related_map = related_map_IN
+        if ( related_map is None ):
+        
+            related_map = cls.load_related_for_reliability_names_list( reliability_names_list_IN )
+            
+        #-- END check to see if related map passed in --#
+        
+        # build instances.
+        for list_index, reliability_names_instance in enumerate( reliability_names_list_IN ):
+        
+            instance = cls()
+            
+            # ==> status and status_message
+            instance.status = status_IN
+            instance.status_message = status_message_IN
+            
+            # ==> label, event_type, notes
+            if ( ( label_IN is not None ) and ( label_IN != "" ) ):
+
+                instance.label = label_IN
+
+            #-- END label --#
+            
+            if ( ( event_type_IN is not None ) and ( event_type_IN != "" ) ):
+
+                instance.event_type = event_type_IN
+
+            #-- END event_type --#
+            
+            if ( ( notes_IN is not None ) and ( notes_IN != "" ) ):
+
+                instance.notes = notes_IN
+
+            #-- END notes --#
+            
+            # ==> Reliability_Names information
+            if ( is_deleted_IN == True ):
+            
+                instance.reliability_names = None
+                instance.is_deleted = True
+                
+            else:
+            
+                instance.reliability_names = reliability_names_instance
+                
+            #-- END check to see if deleted --#
+            instance.original_reliability_names_id = reliability_names_instance.id
+            
+            # ==> related article and person name
+            instance.article_id = reliability_names_instance.article_id
+            if ( ( reliability_names_instance.person_name is not None ) and ( reliability_names_instance.person_name != "" ) ):
+
+                instance.person_name = reliability_names_instance.person_name
+                
+            #-- END check for person name --#
+            
+            # ==> per-row values
+            if ( field_value_list_IN is not None ):
+            
+                field_value_map = field_value_list_IN[ list_index ]
+                for field_name, field_value in six.iteritems( field_value_map ):
+                
+                    setattr( instance, field_name, field_value )
+                    
+                #-- END loop over field values --#
+                
+            #-- END check to see if per-row values --#
+            
+            list_OUT.append( instance )
+            
+        #-- END loop over Reliability_Names --#
+        
+        # write
+        cls.objects.bulk_create( list_OUT, batch_size = cls.DEFAULT_BULK_BATCH_SIZE )
+        
+        # Article_Data and Person links for all coders that have related
+        #     Article_Data.
+        for reliability_names_instance, instance in zip( reliability_names_list_IN, list_OUT ):
+        
+            for article_data_id, person_type, article_person_id in reliability_names_instance.get_coder_value_matrix( cls.RELATED_FIELD_NAME_SUFFIX_LIST ):
+            
+                if ( ( article_data_id is not None ) and ( article_data_id in related_map[ cls.RELATED_MAP_KEY_ARTICLE_DATA ] ) ):
+                
+                    # ==> article_datas
+                    article_data_link_list.append( ( instance.id, article_data_id ) )
+                    
+                    # ==> persons
+                    article_person_instance = cls.get_article_person_from_related_map( related_map, person_type, article_person_id )
+                    if ( ( article_person_instance is not None ) and ( article_person_instance.person_id is not None ) ):
+                    
+                        person_link_list.append( ( instance.id, article_person_instance.person_id ) )
+                        
+                    #-- END check to see if associated person. --#
+                
+                #-- END check to see if Article_Data ID. --#
+                
+            #-- END loop over coders --#
+            
+        #-- END loop over Reliability_Names --#
+        
+        cls.bulk_create_m2m_links( "article_datas", article_data_link_list )
+        cls.bulk_create_m2m_links( "persons", person_link_list )
+        
+        return list_OUT
+    
+    #-- END classmethod create_from_reliability_names_list() --#
+
+
+    @classmethod
+    def get_article_person_from_related_map( cls, related_map_IN, person_type_IN, article_person_id_IN ):
+        
+        '''
+        Accepts map returned by load_related_for_reliability_names_list(),
+            person type, and Article_Person ID.  Returns Article_Author (author)
+            or Article_Subject (mentioned or quoted subject) from the map, or
+            None if no ID, other type, or not in map.
+        '''
+        
+        # return reference
+        instance_OUT = None
+        
+        if ( ( article_person_id_IN is not None ) and ( article_person_id_IN > 0 ) ):
+        
+            if ( person_type_IN == Reliability_Names.PERSON_TYPE_AUTHOR ):
+            
+                instance_OUT = related_map_IN[ cls.RELATED_MAP_KEY_ARTICLE_AUTHOR ].get( article_person_id_IN, None )
+                
+            elif ( ( person_type_IN == Reliability_Names.SUBJECT_TYPE_MENTIONED )
+                or ( person_type_IN == Reliability_Names.SUBJECT_TYPE_QUOTED ) ):
+                
+                instance_OUT = related_map_IN[ cls.RELATED_MAP_KEY_ARTICLE_SUBJECT ].get( article_person_id_IN, None )
+                
+            #-- END check of person type. --#
+            
+        #-- END check to see if article_person_id --#
+        
+        return instance_OUT
+    
+    #-- END classmethod get_article_person_from_related_map() --#
+
+
+    @classmethod
+    def load_related_for_reliability_names_list( cls, reliability_names_list_IN ):
+        
+        '''
+        Accepts list of Reliability_Names instances.  Collects the
+            Article_Data, Article_Author, and Article_Subject IDs across all
+            their coders, then loads each type with one in_bulk() query.
+            Returns map of RELATED_MAP_KEY_* to map of ID to instance.
+        '''
+        
+        # return reference
+        map_OUT = {}
+        
+        # declare variables
+        article_data_id_set = set()
+        article_author_id_set = set()
+        article_subject_id_set = set()
+        reliability_names_instance = None
+        article_data_id = -1
+        person_type = ""
+        article_person_id = -1
+        
+        # collect IDs.
+        for reliability_names_instance in reliability_names_list_IN:
+        
+            for article_data_id, person_type, article_person_id in reliability_names_instance.get_coder_value_matrix( cls.RELATED_FIELD_NAME_SUFFIX_LIST ):
+            
+                if ( article_data_id is not None ):
+                
+                    article_data_id_set.add( article_data_id )
+                    if ( ( article_person_id is not None ) and ( article_person_id > 0 ) ):
+                    
+                        if ( person_type == Reliability_Names.PERSON_TYPE_AUTHOR ):
+                        
+                            article_author_id_set.add( article_person_id )
+                            
+                        elif ( ( person_type == Reliability_Names.SUBJECT_TYPE_MENTIONED )
+                            or ( person_type == Reliability_Names.SUBJECT_TYPE_QUOTED ) ):
+                            
+                            article_subject_id_set.add( article_person_id )
+                            
+                        #-- END check of person type. --#
+                        
+                    #-- END check to see if article_person_id --#
+                    
+                #-- END check to see if Article_Data ID. --#
+                
+            #-- END loop over coders --#
+            
+        #-- END loop over Reliability_Names --#
+        
+        # load
+        map_OUT[ cls.RELATED_MAP_KEY_ARTICLE_DATA ] = Article_Data.objects.in_bulk( list( article_data_id_set ) )
+        map_OUT[ cls.RELATED_MAP_KEY_ARTICLE_AUTHOR ] = Article_Author.objects.in_bulk( list( article_author_id_set ) )
+        map_OUT[ cls.RELATED_MAP_KEY_ARTICLE_SUBJECT ] = Article_Subject.objects.in_bulk( list( article_subject_id_set ) )
         
-        return instance_OUT
-    
-    #-- END method create_from_reliability_data() --#
-    
+        return map_OUT
     
+    #-- END classmethod load_related_for_reliability_names_list() --#
+
+
     #----------------------------------------------------------------------------
     # ! ==> instance methods
     #----------------------------------------------------------------------------
@@ -3001,10 +4790,14 @@ class Reliability_Names_Coder_Data( models.Model ):
 
     '''
     Class to hold information on name detection choices within a given article
-        for a given coder, for use in inter-coder reliability testing.  Making
-        this class now, but not using it - will eventually want to remove these
-        details from Reliability_Names, switch over to having a set of these
-        records per name if I continue to add fields to test.
+        for a given coder, for use in inter-coder reliability testing.  Long
+        format version of the coderN_* columns in Reliability_Names - one row
+        per Reliability_Names row per coder index that has data, with the
+        label and coder index copied in so a label (or a pair of coders in a
+        label) can be pulled out with one indexed query, no matter how many
+        coders.  Written in bulk by ReliabilityNamesBuilder, kept in sync by
+        Reliability_Names.merge_records(), and can be (re)built for an
+        existing label with rebuild_for_label().
     '''
 
     #----------------------------------------------------------------------
@@ -3012,6 +4805,24 @@ class Reliability_Names_Coder_Data( models.Model ):
     #----------------------------------------------------------------------    
 
 
+    # Reliability_Names field name suffixes mapped to names of fields here.
+    SUFFIX_TO_FIELD_NAME_MAP = {}
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_CODER ] = "coder"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_CODER_ID ] = "coder_numeric_id"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_DETECTED ] = "detected"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_PERSON_ID ] = "person_id"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE ] = "person_type"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE_INT ] = "person_type_int"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID ] = "article_data_id"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_PERSON_ID ] = "article_person_id"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_FIRST_QUOTE_GRAF ] = "first_quote_graph"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_FIRST_QUOTE_INDEX ] = "first_quote_index"
+    SUFFIX_TO_FIELD_NAME_MAP[ Reliability_Names.FIELD_NAME_SUFFIX_ORGANIZATION_HASH ] = "organization_hash"
+
+    # default batch size for bulk_create()
+    DEFAULT_BATCH_SIZE = 1000
+
+
     #----------------------------------------------------------------------
     # model fields
     #----------------------------------------------------------------------
@@ -3024,6 +4835,8 @@ class Reliability_Names_Coder_Data( models.Model ):
     #label = models.CharField( max_length = 255, blank = True, null = True )
 
     reliability_names = models.ForeignKey( Reliability_Names, on_delete = models.CASCADE, blank = True, null = True )
+    label = models.CharField( max_length = 255, blank = True, null = True )
+    coder_index = models.IntegerField( blank = True, null = True )
     coder = models.ForeignKey( User, on_delete = models.DO_NOTHING, blank = True, null = True )
     coder_numeric_id = models.IntegerField( blank = True, null = True )
     detected = models.IntegerField( blank = True, null = True )
@@ -3047,6 +4860,10 @@ class Reliability_Names_Coder_Data( models.Model ):
     # Meta-data for this class.
     class Meta:
         ordering = [ 'reliability_names', 'coder', ]
+        indexes = [
+            models.Index( fields = [ "label", "coder_index" ], name = "rncd_label_coder_index_idx" ),
+            models.Index( fields = [ "reliability_names", "coder_index" ], name = "rncd_rn_coder_index_idx" ),
+        ]
 
 
     #----------------------------------------------------------------------------
@@ -3054,6 +4871,259 @@ class Reliability_Names_Coder_Data( models.Model ):
     #----------------------------------------------------------------------------
 
 
+    @classmethod
+    def build_from_reliability_names( cls, reliability_names_IN ):
+
+        '''
+        Accepts a saved Reliability_Names instance.  Returns list of unsaved
+            Reliability_Names_Coder_Data instances, one for each coder index
+            that has a coder (the builder sets the coder and 0 values for
+            coders who did not detect the person - those are data, too) or is
+            not empty (see Reliability_Names.is_index_empty()).
+        '''
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        current_index = -1
+        coder_data_instance = None
+        field_name_suffix = ""
+        field_name = ""
+        coder_user_id = None
+
+        # loop over indexes.
+        for current_index in range( 1, Reliability_Names.MAX_INDEX + 1 ):
+
+            # anything there?
+            coder_user_id = getattr( reliability_names_IN, Reliability_Names.INDEX_SUFFIX_TO_ATTNAME_MAP[ ( current_index, Reliability_Names.FIELD_NAME_SUFFIX_CODER ) ] )
+            if ( ( coder_user_id is not None ) or ( reliability_names_IN.is_index_empty( current_index ) == False ) ):
+
+                # yes - make a row.
+                coder_data_instance = cls()
+                coder_data_instance.reliability_names_id = reliability_names_IN.id
+                coder_data_instance.label = reliability_names_IN.label
+                coder_data_instance.coder_index = current_index
+
+                # copy values (coder by ID, so no lookup).
+                for field_name_suffix, field_name in six.iteritems( cls.SUFFIX_TO_FIELD_NAME_MAP ):
+
+                    if ( field_name_suffix == Reliability_Names.FIELD_NAME_SUFFIX_CODER ):
+
+                        coder_data_instance.coder_id = coder_user_id
+
+                    else:
+
+                        setattr( coder_data_instance, field_name, reliability_names_IN.get_field_value( current_index, field_name_suffix ) )
+
+                    #-- END check to see if coder FK --#
+
+                #-- END loop over fields --#
+
+                list_OUT.append( coder_data_instance )
+
+            #-- END check to see if index is empty --#
+
+        #-- END loop over indexes --#
+
+        return list_OUT
+
+    #-- END class method build_from_reliability_names() --#
+
+
+    @classmethod
+    def create_for_reliability_names_list( cls, reliability_names_list_IN, batch_size_IN = None ):
+
+        '''
+        Accepts list of saved Reliability_Names instances and optional batch
+            size.  Deletes any existing coder data rows for them, then builds
+            new ones and writes them with bulk_create(), in one transaction.
+            Returns list of rows created.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        batch_size = -1
+        reliability_names_instance = None
+        reliability_names_id_list = []
+
+        # batch size
+        batch_size = batch_size_IN
+        if ( ( batch_size is None ) or ( batch_size <= 0 ) ):
+
+            batch_size = cls.DEFAULT_BATCH_SIZE
+
+        #-- END check to see if batch size --#
+
+        # build rows
+        reliability_names_id_list = []
+        for reliability_names_instance in reliability_names_list_IN:
+
+            reliability_names_id_list.append( reliability_names_instance.id )
+            list_OUT.extend( cls.build_from_reliability_names( reliability_names_instance ) )
+
+        #-- END loop over Reliability_Names --#
+
+        # replace existing.
+        if ( len( reliability_names_id_list ) > 0 ):
+
+            with transaction.atomic():
+
+                cls.objects.filter( reliability_names_id__in = reliability_names_id_list ).delete()
+                cls.objects.bulk_create( list_OUT, batch_size = batch_size )
+
+            #-- END with transaction.atomic() --#
+
+        #-- END check to see if any Reliability_Names --#
+
+        return list_OUT
+
+    #-- END class method create_for_reliability_names_list() --#
+
+
+    @classmethod
+    def load_value_array( cls, label_IN, field_name_suffix_list_IN, coder_index_list_IN = None, dtype_IN = numpy.float64 ):
+
+        '''
+        Accepts label, list of Reliability_Names field name suffixes, optional
+            list of coder indexes (if None, all indexes), and numpy dtype for
+            the values (float64 needs numeric fields - for string fields like
+            person_type or organization_hash, pass object).  Loads the coder
+            data for the label in one query on the ( label, coder_index )
+            index.  Returns tuple of:
+            - numpy array of the IDs of the Reliability_Names rows that have
+                coder data, sorted.
+            - numpy array of the coder indexes, sorted.
+            - numpy array of values, rows x coder indexes x fields, with
+                missing values nan (float) or None (object).
+        '''
+
+        # return reference
+        id_array_OUT = None
+        coder_index_array_OUT = None
+        value_array_OUT = None
+
+        # declare variables
+        field_name_list = []
+        field_name_suffix = ""
+        coder_data_qs = None
+        value_list = None
+        raw_array = None
+        row_position_array = None
+        coder_position_array = None
+        field_position = -1
+        field_values = None
+        current_value = None
+
+        # fields
+        field_name_list = []
+        for field_name_suffix in field_name_suffix_list_IN:
+
+            field_name_list.append( cls.SUFFIX_TO_FIELD_NAME_MAP[ field_name_suffix ] )
+
+        #-- END loop over suffixes --#
+
+        # one query.
+        coder_data_qs = cls.objects.filter( label = label_IN )
+        if ( coder_index_list_IN is not None ):
+
+            coder_data_qs = coder_data_qs.filter( coder_index__in = coder_index_list_IN )
+
+        #-- END check to see if coder indexes --#
+
+        value_list = list( coder_data_qs.order_by().values_list( "reliability_names_id", "coder_index", *field_name_list ) )
+
+        # positions of each row and coder index.
+        raw_array = numpy.array( value_list, dtype = object ).reshape( len( value_list ), 2 + len( field_name_list ) )
+        id_array_OUT, row_position_array = numpy.unique( raw_array[ :, 0 ].astype( numpy.int64 ), return_inverse = True )
+        if ( coder_index_list_IN is not None ):
+
+            coder_index_array_OUT = numpy.array( sorted( coder_index_list_IN ), dtype = numpy.int64 )
+
+        else:
+
+            coder_index_array_OUT = numpy.unique( raw_array[ :, 1 ].astype( numpy.int64 ) )
+
+        #-- END check to see if coder indexes --#
+        coder_position_array = numpy.searchsorted( coder_index_array_OUT, raw_array[ :, 1 ].astype( numpy.int64 ) )
+
+        # fill in values.
+        value_array_OUT = numpy.full( ( len( id_array_OUT ), len( coder_index_array_OUT ), len( field_name_list ) ), numpy.nan if ( dtype_IN != object ) else None, dtype = dtype_IN )
+        for field_position in range( len( field_name_list ) ):
+
+            field_values = raw_array[ :, 2 + field_position ]
+            if ( dtype_IN != object ):
+
+                # None to nan.
+                field_values = numpy.array( [ numpy.nan if ( current_value is None ) else current_value for current_value in field_values ], dtype = dtype_IN )
+
+            #-- END check to see if converting --#
+
+            value_array_OUT[ row_position_array, coder_position_array, field_position ] = field_values
+
+        #-- END loop over fields --#
+
+        return id_array_OUT, coder_index_array_OUT, value_array_OUT
+
+    #-- END class method load_value_array() --#
+
+
+    @classmethod
+    def rebuild_for_label( cls, label_IN, batch_size_IN = None ):
+
+        '''
+        Accepts label and optional batch size.  Rebuilds the coder data for all
+            the Reliability_Names rows with the label from their coderN_*
+            columns, a batch at a time.  Returns count of coder data rows
+            created.
+        '''
+
+        # return reference
+        count_OUT = 0
+
+        # declare variables
+        batch_size = -1
+        reliability_names_qs = None
+        reliability_names_list = []
+        reliability_names_instance = None
+
+        # batch size
+        batch_size = batch_size_IN
+        if ( ( batch_size is None ) or ( batch_size <= 0 ) ):
+
+            batch_size = cls.DEFAULT_BATCH_SIZE
+
+        #-- END check to see if batch size --#
+
+        # loop over rows for label.
+        reliability_names_qs = Reliability_Names.objects.filter( label = label_IN ).order_by( "pk" )
+        reliability_names_list = []
+        for reliability_names_instance in reliability_names_qs.iterator( chunk_size = batch_size ):
+
+            reliability_names_list.append( reliability_names_instance )
+            if ( len( reliability_names_list ) >= batch_size ):
+
+                count_OUT += len( cls.create_for_reliability_names_list( reliability_names_list, batch_size_IN = batch_size ) )
+                reliability_names_list = []
+
+            #-- END check to see if batch full --#
+
+        #-- END loop over Reliability_Names --#
+
+        # anything left?
+        if ( len( reliability_names_list ) > 0 ):
+
+            count_OUT += len( cls.create_for_reliability_names_list( reliability_names_list, batch_size_IN = batch_size ) )
+
+        #-- END check to see if anything left --#
+
+        return count_OUT
+
+    #-- END class method rebuild_for_label() --#
+
+
     #----------------------------------------------------------------------------
     # instance methods
     #----------------------------------------------------------------------------
@@ -3158,6 +5228,31 @@ class Reliability_Names_Results( models.Model ):
     FIELD_ORGANIZATION_HASH_PI = Reliability_Names.FIELD_NAME_SUFFIX_ORGANIZATION_HASH + SUFFIX_PI
     FIELD_ORGANIZATION_HASH_COUNT = Reliability_Names.FIELD_NAME_SUFFIX_ORGANIZATION_HASH + SUFFIX_COUNT
 
+    # results matrix - per-row identifying columns, then metric columns, in
+    #     output order.
+    ROW_INFO_COLUMN_NAME_LIST = [ "label", "id", "coder1_coder_index", "coder2_coder_index", "coder1_id", "coder2_id" ]
+    METRIC_COLUMN_NAME_LIST = []
+    for field_name_suffix in [ "count", FIELD_DETECT_PERCENT, FIELD_DETECT_ALPHA, FIELD_DETECT_PI, FIELD_LOOKUP_PERCENT, FIELD_LOOKUP_ALPHA, FIELD_LOOKUP_NONZERO_PERCENT, FIELD_LOOKUP_NONZERO_ALPHA, FIELD_LOOKUP_NONZERO_COUNT, "type_percent", "type_alpha", "type_pi", FIELD_TYPE_NONZERO_PERCENT, FIELD_TYPE_NONZERO_ALPHA, FIELD_TYPE_NONZERO_PI, FIELD_TYPE_NONZERO_COUNT ]:
+        METRIC_COLUMN_NAME_LIST.append( PREFIX_AUTHOR + field_name_suffix )
+    #-- END loop over author fields --#
+    for field_name_suffix in [ "count", FIELD_DETECT_PERCENT, FIELD_DETECT_ALPHA, FIELD_DETECT_PI, FIELD_LOOKUP_PERCENT, FIELD_LOOKUP_ALPHA, FIELD_LOOKUP_NONZERO_PERCENT, FIELD_LOOKUP_NONZERO_ALPHA, FIELD_LOOKUP_NONZERO_COUNT, "type_percent", "type_alpha", "type_pi", FIELD_TYPE_NONZERO_PERCENT, FIELD_TYPE_NONZERO_ALPHA, FIELD_TYPE_NONZERO_PI, FIELD_TYPE_NONZERO_COUNT, FIELD_FIRST_QUOTE_GRAF_PERCENT, FIELD_FIRST_QUOTE_GRAF_ALPHA, FIELD_FIRST_QUOTE_GRAF_PI, FIELD_FIRST_QUOTE_GRAF_COUNT, FIELD_FIRST_QUOTE_INDEX_PERCENT, FIELD_FIRST_QUOTE_INDEX_ALPHA, FIELD_FIRST_QUOTE_INDEX_PI, FIELD_FIRST_QUOTE_INDEX_COUNT, FIELD_ORGANIZATION_HASH_PERCENT, FIELD_ORGANIZATION_HASH_ALPHA, FIELD_ORGANIZATION_HASH_PI, FIELD_ORGANIZATION_HASH_COUNT ]:
+        METRIC_COLUMN_NAME_LIST.append( PREFIX_SUBJECT + field_name_suffix )
+    #-- END loop over subject fields --#
+    del field_name_suffix
+    
+    # results matrix - keys in dictionary returned by get_results_matrix().
+    RESULTS_MATRIX_KEY_LABEL = "label"
+    RESULTS_MATRIX_KEY_ROW_INFO_LIST = "row_info_list"
+    RESULTS_MATRIX_KEY_VALUE_ROW_LIST = "value_row_list"
+    RESULTS_MATRIX_KEY_VALUE_MATRIX = "value_matrix"
+    RESULTS_MATRIX_KEY_STAMP = "stamp"
+    
+    # results matrix cache - one entry per label, least recently used dropped
+    #     first.
+    DEFAULT_RESULTS_MATRIX_CACHE_MAX_SIZE = 100
+    results_matrix_cache = LRUCache()
+    results_matrix_cache_max_size = DEFAULT_RESULTS_MATRIX_CACHE_MAX_SIZE
+
  
     #----------------------------------------------------------------------
     # model fields
@@ -3224,6 +5319,9 @@ class Reliability_Names_Results( models.Model ):
     # Meta-data for this class.
     class Meta:
         ordering = [ 'label', 'coder1', 'coder2' ]
+        indexes = [
+            models.Index( fields = [ "label", "coder1", "coder2" ], name = "rnr_label_coders_idx" ),
+        ]
 
 
     #----------------------------------------------------------------------------
@@ -3231,6 +5329,289 @@ class Reliability_Names_Results( models.Model ):
     #----------------------------------------------------------------------------
 
 
+    @classmethod
+    def build_results_matrix( cls, label_IN ):
+        
+        '''
+        Accepts label.  Retrieves all the Reliability_Names_Results for the
+            label with one values_list() query (ordered by coder indices, then
+            ID).  Returns dictionary from build_results_matrix_from_rows() for
+            the rows.
+        '''
+        
+        # return reference
+        matrix_dict_OUT = None
+        
+        # declare variables
+        results_qs = None
+        
+        # one query, only the columns we need.
+        results_qs = cls.objects.filter( label = label_IN )
+        results_qs = results_qs.order_by( "coder1_coder_index", "coder2_coder_index", "id" )
+        results_qs = results_qs.values_list( *( cls.ROW_INFO_COLUMN_NAME_LIST + cls.METRIC_COLUMN_NAME_LIST ) )
+        
+        matrix_dict_OUT = cls.build_results_matrix_from_rows( label_IN, results_qs )
+        
+        return matrix_dict_OUT
+        
+    #-- END classmethod build_results_matrix() --#
+
+
+    @classmethod
+    def build_results_matrix_from_rows( cls, label_IN, row_list_IN ):
+        
+        '''
+        Accepts label and iterable of rows of ROW_INFO_COLUMN_NAME_LIST then
+            METRIC_COLUMN_NAME_LIST values (as values_list() returns them).
+            Returns dictionary with:
+            - RESULTS_MATRIX_KEY_LABEL - the label.
+            - RESULTS_MATRIX_KEY_ROW_INFO_LIST - list of tuples of
+                ROW_INFO_COLUMN_NAME_LIST values, one per row.
+            - RESULTS_MATRIX_KEY_VALUE_ROW_LIST - list of tuples of
+                METRIC_COLUMN_NAME_LIST values, one per row, as loaded (int,
+                Decimal, or None) - use for output.
+            - RESULTS_MATRIX_KEY_VALUE_MATRIX - the same values as a numpy
+                float64 array, NULL as numpy.nan - use for float math.
+            - RESULTS_MATRIX_KEY_STAMP - get_results_stamp() for the label
+                (None - set by get_results_matrix()).
+        '''
+        
+        # return reference
+        matrix_dict_OUT = None
+        
+        # declare variables
+        row_info_count = -1
+        row_info_list = None
+        value_row_list = None
+        current_row = None
+        value_matrix = None
+        
+        # split into row info and metric values.
+        row_info_count = len( cls.ROW_INFO_COLUMN_NAME_LIST )
+        row_info_list = []
+        value_row_list = []
+        for current_row in row_list_IN:
+        
+            row_info_list.append( tuple( current_row[ : row_info_count ] ) )
+            value_row_list.append( tuple( current_row[ row_info_count : ] ) )
+            
+        #-- END loop over rows --#
+        
+        # floats, for math (Decimal converts, None becomes nan).
+        value_matrix = numpy.array( value_row_list, dtype = numpy.float64 ).reshape( len( value_row_list ), len( cls.METRIC_COLUMN_NAME_LIST ) )
+        
+        matrix_dict_OUT = {}
+        matrix_dict_OUT[ cls.RESULTS_MATRIX_KEY_LABEL ] = label_IN
+        matrix_dict_OUT[ cls.RESULTS_MATRIX_KEY_ROW_INFO_LIST ] = row_info_list
+        matrix_dict_OUT[ cls.RESULTS_MATRIX_KEY_VALUE_ROW_LIST ] = value_row_list
+        matrix_dict_OUT[ cls.RESULTS_MATRIX_KEY_VALUE_MATRIX ] = value_matrix
+        matrix_dict_OUT[ cls.RESULTS_MATRIX_KEY_STAMP ] = None
+        
+        return matrix_dict_OUT
+        
+    #-- END classmethod build_results_matrix_from_rows() --#
+
+
+    @classmethod
+    def build_results_row_list( cls, matrix_dict_IN ):
+        
+        '''
+        Accepts dictionary from get_results_matrix().  Returns list of
+            dictionaries, one per row, of column name to value, for
+            ROW_INFO_COLUMN_NAME_LIST then METRIC_COLUMN_NAME_LIST, with values
+            as loaded (counts stay int, Decimals stay Decimal, NULL is None),
+            for rendering or JSON.
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        # declare variables
+        row_info = None
+        value_row = None
+        row_dict = None
+        
+        for row_info, value_row in zip( matrix_dict_IN[ cls.RESULTS_MATRIX_KEY_ROW_INFO_LIST ], matrix_dict_IN[ cls.RESULTS_MATRIX_KEY_VALUE_ROW_LIST ] ):
+        
+            row_dict = dict( zip( cls.ROW_INFO_COLUMN_NAME_LIST, row_info ) )
+            row_dict.update( zip( cls.METRIC_COLUMN_NAME_LIST, value_row ) )
+            list_OUT.append( row_dict )
+            
+        #-- END loop over rows --#
+        
+        return list_OUT
+        
+    #-- END classmethod build_results_row_list() --#
+
+
+    @classmethod
+    def calculate_results_sums_and_averages( cls, matrix_dict_IN ):
+        
+        '''
+        Accepts dictionary from get_results_matrix().  Returns tuple of
+            dictionaries of METRIC_COLUMN_NAME_LIST column name to sum of
+            non-NULL values, and to that sum divided by the count of all rows
+            (None if no rows), as decimal.Decimal.  Sums are taken from the
+            values as loaded, not the float matrix, so they are exact.
+        '''
+        
+        # return reference
+        sum_dict_OUT = {}
+        average_dict_OUT = {}
+        
+        # declare variables
+        value_row_list = None
+        row_count = -1
+        sum_list = None
+        value_row = None
+        column_position = -1
+        current_value = None
+        column_name = ""
+        column_sum = None
+        
+        value_row_list = matrix_dict_IN[ cls.RESULTS_MATRIX_KEY_VALUE_ROW_LIST ]
+        row_count = len( value_row_list )
+        
+        # sum each column, skipping NULL.
+        sum_list = [ decimal.Decimal( 0 ) ] * len( cls.METRIC_COLUMN_NAME_LIST )
+        for value_row in value_row_list:
+        
+            for column_position, current_value in enumerate( value_row ):
+            
+                if ( current_value is not None ):
+                
+                    sum_list[ column_position ] += decimal.Decimal( current_value )
+                    
+                #-- END check to see if NULL --#
+                
+            #-- END loop over columns --#
+            
+        #-- END loop over rows --#
+        
+        sum_dict_OUT = dict( zip( cls.METRIC_COLUMN_NAME_LIST, sum_list ) )
+        if ( row_count > 0 ):
+        
+            average_dict_OUT = dict( [ ( column_name, column_sum / row_count ) for column_name, column_sum in zip( cls.METRIC_COLUMN_NAME_LIST, sum_list ) ] )
+            
+        else:
+        
+            average_dict_OUT = dict( [ ( column_name, None ) for column_name in cls.METRIC_COLUMN_NAME_LIST ] )
+            
+        #-- END check to see if any rows --#
+        
+        return sum_dict_OUT, average_dict_OUT
+        
+    #-- END classmethod calculate_results_sums_and_averages() --#
+
+
+    @classmethod
+    def clear_results_matrix_cache( cls, label_IN = None ):
+        
+        '''
+        Invalidates the results matrix cache used by get_results_matrix().  If
+            a label is passed in, removes just that label.  If not, clears the
+            whole cache.
+        '''
+        
+        # label passed in?
+        if ( label_IN is not None ):
+        
+            cls.results_matrix_cache.pop( label_IN )
+            
+        else:
+        
+            cls.results_matrix_cache.clear()
+            
+        #-- END check to see if label --#
+        
+    #-- END classmethod clear_results_matrix_cache() --#
+
+
+    @classmethod
+    def get_results_matrix( cls, label_IN, use_cache_IN = True ):
+        
+        '''
+        Accepts label and flag for whether to use the results matrix cache.
+            Returns dictionary from build_results_matrix() for the label, from
+            the cache if its stamp (count and latest last_modified, one
+            aggregate query) still matches, otherwise rebuilt and cached.
+
+        Postconditions: cache holds at most results_matrix_cache_max_size
+            labels, least recently used dropped first.  Cached matrices are
+            shared - don't change them.  Stamp check means results written by
+            other processes are picked up; ReliabilityNamesAnalyzer also calls
+            clear_results_matrix_cache() after it writes results.
+        '''
+        
+        # return reference
+        matrix_dict_OUT = None
+        
+        # declare variables
+        results_stamp = None
+        
+        # current stamp for label.
+        results_stamp = cls.get_results_stamp( label_IN )
+        
+        # cached?
+        if ( use_cache_IN == True ):
+        
+            matrix_dict_OUT = cls.results_matrix_cache.get( label_IN )
+            if ( matrix_dict_OUT is not None ):
+            
+                # still current?
+                if ( matrix_dict_OUT[ cls.RESULTS_MATRIX_KEY_STAMP ] != results_stamp ):
+                
+                    # no - rebuild (replaces cached matrix).
+                    matrix_dict_OUT = None
+                    
+                #-- END check to see if stamp matches --#
+                
+            #-- END check to see if cached --#
+            
+        #-- END check to see if using cache --#
+        
+        # build?
+        if ( matrix_dict_OUT is None ):
+        
+            matrix_dict_OUT = cls.build_results_matrix( label_IN )
+            matrix_dict_OUT[ cls.RESULTS_MATRIX_KEY_STAMP ] = results_stamp
+            
+            if ( use_cache_IN == True ):
+            
+                cls.results_matrix_cache.set( label_IN, matrix_dict_OUT, max_size_IN = cls.results_matrix_cache_max_size )
+                
+            #-- END check to see if using cache --#
+            
+        #-- END check to see if need to build --#
+        
+        return matrix_dict_OUT
+        
+    #-- END classmethod get_results_matrix() --#
+
+
+    @classmethod
+    def get_results_stamp( cls, label_IN ):
+        
+        '''
+        Accepts label.  Returns tuple of count of Reliability_Names_Results
+            for the label and their latest last_modified (one aggregate query),
+            used to tell if a cached results matrix is out of date.
+        '''
+        
+        # return reference
+        stamp_OUT = None
+        
+        # declare variables
+        aggregate_dict = None
+        
+        aggregate_dict = cls.objects.filter( label = label_IN ).aggregate( results_count = Count( "id" ), results_last_modified = Max( "last_modified" ) )
+        stamp_OUT = ( aggregate_dict[ "results_count" ], aggregate_dict[ "results_last_modified" ] )
+        
+        return stamp_OUT
+        
+    #-- END classmethod get_results_stamp() --#
+
+
     #----------------------------------------------------------------------------
     # instance methods
     #----------------------------------------------------------------------------
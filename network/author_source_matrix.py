@@ -0,0 +1,545 @@
+from __future__ import unicode_literals
+from __future__ import division
+
+'''
+Copyright 2016-2017 Jonathan Morgan
+
+This file is part of http://github.com/jonathanmorgan/context_analysis.
+
+context_analysis is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+
+context_analysis is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with http://github.com/jonathanmorgan/context_analysis. If not, see http://www.gnu.org/licenses/.
+'''
+
+#==============================================================================#
+# ! imports
+#==============================================================================#
+
+# stats and analysis
+import numpy
+import scipy.sparse
+
+
+#-------------------------------------------------------------------------------
+# ! class definitions
+#-------------------------------------------------------------------------------
+
+
+class AuthorSourceMatrix( object ):
+
+    '''
+    Sparse store of the author-to-source ties (and author-to-article links)
+        one coder index found, for NetworkPersonInfo:
+        - person and article IDs are mapped to dense integer row and column
+            positions, in the order they are first seen (author_id_list,
+            source_id_list, article_id_list map positions back to IDs).
+        - ties are appended to lists of row and column positions (COO), then
+            compacted into a scipy.sparse CSR matrix of mention counts the
+            first time a matrix is needed - adding a tie is O(1), no matter
+            how many sources an author has.
+        - source, shared source, and article counts per author are computed
+            from the matrices with vectorized operations.
+    '''
+
+
+    #---------------------------------------------------------------------------
+    # constants-ish
+    #---------------------------------------------------------------------------
+
+
+    # dtype of count matrices
+    COUNT_DTYPE = numpy.int32
+
+
+    #---------------------------------------------------------------------------
+    # instance methods
+    #---------------------------------------------------------------------------
+
+
+    def __init__( self ):
+
+        # declare instance variables - ID to position maps.
+        self.author_id_to_row_map = {}
+        self.author_id_list = []
+        self.source_id_to_column_map = {}
+        self.source_id_list = []
+        self.article_id_to_column_map = {}
+        self.article_id_list = []
+
+        # pending ties and article links, not yet compacted.
+        self.tie_row_list = []
+        self.tie_column_list = []
+        self.article_row_list = []
+        self.article_column_list = []
+
+        # compacted CSR matrices (None until first compact()).
+        self.tie_count_matrix = None
+        self.author_article_count_matrix = None
+
+    #-- END method __init__() --#
+
+
+    def add_article( self, author_id_IN, article_id_IN ):
+
+        '''
+        Accepts author person ID and article ID.  Records that the author
+            wrote the article (adding the author if new).
+        '''
+
+        # declare variables
+        row = -1
+        column = -1
+
+        row = self.add_author( author_id_IN )
+        column = self.article_id_to_column_map.get( article_id_IN, None )
+        if ( column is None ):
+
+            column = len( self.article_id_list )
+            self.article_id_to_column_map[ article_id_IN ] = column
+            self.article_id_list.append( article_id_IN )
+
+        #-- END check to see if new article --#
+
+        self.article_row_list.append( row )
+        self.article_column_list.append( column )
+
+    #-- END method add_article() --#
+
+
+    def add_author( self, author_id_IN ):
+
+        '''
+        Accepts author person ID.  Returns the author's row position, adding
+            the author if not seen before.
+        '''
+
+        # return reference
+        row_OUT = -1
+
+        row_OUT = self.author_id_to_row_map.get( author_id_IN, None )
+        if ( row_OUT is None ):
+
+            row_OUT = len( self.author_id_list )
+            self.author_id_to_row_map[ author_id_IN ] = row_OUT
+            self.author_id_list.append( author_id_IN )
+
+        #-- END check to see if new author --#
+
+        return row_OUT
+
+    #-- END method add_author() --#
+
+
+    def add_source( self, source_id_IN ):
+
+        '''
+        Accepts source person ID.  Returns the source's column position, adding
+            the source if not seen before.
+        '''
+
+        # return reference
+        column_OUT = -1
+
+        column_OUT = self.source_id_to_column_map.get( source_id_IN, None )
+        if ( column_OUT is None ):
+
+            column_OUT = len( self.source_id_list )
+            self.source_id_to_column_map[ source_id_IN ] = column_OUT
+            self.source_id_list.append( source_id_IN )
+
+        #-- END check to see if new source --#
+
+        return column_OUT
+
+    #-- END method add_source() --#
+
+
+    def add_tie( self, author_id_IN, source_id_IN ):
+
+        '''
+        Accepts author and source person IDs.  Records one mention of the
+            source by the author (adding either if new).
+        '''
+
+        self.tie_row_list.append( self.add_author( author_id_IN ) )
+        self.tie_column_list.append( self.add_source( source_id_IN ) )
+
+    #-- END method add_tie() --#
+
+
+    def build_count_matrix( self, matrix_IN, row_list_IN, column_list_IN, column_count_IN ):
+
+        '''
+        Accepts existing CSR count matrix (or None), lists of pending row and
+            column positions, and column count.  Returns CSR matrix of the
+            existing counts plus one per pending position, shaped to the
+            current author count by column count (duplicates summed).
+        '''
+
+        # return reference
+        matrix_OUT = None
+
+        # declare variables
+        row_array = None
+        column_array = None
+        data_array = None
+        existing_coo = None
+
+        row_array = numpy.array( row_list_IN, dtype = numpy.int64 )
+        column_array = numpy.array( column_list_IN, dtype = numpy.int64 )
+        data_array = numpy.ones( len( row_list_IN ), dtype = self.COUNT_DTYPE )
+
+        # add in existing counts.
+        if ( matrix_IN is not None ):
+
+            existing_coo = matrix_IN.tocoo()
+            row_array = numpy.concatenate( [ existing_coo.row.astype( numpy.int64 ), row_array ] )
+            column_array = numpy.concatenate( [ existing_coo.col.astype( numpy.int64 ), column_array ] )
+            data_array = numpy.concatenate( [ existing_coo.data.astype( self.COUNT_DTYPE ), data_array ] )
+
+        #-- END check to see if existing matrix --#
+
+        # COO -> CSR sums duplicates.
+        matrix_OUT = scipy.sparse.coo_matrix( ( data_array, ( row_array, column_array ) ), shape = ( len( self.author_id_list ), column_count_IN ) ).tocsr()
+        matrix_OUT.sum_duplicates()
+
+        return matrix_OUT
+
+    #-- END method build_count_matrix() --#
+
+
+    def compact( self ):
+
+        '''
+        Merges pending ties and article links into the CSR count matrices, and
+            grows the matrices to the current author, source, and article
+            counts.  Clears the pending lists.
+        '''
+
+        # ties
+        if ( ( self.tie_count_matrix is None ) or ( len( self.tie_row_list ) > 0 ) or ( self.tie_count_matrix.shape != ( len( self.author_id_list ), len( self.source_id_list ) ) ) ):
+
+            self.tie_count_matrix = self.build_count_matrix( self.tie_count_matrix, self.tie_row_list, self.tie_column_list, len( self.source_id_list ) )
+            self.tie_row_list = []
+            self.tie_column_list = []
+
+        #-- END check to see if ties changed --#
+
+        # articles
+        if ( ( self.author_article_count_matrix is None ) or ( len( self.article_row_list ) > 0 ) or ( self.author_article_count_matrix.shape != ( len( self.author_id_list ), len( self.article_id_list ) ) ) ):
+
+            self.author_article_count_matrix = self.build_count_matrix( self.author_article_count_matrix, self.article_row_list, self.article_column_list, len( self.article_id_list ) )
+            self.article_row_list = []
+            self.article_column_list = []
+
+        #-- END check to see if articles changed --#
+
+    #-- END method compact() --#
+
+
+    def get_article_count_array( self ):
+
+        '''
+        Returns numpy array of count of distinct articles per author, in
+            author_id_list order.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        self.compact()
+        array_OUT = numpy.diff( self.author_article_count_matrix.indptr )
+
+        return array_OUT
+
+    #-- END method get_article_count_array() --#
+
+
+    def get_author_article_id_list( self, author_id_IN ):
+
+        '''
+        Accepts author person ID.  Returns list of IDs of the distinct articles
+            by the author, in the order the articles were first seen.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        list_OUT = self.get_row_id_list( self.get_author_article_matrix(), self.author_id_to_row_map[ author_id_IN ], self.article_id_list )
+
+        return list_OUT
+
+    #-- END method get_author_article_id_list() --#
+
+
+    def get_author_article_matrix( self ):
+
+        '''
+        Returns CSR author x article matrix, 1 where the author wrote the
+            article.
+        '''
+
+        # return reference
+        matrix_OUT = None
+
+        self.compact()
+        matrix_OUT = self.binarize( self.author_article_count_matrix )
+
+        return matrix_OUT
+
+    #-- END method get_author_article_matrix() --#
+
+
+    def get_author_source_id_list( self, author_id_IN ):
+
+        '''
+        Accepts author person ID.  Returns list of IDs of the distinct sources
+            the author quoted, in the order the sources were first seen.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        list_OUT = self.get_row_id_list( self.get_incidence_matrix(), self.author_id_to_row_map[ author_id_IN ], self.source_id_list )
+
+        return list_OUT
+
+    #-- END method get_author_source_id_list() --#
+
+
+    def get_co_occurrence_matrix( self ):
+
+        '''
+        Returns CSR author x author matrix A * A.T, where A is the incidence
+            matrix - the value at ( i, j ) is the number of sources authors i
+            and j both quoted (on the diagonal, the author's source count).
+        '''
+
+        # return reference
+        matrix_OUT = None
+
+        # declare variables
+        incidence_matrix = None
+
+        incidence_matrix = self.get_incidence_matrix()
+        matrix_OUT = incidence_matrix.dot( incidence_matrix.T ).tocsr()
+        matrix_OUT.eliminate_zeros()
+
+        return matrix_OUT
+
+    #-- END method get_co_occurrence_matrix() --#
+
+
+    def get_incidence_matrix( self ):
+
+        '''
+        Returns CSR author x source incidence matrix, 1 where the author quoted
+            the source at least once.
+        '''
+
+        # return reference
+        matrix_OUT = None
+
+        self.compact()
+        matrix_OUT = self.binarize( self.tie_count_matrix )
+
+        return matrix_OUT
+
+    #-- END method get_incidence_matrix() --#
+
+
+    def get_related_author_id_lists( self ):
+
+        '''
+        Returns list, in author_id_list order, of the list of IDs of authors
+            who quoted any of the same sources as the author (including the
+            author), from the non-zero entries in each row of
+            get_co_occurrence_matrix(), or None if the author shares no
+            sources.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        co_occurrence_matrix = None
+        row = -1
+        row_start = -1
+        row_end = -1
+
+        co_occurrence_matrix = self.get_co_occurrence_matrix()
+        co_occurrence_matrix.sort_indices()
+        list_OUT = [ None ] * len( self.author_id_list )
+        for row in range( len( self.author_id_list ) ):
+
+            # more than just the author?
+            row_start = co_occurrence_matrix.indptr[ row ]
+            row_end = co_occurrence_matrix.indptr[ row + 1 ]
+            if ( ( row_end - row_start ) > 1 ):
+
+                list_OUT[ row ] = [ self.author_id_list[ column ] for column in co_occurrence_matrix.indices[ row_start : row_end ].tolist() ]
+
+            #-- END check to see if any related authors --#
+
+        #-- END loop over authors --#
+
+        return list_OUT
+
+    #-- END method get_related_author_id_lists() --#
+
+
+    def get_shared_source_count_array( self ):
+
+        '''
+        Returns numpy array of count of each author's sources who were also
+            quoted by at least one other author, in author_id_list order.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        # declare variables
+        incidence_matrix = None
+        shared_mask = None
+
+        incidence_matrix = self.get_incidence_matrix()
+        shared_mask = ( self.get_source_author_count_array() > 1 ).astype( self.COUNT_DTYPE )
+        array_OUT = numpy.asarray( incidence_matrix.dot( shared_mask ) ).ravel()
+
+        return array_OUT
+
+    #-- END method get_shared_source_count_array() --#
+
+
+    def get_shared_source_id_lists( self ):
+
+        '''
+        Returns list, in author_id_list order, of the list of IDs of each
+            author's sources who were also quoted by at least one other author
+            (empty if none), by keeping only the incidence matrix columns of
+            sources with more than one author.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        shared_column_array = None
+        shared_matrix = None
+        shared_source_id_list = None
+        row = -1
+
+        # columns of shared sources, and the matrix limited to them.
+        shared_column_array = numpy.flatnonzero( self.get_source_author_count_array() > 1 )
+        shared_matrix = self.get_incidence_matrix()[ :, shared_column_array ].tocsr()
+        shared_source_id_list = [ self.source_id_list[ column ] for column in shared_column_array.tolist() ]
+
+        list_OUT = [ self.get_row_id_list( shared_matrix, row, shared_source_id_list ) for row in range( len( self.author_id_list ) ) ]
+
+        return list_OUT
+
+    #-- END method get_shared_source_id_lists() --#
+
+
+    def get_source_author_count_array( self ):
+
+        '''
+        Returns numpy array of count of distinct authors who quoted each
+            source, in source_id_list order.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        array_OUT = numpy.diff( self.get_incidence_matrix().tocsc().indptr )
+
+        return array_OUT
+
+    #-- END method get_source_author_count_array() --#
+
+
+    def get_source_author_id_list( self, source_id_IN ):
+
+        '''
+        Accepts source person ID.  Returns list of IDs of the distinct authors
+            who quoted the source, in the order the authors were first seen.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        list_OUT = self.get_row_id_list( self.get_incidence_matrix().T.tocsr(), self.source_id_to_column_map[ source_id_IN ], self.author_id_list )
+
+        return list_OUT
+
+    #-- END method get_source_author_id_list() --#
+
+
+    def get_source_count_array( self ):
+
+        '''
+        Returns numpy array of count of distinct sources per author, in
+            author_id_list order.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        self.compact()
+        array_OUT = numpy.diff( self.tie_count_matrix.indptr )
+
+        return array_OUT
+
+    #-- END method get_source_count_array() --#
+
+
+    #---------------------------------------------------------------------------
+    # static methods
+    #---------------------------------------------------------------------------
+
+
+    @staticmethod
+    def binarize( matrix_IN ):
+
+        '''
+        Accepts CSR count matrix.  Returns copy with every stored count set to
+            1.
+        '''
+
+        # return reference
+        matrix_OUT = None
+
+        matrix_OUT = matrix_IN.copy()
+        matrix_OUT.data[ : ] = 1
+
+        return matrix_OUT
+
+    #-- END static method binarize() --#
+
+
+    @staticmethod
+    def get_row_id_list( csr_matrix_IN, row_IN, column_id_list_IN ):
+
+        '''
+        Accepts CSR matrix, row position, and list that maps column positions
+            to IDs.  Returns list of IDs of the row's stored columns, in column
+            order.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        column_array = None
+
+        column_array = csr_matrix_IN.indices[ csr_matrix_IN.indptr[ row_IN ] : csr_matrix_IN.indptr[ row_IN + 1 ] ]
+        list_OUT = [ column_id_list_IN[ column ] for column in numpy.sort( column_array ).tolist() ]
+
+        return list_OUT
+
+    #-- END static method get_row_id_list() --#
+
+
+#-- END class AuthorSourceMatrix --#
@@ -1,18 +1,27 @@
 from __future__ import unicode_literals
 
 # python package imports
+import os
 import six
 
+# stats and analysis
+import numpy
+
 # django imports
 from django.contrib.auth.models import User
 
 # context_text imports
 from context_text.models import Article
+from context_text.models import Article_Author
 from context_text.models import Article_Data
+from context_text.models import Article_Subject
 from context_text.models import Person
 
 # context_analysis imports
 from context_analysis.models import Reliability_Ties
+from context_analysis.network.author_source_matrix import AuthorSourceMatrix
+from context_analysis.network.network_person_snapshot import NetworkPersonSnapshot
+from context_analysis.network.network_person_summary import NetworkPersonSummary
 from context_analysis.reliability.reliability_names_builder import ReliabilityNamesBuilder
 
 #-------------------------------------------------------------------------------
@@ -47,6 +56,27 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
         - self.PROP_CODER_AUTHOR_SOURCE_COUNT_LIST = "coder_author_source_count_list" - list of source counts per author, in same order as list of author IDs.
         - self.PROP_CODER_AUTHOR_SHARED_COUNT_LIST = "coder_author_shared_count_list" - list of shared source counts per author, in same order as list of author IDs.
         - self.PROP_CODER_AUTHOR_ARTICLE_COUNT_LIST = "coder_author_article_count_list" - list of counts of articles in this analysis for each author.
+        - self.PROP_CODER_SUMMARY = "coder_summary" - NetworkPersonSummary with the author IDs and counts above as numpy arrays, with mean, median, percentile, and filter methods (also available from get_index_summary()).
+
+    If self.use_sparse_backend is True, ties are instead accumulated per coder
+        index in an AuthorSourceMatrix (self.coder_index_to_matrix_map), and
+        counts are computed from its scipy.sparse matrices.  The author and
+        source data above are then built from the matrices, so
+        self.coder_index_to_data_map has the same contents (lists of sources,
+        authors, and articles are in the order each ID was first seen for the
+        index, rather than per author).
+
+    If process_articles() is passed a snapshot file path, the ties found for
+        each article are also recorded per index in a NetworkPersonSnapshot
+        (self.snapshot) and saved to that file, along with the ID and
+        last_modified of each Article_Data, Article_Author, and
+        Article_Subject, and the tags, automated coder types, and coder index
+        priorities used.  With incremental_IN = True, the snapshot is loaded
+        first and, if its settings match, only articles whose Article_Data,
+        Article_Author, or Article_Subject rows were added, removed, or
+        modified since it was saved are re-processed - the author and source
+        data for each index are then built from the snapshot's ties, the same
+        as with the sparse backend.
     '''
         
     #----------------------------------------------------------------------
@@ -76,6 +106,7 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
     PROP_CODER_AUTHOR_SOURCE_COUNT_LIST = "coder_author_source_count_list"
     PROP_CODER_AUTHOR_SHARED_COUNT_LIST = "coder_author_shared_count_list"
     PROP_CODER_AUTHOR_ARTICLE_COUNT_LIST = "coder_author_article_count_list"
+    PROP_CODER_SUMMARY = "coder_summary"
 
     # author property names
     PROP_AUTHOR_SOURCE_LIST = "author_source_list"
@@ -115,9 +146,114 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
         # coder index to data map.
         self.coder_index_to_data_map = {}
         
+        # sparse matrix backend - coder index to AuthorSourceMatrix.
+        self.use_sparse_backend = False
+        self.coder_index_to_matrix_map = {}
+        
+        # per-article snapshot of ties, for incremental processing.
+        self.snapshot = None
+        
     #-- END method __init__() --#
     
 
+    def build_index_data_from_matrix( self, index_IN ):
+        
+        '''
+        Accepts an index value.  Uses the index's AuthorSourceMatrix to fill in
+            the author data (source list, article ID list) and source data
+            (author list) for the index in self.coder_index_to_data_map, for
+            code that reads the dictionaries.  Returns the index's data
+            dictionary.
+        '''
+        
+        # return reference
+        instance_OUT = None
+        
+        # declare variables
+        me = "build_index_data_from_matrix"
+        index_matrix = None
+        incidence_matrix = None
+        author_article_matrix = None
+        source_author_matrix = None
+        index_author_data_dict = None
+        index_source_data_dict = None
+        row = -1
+        author_id = -1
+        author_info_dict = None
+        column = -1
+        source_id = -1
+        source_info_dict = None
+        
+        # get matrices for index.
+        index_matrix = self.get_index_matrix( index_IN )
+        incidence_matrix = index_matrix.get_incidence_matrix()
+        author_article_matrix = index_matrix.get_author_article_matrix()
+        source_author_matrix = incidence_matrix.T.tocsr()
+        
+        # author data
+        index_author_data_dict = self.get_index_author_data( index_IN )
+        for row, author_id in enumerate( index_matrix.author_id_list ):
+        
+            author_info_dict = index_author_data_dict.setdefault( author_id, {} )
+            author_info_dict[ self.PROP_AUTHOR_SOURCE_LIST ] = AuthorSourceMatrix.get_row_id_list( incidence_matrix, row, index_matrix.source_id_list )
+            author_info_dict[ self.PROP_AUTHOR_ARTICLE_ID_LIST ] = AuthorSourceMatrix.get_row_id_list( author_article_matrix, row, index_matrix.article_id_list )
+            
+        #-- END loop over authors --#
+        
+        # source data
+        index_source_data_dict = self.get_index_source_data( index_IN )
+        for column, source_id in enumerate( index_matrix.source_id_list ):
+        
+            source_info_dict = index_source_data_dict.setdefault( source_id, {} )
+            source_info_dict[ self.PROP_SOURCE_AUTHOR_LIST ] = AuthorSourceMatrix.get_row_id_list( source_author_matrix, column, index_matrix.author_id_list )
+            
+        #-- END loop over sources --#
+        
+        instance_OUT = self.get_index_data( index_IN )
+        
+        return instance_OUT
+        
+    #-- END method build_index_data_from_matrix() --#
+    
+
+    def build_index_matrix_from_data( self, index_IN ):
+        
+        '''
+        Accepts an index value.  Returns a new AuthorSourceMatrix with a tie
+            for each source in each author's source list in the index's author
+            data (authors with no sources included), for vectorized processing
+            when self.use_sparse_backend is False.  Does not store the matrix
+            in self.coder_index_to_matrix_map.
+        '''
+        
+        # return reference
+        instance_OUT = None
+        
+        # declare variables
+        me = "build_index_matrix_from_data"
+        index_author_data_dict = None
+        author_id = -1
+        author_info_dict = None
+        source_id = -1
+        
+        instance_OUT = AuthorSourceMatrix()
+        index_author_data_dict = self.get_index_author_data( index_IN )
+        for author_id, author_info_dict in six.iteritems( index_author_data_dict ):
+        
+            instance_OUT.add_author( author_id )
+            for source_id in author_info_dict.get( self.PROP_AUTHOR_SOURCE_LIST, [] ):
+            
+                instance_OUT.add_tie( author_id, source_id )
+                
+            #-- END loop over author's sources --#
+            
+        #-- END loop over authors --#
+        
+        return instance_OUT
+        
+    #-- END method build_index_matrix_from_data() --#
+    
+
     def get_article_data_for_index( self, index_IN, article_data_qs_IN ):
         
         '''
@@ -296,6 +432,56 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
     #-- END method get_index_data_property_dict() --#
     
         
+    def get_index_matrix( self, index_IN ):
+        
+        '''
+        Accepts an index value.  Returns the AuthorSourceMatrix for that index.
+            If none found, creates one, stores it for the index, then returns
+            it.
+        '''
+        
+        # return reference
+        instance_OUT = None
+        
+        instance_OUT = self.coder_index_to_matrix_map.get( index_IN, None )
+        if ( instance_OUT is None ):
+        
+            instance_OUT = AuthorSourceMatrix()
+            self.coder_index_to_matrix_map[ index_IN ] = instance_OUT
+            
+        #-- END check to see if index has matrix --#
+        
+        return instance_OUT
+        
+    #-- END method get_index_matrix() --#
+    
+        
+    def get_index_summary( self, index_IN ):
+        
+        '''
+        Accepts an index value.  Returns the NetworkPersonSummary
+            summarize_data() stored for that index, or None if none.
+        '''
+        
+        # return reference
+        instance_OUT = None
+        
+        # declare variables
+        me = "get_index_summary"
+        coder_data_dict = None
+        
+        coder_data_dict = self.coder_index_to_data_map.get( index_IN, None )
+        if ( coder_data_dict is not None ):
+        
+            instance_OUT = coder_data_dict.get( self.PROP_CODER_SUMMARY, None )
+            
+        #-- END check to see if data for index --#
+        
+        return instance_OUT
+        
+    #-- END method get_index_summary() --#
+    
+        
     def get_index_source_data( self, index_IN ):
         
         '''
@@ -318,7 +504,7 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
     #-- END method get_index_source_data() --#
     
         
-    def process_articles( self, tag_list_IN = [] ):
+    def process_articles( self, tag_list_IN = [], snapshot_path_IN = None, incremental_IN = False ):
 
         '''
         Grabs articles with a tag in tag_list_IN.  For each, loops through their
@@ -326,6 +512,14 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
            sources cited in articles, and counts of the number of articles in
            the selected set that mention each source, as coded by one to three
            different coders.
+           
+        If snapshot_path_IN is set, records ties per article in self.snapshot
+           and saves it to that path when done.  If incremental_IN is also
+           True and a snapshot with the same settings (tags, automated coder
+           types, coder index priorities) exists at that path, only articles
+           whose Article_Data, Article_Author, or Article_Subject rows changed
+           since the snapshot are processed, and the rest of the data comes
+           from the snapshot.
         '''
         
         # declare variables - retrieving reliability sample.
@@ -348,6 +542,15 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
         temp_index = -1
         coder_index = -1
         coder_article_data = None
+        
+        # declare variables - snapshot.
+        process_article_qs = None
+        current_snapshot = None
+        loaded_snapshot = None
+        article_data_array = None
+        article_person_array_list = None
+        article_person_array = None
+        changed_article_id_list = None
 
         #-------------------------------------------------------------------------------
         # process articles to build data
@@ -364,10 +567,68 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
         article_qs = article_qs.order_by( "id" )
         
         #article_qs = article_qs[ : 2 ]
+        
+        # snapshot?
+        process_article_qs = article_qs
+        if ( ( snapshot_path_IN is not None ) and ( snapshot_path_IN != "" ) ):
+        
+            # settings for this run.
+            current_snapshot = self.make_snapshot( tag_list_IN )
+            
+            # start from saved snapshot, if incremental and it was made with
+            #     the same settings.
+            self.snapshot = None
+            if ( ( incremental_IN == True ) and ( os.path.exists( snapshot_path_IN ) == True ) ):
+            
+                loaded_snapshot = NetworkPersonSnapshot.load( snapshot_path_IN )
+                if ( loaded_snapshot.is_same_settings( current_snapshot ) == True ):
+                
+                    self.snapshot = loaded_snapshot
+                    
+                else:
+                
+                    print( "In " + me + ": snapshot " + snapshot_path_IN + " is for tags " + str( loaded_snapshot.tag_list ) + ", coder types " + str( loaded_snapshot.coder_type_list ) + ", coder priorities " + str( loaded_snapshot.coder_priority_array ) + "; not " + str( current_snapshot.tag_list ) + ", " + str( current_snapshot.coder_type_list ) + ", " + str( current_snapshot.coder_priority_array ) + " - processing all articles." )
+                    
+                #-- END check to see if snapshot has same settings --#
+                
+            #-- END check to see if incremental --#
+            
+            if ( self.snapshot is None ):
+            
+                self.snapshot = current_snapshot
+                
+            #-- END check to see if snapshot loaded --#
+            
+            # ID and last_modified of every Article_Data we might look at...
+            article_data_qs = Article_Data.objects.filter( article__in = article_qs )
+            article_data_qs = self.filter_article_data( article_data_qs )
+            article_data_array = NetworkPersonSnapshot.make_article_data_array( article_data_qs.values_list( "article_id", "id", "last_modified" ) )
+            
+            # ...and of their authors and subjects (editing these doesn't
+            #     update Article_Data.last_modified).
+            article_person_array_list = []
+            article_person_array_list.append( NetworkPersonSnapshot.make_article_person_array( Article_Author.objects.filter( article_data__in = article_data_qs ).values_list( "article_data__article_id", "article_data_id", "id", "person_id", "author_type", "last_modified" ), NetworkPersonSnapshot.PERSON_ROW_TYPE_AUTHOR ) )
+            article_person_array_list.append( NetworkPersonSnapshot.make_article_person_array( Article_Subject.objects.filter( article_data__in = article_data_qs ).values_list( "article_data__article_id", "article_data_id", "id", "person_id", "subject_type", "last_modified" ), NetworkPersonSnapshot.PERSON_ROW_TYPE_SUBJECT ) )
+            article_person_array = numpy.concatenate( article_person_array_list )
+            
+            # only process articles whose coding changed (all, if new
+            #     snapshot), after clearing out their old ties.
+            changed_article_id_list = self.snapshot.get_changed_article_id_list( article_data_array, article_person_array )
+            self.snapshot.remove_articles( changed_article_id_list )
+            self.snapshot.article_data_array = article_data_array
+            self.snapshot.article_person_array = article_person_array
+            process_article_qs = article_qs.filter( id__in = changed_article_id_list )
+            print( "In " + me + ": processing " + str( len( changed_article_id_list ) ) + " new or changed articles." )
+            
+        else:
+        
+            self.snapshot = None
+        
+        #-- END check to see if snapshot --#
             
         # loop over the articles.
         article_data_counter = 0
-        for current_article in article_qs:
+        for current_article in process_article_qs:
         
             # initialize variables
             coder_article_data = None
@@ -423,6 +684,31 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
                     
         #-- END loop over articles. --#
         
+        # snapshot?  Build matrices for every index from its ties, and save.
+        if ( self.snapshot is not None ):
+        
+            self.coder_index_to_data_map = {}
+            self.coder_index_to_matrix_map = {}
+            for coder_index in self.snapshot.get_index_list():
+            
+                self.coder_index_to_matrix_map[ coder_index ] = self.snapshot.build_index_matrix( coder_index )
+                self.build_index_data_from_matrix( coder_index )
+                
+            #-- END loop over indices in snapshot --#
+            
+            self.snapshot.save( snapshot_path_IN )
+
+        # sparse backend?  Build author and source data from the matrices.
+        elif ( self.use_sparse_backend == True ):
+        
+            for coder_index in sorted( self.coder_index_to_matrix_map.keys() ):
+            
+                self.build_index_data_from_matrix( coder_index )
+                
+            #-- END loop over indices with matrices --#
+            
+        #-- END check to see if sparse backend --#
+        
         # now, look over all the resulting data to update each coder's author
         #    data so it includes information on sources shared between authors.
         self.update_author_shared_sources()
@@ -444,6 +730,65 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
     #-- END method process_articles() --#
 
 
+    def make_snapshot( self, tag_list_IN ):
+
+        '''
+        Accepts list of tags.  Returns new, empty NetworkPersonSnapshot with
+            the settings that decide which Article_Data are processed for
+            each index - the tags, the automated coder types
+            filter_article_data() limits to, and ( index, coder ID, priority )
+            for each coder assigned to an index.
+        '''
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        coder_type_list = None
+        coder_priority_row_list = None
+        coder_index = -1
+        index_info = None
+        coder_id = -1
+
+        instance_OUT = NetworkPersonSnapshot()
+        instance_OUT.tag_list = list( tag_list_IN )
+
+        # automated coder types - same logic as filter_article_data().
+        if ( ( self.limit_to_automated_coder_type is not None ) and ( self.limit_to_automated_coder_type != "" ) ):
+
+            coder_type_list = [ self.limit_to_automated_coder_type ]
+
+        else:
+
+            coder_type_list = self.automated_coder_type_include_list
+
+        #-- END check to see if single automated coder type --#
+
+        if ( isinstance( coder_type_list, list ) == True ):
+
+            instance_OUT.coder_type_list = list( coder_type_list )
+
+        #-- END check to see if list --#
+
+        # coder priorities for each index.
+        coder_priority_row_list = []
+        for coder_index, index_info in six.iteritems( self.get_index_to_info_map() ):
+
+            for coder_id in index_info.get_coder_id_to_info_map().keys():
+
+                coder_priority_row_list.append( ( int( coder_index ), int( coder_id ), index_info.get_coder_priority( coder_id ) ) )
+
+            #-- END loop over coders for index --#
+
+        #-- END loop over indices --#
+
+        instance_OUT.coder_priority_array = NetworkPersonSnapshot.make_coder_priority_array( coder_priority_row_list )
+
+        return instance_OUT
+
+    #-- END method make_snapshot() --#
+
+
     def process_relations( self, index_IN, article_data_IN ):
         
         '''
@@ -464,6 +809,7 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
         author_person = None
         current_source = None
         source_person = None
+        index_matrix = None
         
         # make sure we have an instance
         if ( article_data_IN is not None ):
@@ -480,28 +826,80 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
             # ...and source QuerySet.
             article_source_qs = article_data_IN.get_quoted_article_sources_qs()
             
+            # sparse backend?
+            if ( ( self.use_sparse_backend == True ) and ( self.snapshot is None ) ):
+            
+                # yes - get matrix for index.
+                index_matrix = self.get_index_matrix( index_IN )
+                
+            #-- END check to see if sparse backend --#
+            
             # for each author...
             for current_author in article_author_qs:
             
                 # get author person.
                 author_person = current_author.person
                 
-                # update author article id list
-                self.update_author_article_id_list( index_IN, author_person, article_id )
+                # snapshot?
+                if ( self.snapshot is not None ):
+                
+                    # record article and ties in snapshot.
+                    if ( author_person is not None ):
                     
-                # update author info for each related source.
-                for current_source in article_source_qs:
+                        self.snapshot.add_article( index_IN, article_id, author_person.id )
+                        for current_source in article_source_qs:
+                        
+                            source_person = current_source.person
+                            if ( source_person is not None ):
+                            
+                                self.snapshot.add_tie( index_IN, article_id, author_person.id, source_person.id )
+                                
+                            #-- END check to see if source person --#
+                            
+                        #-- END loop over sources --#
+                        
+                    #-- END check to see if author person --#
+                    
+                # sparse?
+                elif ( index_matrix is not None ):
                 
-                    # get source person
-                    source_person = current_source.person
+                    # add article and ties to matrix.
+                    if ( author_person is not None ):
+                    
+                        index_matrix.add_article( author_person.id, article_id )
+                        for current_source in article_source_qs:
+                        
+                            source_person = current_source.person
+                            if ( source_person is not None ):
+                            
+                                index_matrix.add_tie( author_person.id, source_person.id )
+                                
+                            #-- END check to see if source person --#
+                            
+                        #-- END loop over sources --#
+                        
+                    #-- END check to see if author person --#
                     
-                    # call method to update author info.
-                    self.update_author_info( author_person, source_person, index_IN )
+                else:
                 
-                    # call method to update source info.
-                    self.update_source_info( author_person, source_person, index_IN )
+                    # update author article id list
+                    self.update_author_article_id_list( index_IN, author_person, article_id )
+                        
+                    # update author info for each related source.
+                    for current_source in article_source_qs:
+                    
+                        # get source person
+                        source_person = current_source.person
+                        
+                        # call method to update author info.
+                        self.update_author_info( author_person, source_person, index_IN )
+                    
+                        # call method to update source info.
+                        self.update_source_info( author_person, source_person, index_IN )
+                        
+                    #-- END loop over sources --#
                     
-                #-- END loop over sources --#
+                #-- END check to see if sparse backend --#
 
             #-- END check to see if QuerySet passed in. --#  
         
@@ -521,7 +919,8 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
            already such that data is processed and ready to be summarized.
            
         Postconditions: updates coder, author, and source info dictionaries with
-           summary information.
+           summary information, including a NetworkPersonSummary of the
+           per-author counts for each coder index.
         '''
         
         # return reference
@@ -544,6 +943,8 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
         article_count = -1
         author_article_id_list = None
         coder_author_article_count_list = None
+        index_matrix = None
+        coder_summary = None
         
         if ( self.DEBUG == True ):
             print( "" )
@@ -569,63 +970,96 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
             # retrieve author data dictionary.
             author_id_to_data_dict = coder_data_dict.get( self.PROP_CODER_AUTHOR_DATA, None )
             
-            # loop over authors
-            for author_id, author_info in six.iteritems( author_id_to_data_dict ):
-        
-                # initialize variables    
-                source_list = None
-                source_count = -1
-                shared_source_info = None
-                shared_source_count = -1
+            # sparse backend for this index?
+            index_matrix = None
+            if ( self.use_sparse_backend == True ):
+            
+                index_matrix = self.coder_index_to_matrix_map.get( coder_index, None )
                 
-                # add id to ID list
-                coder_author_id_list.append( author_id )
+            #-- END check to see if sparse backend --#
+            
+            if ( index_matrix is not None ):
+            
+                # yes - counts for all authors at once, from the matrices.
+                coder_summary = NetworkPersonSummary( index_matrix.author_id_list, index_matrix.get_source_count_array(), index_matrix.get_shared_source_count_array(), index_matrix.get_article_count_array() )
+                coder_author_id_list = list( index_matrix.author_id_list )
+                coder_author_source_count_list = coder_summary.source_count_array.tolist()
+                coder_author_shared_count_list = coder_summary.shared_count_array.tolist()
+                coder_author_article_count_list = coder_summary.article_count_array.tolist()
+                
+                # store counts in author info, too.
+                for author_id, source_count, shared_source_count in zip( coder_author_id_list, coder_author_source_count_list, coder_author_shared_count_list ):
+                
+                    author_info = author_id_to_data_dict.setdefault( author_id, {} )
+                    author_info[ self.PROP_AUTHOR_SOURCE_COUNT ] = source_count
+                    author_info[ self.PROP_AUTHOR_SHARED_SOURCE_COUNT ] = shared_source_count
+                    
+                #-- END loop over authors --#
+                
+            else:
+            
+                # loop over authors
+                for author_id, author_info in six.iteritems( author_id_to_data_dict ):
+        
+                    # initialize variables    
+                    source_list = None
+                    source_count = -1
+                    shared_source_info = None
+                    shared_source_count = -1
+                
+                    # add id to ID list
+                    coder_author_id_list.append( author_id )
         
-                # get source list...
-                source_list = author_info.get( self.PROP_AUTHOR_SOURCE_LIST, None )
+                    # get source list...
+                    source_list = author_info.get( self.PROP_AUTHOR_SOURCE_LIST, None )
             
-                # ...and shared source info from author data.
-                shared_source_info = author_info.get( self.PROP_AUTHOR_SHARED_SOURCE_INFO, None )
+                    # ...and shared source info from author data.
+                    shared_source_info = author_info.get( self.PROP_AUTHOR_SHARED_SOURCE_INFO, None )
                 
-                # get lengths and add to author info and appropriate lists.
+                    # get lengths and add to author info and appropriate lists.
                 
-                # source count
-                source_count = 0
-                if ( source_list is not None ):
+                    # source count
+                    source_count = 0
+                    if ( source_list is not None ):
                 
-                    # got a source list.
-                    source_count = len( source_list )
+                        # got a source list.
+                        source_count = len( source_list )
                     
-                #-- END check to see if list is None --#
-                author_info[ self.PROP_AUTHOR_SOURCE_COUNT ] = source_count
-                coder_author_source_count_list.append( source_count )
+                    #-- END check to see if list is None --#
+                    author_info[ self.PROP_AUTHOR_SOURCE_COUNT ] = source_count
+                    coder_author_source_count_list.append( source_count )
             
-                # shared source count
-                shared_source_count = 0
-                if ( shared_source_info is not None ):
+                    # shared source count
+                    shared_source_count = 0
+                    if ( shared_source_info is not None ):
 
-                    shared_source_count = len( shared_source_info )
+                        shared_source_count = len( shared_source_info )
                     
-                #-- END check to see if dictionary is None --#
-                author_info[ self.PROP_AUTHOR_SHARED_SOURCE_COUNT ] = shared_source_count
-                coder_author_shared_count_list.append( shared_source_count )
+                    #-- END check to see if dictionary is None --#
+                    author_info[ self.PROP_AUTHOR_SHARED_SOURCE_COUNT ] = shared_source_count
+                    coder_author_shared_count_list.append( shared_source_count )
                 
-                # get author's article count and add to coder list.
-                author_article_id_list = author_info.get( self.PROP_AUTHOR_ARTICLE_ID_LIST, [] )
-                article_count = len( author_article_id_list )
-                coder_author_article_count_list.append( article_count )
+                    # get author's article count and add to coder list.
+                    author_article_id_list = author_info.get( self.PROP_AUTHOR_ARTICLE_ID_LIST, [] )
+                    article_count = len( author_article_id_list )
+                    coder_author_article_count_list.append( article_count )
 
-                if ( self.DEBUG == True ):
-                    print( "******** In " + me + "(): Summarizing coder index " + str( coder_index ) + "; author " + str( author_id ) + "; article ID list = " + str( author_article_id_list ) )
-                #-- END DEBUG --#
+                    if ( self.DEBUG == True ):
+                        print( "******** In " + me + "(): Summarizing coder index " + str( coder_index ) + "; author " + str( author_id ) + "; article ID list = " + str( author_article_id_list ) )
+                    #-- END DEBUG --#
             
-            #-- END loop over authors. --#
+                #-- END loop over authors. --#
+                
+                coder_summary = NetworkPersonSummary( coder_author_id_list, coder_author_source_count_list, coder_author_shared_count_list, coder_author_article_count_list )
+            
+            #-- END check to see if sparse backend --#
             
-            # add lists to coder's data.
+            # add lists and summary to coder's data.
             coder_data_dict[ self.PROP_CODER_AUTHOR_ID_LIST ] = coder_author_id_list
             coder_data_dict[ self.PROP_CODER_AUTHOR_SOURCE_COUNT_LIST ] = coder_author_source_count_list
             coder_data_dict[ self.PROP_CODER_AUTHOR_SHARED_COUNT_LIST ] = coder_author_shared_count_list
             coder_data_dict[ self.PROP_CODER_AUTHOR_ARTICLE_COUNT_LIST ] = coder_author_article_count_list
+            coder_data_dict[ self.PROP_CODER_SUMMARY ] = coder_summary
             
         #-- END loop over coders. --#
         
@@ -805,10 +1239,17 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
         
         '''
         Within the data for each coder (as defined by index, rather than a coder
-           ID), looks through the source data to find instances where a source
-           was quoted by multiple authors, then updates the authors' data so it
-           contains lists of the sources who were shared and the other authors
-           who quoted each source.
+           ID), finds sources quoted by multiple authors, then updates the
+           authors' data so it contains lists of the sources who were shared
+           and the other authors who quoted each source.
+           
+        Works on all authors at once from the index's sparse author x source
+           incidence matrix A (the index's AuthorSourceMatrix if
+           self.use_sparse_backend is True, else one built from the author
+           data): shared sources are the columns of A with more than one
+           author, and an author's related authors are the non-zero entries
+           in their row of the co-occurrence product A * A.T.  Related author
+           lists are in the order authors were first seen for the index.
            
         Preconditions: this method is invoked at the end of process_articles().
            If you invoke it on its own, you must already have called
@@ -832,18 +1273,17 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
         coder_data_dict = None
         author_id_to_data_dict = None
         source_id_to_data_dict = None
-        source_id = -1
-        source_data_dict = None
-        source_author_list = None
-        source_author_count = -1
+        index_matrix = None
+        shared_source_id_lists = None
+        related_author_id_lists = None
+        row = -1
+        author_id = -1
         
-        # declare variables - processing for sources with multiple authors.
-        shared_author_id = -1
+        # declare variables - processing for authors with shared sources.
         shared_author_data = None
         author_shared_sources = None
-        author_related_authors = None
         shared_source_dict = None
-        current_related_author_id = -1
+        source_id = -1
 
         print( "" )
         print( "Start of " + me + "():" )
@@ -858,88 +1298,45 @@ class NetworkPersonInfo( ReliabilityNamesBuilder ):
             author_id_to_data_dict = coder_data_dict.get( self.PROP_CODER_AUTHOR_DATA, None )
             source_id_to_data_dict = coder_data_dict.get( self.PROP_CODER_SOURCE_DATA, None )
             
-            # start with source data - loop looking for sources with more than
-            #    one author.
-            for source_id, source_data_dict in six.iteritems( source_id_to_data_dict ):
+            # get incidence matrix for index.
+            if ( self.use_sparse_backend == True ):
             
-                # get author list.
-                source_author_list = source_data_dict.get( self.PROP_SOURCE_AUTHOR_LIST, None )
+                index_matrix = self.get_index_matrix( coder_index )
                 
-                # get count of authors for source
-                source_author_count = len( source_author_list )
+            else:
+            
+                index_matrix = self.build_index_matrix_from_data( coder_index )
                 
-                # if greater than 1, need to process.
-                if ( source_author_count > 1 ):
+            #-- END check to see if sparse backend --#
+            
+            # shared sources and related authors for all authors at once.
+            shared_source_id_lists = index_matrix.get_shared_source_id_lists()
+            related_author_id_lists = index_matrix.get_related_author_id_lists()
+            
+            for row, author_id in enumerate( index_matrix.author_id_list ):
+            
+                # any shared sources?
+                if ( len( shared_source_id_lists[ row ] ) > 0 ):
                 
-                    print( "In " + me + ": multiple authors ( " + str( source_author_list ) + " for source " + str( source_id ) )
-                    
-                    # for each author, need to get their data and add info on
-                    #    shared source.
-                    for shared_author_id in source_author_list:
+                    # yes - add shared source info and list of authors with
+                    #    whom the current author shared sources.
+                    shared_author_data = author_id_to_data_dict[ author_id ]
+                    author_shared_sources = {}
+                    for source_id in shared_source_id_lists[ row ]:
                     
-                        # get data for author
-                        shared_author_data = author_id_to_data_dict[ shared_author_id ]
+                        shared_source_dict = {}
+                        shared_source_dict[ self.PROP_SHARED_SOURCE_ID ] = source_id
+                        shared_source_dict[ self.PROP_SHARED_SOURCE_AUTHOR_LIST ] = source_id_to_data_dict[ source_id ].get( self.PROP_SOURCE_AUTHOR_LIST, None )
+                        author_shared_sources[ source_id ] = shared_source_dict
                         
-                        # see if the author has anything stored for shared
-                        #    sources.
-                        author_shared_sources = shared_author_data.get( self.PROP_AUTHOR_SHARED_SOURCE_INFO, None )
-                        author_related_authors = shared_author_data.get( self.PROP_AUTHOR_SHARED_SOURCE_AUTHORS_LIST, None )
-                        if ( author_shared_sources is None ):
-                        
-                            # no.  Add shared source info and list of authors
-                            #    with whom the current author shared sources.
-                            author_shared_sources = {}
-                            shared_author_data[ self.PROP_AUTHOR_SHARED_SOURCE_INFO ] = author_shared_sources
-                            author_related_authors = []
-                            shared_author_data[ self.PROP_AUTHOR_SHARED_SOURCE_AUTHORS_LIST ] = author_related_authors
-                        
-                        #-- END check to see if author has shared source information --#
-                        
-                        # add information on source to shared source info.
-                        #   - in self.PROP_AUTHOR_SHARED_SOURCE_INFO
-                        
-                        # is shared source already captured?
-                        if ( source_id not in author_shared_sources ):
-                        
-                            # no.  Populate dictionary...
-                            shared_source_dict = {}
-                            shared_source_dict[ self.PROP_SHARED_SOURCE_ID ] = source_id
-                            shared_source_dict[ self.PROP_SHARED_SOURCE_AUTHOR_LIST ] = source_author_list
-
-                            # ...then add it to author's shared source info.
-                            author_shared_sources[ source_id ] = shared_source_dict
-                            
-                        else:
-                        
-                            # if present, output message, but also leave alone.
-                            print( "In " + me + ": Source " + str( source_id ) + " already in shared sources for author " + str( shared_author_id ) + ".  This should not have happened..." )
-                            
-                        #-- END check to see if source is in author's list of shared sources. --#
-                        
-                        # make sure all related authors are in list of authors
-                        #   with whom the current author shares sources.
-                        for current_related_author_id in source_author_list:
-                        
-                            # is author in master list?
-                            if ( current_related_author_id not in author_related_authors ):
-                            
-                                # no.  Add it.
-                                author_related_authors.append( current_related_author_id )
-                                
-                            #-- END check to see if related author is in author's list. --#
-                         
-                        #-- END loop over related authors for current source --#
+                    #-- END loop over shared sources --#
                     
-                    #-- END loop over shared author data. --#
-                
-                else:
-                
-                    # only one author for this source - moving on.
-                    pass
-                
-                #-- END check to see if more than one author for the current source. --#
+                    shared_author_data[ self.PROP_AUTHOR_SHARED_SOURCE_INFO ] = author_shared_sources
+                    shared_author_data[ self.PROP_AUTHOR_SHARED_SOURCE_AUTHORS_LIST ] = related_author_id_lists[ row ]
+                    
+                #-- END check to see if author has shared sources --#
             
-            #-- END loop over sources. --#
+            #-- END loop over authors. --#
         
         #-- END loop over coders. --#
         
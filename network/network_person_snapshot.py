@@ -0,0 +1,603 @@
+from __future__ import unicode_literals
+from __future__ import division
+
+'''
+Copyright 2016-2017 Jonathan Morgan
+
+This file is part of http://github.com/jonathanmorgan/context_analysis.
+
+context_analysis is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+
+context_analysis is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with http://github.com/jonathanmorgan/context_analysis. If not, see http://www.gnu.org/licenses/.
+'''
+
+#==============================================================================#
+# ! imports
+#==============================================================================#
+
+# python base imports
+import datetime
+import os
+import zlib
+
+# stats and analysis
+import numpy
+
+# context_analysis imports
+from context_analysis.network.author_source_matrix import AuthorSourceMatrix
+
+
+#-------------------------------------------------------------------------------
+# ! class definitions
+#-------------------------------------------------------------------------------
+
+
+class NetworkPersonSnapshot( object ):
+
+    '''
+    Per-article record of the author-to-source ties (and author-to-article
+        links) NetworkPersonInfo found for each coder index, plus the ID and
+        last_modified of each Article_Data, Article_Author, and
+        Article_Subject it looked at, so a later run can re-process only the
+        articles whose coding changed:
+        - rows are kept per index in int64 numpy arrays - ties as ( article ID,
+            author ID, source ID ), article links as ( article ID, author ID ).
+        - Article_Data are kept as ( article ID, Article_Data ID,
+            last_modified in microseconds since the epoch ).
+        - Article_Author and Article_Subject are kept as ( article ID,
+            Article_Data ID, PERSON_ROW_TYPE_*, row ID, person ID, type code,
+            last_modified ) - type code is from get_type_code() of
+            author_type or subject_type.
+        - the settings that decide which Article_Data are used for each index
+            are kept too - tags, automated coder types, and ( index, coder ID,
+            priority ) rows - so a snapshot made with other settings is not
+            reused (see is_same_settings()).
+        - saved to and loaded from a compressed numpy .npz file.
+        - removing an article drops all its rows, so it can be processed again.
+    '''
+
+
+    #---------------------------------------------------------------------------
+    # constants-ish
+    #---------------------------------------------------------------------------
+
+
+    # dtype of ID arrays
+    ID_DTYPE = numpy.int64
+
+    # column counts
+    TIE_COLUMN_COUNT = 3
+    ARTICLE_COLUMN_COUNT = 2
+    ARTICLE_DATA_COLUMN_COUNT = 3
+    ARTICLE_PERSON_COLUMN_COUNT = 7
+    CODER_PRIORITY_COLUMN_COUNT = 3
+
+    # article person row types
+    PERSON_ROW_TYPE_AUTHOR = 1
+    PERSON_ROW_TYPE_SUBJECT = 2
+
+    # .npz array names
+    FILE_KEY_TAG_LIST = "tag_list"
+    FILE_KEY_CODER_TYPE_LIST = "coder_type_list"
+    FILE_KEY_CODER_PRIORITY = "coder_priority"
+    FILE_KEY_ARTICLE_DATA = "article_data"
+    FILE_KEY_ARTICLE_PERSON = "article_person"
+    FILE_KEY_INDEX_PREFIX = "index_"
+    FILE_KEY_TIES_SUFFIX = "_ties"
+    FILE_KEY_ARTICLES_SUFFIX = "_articles"
+
+
+    #---------------------------------------------------------------------------
+    # class methods
+    #---------------------------------------------------------------------------
+
+
+    @classmethod
+    def load( cls, file_path_IN ):
+
+        '''
+        Accepts path of snapshot file written by save().  Returns
+            NetworkPersonSnapshot with the file's contents.
+        '''
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        npz_file = None
+        array_name = ""
+        index_string = ""
+        index = -1
+
+        instance_OUT = cls()
+        with numpy.load( file_path_IN, allow_pickle = False ) as npz_file:
+
+            instance_OUT.tag_list = [ str( tag ) for tag in npz_file[ cls.FILE_KEY_TAG_LIST ].tolist() ]
+            instance_OUT.article_data_array = npz_file[ cls.FILE_KEY_ARTICLE_DATA ].reshape( -1, cls.ARTICLE_DATA_COLUMN_COUNT )
+
+            # older snapshots don't have these - settings then won't match,
+            #     so everything is processed again.
+            if ( cls.FILE_KEY_CODER_TYPE_LIST in npz_file.files ):
+
+                instance_OUT.coder_type_list = [ str( coder_type ) for coder_type in npz_file[ cls.FILE_KEY_CODER_TYPE_LIST ].tolist() ]
+                instance_OUT.coder_priority_array = npz_file[ cls.FILE_KEY_CODER_PRIORITY ].reshape( -1, cls.CODER_PRIORITY_COLUMN_COUNT )
+                instance_OUT.article_person_array = npz_file[ cls.FILE_KEY_ARTICLE_PERSON ].reshape( -1, cls.ARTICLE_PERSON_COLUMN_COUNT )
+
+            else:
+
+                instance_OUT.coder_priority_array = None
+
+            #-- END check to see if settings in file --#
+
+            for array_name in npz_file.files:
+
+                if ( array_name.startswith( cls.FILE_KEY_INDEX_PREFIX ) == True ):
+
+                    # index_<index>_ties or index_<index>_articles
+                    index_string = array_name[ len( cls.FILE_KEY_INDEX_PREFIX ) : ]
+                    if ( index_string.endswith( cls.FILE_KEY_TIES_SUFFIX ) == True ):
+
+                        index = int( index_string[ : - len( cls.FILE_KEY_TIES_SUFFIX ) ] )
+                        instance_OUT.index_to_tie_array_map[ index ] = npz_file[ array_name ].reshape( -1, cls.TIE_COLUMN_COUNT )
+
+                    elif ( index_string.endswith( cls.FILE_KEY_ARTICLES_SUFFIX ) == True ):
+
+                        index = int( index_string[ : - len( cls.FILE_KEY_ARTICLES_SUFFIX ) ] )
+                        instance_OUT.index_to_article_array_map[ index ] = npz_file[ array_name ].reshape( -1, cls.ARTICLE_COLUMN_COUNT )
+
+                    #-- END check to see what kind of index array --#
+
+                #-- END check to see if index array --#
+
+            #-- END loop over arrays in file --#
+
+        #-- END with numpy.load() --#
+
+        return instance_OUT
+
+    #-- END class method load() --#
+
+
+    #---------------------------------------------------------------------------
+    # static methods
+    #---------------------------------------------------------------------------
+
+
+    @staticmethod
+    def get_timestamp_int( datetime_IN ):
+
+        '''
+        Accepts datetime.  Returns integer microseconds since the epoch (in
+            the datetime's timezone if naive, UTC if aware), or -1 if None.
+        '''
+
+        # return reference
+        value_OUT = -1
+
+        # declare variables
+        epoch_datetime = None
+
+        if ( datetime_IN is not None ):
+
+            if ( datetime_IN.tzinfo is None ):
+
+                epoch_datetime = datetime.datetime( 1970, 1, 1 )
+
+            else:
+
+                epoch_datetime = datetime.datetime( 1970, 1, 1, tzinfo = datetime.timezone.utc )
+
+            #-- END check to see if timezone aware --#
+
+            value_OUT = ( datetime_IN - epoch_datetime ) // datetime.timedelta( microseconds = 1 )
+
+        #-- END check to see if datetime --#
+
+        return value_OUT
+
+    #-- END static method get_timestamp_int() --#
+
+
+    @staticmethod
+    def get_type_code( type_IN ):
+
+        '''
+        Accepts author_type or subject_type string.  Returns integer code for
+            it (CRC-32 of the UTF-8 string, so the same from run to run), or -1
+            if None.
+        '''
+
+        # return reference
+        value_OUT = -1
+
+        if ( type_IN is not None ):
+
+            value_OUT = zlib.crc32( str( type_IN ).encode( "utf-8" ) )
+
+        #-- END check to see if type --#
+
+        return value_OUT
+
+    #-- END static method get_type_code() --#
+
+
+    @staticmethod
+    def make_article_data_array( article_data_row_list_IN ):
+
+        '''
+        Accepts iterable of ( article ID, Article_Data ID, last_modified )
+            tuples (as from values_list()).  Returns int64 array of ( article
+            ID, Article_Data ID, last_modified microseconds ) rows.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        # declare variables
+        article_id = -1
+        article_data_id = -1
+        last_modified = None
+
+        array_OUT = numpy.array( [ ( article_id, article_data_id, NetworkPersonSnapshot.get_timestamp_int( last_modified ) ) for article_id, article_data_id, last_modified in article_data_row_list_IN ], dtype = NetworkPersonSnapshot.ID_DTYPE ).reshape( -1, NetworkPersonSnapshot.ARTICLE_DATA_COLUMN_COUNT )
+
+        return array_OUT
+
+    #-- END static method make_article_data_array() --#
+
+
+    @staticmethod
+    def make_article_person_array( article_person_row_list_IN, person_row_type_IN ):
+
+        '''
+        Accepts iterable of ( article ID, Article_Data ID, row ID, person ID,
+            author_type or subject_type, last_modified ) tuples (as from
+            values_list()) and the PERSON_ROW_TYPE_* of the rows.  Returns
+            int64 array of ( article ID, Article_Data ID, row type, row ID,
+            person ID (-1 if None), type code, last_modified microseconds )
+            rows.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        # declare variables
+        article_id = -1
+        article_data_id = -1
+        row_id = -1
+        person_id = -1
+        person_type = None
+        last_modified = None
+
+        array_OUT = numpy.array( [ ( article_id, article_data_id, person_row_type_IN, row_id, -1 if person_id is None else person_id, NetworkPersonSnapshot.get_type_code( person_type ), NetworkPersonSnapshot.get_timestamp_int( last_modified ) ) for article_id, article_data_id, row_id, person_id, person_type, last_modified in article_person_row_list_IN ], dtype = NetworkPersonSnapshot.ID_DTYPE ).reshape( -1, NetworkPersonSnapshot.ARTICLE_PERSON_COLUMN_COUNT )
+
+        return array_OUT
+
+    #-- END static method make_article_person_array() --#
+
+
+    @staticmethod
+    def make_coder_priority_array( coder_priority_row_list_IN ):
+
+        '''
+        Accepts iterable of ( index, coder ID, priority ) tuples.  Returns
+            int64 array of the rows, sorted, so the same settings always give
+            the same array.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        array_OUT = numpy.array( sorted( coder_priority_row_list_IN ), dtype = NetworkPersonSnapshot.ID_DTYPE ).reshape( -1, NetworkPersonSnapshot.CODER_PRIORITY_COLUMN_COUNT )
+
+        return array_OUT
+
+    #-- END static method make_coder_priority_array() --#
+
+
+    #---------------------------------------------------------------------------
+    # instance methods
+    #---------------------------------------------------------------------------
+
+
+    def __init__( self ):
+
+        # declare instance variables - tags of articles in snapshot.
+        self.tag_list = []
+
+        # settings - automated coder types, ( index, coder ID, priority ) rows.
+        self.coder_type_list = []
+        self.coder_priority_array = numpy.zeros( ( 0, self.CODER_PRIORITY_COLUMN_COUNT ), dtype = self.ID_DTYPE )
+
+        # ( article ID, Article_Data ID, last_modified ) rows.
+        self.article_data_array = numpy.zeros( ( 0, self.ARTICLE_DATA_COLUMN_COUNT ), dtype = self.ID_DTYPE )
+
+        # Article_Author and Article_Subject rows.
+        self.article_person_array = numpy.zeros( ( 0, self.ARTICLE_PERSON_COLUMN_COUNT ), dtype = self.ID_DTYPE )
+
+        # compacted per-index rows.
+        self.index_to_tie_array_map = {}
+        self.index_to_article_array_map = {}
+
+        # pending per-index rows, not yet compacted.
+        self.index_to_tie_row_list_map = {}
+        self.index_to_article_row_list_map = {}
+
+    #-- END method __init__() --#
+
+
+    def add_article( self, index_IN, article_id_IN, author_id_IN ):
+
+        '''
+        Accepts coder index, article ID, and author person ID.  Records that
+            the index's coding has the author writing the article.
+        '''
+
+        self.index_to_article_row_list_map.setdefault( index_IN, [] ).append( ( article_id_IN, author_id_IN ) )
+
+    #-- END method add_article() --#
+
+
+    def add_tie( self, index_IN, article_id_IN, author_id_IN, source_id_IN ):
+
+        '''
+        Accepts coder index, article ID, and author and source person IDs.
+            Records one mention of the source by the author in the article for
+            the index.
+        '''
+
+        self.index_to_tie_row_list_map.setdefault( index_IN, [] ).append( ( article_id_IN, author_id_IN, source_id_IN ) )
+
+    #-- END method add_tie() --#
+
+
+    def build_index_matrix( self, index_IN ):
+
+        '''
+        Accepts coder index.  Returns AuthorSourceMatrix with the index's
+            article links and ties added in article ID order (rows for an
+            article in the order recorded), so IDs are first seen in the same
+            order as when processing all articles by ID.
+        '''
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        article_array = None
+        tie_array = None
+        article_id = -1
+        author_id = -1
+        source_id = -1
+
+        self.compact()
+        instance_OUT = AuthorSourceMatrix()
+
+        article_array = self.index_to_article_array_map.get( index_IN, None )
+        tie_array = self.index_to_tie_array_map.get( index_IN, None )
+
+        if ( article_array is not None ):
+
+            article_array = article_array[ numpy.argsort( article_array[ :, 0 ], kind = "stable" ) ]
+            for article_id, author_id in article_array.tolist():
+
+                instance_OUT.add_article( author_id, article_id )
+
+            #-- END loop over article links --#
+
+        #-- END check to see if article links --#
+
+        if ( tie_array is not None ):
+
+            tie_array = tie_array[ numpy.argsort( tie_array[ :, 0 ], kind = "stable" ) ]
+            for article_id, author_id, source_id in tie_array.tolist():
+
+                instance_OUT.add_tie( author_id, source_id )
+
+            #-- END loop over ties --#
+
+        #-- END check to see if ties --#
+
+        return instance_OUT
+
+    #-- END method build_index_matrix() --#
+
+
+    def compact( self ):
+
+        '''
+        Appends pending rows to the per-index arrays.  Clears the pending
+            lists.
+        '''
+
+        # declare variables
+        index = -1
+        row_list = None
+        existing_array = None
+
+        for index, row_list in self.index_to_tie_row_list_map.items():
+
+            existing_array = self.index_to_tie_array_map.get( index, numpy.zeros( ( 0, self.TIE_COLUMN_COUNT ), dtype = self.ID_DTYPE ) )
+            self.index_to_tie_array_map[ index ] = numpy.concatenate( [ existing_array, numpy.array( row_list, dtype = self.ID_DTYPE ).reshape( -1, self.TIE_COLUMN_COUNT ) ] )
+
+        #-- END loop over pending ties --#
+
+        for index, row_list in self.index_to_article_row_list_map.items():
+
+            existing_array = self.index_to_article_array_map.get( index, numpy.zeros( ( 0, self.ARTICLE_COLUMN_COUNT ), dtype = self.ID_DTYPE ) )
+            self.index_to_article_array_map[ index ] = numpy.concatenate( [ existing_array, numpy.array( row_list, dtype = self.ID_DTYPE ).reshape( -1, self.ARTICLE_COLUMN_COUNT ) ] )
+
+        #-- END loop over pending article links --#
+
+        self.index_to_tie_row_list_map = {}
+        self.index_to_article_row_list_map = {}
+
+    #-- END method compact() --#
+
+
+    def get_changed_article_id_list( self, article_data_array_IN, article_person_array_IN = None ):
+
+        '''
+        Accepts array of the current ( article ID, Article_Data ID,
+            last_modified ) rows (from make_article_data_array()), and
+            optionally array of the current Article_Author and Article_Subject
+            rows (from make_article_person_array()).  Returns sorted list of
+            IDs of articles that have an Article_Data, Article_Author, or
+            Article_Subject that was added, removed, or modified since the
+            snapshot, including articles no longer present at all.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        changed_article_id_set = None
+        snapshot_array = None
+        current_array = None
+        snapshot_row_set = None
+        current_row_set = None
+        changed_row = None
+
+        changed_article_id_set = set()
+        for snapshot_array, current_array in [ ( self.article_data_array, article_data_array_IN ), ( self.article_person_array, article_person_array_IN ) ]:
+
+            if ( current_array is not None ):
+
+                snapshot_row_set = set( map( tuple, snapshot_array.tolist() ) )
+                current_row_set = set( map( tuple, current_array.tolist() ) )
+                changed_article_id_set.update( [ changed_row[ 0 ] for changed_row in snapshot_row_set.symmetric_difference( current_row_set ) ] )
+
+            #-- END check to see if current rows --#
+
+        #-- END loop over row arrays --#
+
+        list_OUT = sorted( changed_article_id_set )
+
+        return list_OUT
+
+    #-- END method get_changed_article_id_list() --#
+
+
+    def get_index_list( self ):
+
+        '''
+        Returns sorted list of coder indices with rows in the snapshot.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        self.compact()
+        list_OUT = sorted( set( self.index_to_tie_array_map.keys() ) | set( self.index_to_article_array_map.keys() ) )
+
+        return list_OUT
+
+    #-- END method get_index_list() --#
+
+
+    def is_same_settings( self, snapshot_IN ):
+
+        '''
+        Accepts NetworkPersonSnapshot.  Returns True if it has the same tags,
+            automated coder types, and coder index priorities as this
+            snapshot (order of tags and coder types doesn't matter), False if
+            not.
+        '''
+
+        # return reference
+        is_same_OUT = False
+
+        is_same_OUT = ( ( sorted( self.tag_list ) == sorted( snapshot_IN.tag_list ) )
+                        and ( sorted( self.coder_type_list ) == sorted( snapshot_IN.coder_type_list ) )
+                        and ( self.coder_priority_array is not None )
+                        and ( snapshot_IN.coder_priority_array is not None )
+                        and ( numpy.array_equal( self.coder_priority_array, snapshot_IN.coder_priority_array ) == True ) )
+
+        return is_same_OUT
+
+    #-- END method is_same_settings() --#
+
+
+    def remove_articles( self, article_id_list_IN ):
+
+        '''
+        Accepts list of article IDs.  Removes all tie, article link,
+            Article_Data, and Article_Author/Article_Subject rows for those
+            articles, from all indices.
+        '''
+
+        # declare variables
+        article_id_array = None
+        index = -1
+        row_array = None
+
+        self.compact()
+        article_id_array = numpy.array( article_id_list_IN, dtype = self.ID_DTYPE )
+
+        for index, row_array in list( self.index_to_tie_array_map.items() ):
+
+            self.index_to_tie_array_map[ index ] = row_array[ ~ numpy.isin( row_array[ :, 0 ], article_id_array ) ]
+
+        #-- END loop over index ties --#
+
+        for index, row_array in list( self.index_to_article_array_map.items() ):
+
+            self.index_to_article_array_map[ index ] = row_array[ ~ numpy.isin( row_array[ :, 0 ], article_id_array ) ]
+
+        #-- END loop over index article links --#
+
+        self.article_data_array = self.article_data_array[ ~ numpy.isin( self.article_data_array[ :, 0 ], article_id_array ) ]
+        self.article_person_array = self.article_person_array[ ~ numpy.isin( self.article_person_array[ :, 0 ], article_id_array ) ]
+
+    #-- END method remove_articles() --#
+
+
+    def save( self, file_path_IN ):
+
+        '''
+        Accepts file path.  Writes snapshot to it as a compressed numpy .npz
+            file (to a temporary file first, then moved into place, so an
+            interrupted save does not clobber the last good snapshot).
+        '''
+
+        # declare variables
+        temp_file_path = ""
+        array_dict = None
+        index = -1
+        row_array = None
+        output_file = None
+
+        self.compact()
+
+        array_dict = {}
+        array_dict[ self.FILE_KEY_TAG_LIST ] = numpy.array( [ str( tag ) for tag in self.tag_list ], dtype = numpy.str_ )
+        array_dict[ self.FILE_KEY_CODER_TYPE_LIST ] = numpy.array( [ str( coder_type ) for coder_type in self.coder_type_list ], dtype = numpy.str_ )
+        array_dict[ self.FILE_KEY_CODER_PRIORITY ] = self.coder_priority_array
+        array_dict[ self.FILE_KEY_ARTICLE_DATA ] = self.article_data_array
+        array_dict[ self.FILE_KEY_ARTICLE_PERSON ] = self.article_person_array
+        for index, row_array in self.index_to_tie_array_map.items():
+
+            array_dict[ self.FILE_KEY_INDEX_PREFIX + str( index ) + self.FILE_KEY_TIES_SUFFIX ] = row_array
+
+        #-- END loop over index ties --#
+
+        for index, row_array in self.index_to_article_array_map.items():
+
+            array_dict[ self.FILE_KEY_INDEX_PREFIX + str( index ) + self.FILE_KEY_ARTICLES_SUFFIX ] = row_array
+
+        #-- END loop over index article links --#
+
+        temp_file_path = file_path_IN + ".tmp"
+        with open( temp_file_path, "wb" ) as output_file:
+
+            numpy.savez_compressed( output_file, **array_dict )
+
+        #-- END with open() --#
+
+        os.replace( temp_file_path, file_path_IN )
+
+    #-- END method save() --#
+
+
+#-- END class NetworkPersonSnapshot --#
@@ -0,0 +1,283 @@
+from __future__ import unicode_literals
+from __future__ import division
+
+'''
+Copyright 2016-2017 Jonathan Morgan
+
+This file is part of http://github.com/jonathanmorgan/context_analysis.
+
+context_analysis is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+
+context_analysis is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with http://github.com/jonathanmorgan/context_analysis. If not, see http://www.gnu.org/licenses/.
+'''
+
+#==============================================================================#
+# ! imports
+#==============================================================================#
+
+# stats and analysis
+import numpy
+
+
+#-------------------------------------------------------------------------------
+# ! class definitions
+#-------------------------------------------------------------------------------
+
+
+class NetworkPersonSummary( object ):
+
+    '''
+    Per-author summary counts NetworkPersonInfo.summarize_data() computes for
+        one coder index, as parallel numpy arrays (one row per author, in
+        author_id_array order):
+        - author_id_array - author person IDs.
+        - source_count_array - count of distinct sources per author.
+        - shared_count_array - count of sources also quoted by another author.
+        - article_count_array - count of articles per author.
+
+    Statistics take a column name (COLUMN_*), and return None if there are no
+        authors.  Filters return a new NetworkPersonSummary with just the
+        matching authors, so they can be chained.
+    '''
+
+
+    #---------------------------------------------------------------------------
+    # constants-ish
+    #---------------------------------------------------------------------------
+
+
+    # column names
+    COLUMN_AUTHOR_ID = "author_id"
+    COLUMN_SOURCE_COUNT = "source_count"
+    COLUMN_SHARED_COUNT = "shared_count"
+    COLUMN_ARTICLE_COUNT = "article_count"
+    COLUMN_NAME_LIST = [ COLUMN_AUTHOR_ID, COLUMN_SOURCE_COUNT, COLUMN_SHARED_COUNT, COLUMN_ARTICLE_COUNT ]
+
+    # dtype of arrays
+    COUNT_DTYPE = numpy.int64
+
+
+    #---------------------------------------------------------------------------
+    # instance methods
+    #---------------------------------------------------------------------------
+
+
+    def __init__( self, author_id_list_IN = [], source_count_list_IN = [], shared_count_list_IN = [], article_count_list_IN = [] ):
+
+        '''
+        Accepts parallel lists (or arrays) of author IDs and their source,
+            shared source, and article counts.
+        '''
+
+        # declare instance variables - one array per column.
+        self.author_id_array = numpy.asarray( author_id_list_IN, dtype = self.COUNT_DTYPE )
+        self.source_count_array = numpy.asarray( source_count_list_IN, dtype = self.COUNT_DTYPE )
+        self.shared_count_array = numpy.asarray( shared_count_list_IN, dtype = self.COUNT_DTYPE )
+        self.article_count_array = numpy.asarray( article_count_list_IN, dtype = self.COUNT_DTYPE )
+
+    #-- END method __init__() --#
+
+
+    def __len__( self ):
+
+        return len( self.author_id_array )
+
+    #-- END method __len__() --#
+
+
+    def filter( self, mask_IN ):
+
+        '''
+        Accepts boolean array with one value per author.  Returns new
+            NetworkPersonSummary with just the authors where it is True.
+        '''
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        mask_array = None
+
+        mask_array = numpy.asarray( mask_IN, dtype = bool )
+        instance_OUT = NetworkPersonSummary( self.author_id_array[ mask_array ], self.source_count_array[ mask_array ], self.shared_count_array[ mask_array ], self.article_count_array[ mask_array ] )
+
+        return instance_OUT
+
+    #-- END method filter() --#
+
+
+    def filter_minimum( self, column_name_IN, minimum_IN ):
+
+        '''
+        Accepts column name and minimum value.  Returns new
+            NetworkPersonSummary with just the authors whose value in the
+            column is greater than or equal to the minimum.
+        '''
+
+        # return reference
+        instance_OUT = None
+
+        instance_OUT = self.filter( self.get_array( column_name_IN ) >= minimum_IN )
+
+        return instance_OUT
+
+    #-- END method filter_minimum() --#
+
+
+    def filter_shared( self ):
+
+        '''
+        Returns new NetworkPersonSummary with just the authors who have at
+            least one shared source.
+        '''
+
+        # return reference
+        instance_OUT = None
+
+        instance_OUT = self.filter_minimum( self.COLUMN_SHARED_COUNT, 1 )
+
+        return instance_OUT
+
+    #-- END method filter_shared() --#
+
+
+    def get_array( self, column_name_IN ):
+
+        '''
+        Accepts column name (COLUMN_*).  Returns the column's numpy array.
+            Throws ValueError if unknown column.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        if ( column_name_IN == self.COLUMN_AUTHOR_ID ):
+
+            array_OUT = self.author_id_array
+
+        elif ( column_name_IN == self.COLUMN_SOURCE_COUNT ):
+
+            array_OUT = self.source_count_array
+
+        elif ( column_name_IN == self.COLUMN_SHARED_COUNT ):
+
+            array_OUT = self.shared_count_array
+
+        elif ( column_name_IN == self.COLUMN_ARTICLE_COUNT ):
+
+            array_OUT = self.article_count_array
+
+        else:
+
+            raise ValueError( "Unknown column name: " + str( column_name_IN ) + "; should be one of " + str( self.COLUMN_NAME_LIST ) )
+
+        #-- END check to see which column --#
+
+        return array_OUT
+
+    #-- END method get_array() --#
+
+
+    def get_mean( self, column_name_IN ):
+
+        '''
+        Accepts column name.  Returns mean of the column as a float, or None
+            if no authors.
+        '''
+
+        # return reference
+        value_OUT = None
+
+        if ( len( self ) > 0 ):
+
+            value_OUT = float( numpy.mean( self.get_array( column_name_IN ) ) )
+
+        #-- END check to see if any authors --#
+
+        return value_OUT
+
+    #-- END method get_mean() --#
+
+
+    def get_median( self, column_name_IN ):
+
+        '''
+        Accepts column name.  Returns median of the column as a float, or None
+            if no authors.
+        '''
+
+        # return reference
+        value_OUT = None
+
+        if ( len( self ) > 0 ):
+
+            value_OUT = float( numpy.median( self.get_array( column_name_IN ) ) )
+
+        #-- END check to see if any authors --#
+
+        return value_OUT
+
+    #-- END method get_median() --#
+
+
+    def get_percentile( self, column_name_IN, percentile_IN ):
+
+        '''
+        Accepts column name and percentile (0 to 100, or a list of them).
+            Returns the column's percentile as a float (list of floats if list
+            passed in), linearly interpolated, or None if no authors.
+        '''
+
+        # return reference
+        value_OUT = None
+
+        if ( len( self ) > 0 ):
+
+            value_OUT = numpy.percentile( self.get_array( column_name_IN ), percentile_IN ).tolist()
+
+        #-- END check to see if any authors --#
+
+        return value_OUT
+
+    #-- END method get_percentile() --#
+
+
+    def get_sum( self, column_name_IN ):
+
+        '''
+        Accepts column name.  Returns sum of the column as an int.
+        '''
+
+        # return reference
+        value_OUT = None
+
+        value_OUT = int( numpy.sum( self.get_array( column_name_IN ) ) )
+
+        return value_OUT
+
+    #-- END method get_sum() --#
+
+
+    def to_data_frame( self ):
+
+        '''
+        Returns pandas DataFrame with one row per author and a column per
+            COLUMN_* name.
+        '''
+
+        # return reference
+        data_frame_OUT = None
+
+        # pandas only needed here, so import on use.
+        import pandas
+
+        data_frame_OUT = pandas.DataFrame( dict( [ ( column_name, self.get_array( column_name ) ) for column_name in self.COLUMN_NAME_LIST ] ), columns = self.COLUMN_NAME_LIST )
+
+        return data_frame_OUT
+
+    #-- END method to_data_frame() --#
+
+
+#-- END class NetworkPersonSummary --#
@@ -39,6 +39,7 @@ from context_text.models import Article_Subject
 from context_text.models import Person
 
 # context_analysis imports
+from context_analysis.lru_cache import LRUCache
 from context_analysis.models import Reliability_Names
 from context_analysis.reliability.index_info import IndexInfo
 from context_analysis.reliability.coder_index_info import CoderIndexInfo
@@ -71,6 +72,9 @@ class IndexHelper( object ):
     MAPPING_INDEX_TO_CODER = "index-to-coder"
     MAPPING_CODER_TO_INDEX = "coder-to-index"
     
+    # per-article index-to-coder cache
+    DEFAULT_ARTICLE_CODER_CACHE_MAX_SIZE = 1000
+    
     # DEBUG
     DEBUG = False
 
@@ -97,6 +101,10 @@ class IndexHelper( object ):
         self.m_limit_to_user_id_list = []
         self.m_exclude_user_id_list = []
         
+        # cache of article ID to index-to-coder map, least recently used first.
+        self.m_article_id_to_coder_map_cache = LRUCache()
+        self.article_coder_cache_max_size = self.DEFAULT_ARTICLE_CODER_CACHE_MAX_SIZE
+        
         # exception helper
         self.m_exception_helper = ExceptionHelper()
         self.m_exception_helper.set_logger_name( self.LOGGER_NAME )
@@ -220,6 +228,9 @@ class IndexHelper( object ):
                 # add the coder.
                 add_status = index_info.add_coder( coder_user_id, coder_priority )
                 
+                # coder configuration changed - clear per-article cache.
+                self.clear_article_coder_cache()
+                
                 # ==> DEBUG
                 if ( debug_flag == True ):
                     # top of add.
@@ -289,6 +300,9 @@ class IndexHelper( object ):
         # get index-to-info map
         index_to_info_dict = self.get_index_to_info_map()
         
+        # coder configuration might change - clear per-article cache.
+        self.clear_article_coder_cache()
+        
         # loop over indexes present in map.
         for current_index, current_index_info in six.iteritems( index_to_info_dict ):
         
@@ -304,6 +318,80 @@ class IndexHelper( object ):
     #-- END method build_index_info() --#
 
 
+    def build_index_to_coder_map( self, article_coder_id_list_IN ):
+        
+        '''
+        Accepts list of the coder IDs of all Article_Data for an article (one
+            entry per Article_Data).  Returns the dictionary that maps each
+            configured index to the User instance of the highest-priority
+            coder for that index who is in the list.  Does not touch the
+            database or the per-article cache.
+        '''
+        
+        # return reference
+        map_OUT = {}
+        
+        # declare variables
+        index_to_info_map = None
+        current_index = -1
+        index_info = None
+        current_coder = None
+        
+        # loop over indexes that have info (so just those that are
+        #     configured, not all).  For each, get coder for article.
+        index_to_info_map = self.get_index_to_info_map()
+        for current_index, index_info in six.iteritems( index_to_info_map ):
+        
+            # use index_info to pick coder from article's coder IDs.
+            current_coder = index_info.get_coder_from_coder_id_list( article_coder_id_list_IN )
+            
+            # got something?
+            if ( current_coder is not None ):
+            
+                # Place coder in map of index to coder.
+                map_OUT[ current_index ] = current_coder
+                
+            #-- END check to see if coder for article. --#
+            
+        #-- END loop over index info --#
+        
+        return map_OUT
+        
+    #-- END method build_index_to_coder_map() --#
+
+
+    def clear_article_coder_cache( self, article_id_IN = None ):
+        
+        '''
+        Invalidates the per-article index-to-coder cache used by
+            map_index_to_coder_for_article().  If an article ID is passed in,
+            removes just that article's entry.  If not, clears the whole cache.
+            Call this if an article's Article_Data change while this helper is
+            in use.
+        '''
+        
+        # declare variables
+        article_cache = None
+        
+        # get cache
+        article_cache = self.m_article_id_to_coder_map_cache
+        
+        # article ID passed in?
+        if ( article_id_IN is not None ):
+        
+            # yes - just remove that article.
+            article_cache.pop( article_id_IN )
+            
+        else:
+        
+            # no - clear everything.
+            article_cache.clear()
+            
+        #-- END check to see if article ID --#
+        
+    #-- END method clear_article_coder_cache() --#
+
+
     def get_coder_for_index( self, index_IN ):
         
         '''
@@ -467,6 +555,109 @@ class IndexHelper( object ):
     #-- END method get_info_for_index() --#
     
         
+    def get_index_to_coder_map_for_article( self, article_IN ):
+
+        '''
+        Accepts an article.  Returns the dictionary that maps each configured
+            index to the User instance of the highest-priority coder for that
+            index who has an Article_Data for the article.  The map is built
+            from a single list of the coder IDs of the article's Article_Data,
+            then cached by article ID, so repeat calls for the same article
+            (one per author and subject) do not hit the database.
+            
+        Postconditions: cache holds at most self.article_coder_cache_max_size
+            articles, least recently used dropped first.  Use
+            clear_article_coder_cache() to invalidate.  Do not alter the map
+            that is returned - it is the cached instance.
+        '''
+
+        # return reference
+        map_OUT = None
+
+        # declare variables
+        me = "get_index_to_coder_map_for_article"
+        article_cache = None
+        article_id = None
+        article_coder_id_list = None
+
+        # article
+        if ( article_IN is not None ):
+
+            # check cache (marks article as most recently used if found).
+            article_cache = self.m_article_id_to_coder_map_cache
+            article_id = article_IN.id
+            map_OUT = article_cache.get( article_id )
+            if ( map_OUT is None ):
+
+                # not cached.  Get coder IDs of all the article's Article_Data
+                #     in one query.
+                article_coder_id_list = list( Article_Data.objects.filter( article_id = article_id ).values_list( "coder_id", flat = True ) )
+                map_OUT = self.build_index_to_coder_map( article_coder_id_list )
+
+                # add to cache, trimmed to size.
+                article_cache.set( article_id, map_OUT, max_size_IN = self.article_coder_cache_max_size )
+
+            #-- END check to see if in cache --#
+
+        #-- END check to see if article passed in --#
+
+        return map_OUT
+
+    #-- END method get_index_to_coder_map_for_article() --#
+
+
+    def get_index_to_coder_map_for_article_id_list( self, article_id_list_IN ):
+
+        '''
+        Accepts list of article IDs.  Returns dictionary that maps each article
+            ID to its index-to-coder map (same as
+            get_index_to_coder_map_for_article() returns), built from the
+            coder IDs of all the articles' Article_Data, retrieved in a single
+            query.  For bulk output - results are not added to the per-article
+            cache.
+        '''
+
+        # return reference
+        map_OUT = {}
+
+        # declare variables
+        me = "get_index_to_coder_map_for_article_id_list"
+        article_id_to_coder_id_list_map = None
+        article_id = -1
+        coder_id = -1
+        article_coder_id_list = None
+
+        # got IDs?
+        if ( ( article_id_list_IN is not None ) and ( len( article_id_list_IN ) > 0 ) ):
+
+            # coder IDs of all the articles' Article_Data, in one query.
+            article_id_to_coder_id_list_map = {}
+            for article_id in article_id_list_IN:
+
+                article_id_to_coder_id_list_map[ article_id ] = []
+
+            #-- END loop over article IDs --#
+
+            for article_id, coder_id in Article_Data.objects.filter( article_id__in = article_id_list_IN ).values_list( "article_id", "coder_id" ):
+
+                article_id_to_coder_id_list_map[ article_id ].append( coder_id )
+
+            #-- END loop over Article_Data --#
+
+            # build each article's map.
+            for article_id, article_coder_id_list in six.iteritems( article_id_to_coder_id_list_map ):
+
+                map_OUT[ article_id ] = self.build_index_to_coder_map( article_coder_id_list )
+
+            #-- END loop over articles --#
+
+        #-- END check to see if IDs passed in --#
+
+        return map_OUT
+
+    #-- END method get_index_to_coder_map_for_article_id_list() --#
+
+
     def get_index_to_info_map( self, *args, **kwargs ):
         
         '''
@@ -572,6 +763,10 @@ class IndexHelper( object ):
         Postconditions: Returns dictionary that maps each index that has been
             assigned one or more coders to the User instance of coder who should
             be used to provide data for that index for the provided article.
+            If mapping_type_IN is MAPPING_CODER_TO_INDEX, instead returns
+            dictionary that maps each coder User to the list of indices they
+            provide data for.  Both are built from the same cached per-article
+            index-to-coder map (see get_index_to_coder_map_for_article()).
         '''
 
         # return reference
@@ -580,14 +775,10 @@ class IndexHelper( object ):
         # declare variables - coding processing.
         me = "map_index_to_coder_for_article"
         my_logger = None
-        article_data_qs = None
-        index_to_info_map = None
-        index = -1
-        index_info = None
+        index_to_coder_map = None
+        current_index = -1
         current_coder = None
-        current_coder_id = -1
         current_coder_index_list = None
-        found_coder_for_index = False
         
         # init logger
         my_logger = self.m_exception_helper        
@@ -595,72 +786,43 @@ class IndexHelper( object ):
         # article
         if ( article_IN is not None ):
     
-            # retrieve the Article_Data QuerySet.    
-            article_data_qs = article_IN.article_data_set.all()
+            # get index-to-coder map for the article (cached).
+            index_to_coder_map = self.get_index_to_coder_map_for_article( article_IN )
 
-            # loop over indexes that have info (so just those that are
-            #     configured, not all).  For each, call IndexInfo method
-            #     get_coder_for_article() to get coder for article, add it to
-            #     the return map.
+            # How do we map?
             map_OUT = {}
+            if ( mapping_type_IN == self.MAPPING_INDEX_TO_CODER ):
             
-            # to start, get index-to-info map
-            index_to_info_map = self.get_index_to_info_map()
-
-            # loop.
-            for current_index, index_info in six.iteritems( index_to_info_map ):
+                # Copy map of index to coder, so cache can't be altered.
+                map_OUT = dict( index_to_coder_map )
             
-                # init
-                found_coder_for_index = False
-                current_coder = None
+            elif ( mapping_type_IN == self.MAPPING_CODER_TO_INDEX ):
             
-                # use index_info to get coder for article.
-                current_coder = index_info.get_coder_for_article( article_IN )
-                
-                # got something?
-                if ( current_coder is not None ):
+                # loop.
+                for current_index, current_coder in six.iteritems( index_to_coder_map ):
                 
-                    # got one.  How do we map?
-                    if ( mapping_type_IN == self.MAPPING_INDEX_TO_CODER ):
+                    # already in map? - coders can map to multiple indices.
+                    if ( current_coder not in map_OUT ):
                     
-                        # Place coder in map of index to coder...
-                        map_OUT[ current_index ] = current_coder
+                        # no - add list for coder.
+                        map_OUT[ current_coder ] = []
+                        
+                    #-- END check to see if coder already in map --#
                     
-                    elif ( mapping_type_IN == self.MAPPING_CODER_TO_INDEX ):
+                    # get coder's list.
+                    current_coder_index_list = map_OUT.get( current_coder, None )
                     
-                        # already in map? - coders can map to multiple indices.
-                        if ( current_coder not in map_OUT ):
-                        
-                            # no - add list for coder.
-                            map_OUT[ current_coder ] = []
-                            
-                        #-- END check to see if coder already in map --#
-                        
-                        # get coder's list.
-                        current_coder_index_list = map_OUT.get( current_coder, None )
-                        
-                        # add index to list if not already there.
-                        if ( current_index not in current_coder_index_list ):
-                        
-                            # not in list - add.
-                            current_coder_index_list.append( current_index )
-                            
-                        #-- END check to see if index in coder's index list. --#
+                    # add index to list if not already there.
+                    if ( current_index not in current_coder_index_list ):
+                    
+                        # not in list - add.
+                        current_coder_index_list.append( current_index )
                         
-                    #-- END check to see mapping type --#
-
-                    # ...and set found flag to True to avoid
-                    #     more lookups.
-                    found_coder_for_index = True
+                    #-- END check to see if index in coder's index list. --#
                     
-                else:
-                
-                    # no coder found.
-                    found_coder_for_index = False
-                
-                #-- END check to see if coder for article. --#
+                #-- END loop over index-to-coder map --#
                     
-            #-- END loop over index info --#
+            #-- END check to see mapping type --#
             
         #-- END check to see if article actually passed in. --#
         
@@ -687,6 +849,9 @@ class IndexHelper( object ):
         # store whatever is passed in.
         self.m_index_to_info_map = map_IN
         
+        # coder configuration changed - clear per-article cache.
+        self.clear_article_coder_cache()
+        
         return status_OUT
 
     #-- END function set_index_to_info_map() --#
@@ -310,7 +310,7 @@ class IndexInfo( object ):
     #-- END method build_index_info() --#
 
 
-    def get_coder_for_article( self, article_IN, *args, **kwargs ):
+    def get_coder_for_article( self, article_IN, article_coder_id_list_IN = None, *args, **kwargs ):
 
         '''
         Accepts an article for which we want to pick a coder.  Returns User
@@ -320,6 +320,11 @@ class IndexInfo( object ):
             index with coders, go through the prioritized list of coders and use
             the first that has an Article_Data in the current article.
             
+        If article_coder_id_list_IN is passed in, it should be a list of the
+            coder IDs of all Article_Data for the article (one entry per
+            Article_Data).  It is used in place of querying Article_Data for
+            each coder.
+            
         Preconditions: This object needs to have been configured with at least
             one coder assigned to an index.
             
@@ -351,8 +356,14 @@ class IndexInfo( object ):
             # For a given article, go through the prioritized list of coders and
             #     use the first that has an Article_Data in the current article.
             current_index_coder_list = self.get_prioritized_coder_list()
-                
-            if ( ( current_index_coder_list is not None )
+            
+            # got a list of coder IDs for the article?
+            if ( article_coder_id_list_IN is not None ):
+            
+                # yes - no need to query.
+                coder_OUT = self.get_coder_from_coder_id_list( article_coder_id_list_IN, current_index_coder_list )
+            
+            elif ( ( current_index_coder_list is not None )
                 and ( isinstance( current_index_coder_list, list ) == True )
                 and ( len( current_index_coder_list ) > 0 ) ):
             
@@ -467,6 +478,85 @@ class IndexInfo( object ):
     #-- END method get_coder_for_index() --#
     
         
+    def get_coder_from_coder_id_list( self, article_coder_id_list_IN, coder_list_IN = None ):
+
+        '''
+        Accepts a list of the coder IDs of the Article_Data for an article (one
+            entry per Article_Data) and an optional prioritized list of coder
+            User instances (if None, uses get_prioritized_coder_list()).
+            Returns the first coder in the prioritized list whose ID is in the
+            article's coder ID list, or None if none found.  Does not touch the
+            database.
+        '''
+
+        # return reference
+        coder_OUT = None
+
+        # declare variables
+        me = "get_coder_from_coder_id_list"
+        my_logger = None
+        logging_message = ""
+        coder_list = None
+        current_coder = None
+        article_data_count = -1
+
+        # init logger
+        my_logger = self.m_exception_helper
+
+        # got a coder list?
+        coder_list = coder_list_IN
+        if ( coder_list is None ):
+
+            # no - use this index's prioritized list.
+            coder_list = self.get_prioritized_coder_list()
+
+        #-- END check to see if coder list passed in. --#
+
+        if ( ( article_coder_id_list_IN is not None )
+            and ( coder_list is not None )
+            and ( len( coder_list ) > 0 ) ):
+
+            # loop over coders, return first with Article_Data.
+            for current_coder in coder_list:
+
+                # coder already found?
+                if ( coder_OUT is None ):
+
+                    # how many Article_Data for this coder?
+                    article_data_count = article_coder_id_list_IN.count( current_coder.id )
+                    if ( article_data_count > 0 ):
+
+                        # got at least one.  Return this coder!
+                        coder_OUT = current_coder
+
+                        # more than one?  Log it, same as in
+                        #     get_coder_for_article().
+                        if ( article_data_count > 1 ):
+
+                            logging_message = "In " + me + "(): multiple Article_Data ( " + str( article_data_count ) + " ) - coder should have updated coding, rather than creating multiple.  Something ain't right here.  Index = " + str( self.get_index() ) + "; current_coder = " + str( current_coder ) + "."
+                            my_logger.output_debug_message( logging_message, method_IN = me, indent_with_IN = "====> ", do_print_IN = False )
+
+                        #-- END check to see if more than one Article_Data --#
+
+                    #-- END check to see if coder has Article_Data --#
+
+                #-- END check to see if already found a coder --#
+
+            #-- END loop over coder list --#
+
+        else:
+
+            # no coders.  Log a message, omit this index, and move on.
+            logging_message = "No coders for index " + str( self.get_index() ) + ".  Moving on."
+            my_logger.output_debug_message( logging_message, method_IN = me  )
+
+        #-- END check to see if coder list and ID list --#
+
+        return coder_OUT
+
+    #-- END method get_coder_from_coder_id_list() --#
+
+
     def get_coder_id_to_info_map( self ):
         
         '''
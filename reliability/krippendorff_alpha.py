@@ -0,0 +1,547 @@
+from __future__ import unicode_literals
+from __future__ import division
+
+'''
+Copyright 2016-2017 Jonathan Morgan
+
+This file is part of http://github.com/jonathanmorgan/context_analysis.
+
+context_analysis is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+
+context_analysis is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with http://github.com/jonathanmorgan/context_analysis. If not, see http://www.gnu.org/licenses/.
+'''
+
+#==============================================================================#
+# ! imports
+#==============================================================================#
+
+# stats and analysis
+import numpy
+import scipy.sparse
+
+# python_utilities
+from python_utilities.analysis.statistics.stats_helper import StatsHelper
+
+
+#-------------------------------------------------------------------------------
+# ! class definitions
+#-------------------------------------------------------------------------------
+
+
+class KrippendorffAlpha( object ):
+
+    '''
+    NumPy implementation of Krippendorff's alpha, built on coincidences, for
+        use in place of R's irr::kripp.alpha().  Supports nominal, ordinal,
+        interval, and ratio measurement levels and missing values (numpy.nan).
+
+    Reliability data is passed as a numpy array with one row per unit (person
+        row) and one column per coder (so the transpose of what
+        irr::kripp.alpha() expects).  For all columns at once, pass a 3-D array
+        of units x coders x columns to compute_alpha_for_columns().
+
+    Coincidences are kept as one entry per ordered pair of values from
+        different coders in a pairable unit (see build_pair_arrays()), and
+        coincidence matrices are scipy.sparse, so memory grows with the number
+        of values coded, not with units x distinct values or distinct values
+        squared - high-cardinality columns like organization hashes are fine.
+
+    As with irr::kripp.alpha(), if there is no expected disagreement (all
+        pairable values the same), alpha is numpy.nan.
+    '''
+
+
+    #---------------------------------------------------------------------------
+    # constants-ish
+    #---------------------------------------------------------------------------
+
+
+    # measurement levels
+    MEASUREMENT_LEVEL_NOMINAL = StatsHelper.MEASUREMENT_LEVEL_NOMINAL
+    MEASUREMENT_LEVEL_ORDINAL = StatsHelper.MEASUREMENT_LEVEL_ORDINAL
+    MEASUREMENT_LEVEL_INTERVAL = StatsHelper.MEASUREMENT_LEVEL_INTERVAL
+    MEASUREMENT_LEVEL_RATIO = StatsHelper.MEASUREMENT_LEVEL_RATIO
+    MEASUREMENT_LEVEL_LIST = [ MEASUREMENT_LEVEL_NOMINAL, MEASUREMENT_LEVEL_ORDINAL, MEASUREMENT_LEVEL_INTERVAL, MEASUREMENT_LEVEL_RATIO ]
+
+    # ordinal and ratio expected disagreement sum over every pair of distinct
+    #     values - at most this many pairs at a time.
+    EXPECTED_BLOCK_SIZE = 1000000
+
+
+    #---------------------------------------------------------------------------
+    # class methods
+    #---------------------------------------------------------------------------
+
+
+    @classmethod
+    def build_coincidence_matrix( cls, value_array_IN, missing_mask_IN = None ):
+
+        '''
+        Accepts 2-D numpy array of reliability data, one row per unit, one
+            column per coder, missing values as numpy.nan, and an optional
+            boolean mask of the same shape that is True where a value is
+            missing (if None, built from numpy.isnan()).  Returns a tuple of:
+            - numpy array of the distinct values found in pairable units, sorted.
+            - coincidence matrix (scipy.sparse CSR, one row and column per
+                distinct value) - each unit with m >= 2 values contributes each
+                ordered pair of its values from different coders, weighted
+                1 / ( m - 1 ).
+        '''
+
+        # return reference
+        values_OUT = None
+        matrix_OUT = None
+
+        # declare variables
+        missing_mask = None
+        value_column_array = None
+        code_1_array = None
+        code_2_array = None
+        weight_array = None
+
+        # one column.
+        if ( missing_mask_IN is not None ):
+
+            missing_mask = numpy.asarray( missing_mask_IN )[ :, :, None ]
+
+        #-- END check to see if mask passed in --#
+
+        values_OUT, value_column_array, code_1_array, code_2_array, weight_array = cls.build_pair_arrays( numpy.asarray( value_array_IN, dtype = numpy.float64 )[ :, :, None ], missing_mask_IN = missing_mask )
+        matrix_OUT = scipy.sparse.coo_matrix( ( weight_array, ( code_1_array, code_2_array ) ), shape = ( len( values_OUT ), len( values_OUT ) ) ).tocsr()
+
+        return values_OUT, matrix_OUT
+
+    #-- END class method build_coincidence_matrix() --#
+
+
+    @classmethod
+    def build_pair_arrays( cls, value_array_IN, missing_mask_IN = None ):
+
+        '''
+        Accepts 3-D numpy array of reliability data, units x coders x columns
+            (missing values as numpy.nan), and an optional boolean mask of the
+            same shape that is True where a value is missing.  Codes the
+            values of all columns in one pass - distinct values are numbered
+            by column, then value, so each column's codes are contiguous and
+            in value order.  Returns a tuple of:
+            - numpy array of the distinct values per column found in pairable
+                units (a unit with 2 or more values in that column).
+            - numpy array of the column of each distinct value.
+            - code_1, code_2, and weight arrays - one entry per ordered pair of
+                values from different coders in a pairable unit, weighted
+                1 / ( m - 1 ) (so the coincidence matrix is their sum).
+        '''
+
+        # return reference
+        values_OUT = None
+        value_column_OUT = None
+        code_1_OUT = None
+        code_2_OUT = None
+        weight_OUT = None
+
+        # declare variables
+        value_array = None
+        present_mask = None
+        present_count_array = None
+        pairable_mask = None
+        coded_mask = None
+        column_indexes = None
+        key_array = None
+        unique_key_array = None
+        code_inverse = None
+        code_array = None
+        weight_array = None
+        coder_count = -1
+        coder_1 = -1
+        coder_2 = -1
+        pair_mask = None
+        code_1_list = []
+        code_2_list = []
+        weight_list = []
+
+        # floats, so nan works.
+        value_array = numpy.asarray( value_array_IN, dtype = numpy.float64 )
+
+        # present values, and units with 2 or more values, per column.
+        if ( missing_mask_IN is None ):
+
+            present_mask = ~numpy.isnan( value_array )
+
+        else:
+
+            present_mask = ~numpy.asarray( missing_mask_IN, dtype = bool )
+
+        #-- END check to see if mask passed in --#
+
+        present_count_array = present_mask.sum( axis = 1 )
+        pairable_mask = ( present_count_array >= 2 )
+        coded_mask = present_mask & pairable_mask[ :, None, : ]
+
+        # distinct ( column, value ) pairs - sorted by column, then value.
+        column_indexes = numpy.nonzero( coded_mask )[ 2 ]
+        key_array = numpy.column_stack( [ column_indexes.astype( numpy.float64 ), value_array[ coded_mask ] ] )
+        if ( len( key_array ) > 0 ):
+
+            unique_key_array, code_inverse = numpy.unique( key_array, axis = 0, return_inverse = True )
+
+        else:
+
+            unique_key_array = numpy.zeros( ( 0, 2 ), dtype = numpy.float64 )
+            code_inverse = numpy.zeros( 0, dtype = numpy.int64 )
+
+        #-- END check to see if any values --#
+
+        values_OUT = unique_key_array[ :, 1 ]
+        value_column_OUT = unique_key_array[ :, 0 ].astype( numpy.int64 )
+
+        # code for each value (-1 if not coded), weight for each unit-column.
+        code_array = numpy.full( value_array.shape, -1, dtype = numpy.int64 )
+        code_array[ coded_mask ] = code_inverse.ravel()
+        weight_array = numpy.zeros( present_count_array.shape, dtype = numpy.float64 )
+        weight_array[ pairable_mask ] = 1.0 / ( present_count_array[ pairable_mask ] - 1 )
+
+        # each ordered pair of coders, all units and columns at once.
+        coder_count = value_array.shape[ 1 ]
+        for coder_1 in range( coder_count ):
+
+            for coder_2 in range( coder_count ):
+
+                if ( coder_1 != coder_2 ):
+
+                    pair_mask = ( code_array[ :, coder_1, : ] >= 0 ) & ( code_array[ :, coder_2, : ] >= 0 )
+                    code_1_list.append( code_array[ :, coder_1, : ][ pair_mask ] )
+                    code_2_list.append( code_array[ :, coder_2, : ][ pair_mask ] )
+                    weight_list.append( weight_array[ pair_mask ] )
+
+                #-- END check to see if different coders --#
+
+            #-- END loop over second coder --#
+
+        #-- END loop over first coder --#
+
+        if ( len( code_1_list ) > 0 ):
+
+            code_1_OUT = numpy.concatenate( code_1_list )
+            code_2_OUT = numpy.concatenate( code_2_list )
+            weight_OUT = numpy.concatenate( weight_list )
+
+        else:
+
+            code_1_OUT = numpy.zeros( 0, dtype = numpy.int64 )
+            code_2_OUT = numpy.zeros( 0, dtype = numpy.int64 )
+            weight_OUT = numpy.zeros( 0, dtype = numpy.float64 )
+
+        #-- END check to see if any coder pairs --#
+
+        return values_OUT, value_column_OUT, code_1_OUT, code_2_OUT, weight_OUT
+
+    #-- END class method build_pair_arrays() --#
+
+
+    @classmethod
+    def compute_alpha( cls, value_array_IN, measurement_level_IN = MEASUREMENT_LEVEL_NOMINAL, missing_mask_IN = None ):
+
+        '''
+        Accepts 2-D numpy array of reliability data (one row per unit, one
+            column per coder, missing values as numpy.nan), measurement level,
+            and optional mask of missing values.  Returns Krippendorff's alpha
+            as a float (numpy.nan if not computable).
+        '''
+
+        # return reference
+        value_OUT = numpy.nan
+
+        # declare variables
+        missing_mask = None
+
+        # one column.
+        if ( missing_mask_IN is not None ):
+
+            missing_mask = numpy.asarray( missing_mask_IN )[ :, :, None ]
+
+        #-- END check to see if mask passed in --#
+
+        value_OUT = cls.compute_alpha_for_columns( numpy.asarray( value_array_IN, dtype = numpy.float64 )[ :, :, None ], [ measurement_level_IN ], missing_mask_IN = missing_mask )[ 0 ]
+
+        return value_OUT
+
+    #-- END class method compute_alpha() --#
+
+
+    @classmethod
+    def compute_alpha_for_columns( cls, value_array_IN, measurement_level_list_IN, missing_mask_IN = None ):
+
+        '''
+        Accepts 3-D numpy array of reliability data, units x coders x columns
+            (missing values as numpy.nan), list of measurement levels, one per
+            column, and optional mask of missing values.  Codes all columns'
+            values at once (build_pair_arrays()), then computes alphas from
+            them.  Returns list of alphas, one per column, in column order.
+        '''
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        values = None
+        value_column_array = None
+        code_1_array = None
+        code_2_array = None
+        weight_array = None
+
+        values, value_column_array, code_1_array, code_2_array, weight_array = cls.build_pair_arrays( value_array_IN, missing_mask_IN = missing_mask_IN )
+        list_OUT = cls.compute_alphas_from_pairs( values, value_column_array, code_1_array, code_2_array, weight_array, measurement_level_list_IN )
+
+        return list_OUT
+
+    #-- END class method compute_alpha_for_columns() --#
+
+
+    @classmethod
+    def compute_alpha_from_coincidence_matrix( cls, values_IN, coincidence_matrix_IN, measurement_level_IN = MEASUREMENT_LEVEL_NOMINAL ):
+
+        '''
+        Accepts sorted array of distinct values, the coincidence matrix for
+            those values, dense or scipy.sparse (see build_coincidence_matrix()
+            - coincidence counts can be summed across chunks of units, so this
+            lets alpha be computed without holding all the data at once), and
+            measurement level.  Returns Krippendorff's alpha as a float
+            (numpy.nan if not computable).
+        '''
+
+        # return reference
+        value_OUT = numpy.nan
+
+        # declare variables
+        values = None
+        coincidence_coo = None
+
+        values = numpy.asarray( values_IN, dtype = numpy.float64 )
+        coincidence_coo = scipy.sparse.coo_matrix( coincidence_matrix_IN, dtype = numpy.float64 )
+        value_OUT = cls.compute_alphas_from_pairs( values, numpy.zeros( len( values ), dtype = numpy.int64 ), coincidence_coo.row, coincidence_coo.col, coincidence_coo.data, [ measurement_level_IN ] )[ 0 ]
+
+        return value_OUT
+
+    #-- END class method compute_alpha_from_coincidence_matrix() --#
+
+
+    @classmethod
+    def compute_alphas_from_pairs( cls, values_IN, value_column_IN, code_1_IN, code_2_IN, weight_IN, measurement_level_list_IN ):
+
+        '''
+        Accepts the outputs of build_pair_arrays() (or a coincidence matrix's
+            entries, all in column 0) and list of measurement levels, one per
+            column.  For each level, computes the observed disagreement of the
+            columns with that level from the pair entries, and their expected
+            disagreement from the value marginals.  Returns list of alphas, one
+            per column (numpy.nan if not computable):
+
+            alpha = 1 - ( n - 1 ) * sum( o_ck * d_ck ) / sum( n_c * n_k * d_ck )
+        '''
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        values = None
+        value_column_array = None
+        code_1_array = None
+        code_2_array = None
+        weight_array = None
+        column_count = -1
+        level_array = None
+        value_counts = None
+        pair_column_array = None
+        total_counts = None
+        observed_array = None
+        expected_array = None
+        measurement_level = None
+        level_column_mask = None
+        pair_mask = None
+        distance_array = None
+        column_index = -1
+        total_count = -1
+
+        values = numpy.asarray( values_IN, dtype = numpy.float64 )
+        value_column_array = numpy.asarray( value_column_IN, dtype = numpy.int64 )
+        code_1_array = numpy.asarray( code_1_IN, dtype = numpy.int64 )
+        code_2_array = numpy.asarray( code_2_IN, dtype = numpy.int64 )
+        weight_array = numpy.asarray( weight_IN, dtype = numpy.float64 )
+        column_count = len( measurement_level_list_IN )
+        level_array = numpy.array( measurement_level_list_IN, dtype = object )
+
+        # marginals - per value (coincidence row sums), then per column.
+        value_counts = numpy.bincount( code_1_array, weights = weight_array, minlength = len( values ) )
+        pair_column_array = value_column_array[ code_1_array ]
+        total_counts = numpy.bincount( value_column_array, weights = value_counts, minlength = column_count )
+
+        # observed and expected disagreement, a level at a time.
+        observed_array = numpy.full( column_count, numpy.nan )
+        expected_array = numpy.full( column_count, numpy.nan )
+        for measurement_level in set( measurement_level_list_IN ):
+
+            if ( measurement_level in cls.MEASUREMENT_LEVEL_LIST ):
+
+                level_column_mask = ( level_array == measurement_level )
+                pair_mask = level_column_mask[ pair_column_array ]
+                distance_array = cls.compute_pair_distances( values, value_counts, measurement_level, code_1_array[ pair_mask ], code_2_array[ pair_mask ] )
+                observed_array[ level_column_mask ] = numpy.bincount( pair_column_array[ pair_mask ], weights = weight_array[ pair_mask ] * distance_array, minlength = column_count )[ level_column_mask ]
+                expected_array[ level_column_mask ] = cls.compute_expected_disagreement( values, value_column_array, value_counts, measurement_level, column_count )[ level_column_mask ]
+
+            #-- END check to see if known level --#
+
+        #-- END loop over levels --#
+
+        # alphas
+        list_OUT = []
+        for column_index in range( column_count ):
+
+            total_count = total_counts[ column_index ]
+            if ( ( total_count > 1 ) and ( expected_array[ column_index ] > 0 ) ):
+
+                list_OUT.append( float( 1.0 - ( ( total_count - 1 ) * observed_array[ column_index ] / expected_array[ column_index ] ) ) )
+
+            else:
+
+                list_OUT.append( numpy.nan )
+
+            #-- END check to see if any expected disagreement --#
+
+        #-- END loop over columns --#
+
+        return list_OUT
+
+    #-- END class method compute_alphas_from_pairs() --#
+
+
+    @classmethod
+    def compute_expected_disagreement( cls, values_IN, value_column_IN, value_counts_IN, measurement_level_IN, column_count_IN ):
+
+        '''
+        Accepts arrays of distinct values, the column of each, and the count
+            (marginal) of each, measurement level, and column count.  Returns
+            array of expected disagreement, sum( n_c * n_k * d_ck ) over all
+            pairs of values in the column, for each column:
+            - nominal - n^2 - sum( n_c^2 ).
+            - interval - 2 * n * sum( n_c * ( c - mean )^2 ).
+            - ordinal and ratio - summed over value pairs, at most
+                EXPECTED_BLOCK_SIZE pairs at a time.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        # declare variables
+        total_counts = None
+        distinct_counts = None
+        column_means = None
+        centered_values = None
+        column_index = -1
+        column_codes = None
+        block_row_count = -1
+        block_start = -1
+        row_codes = None
+        distance_matrix = None
+
+        total_counts = numpy.bincount( value_column_IN, weights = value_counts_IN, minlength = column_count_IN )
+        array_OUT = numpy.zeros( column_count_IN, dtype = numpy.float64 )
+
+        if ( measurement_level_IN == cls.MEASUREMENT_LEVEL_NOMINAL ):
+
+            array_OUT = total_counts ** 2 - numpy.bincount( value_column_IN, weights = value_counts_IN ** 2, minlength = column_count_IN )
+
+        elif ( measurement_level_IN == cls.MEASUREMENT_LEVEL_INTERVAL ):
+
+            # centered on each column's mean, so big values don't cancel (and
+            #     exactly 0 if only one distinct value, despite rounding).
+            column_means = numpy.bincount( value_column_IN, weights = value_counts_IN * values_IN, minlength = column_count_IN ) / numpy.where( total_counts > 0, total_counts, 1.0 )
+            centered_values = values_IN - column_means[ value_column_IN ]
+            array_OUT = 2.0 * total_counts * numpy.bincount( value_column_IN, weights = value_counts_IN * centered_values ** 2, minlength = column_count_IN )
+            distinct_counts = numpy.bincount( value_column_IN, minlength = column_count_IN )
+            array_OUT[ distinct_counts < 2 ] = 0.0
+
+        else:
+
+            # codes for a column are contiguous - sum a block of rows at a time.
+            for column_index in numpy.unique( value_column_IN ).tolist():
+
+                column_codes = numpy.flatnonzero( value_column_IN == column_index )
+                block_row_count = max( 1, cls.EXPECTED_BLOCK_SIZE // len( column_codes ) )
+                for block_start in range( 0, len( column_codes ), block_row_count ):
+
+                    row_codes = column_codes[ block_start : block_start + block_row_count ]
+                    distance_matrix = cls.compute_pair_distances( values_IN, value_counts_IN, measurement_level_IN, row_codes[ :, None ], column_codes[ None, : ] )
+                    array_OUT[ column_index ] += ( value_counts_IN[ row_codes ][ :, None ] * value_counts_IN[ column_codes ][ None, : ] * distance_matrix ).sum()
+
+                #-- END loop over blocks of rows --#
+
+            #-- END loop over columns --#
+
+        #-- END check to see which measurement level --#
+
+        return array_OUT
+
+    #-- END class method compute_expected_disagreement() --#
+
+
+    @classmethod
+    def compute_pair_distances( cls, values_IN, value_counts_IN, measurement_level_IN, code_1_IN, code_2_IN ):
+
+        '''
+        Accepts arrays of distinct values and the count of each (coincidence
+            row sums), measurement level, and arrays of value codes (any
+            shape that broadcasts).  Returns array of squared differences
+            (delta squared) between the values at each pair of codes for that
+            level (for ordinal, both codes must be from the same column).
+            Returns None for unknown level.
+        '''
+
+        # return reference
+        array_OUT = None
+
+        # declare variables
+        value_1_array = None
+        value_2_array = None
+        low_codes = None
+        high_codes = None
+        cumulative_counts = None
+        between_counts = None
+        value_sums = None
+
+        if ( measurement_level_IN == cls.MEASUREMENT_LEVEL_NOMINAL ):
+
+            # 0 if same, 1 if different.
+            array_OUT = ( code_1_IN != code_2_IN ).astype( numpy.float64 )
+
+        elif ( measurement_level_IN == cls.MEASUREMENT_LEVEL_ORDINAL ):
+
+            # ( sum of counts of values from c through k - ( n_c + n_k ) / 2 ) ^ 2
+            low_codes = numpy.minimum( code_1_IN, code_2_IN )
+            high_codes = numpy.maximum( code_1_IN, code_2_IN )
+            cumulative_counts = numpy.cumsum( value_counts_IN )
+            between_counts = cumulative_counts[ high_codes ] - cumulative_counts[ low_codes ] + value_counts_IN[ low_codes ]
+            array_OUT = ( between_counts - ( value_counts_IN[ low_codes ] + value_counts_IN[ high_codes ] ) / 2.0 ) ** 2
+
+        elif ( measurement_level_IN == cls.MEASUREMENT_LEVEL_INTERVAL ):
+
+            # ( c - k ) ^ 2
+            array_OUT = ( values_IN[ code_1_IN ] - values_IN[ code_2_IN ] ) ** 2
+
+        elif ( measurement_level_IN == cls.MEASUREMENT_LEVEL_RATIO ):
+
+            # ( ( c - k ) / ( c + k ) ) ^ 2, 0 where c + k = 0.
+            value_1_array = values_IN[ code_1_IN ]
+            value_2_array = values_IN[ code_2_IN ]
+            value_sums = value_1_array + value_2_array
+            array_OUT = numpy.where( value_sums == 0, 0.0, ( ( value_1_array - value_2_array ) / numpy.where( value_sums == 0, 1.0, value_sums ) ) ** 2 )
+
+        #-- END check to see which measurement level --#
+
+        return array_OUT
+
+    #-- END class method compute_pair_distances() --#
+
+
+#-- END class KrippendorffAlpha --#
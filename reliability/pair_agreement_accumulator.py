@@ -0,0 +1,194 @@
+from __future__ import unicode_literals
+from __future__ import division
+
+'''
+Copyright 2016-2017 Jonathan Morgan
+
+This file is part of http://github.com/jonathanmorgan/context_analysis.
+
+context_analysis is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+
+context_analysis is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with http://github.com/jonathanmorgan/context_analysis. If not, see http://www.gnu.org/licenses/.
+'''
+
+#==============================================================================#
+# ! imports
+#==============================================================================#
+
+# python built-in libraries
+import collections
+
+# stats and analysis
+import numpy
+import scipy.sparse
+
+# context_analysis imports
+from context_analysis.reliability.krippendorff_alpha import KrippendorffAlpha
+
+
+#-------------------------------------------------------------------------------
+# ! class definitions
+#-------------------------------------------------------------------------------
+
+
+class PairAgreementAccumulator( object ):
+
+    '''
+    Accumulates sufficient statistics for agreement between two coders on one
+        column, a chunk of rows at a time, so percentage agreement and
+        Krippendorff's alpha can be computed without holding all the rows in
+        memory:
+        - row_count - number of rows seen.
+        - agree_count - number of rows where the values are equal (nan never
+            equals nan, same as StatsHelper.percentage_agreement()).
+        - pair_count_map - Counter of ( value_1, value_2 ) for rows where both
+            coders have a value - all that is needed to rebuild the coincidence
+            matrix.
+    '''
+
+
+    #---------------------------------------------------------------------------
+    # instance methods
+    #---------------------------------------------------------------------------
+
+
+    def __init__( self ):
+
+        # declare instance variables
+        self.row_count = 0
+        self.agree_count = 0
+        self.pair_count_map = collections.Counter()
+
+    #-- END method __init__() --#
+
+
+    def add_values( self, values_1_IN, values_2_IN, row_mask_IN = None ):
+
+        '''
+        Accepts numpy arrays of the two coders' values for a chunk of rows
+            (missing values as numpy.nan) and an optional boolean mask of rows
+            to include.  Adds them to the statistics.
+        '''
+
+        # declare variables
+        values_1 = None
+        values_2 = None
+        pairable_mask = None
+        pair_array = None
+        unique_pair_array = None
+        unique_count_array = None
+        current_pair = None
+        current_count = -1
+
+        # floats, so nan works.
+        values_1 = numpy.asarray( values_1_IN, dtype = numpy.float64 )
+        values_2 = numpy.asarray( values_2_IN, dtype = numpy.float64 )
+
+        # filter?
+        if ( row_mask_IN is not None ):
+
+            values_1 = values_1[ row_mask_IN ]
+            values_2 = values_2[ row_mask_IN ]
+
+        #-- END check to see if row mask --#
+
+        # counts
+        self.row_count += len( values_1 )
+        self.agree_count += int( ( values_1 == values_2 ).sum() )
+
+        # pairs where both have a value.
+        pairable_mask = ~( numpy.isnan( values_1 ) | numpy.isnan( values_2 ) )
+        if ( pairable_mask.any() == True ):
+
+            pair_array = numpy.column_stack( [ values_1[ pairable_mask ], values_2[ pairable_mask ] ] )
+            unique_pair_array, unique_count_array = numpy.unique( pair_array, axis = 0, return_counts = True )
+            for current_pair, current_count in zip( unique_pair_array, unique_count_array ):
+
+                self.pair_count_map[ ( float( current_pair[ 0 ] ), float( current_pair[ 1 ] ) ) ] += int( current_count )
+
+            #-- END loop over distinct pairs --#
+
+        #-- END check to see if any pairable rows --#
+
+    #-- END method add_values() --#
+
+
+    def get_alpha( self, measurement_level_IN = KrippendorffAlpha.MEASUREMENT_LEVEL_NOMINAL ):
+
+        '''
+        Accepts measurement level.  Returns Krippendorff's alpha for all the
+            values added so far (numpy.nan if not computable).
+        '''
+
+        # return reference
+        value_OUT = None
+
+        # declare variables
+        values = None
+        coincidence_matrix = None
+
+        values, coincidence_matrix = self.get_coincidence_matrix()
+        value_OUT = KrippendorffAlpha.compute_alpha_from_coincidence_matrix( values, coincidence_matrix, measurement_level_IN = measurement_level_IN )
+
+        return value_OUT
+
+    #-- END method get_alpha() --#
+
+
+    def get_coincidence_matrix( self ):
+
+        '''
+        Returns tuple of sorted numpy array of distinct values and coincidence
+            matrix (scipy.sparse CSR), the same as
+            KrippendorffAlpha.build_coincidence_matrix() would return for all
+            the pairable rows added so far (with two coders, each row with
+            values c and k adds 1 to o_ck and 1 to o_kc).
+        '''
+
+        # return reference
+        values_OUT = None
+        matrix_OUT = None
+
+        # declare variables
+        pair_array = None
+        count_array = None
+        position_array = None
+
+        # distinct values, and position of each pair's values.
+        pair_array = numpy.array( list( self.pair_count_map.keys() ), dtype = numpy.float64 ).reshape( -1, 2 )
+        count_array = numpy.array( list( self.pair_count_map.values() ), dtype = numpy.float64 )
+        values_OUT, position_array = numpy.unique( pair_array, return_inverse = True )
+        position_array = position_array.reshape( -1, 2 )
+
+        # each pair adds to o_ck and o_kc (duplicates summed).
+        matrix_OUT = scipy.sparse.coo_matrix( ( numpy.concatenate( [ count_array, count_array ] ), ( numpy.concatenate( [ position_array[ :, 0 ], position_array[ :, 1 ] ] ), numpy.concatenate( [ position_array[ :, 1 ], position_array[ :, 0 ] ] ) ) ), shape = ( len( values_OUT ), len( values_OUT ) ) ).tocsr()
+
+        return values_OUT, matrix_OUT
+
+    #-- END method get_coincidence_matrix() --#
+
+
+    def get_percentage_agreement( self ):
+
+        '''
+        Returns percentage agreement for all the rows added so far, or None if
+            no rows (same as StatsHelper.percentage_agreement()).
+        '''
+
+        # return reference
+        value_OUT = None
+
+        if ( self.row_count > 0 ):
+
+            value_OUT = self.agree_count / self.row_count
+
+        #-- END check to see if any rows --#
+
+        return value_OUT
+
+    #-- END method get_percentage_agreement() --#
+
+
+#-- END class PairAgreementAccumulator --#
@@ -25,8 +25,12 @@ You should have received a copy of the GNU Lesser General Public License along w
 from django.contrib.auth.models import User
 from django.core.exceptions import MultipleObjectsReturned
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections
 
 # python package imports
+import collections
+import multiprocessing
+import multiprocessing.util
 import six
 
 # stats and analysis
@@ -68,7 +72,109 @@ from context_text.shared.context_text_base import ContextTextBase
 
 # context_analysis imports
 from context_analysis.models import Reliability_Names
+from context_analysis.models import Reliability_Names_Coder_Data
 from context_analysis.models import Reliability_Names_Results
+from context_analysis.reliability.krippendorff_alpha import KrippendorffAlpha
+from context_analysis.reliability.pair_agreement_accumulator import PairAgreementAccumulator
+from context_analysis.reliability.rserve_connection_pool import RserveConnectionPool
+
+
+#-------------------------------------------------------------------------------
+# ! process pool workers
+#-------------------------------------------------------------------------------
+
+
+# per-process state for pair workers - set by init_pair_worker().
+pair_worker_analyzer = None
+pair_worker_person_type_to_df_map = None
+
+
+def init_pair_worker( alpha_backend_IN, indices_to_compare_IN, person_type_to_df_map_IN, rserve_host_IN = None, rserve_port_IN = None ):
+
+    '''
+    Process pool initializer for ReliabilityNamesAnalyzer.analyze_pairs_in_parallel().
+        Runs once in each worker process.  Stores the person type to data frame
+        map so it is only sent to each worker once, and creates the worker's own
+        ReliabilityNamesAnalyzer.  If the alpha backend is R, the worker also
+        gets its own warmed Rserve connection (from this process's own
+        RserveConnectionPool for the Rserve host and port passed in), and
+        registers close_pair_worker() to close it when the worker exits.
+    '''
+
+    # declare variables
+    global pair_worker_analyzer
+    global pair_worker_person_type_to_df_map
+
+    # store data.
+    pair_worker_person_type_to_df_map = person_type_to_df_map_IN
+
+    # make analyzer.
+    pair_worker_analyzer = ReliabilityNamesAnalyzer()
+    pair_worker_analyzer.alpha_backend = alpha_backend_IN
+    pair_worker_analyzer.indices_to_compare = indices_to_compare_IN
+    pair_worker_analyzer.rserve_host = rserve_host_IN
+    pair_worker_analyzer.rserve_port = rserve_port_IN
+
+    # R?
+    if ( alpha_backend_IN == ReliabilityNamesAnalyzer.ALPHA_BACKEND_R ):
+
+        pair_worker_analyzer.acquire_rserve_connection()
+
+        # close it when the worker exits (pool workers skip atexit).
+        multiprocessing.util.Finalize( None, close_pair_worker, exitpriority = 10 )
+
+    #-- END check to see if R backend --#
+
+#-- END function init_pair_worker() --#
+
+
+def close_pair_worker():
+
+    '''
+    Process pool finalizer for ReliabilityNamesAnalyzer.analyze_pairs_in_parallel()
+        - registered by init_pair_worker(), runs when a worker process exits.
+        Gives back the worker analyzer's Rserve connection, then closes all of
+        this process's pooled Rserve connections.
+    '''
+
+    # declare variables
+    global pair_worker_analyzer
+
+    if ( pair_worker_analyzer is not None ):
+
+        if ( pair_worker_analyzer.rserve_connection is not None ):
+
+            pair_worker_analyzer.release_rserve_connection()
+
+        #-- END check to see if connection --#
+
+        pair_worker_analyzer = None
+
+    #-- END check to see if worker analyzer --#
+
+    RserveConnectionPool.clear_shared_pool()
+
+#-- END function close_pair_worker() --#
+
+
+def analyze_pair_worker( task_IN ):
+
+    '''
+    Process pool task for ReliabilityNamesAnalyzer.analyze_pairs_in_parallel().
+        Accepts a tuple of ( index_1, index_2, person_type ).  Runs the worker
+        analyzer's analyze_pair_task() for it, and returns the dictionary of
+        result values, so the parent process can merge them into the results
+        for the pair.
+    '''
+
+    # return reference
+    map_OUT = {}
+
+    map_OUT = pair_worker_analyzer.analyze_pair_task( task_IN, pair_worker_person_type_to_df_map )
+
+    return map_OUT
+
+#-- END function analyze_pair_worker() --#
 
 
 #-------------------------------------------------------------------------------
@@ -128,6 +234,12 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
     # person types
     PERSON_TYPE_AUTHOR = RESULTS_COLUMN_NAME_PREFIX_AUTHOR
     PERSON_TYPE_SUBJECT = RESULTS_COLUMN_NAME_PREFIX_SUBJECT
+    
+    # map of person type to value in Reliability_Names.person_type.
+    PERSON_TYPE_TO_ROW_PERSON_TYPE_MAP = {
+        PERSON_TYPE_AUTHOR : ManualArticleCoder.PERSON_TYPE_AUTHOR,
+        PERSON_TYPE_SUBJECT : ManualArticleCoder.PERSON_TYPE_SUBJECT
+    }
     PERSON_TYPE_LIST = [ PERSON_TYPE_AUTHOR, PERSON_TYPE_SUBJECT ]
 
     # measurement levels
@@ -142,6 +254,39 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
     DATA_TYPE_HEX_HASH = "hex_hash"
     DATA_TYPE_LIST = [ DATA_TYPE_INTEGER, DATA_TYPE_DECIMAL, DATA_TYPE_HEX_HASH ]
     
+    # Krippendorff's alpha backends
+    ALPHA_BACKEND_R = "R"  # irr::kripp.alpha() via Rserve
+    ALPHA_BACKEND_NUMPY = "numpy"  # KrippendorffAlpha, in-process
+    ALPHA_BACKEND_LIST = [ ALPHA_BACKEND_R, ALPHA_BACKEND_NUMPY ]
+    DEFAULT_ALPHA_BACKEND = ALPHA_BACKEND_R
+    
+    # parallel processing - number of worker processes (1 = no process pool).
+    DEFAULT_WORKER_COUNT = 1
+    
+    # start method for pair worker processes - fork, so workers inherit
+    #     django setup.
+    PAIR_WORKER_START_METHOD = "fork"
+    
+    # Rserve - reuse warmed connections from RserveConnectionPool?
+    DEFAULT_USE_RSERVE_POOL = True
+    
+    # data load - read coder values from long-format
+    #     Reliability_Names_Coder_Data instead of the coderN_* columns?
+    DEFAULT_USE_CODER_DATA = False
+    
+    # data load - Reliability_Names table, dtypes for loaded columns.
+    RELIABILITY_NAMES_TABLE_NAME = Reliability_Names._meta.db_table
+    DTYPE_CATEGORY = "category"
+    DTYPE_INT32 = "int32"
+    DTYPE_INT32_WITH_NULLS = "float64"  # int32 can't hold NaN.
+    DTYPE_CODER_ID = "Int64"  # nullable, so IDs stay integers when a coder is missing.
+    DTYPE_OBJECT = "object"
+    DATA_TYPE_TO_DTYPE_MAP = {
+        DATA_TYPE_INTEGER : DTYPE_INT32,
+        DATA_TYPE_DECIMAL : "float64",
+        DATA_TYPE_HEX_HASH : DTYPE_OBJECT
+    }
+    
     # truncation directions:
     TRUNCATE_FROM_LEFT = "left"
     TRUNCATE_FROM_RIGHT = "right"
@@ -234,6 +379,18 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
     DEFAULT_COLUMN_INFO_LIST = [ COLUMN_INFO_DETECTED, COLUMN_INFO_PERSON_ID_LOOKUP, COLUMN_INFO_PERSON_TYPE_INT, COLUMN_INFO_FIRST_QUOTE_GRAF, COLUMN_INFO_FIRST_QUOTE_INDEX, COLUMN_INFO_ORGANIZATION_HASH ]
 
     
+    #---------------------------------------------------------------------------
+    # NOT instance variables
+    # Class variables - overriden by __init__() per instance if same names, but
+    #    if not set there, shared!
+    #---------------------------------------------------------------------------
+
+
+    # SQLAlchemy engines for pandas, keyed on database URL, shared by all
+    #     instances so each run reuses the engine's connection pool.
+    pandas_db_engine_cache = {}
+
+
     #---------------------------------------------------------------------------
     # instance methods
     #---------------------------------------------------------------------------
@@ -263,6 +420,21 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
         self.indices_to_compare = -1
         self.columns_to_compare = {}
         
+        # how do we compute Krippendorff's alpha? ( ALPHA_BACKEND_* )
+        self.alpha_backend = self.DEFAULT_ALPHA_BACKEND
+        
+        # how many processes do we use to analyze pairs?
+        self.worker_count = self.DEFAULT_WORKER_COUNT
+        
+        # Rserve connection pooling - if rserve_pool is None, uses
+        #     RserveConnectionPool.get_shared_pool() for rserve_host and
+        #     rserve_port.
+        self.use_rserve_pool = self.DEFAULT_USE_RSERVE_POOL
+        self.rserve_pool = None
+        
+        # load coder values from Reliability_Names_Coder_Data?
+        self.use_coder_data = self.DEFAULT_USE_CODER_DATA
+        
         # database credentials - try reading from config.
         self.db_username = ""
         self.db_password = ""
@@ -295,13 +467,286 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
     #-- END method __init__() --#
     
 
+    def acquire_rserve_connection( self ):
+        
+        '''
+        Gets an Rserve connection with irr loaded and stores it as this
+            instance's Rserve connection (so get_rserve_connection() returns
+            it).  If self.use_rserve_pool is True, checks out a warmed
+            connection from self.rserve_pool (or the shared
+            RserveConnectionPool for this process if that is None).  If not,
+            opens a new connection and loads irr.  Returns the connection.
+            Call release_rserve_connection() when done.
+        '''
+        
+        # return reference
+        connection_OUT = None
+        
+        # declare variables
+        me = "acquire_rserve_connection"
+        
+        # pooled?
+        if ( self.use_rserve_pool == True ):
+        
+            # check out of pool, store in instance.
+            connection_OUT = self.get_rserve_pool().acquire_connection()
+            self.set_rserve_connection( connection_OUT )
+            
+        else:
+        
+            # open new connection.
+            connection_OUT = self.get_rserve_connection()
+            connection_OUT.eval( "library( irr )" )
+            
+        #-- END check to see if we use the pool --#
+        
+        return connection_OUT
+        
+    #-- END method acquire_rserve_connection() --#
+    
+
+    def analyze_all_pairs( self, label_IN, person_type_to_df_map_IN, indices_to_compare_IN ):
+        
+        '''
+        Batched alternative to the pair-by-pair loop in
+            analyze_reliability_names().  Accepts the label, a dictionary that
+            maps person type (PERSON_TYPE_AUTHOR, PERSON_TYPE_SUBJECT) to the
+            data frame of Reliability_Names rows of that type, and the number
+            of indices to compare.  Creates a Reliability_Names_Results instance
+            for every pair of indices, then, for each person type, stacks all
+            the coderN columns into one array and computes results for all
+            pairs at once (see analyze_person_coding_all_pairs()).  Does not
+            save.  Returns list of results instances, in the same order as the
+            pair-by-pair loop.
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        # declare variables
+        me = "analyze_all_pairs"
+        pair_to_results_map = None
+        current_person_type = None
+        person_df = None
+        
+        # make a results instance for each pair.
+        pair_to_results_map = self.create_pair_results_map( label_IN, indices_to_compare_IN )
+        list_OUT = list( pair_to_results_map.values() )
+        
+        # analyze each person type, all pairs at once.
+        for current_person_type in self.PERSON_TYPE_LIST:
+        
+            person_df = person_type_to_df_map_IN.get( current_person_type, None )
+            if ( person_df is not None ):
+            
+                self.analyze_person_coding_all_pairs( person_df, current_person_type, indices_to_compare_IN, pair_to_results_map )
+                
+            #-- END check to see if data frame for person type --#
+            
+        #-- END loop over person types --#
+        
+        return list_OUT
+        
+    #-- END method analyze_all_pairs() --#
+
+
+    def analyze_all_pairs_in_chunks( self, label_IN, indices_to_compare_IN, chunk_size_IN ):
+        
+        '''
+        Streaming alternative to analyze_all_pairs(), for labels too big to
+            load at once.  Accepts the label, number of indices to compare, and
+            chunk size.  Reads the label chunk_size_IN rows at a time (see
+            load_reliability_names_chunks()), and for each person type, pair,
+            and column spec, adds the chunk's values to a
+            PairAgreementAccumulator (agreement counts and value pair counts
+            for the coincidence matrix).  Once all chunks are read, computes
+            percentage agreement, Potter's pi, and Krippendorff's alpha from
+            the accumulated statistics - the same values analyze_all_pairs()
+            produces.  Does not save.  Returns list of results instances, in
+            pair order.
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        # declare variables
+        me = "analyze_all_pairs_in_chunks"
+        column_info_list = None
+        non_zero_result_name_list = None
+        accumulator_map = None
+        person_count_map = None
+        pair_to_results_map = None
+        chunk_df = None
+        chunk_count = 0
+        current_person_type = None
+        person_df = None
+        value_array = None
+        index_1 = -1
+        index_2 = -1
+        column_index = -1
+        current_column_info = None
+        result_name = ""
+        row_mask = None
+        accumulator_key = None
+        current_accumulator = None
+        results_instance = None
+        result_column_prefix = ""
+        pair_percent = None
+        pi_value = None
+        
+        # configure processing
+        column_info_list = self.get_all_column_info_list()
+        non_zero_result_name_list = [ self.RESULTS_COLUMN_NAME_LOOKUP_NON_ZERO, self.RESULTS_COLUMN_NAME_TYPE_NON_ZERO ]
+        accumulator_map = {}
+        person_count_map = {}
+        for current_person_type in self.PERSON_TYPE_LIST:
+        
+            person_count_map[ current_person_type ] = 0
+            
+        #-- END loop over person types --#
+        
+        # ! ==> accumulate, chunk by chunk.
+        for chunk_df in self.load_reliability_names_chunks( label_IN, indices_to_compare_IN, chunk_size_IN ):
+        
+            chunk_count += 1
+            
+            # first chunk - store coder info, make results instances.
+            if ( pair_to_results_map is None ):
+            
+                self.store_coder_info( chunk_df, indices_to_compare_IN )
+                pair_to_results_map = self.create_pair_results_map( label_IN, indices_to_compare_IN )
+                
+            #-- END check to see if first chunk --#
+            
+            # convert hex hashes in this chunk.
+            self.convert_hex_hash_columns( chunk_df, indices_to_compare_IN )
+            
+            for current_person_type in self.PERSON_TYPE_LIST:
+            
+                person_df = chunk_df[ chunk_df[ "person_type" ] == self.PERSON_TYPE_TO_ROW_PERSON_TYPE_MAP[ current_person_type ] ]
+                person_count_map[ current_person_type ] += len( person_df )
+                
+                # rows x coders x columns
+                value_array = self.build_value_array( person_df, indices_to_compare_IN, column_info_list )
+                
+                for index_1, index_2 in six.iterkeys( pair_to_results_map ):
+                
+                    for column_index, current_column_info in enumerate( column_info_list ):
+                    
+                        result_name = current_column_info.get( self.CTC_RESULT_COLUMN_NAME, None )
+                        
+                        # non-zero specs only include rows where both > 0.
+                        row_mask = None
+                        if ( result_name in non_zero_result_name_list ):
+                        
+                            row_mask = ( value_array[ :, index_1 - 1, column_index ] > 0 ) & ( value_array[ :, index_2 - 1, column_index ] > 0 )
+                            
+                        #-- END check to see if non-zero spec --#
+                        
+                        # get accumulator, add values.
+                        accumulator_key = ( current_person_type, index_1, index_2, result_name )
+                        current_accumulator = accumulator_map.get( accumulator_key, None )
+                        if ( current_accumulator is None ):
+                        
+                            current_accumulator = PairAgreementAccumulator()
+                            accumulator_map[ accumulator_key ] = current_accumulator
+                            
+                        #-- END check to see if accumulator --#
+                        current_accumulator.add_values( value_array[ :, index_1 - 1, column_index ],
+                                                        value_array[ :, index_2 - 1, column_index ],
+                                                        row_mask_IN = row_mask )
+                        
+                    #-- END loop over column specs --#
+                    
+                #-- END loop over pairs --#
+                
+            #-- END loop over person types --#
+            
+        #-- END loop over chunks --#
+        
+        self.output_debug_message( "Read " + str( chunk_count ) + " chunks for label " + str( label_IN ), method_IN = me )
+        
+        # ! ==> compute results from statistics.
+        if ( pair_to_results_map is not None ):
+        
+            for ( index_1, index_2 ), results_instance in six.iteritems( pair_to_results_map ):
+            
+                for current_person_type in self.PERSON_TYPE_LIST:
+                
+                    # person count
+                    setattr( results_instance, current_person_type + "count", person_count_map[ current_person_type ] )
+                    
+                    for current_column_info in column_info_list:
+                    
+                        result_name = current_column_info.get( self.CTC_RESULT_COLUMN_NAME, None )
+                        result_column_prefix = current_person_type + result_name
+                        current_accumulator = accumulator_map[ ( current_person_type, index_1, index_2, result_name ) ]
+                        
+                        # percentage agreement (only set if rows, except
+                        #     non-zero, same as analyze_all_pairs()).
+                        pair_percent = current_accumulator.get_percentage_agreement()
+                        if ( ( pair_percent is not None ) or ( result_name in non_zero_result_name_list ) ):
+                        
+                            setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_PERCENT, pair_percent )
+                            
+                        #-- END check to see if we store percentage --#
+                        
+                        # alpha
+                        setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_ALPHA, current_accumulator.get_alpha( current_column_info.get( self.CTC_COLUMN_MEASUREMENT_LEVEL, None ) ) )
+                        
+                        # Potter's pi, if nominal with a count of values.
+                        pi_value = self.calculate_potter_pi( pair_percent, current_column_info, indices_to_compare_IN )
+                        if ( pi_value is not None ):
+                        
+                            setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_PI, pi_value )
+                            
+                        #-- END check to see if pi --#
+                        
+                        # non-zero count - the person lookup subset's, for
+                        #     person type too (same as analyze_person_coding()).
+                        if ( result_name in non_zero_result_name_list ):
+                        
+                            setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_COUNT, accumulator_map[ ( current_person_type, index_1, index_2, self.RESULTS_COLUMN_NAME_LOOKUP_NON_ZERO ) ].row_count )
+                            
+                        #-- END check to see if non-zero spec --#
+                        
+                    #-- END loop over column specs --#
+                    
+                #-- END loop over person types --#
+                
+            #-- END loop over pairs --#
+            
+            list_OUT = list( pair_to_results_map.values() )
+            
+        #-- END check to see if any rows --#
+        
+        return list_OUT
+        
+    #-- END method analyze_all_pairs_in_chunks() --#
+
+
     def analyze_column( self,
                         index_1_IN,
                         index_2_IN,
                         person_df_IN,
                         column_info_IN,
                         results_instance_IN,
-                        column_name_prefix_IN ):
+                        column_name_prefix_IN,
+                        kripp_alpha_IN = None ):
+        
+        '''
+        Accepts 2 indices, a data frame of Reliability_Name rows, column info
+            for the column we want to compare, an instance of
+            Reliability_Names_Results to store results in, and the results
+            column name prefix for the person type ( "author_" or "subject_" ).
+            Computes percentage agreement, Krippendorff's alpha, and, if
+            nominal with a value count, Potter's pi for the column, stores them
+            in the results instance, and returns it.
+            
+        If kripp_alpha_IN is passed in, it is used as the alpha value rather
+            than computing alpha here.  Otherwise, alpha is computed using the
+            backend in self.alpha_backend.
+        '''
         
         # return reference
         instance_OUT = None
@@ -323,9 +768,6 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
         current_column_data_type = ""
         current_column_truncate_to_length = ""
         current_column_truncate_from = ""
-        chop_from = ""
-        chop_result_size = -1
-        chop_lambda = None
         compare_column_name_1 = ""
         compare_column_name_2 = ""
         compare_values_1 = ""
@@ -339,13 +781,11 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
         kripp_alpha = -1
         my_indices_to_compare = -1
         potter_pi = -1
+        r_conn = None
         
         # get logger
         my_logger = self.get_logger()
         
-        # get Rserve connection
-        r_conn = self.get_rserve_connection()
-        
         # got index 1?
         if ( ( index_1_IN is not None ) and ( index_1_IN != "" ) and ( index_1_IN > 0 ) ):
         
@@ -418,80 +858,16 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
                                 print( debug_message )
                                 self.output_debug_message( debug_message, method_IN = me )
                 
-                                # retrieve numpy arrays of column values.
-                                compare_values_1 = person_df[ compare_column_name_1 ]
-                                compare_values_2 = person_df[ compare_column_name_2 ]
+                                # retrieve column values, converted based on
+                                #     column data type.
+                                compare_values_1 = self.get_column_values( person_df, current_index, current_column_info )
+                                compare_values_2 = self.get_column_values( person_df, comparison_index, current_column_info )
                                 
                                 debug_message = "========> compare_values_1 ( type = " + str( type ( compare_values_1 ) ) + " ) = " + str( compare_values_1 )
                                 self.output_debug_message( debug_message, method_IN = me )
                                 
                                 debug_message = "========> compare_values_2 ( type = " + str( type ( compare_values_2 ) ) + " ) = " + str( compare_values_2 )
                                 self.output_debug_message( debug_message, method_IN = me )
-                                
-                                # check if there is a column data type.
-                                if ( ( current_column_data_type is not None )
-                                    and ( current_column_data_type != "" )
-                                    and ( current_column_data_type in self.DATA_TYPE_LIST ) ):
-                                    
-                                    # got a hexadecimal hash value we need to
-                                    #     convert to base 10 integer?
-                                    if ( current_column_data_type == self.DATA_TYPE_HEX_HASH ):
-                                    
-                                        # convert any None to "-1".
-                                        #compare_values_1.fillna( "-1" )
-                                        compare_values_1[ compare_values_1.isnull() ] = "-1"
-                                        #compare_values_2.fillna( "-1" )
-                                        compare_values_2[ compare_values_2.isnull() ] = "-1"
-
-                                        # truncate?
-                                        if ( ( current_column_truncate_to_length is not None )
-                                            and ( int( current_column_truncate_to_length ) > 0 ) ):
-                                            
-                                            # chop from left or right?
-                                            if ( current_column_truncate_from == self.TRUNCATE_FROM_LEFT ):
-                                            
-                                                # chop from left side.
-                                                chop_from = self.TRUNCATE_FROM_LEFT
-                                                chop_result_size = -1 * current_column_truncate_to_length
-                                                chop_lambda = lambda x: x[ chop_result_size : ]
-
-                                            elif ( current_column_truncate_from == self.TRUNCATE_FROM_RIGHT ):
-                                            
-                                                # chop from the right.
-                                                chop_from = self.TRUNCATE_FROM_RIGHT
-                                                chop_result_size = current_column_truncate_to_length
-                                                chop_lambda = lambda x: x[ : chop_result_size ]
-                                            
-                                            else:
-                                            
-                                                # chop from left side.
-                                                chop_from = self.TRUNCATE_FROM_LEFT
-                                                chop_result_size = -1 * current_column_truncate_to_length
-                                                chop_lambda = lambda x: x[ chop_result_size : ]
-                                                
-                                            #-- END CHECK To see what end of string we truncate from. --#
-                                            
-                                            compare_values_1 = compare_values_1.apply( chop_lambda )
-                                            compare_values_2 = compare_values_2.apply( chop_lambda )
-
-                                        #-- END check to see if we truncate. --#
-                                        
-                                        # convert to base 10 integer.
-                                        compare_values_1 = compare_values_1.apply( int, args = ( 16, ) )
-                                        # compare_values_1 = compare_values_1.astype( numpy.uint64 ) # R doesn't know what data type uint64 corresponds to.
-                                        compare_values_1 = compare_values_1.astype( numpy.int64 )
-                                        compare_values_2 = compare_values_2.apply( int, args = ( 16, ) )
-                                        compare_values_2 = compare_values_2.astype( numpy.int64 )
-
-                                        debug_message = "========> (in hex hash type) compare_values_1 ( type = " + str( type ( compare_values_1 ) ) + " ) = " + str( compare_values_1 )
-                                        self.output_debug_message( debug_message, method_IN = me )
-
-                                        debug_message = "========> (in hex hash type) compare_values_2 ( type = " + str( type ( compare_values_2 ) ) + " ) = " + str( compare_values_2 )
-                                        self.output_debug_message( debug_message, method_IN = me )
-                                        
-                                    #-- END check to see if hex hash type. --#
-                                    
-                                #-- END check to see if data type. --#
                                     
                                 # for each type, get columns/numpy arrays for fields we want to check, then:
                 
@@ -510,7 +886,6 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
                                 setattr( instance_OUT, result_column_name, percentage_agreement )
                                 
                                 # ! ==> krippendorff's alpha at appropriate measurement level.
-                                # - first, try in R.
                                 
                                 # combine values into a dataframe
                                 value_df = pandas.DataFrame()
@@ -520,21 +895,39 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
                                 # convert to numpy array
                                 value_array_tall = value_df.values
                                 
-                                # transpose columns to rows (because the alpha function
-                                #     wants the data this way).
-                                value_array_wide = numpy.transpose( value_array_tall )
+                                # alpha passed in?
+                                if ( kripp_alpha_IN is not None ):
+                                
+                                    # yes - already computed.
+                                    R_kripp_alpha = kripp_alpha_IN
+                                    
+                                elif ( self.alpha_backend == self.ALPHA_BACKEND_NUMPY ):
                                 
-                                # R - store values in R.
-                                r_conn.r.valueArrayWide = value_array_wide
+                                    # compute in-process, no R.
+                                    R_kripp_alpha = KrippendorffAlpha.compute_alpha( value_array_tall, measurement_level_IN = current_column_level )
+                                    
+                                else:
                                 
-                                # R - call irr::kripp.alpha()
-                                kripp_alpha_result = r_conn.eval( "irr::kripp.alpha( valueArrayWide, method = \"" + current_column_level + "\" )" )
-                                #print( str( kripp_alpha_result ) )
+                                    # R - get Rserve connection
+                                    r_conn = self.get_rserve_connection()
                                 
-                                # get alpha value from result.
-                                R_kripp_alpha = kripp_alpha_result[ str( "value" ) ]
+                                    # transpose columns to rows (because the alpha function
+                                    #     wants the data this way).
+                                    value_array_wide = numpy.transpose( value_array_tall )
+                                    
+                                    # R - store values in R.
+                                    r_conn.r.valueArrayWide = value_array_wide
+                                    
+                                    # R - call irr::kripp.alpha()
+                                    kripp_alpha_result = r_conn.eval( "irr::kripp.alpha( valueArrayWide, method = \"" + current_column_level + "\" )" )
+                                    #print( str( kripp_alpha_result ) )
+                                    
+                                    # get alpha value from result.
+                                    R_kripp_alpha = kripp_alpha_result[ str( "value" ) ]
+                                    
+                                #-- END check to see how we compute alpha --#
 
-                                debug_message = "========> R irr::kripp.alpha = " + str( R_kripp_alpha )
+                                debug_message = "========> kripp.alpha ( " + str( self.alpha_backend ) + " ) = " + str( R_kripp_alpha )
                                 print( debug_message )
                                 self.output_debug_message( debug_message, method_IN = me )
                                 
@@ -624,6 +1017,190 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
     #-- END method analyze_column() --#
 
 
+    def analyze_pair_task( self, task_IN, person_type_to_df_map_IN ):
+        
+        '''
+        Accepts a tuple of ( index_1, index_2, person_type ) and a dictionary
+            that maps person type to the data frame of Reliability_Names rows of
+            that type.  Runs analyze_person_coding() for that pair and person
+            type against an unsaved Reliability_Names_Results, then returns a
+            dictionary of the values it set - field name to value, for the
+            fields that start with the person type.
+        '''
+        
+        # return reference
+        map_OUT = {}
+        
+        # declare variables
+        index_1 = -1
+        index_2 = -1
+        person_type = ""
+        person_df = None
+        results_instance = None
+        current_field = None
+        
+        # unpack task
+        index_1, index_2, person_type = task_IN
+        person_df = person_type_to_df_map_IN.get( person_type, None )
+        
+        # analyze
+        results_instance = Reliability_Names_Results()
+        results_instance = self.analyze_person_coding( index_1,
+                                                       index_2,
+                                                       person_df,
+                                                       person_type,
+                                                       results_instance )
+        
+        # got results?
+        if ( results_instance is not None ):
+        
+            # pull out values for this person type.
+            for current_field in results_instance._meta.fields:
+            
+                if ( current_field.name.startswith( person_type ) == True ):
+                
+                    map_OUT[ current_field.name ] = getattr( results_instance, current_field.name )
+                    
+                #-- END check to see if field for this person type --#
+                
+            #-- END loop over fields --#
+            
+        #-- END check to see if results --#
+        
+        return map_OUT
+        
+    #-- END method analyze_pair_task() --#
+
+
+    def analyze_pairs_in_parallel( self, label_IN, person_type_to_df_map_IN, indices_to_compare_IN, worker_count_IN ):
+        
+        '''
+        Parallel alternative to the pair-by-pair loop in
+            analyze_reliability_names().  Accepts the label, a dictionary that
+            maps person type to the data frame of Reliability_Names rows of that
+            type, the number of indices to compare, and the number of worker
+            processes.  Fans each pair x person type out to a process pool (see
+            init_pair_worker() and analyze_pair_worker()) - each worker has its
+            own analyzer, and its own Rserve connection if the alpha backend is
+            R.  Results are merged back into a Reliability_Names_Results
+            instance per pair in pair order, so output does not depend on which
+            worker finishes first.  Does not save.  Returns list of results
+            instances, in the same order as the pair-by-pair loop.
+            
+        Worker processes are always started with the "fork" start method
+            (PAIR_WORKER_START_METHOD), so django is already set up in each
+            worker, whatever the platform default is.  If worker_count_IN is 1
+            or less, or fork is not available (Windows), runs the same tasks in
+            this process instead.
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        # declare variables
+        me = "analyze_pairs_in_parallel"
+        pair_to_results_map = None
+        task_list = None
+        pair_key = None
+        current_person_type = None
+        worker_context = None
+        worker_pool = None
+        acquired_rserve_connection = False
+        task_results_list = None
+        current_task = None
+        task_results = None
+        results_instance = None
+        field_name = ""
+        field_value = None
+        
+        # make a results instance for each pair.
+        pair_to_results_map = self.create_pair_results_map( label_IN, indices_to_compare_IN )
+        list_OUT = list( pair_to_results_map.values() )
+        
+        # make tasks - one per pair per person type.
+        task_list = []
+        for pair_key in six.iterkeys( pair_to_results_map ):
+        
+            for current_person_type in self.PERSON_TYPE_LIST:
+            
+                task_list.append( ( pair_key[ 0 ], pair_key[ 1 ], current_person_type ) )
+                
+            #-- END loop over person types --#
+            
+        #-- END loop over pairs --#
+        
+        # can we fork?
+        if ( ( worker_count_IN > 1 ) and ( self.PAIR_WORKER_START_METHOD in multiprocessing.get_all_start_methods() ) ):
+        
+            self.output_debug_message( "Analyzing " + str( len( task_list ) ) + " pair x person type tasks with " + str( worker_count_IN ) + " worker processes.", method_IN = me )
+            
+            # close database connections so workers don't share them - django
+            #     re-opens as needed.
+            connections.close_all()
+            
+            # run tasks - map() returns results in task order.
+            worker_context = multiprocessing.get_context( self.PAIR_WORKER_START_METHOD )
+            worker_pool = worker_context.Pool( processes = worker_count_IN,
+                                               initializer = init_pair_worker,
+                                               initargs = ( self.alpha_backend, indices_to_compare_IN, person_type_to_df_map_IN, self.rserve_host, self.rserve_port ) )
+            try:
+            
+                task_results_list = worker_pool.map( analyze_pair_worker, task_list, chunksize = 1 )
+                
+            finally:
+            
+                worker_pool.close()
+                worker_pool.join()
+                
+            #-- END try-finally around process pool --#
+            
+        else:
+        
+            # no - same tasks, in this process.
+            self.output_debug_message( "Analyzing " + str( len( task_list ) ) + " pair x person type tasks in this process.", method_IN = me )
+            
+            # R, and no connection yet?  Get one for these tasks.
+            acquired_rserve_connection = False
+            if ( ( self.alpha_backend == self.ALPHA_BACKEND_R ) and ( self.rserve_connection is None ) ):
+            
+                self.acquire_rserve_connection()
+                acquired_rserve_connection = True
+                
+            #-- END check to see if we need an Rserve connection --#
+            
+            try:
+            
+                task_results_list = [ self.analyze_pair_task( current_task, person_type_to_df_map_IN ) for current_task in task_list ]
+                
+            finally:
+            
+                if ( acquired_rserve_connection == True ):
+                
+                    self.release_rserve_connection()
+                    
+                #-- END check to see if we got a connection --#
+                
+            #-- END try-finally around Rserve connection --#
+            
+        #-- END check to see if we can fork worker processes --#
+        
+        # merge results into the instance for each pair.
+        for current_task, task_results in zip( task_list, task_results_list ):
+        
+            results_instance = pair_to_results_map.get( ( current_task[ 0 ], current_task[ 1 ] ) )
+            for field_name, field_value in six.iteritems( task_results ):
+            
+                setattr( results_instance, field_name, field_value )
+                
+            #-- END loop over result values --#
+            
+        #-- END loop over task results --#
+        
+        return list_OUT
+        
+    #-- END method analyze_pairs_in_parallel() --#
+
+
     def analyze_person_coding( self, index_1_IN, index_2_IN, person_df_IN, person_type_IN, results_instance_IN ):
     
         '''
@@ -651,6 +1228,9 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
         person_type_no_zeros_df = None
         person_type_no_zeros_count = -1
         column_name_person_type_no_zeros_count = ""
+        result_name_to_alpha_map = None
+        column_result_name = ""
+        column_alpha = None
 
         # get logger
         my_logger = self.get_logger()
@@ -686,16 +1266,29 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
                             column_name_person_count = column_name_prefix + "count"
                             setattr( instance_OUT, column_name_person_count, person_count )
                             
+                            # in-process alpha?  If so, do all columns at once.
+                            result_name_to_alpha_map = {}
+                            if ( self.alpha_backend == self.ALPHA_BACKEND_NUMPY ):
+                            
+                                result_name_to_alpha_map = self.compute_alpha_for_columns( index_1_IN, index_2_IN, person_df_IN, columns_to_compare )
+                                
+                            #-- END check to see if numpy alpha backend --#
+                            
                             # loop over columns_to_compare
                             for current_column_info in columns_to_compare:
                             
+                                # got alpha already?
+                                column_result_name = current_column_info.get( self.CTC_RESULT_COLUMN_NAME, None )
+                                column_alpha = result_name_to_alpha_map.get( column_result_name, None )
+                            
                                 # call analyze_column()
                                 instance_OUT = self.analyze_column( index_1_IN,
                                                                     index_2_IN,
                                                                     person_df_IN,
                                                                     current_column_info,
                                                                     instance_OUT,
-                                                                    column_name_prefix )
+                                                                    column_name_prefix,
+                                                                    kripp_alpha_IN = column_alpha )
             
                             #-- END loop over column info --#
                             
@@ -812,36 +1405,208 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
     #-- END method analyze_person_coding() --#
     
         
-    def analyze_reliability_names( self, label_IN, indices_to_compare_IN = -1 ):
-        
+    def analyze_person_coding_all_pairs( self, person_df_IN, person_type_IN, indices_to_compare_IN, pair_to_results_map_IN ):
+    
         '''
-        Analyzes records in Reliability_Names with a given label to see how well
-            the coding values agree across coders.
-            
-        Accepts:
-        - label_IN - required label we want to use to filter Reliability_Names records.
-        - indices_to_compare_IN - number of the coder indices you want to include in pairwise analysis (there are 10 total at the moment).
+        Accepts a data frame of Reliability_Name rows for one person type, the
+            person type ( "subject" or "author" ), the number of indices to
+            compare, and a dictionary that maps ( index_1, index_2 ) tuples to
+            the Reliability_Names_Results instance for that pair.  Stacks the
+            coderN values for all columns into one rows x coders x columns
+            array, then computes percentage agreement and Potter's pi for every
+            pair with array operations, and Krippendorff's alpha for each pair
+            with KrippendorffAlpha (always in-process, regardless of
+            self.alpha_backend).  Also does the non-zero person lookup and
+            person type subsets.  Stores results in the results instances.
+        '''
+    
+        # declare variables
+        me = "analyze_person_coding_all_pairs"
+        columns_to_compare = None
+        column_count = -1
+        value_array = None
+        equal_array = None
+        percent_array = None
+        level_list = None
+        column_index = -1
+        current_column_info = None
+        pair_key = None
+        results_instance = None
+        index_1 = -1
+        index_2 = -1
+        pair_value_array = None
+        alpha_list = None
+        alpha_value = None
+        pair_percent = None
+        pi_value = None
+        result_column_prefix = ""
+        non_zero_info_list = None
+        non_zero_column_info = None
+        non_zero_value_array = None
+        non_zero_mask = None
+        non_zero_count_array = None
+        non_zero_equal_array = None
+        non_zero_percent = None
+        pair_mask = None
+        pair_count = -1
+        lookup_count_array = None
+        
+        # configure processing
+        columns_to_compare = self.DEFAULT_COLUMN_INFO_LIST
+        column_count = len( columns_to_compare )
+        
+        # ! ==> stack values: rows x coders x columns
+        value_array = self.build_value_array( person_df_IN, indices_to_compare_IN, columns_to_compare )
+        level_list = [ current_column_info.get( self.CTC_COLUMN_MEASUREMENT_LEVEL, None ) for current_column_info in columns_to_compare ]
+        
+        # ! ==> percentage agreement for all pairs, all columns: coders x coders x columns
+        #     (nan never equals nan, same as StatsHelper.percentage_agreement()).
+        percent_array = None
+        if ( value_array.shape[ 0 ] > 0 ):
+        
+            equal_array = ( value_array[ :, :, None, : ] == value_array[ :, None, :, : ] )
+            percent_array = equal_array.mean( axis = 0 )
+            
+        #-- END check to see if any rows --#
+        
+        # ! ==> loop over pairs to store results and compute alpha.
+        for pair_key, results_instance in six.iteritems( pair_to_results_map_IN ):
+        
+            index_1, index_2 = pair_key
+            
+            # person count
+            setattr( results_instance, person_type_IN + "count", len( person_df_IN ) )
+            
+            # alpha for all columns for this pair.
+            pair_value_array = value_array[ :, [ index_1 - 1, index_2 - 1 ], : ]
+            alpha_list = KrippendorffAlpha.compute_alpha_for_columns( pair_value_array, level_list )
+            
+            for column_index in range( column_count ):
+            
+                current_column_info = columns_to_compare[ column_index ]
+                result_column_prefix = person_type_IN + current_column_info.get( self.CTC_RESULT_COLUMN_NAME, None )
+                
+                # percentage agreement (None if no rows, like StatsHelper).
+                pair_percent = None
+                if ( percent_array is not None ):
+                
+                    pair_percent = float( percent_array[ index_1 - 1, index_2 - 1, column_index ] )
+                    setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_PERCENT, pair_percent )
+                    
+                #-- END check to see if percentages --#
+                
+                # alpha
+                setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_ALPHA, alpha_list[ column_index ] )
+                
+                # Potter's pi, if nominal with a count of values.
+                pi_value = self.calculate_potter_pi( pair_percent, current_column_info, indices_to_compare_IN )
+                if ( pi_value is not None ):
+                
+                    setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_PI, pi_value )
+                    
+                #-- END check to see if pi --#
+                
+            #-- END loop over columns --#
+            
+        #-- END loop over pairs --#
+        
+        # ! ==> non-zero subsets - person lookup and person type where both
+        #     coders have a value greater than 0.
+        non_zero_info_list = [ self.COLUMN_INFO_PERSON_ID_LOOKUP_NON_ZERO, self.COLUMN_INFO_PERSON_TYPE_INT_NON_ZERO ]
+        for non_zero_column_info in non_zero_info_list:
+        
+            # rows x coders
+            non_zero_value_array = self.build_value_array( person_df_IN, indices_to_compare_IN, [ non_zero_column_info ] )[ :, :, 0 ]
+            
+            # rows x coders x coders - True where both coders > 0 (nan is not).
+            non_zero_mask = ( non_zero_value_array[ :, :, None ] > 0 ) & ( non_zero_value_array[ :, None, : ] > 0 )
+            non_zero_count_array = non_zero_mask.sum( axis = 0 )
+            non_zero_equal_array = ( ( non_zero_value_array[ :, :, None ] == non_zero_value_array[ :, None, : ] ) & non_zero_mask ).sum( axis = 0 )
+            result_column_prefix = person_type_IN + non_zero_column_info.get( self.CTC_RESULT_COLUMN_NAME, None )
+            
+            # stored counts are the person lookup subset's, for person type
+            #     too (same as analyze_person_coding()).
+            if ( lookup_count_array is None ):
+            
+                lookup_count_array = non_zero_count_array
+                
+            #-- END check to see if lookup counts --#
+            
+            for pair_key, results_instance in six.iteritems( pair_to_results_map_IN ):
+            
+                index_1, index_2 = pair_key
+                pair_count = int( non_zero_count_array[ index_1 - 1, index_2 - 1 ] )
+                
+                # count
+                setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_COUNT, int( lookup_count_array[ index_1 - 1, index_2 - 1 ] ) )
+                
+                # percentage (None if no rows, like StatsHelper).
+                non_zero_percent = None
+                if ( pair_count > 0 ):
+                
+                    non_zero_percent = float( non_zero_equal_array[ index_1 - 1, index_2 - 1 ] ) / pair_count
+                    
+                #-- END check to see if any rows --#
+                setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_PERCENT, non_zero_percent )
+                
+                # alpha on the pair's non-zero rows.
+                pair_mask = non_zero_mask[ :, index_1 - 1, index_2 - 1 ]
+                alpha_value = KrippendorffAlpha.compute_alpha( non_zero_value_array[ pair_mask ][ :, [ index_1 - 1, index_2 - 1 ] ],
+                                                               measurement_level_IN = non_zero_column_info.get( self.CTC_COLUMN_MEASUREMENT_LEVEL, None ) )
+                setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_ALPHA, alpha_value )
+                
+                # pi
+                pi_value = self.calculate_potter_pi( non_zero_percent, non_zero_column_info, indices_to_compare_IN )
+                if ( pi_value is not None ):
+                
+                    setattr( results_instance, result_column_prefix + self.RESULTS_COLUMN_NAME_SUFFIX_PI, pi_value )
+                    
+                #-- END check to see if pi --#
+                
+            #-- END loop over pairs --#
+            
+        #-- END loop over non-zero columns --#
+        
+    #-- END method analyze_person_coding_all_pairs() --#
+    
+        
+    def analyze_reliability_names( self, label_IN, indices_to_compare_IN = -1, do_batch_IN = False, worker_count_IN = None, chunk_size_IN = None ):
+        
+        '''
+        Analyzes records in Reliability_Names with a given label to see how well
+            the coding values agree across coders.
+            
+        Accepts:
+        - label_IN - required label we want to use to filter Reliability_Names records.
+        - indices_to_compare_IN - number of the coder indices you want to include in pairwise analysis (there are 10 total at the moment).
+        - do_batch_IN - if True, computes results for all pairs at once with
+            analyze_all_pairs() (numpy only, no R), then writes all
+            Reliability_Names_Results rows with one bulk_create().  Defaults to
+            False.
+        - worker_count_IN - number of worker processes to use to analyze pairs.
+            If None, uses self.worker_count.  If greater than 1 (and not
+            batch), pairs are analyzed in a process pool with
+            analyze_pairs_in_parallel(), then all results are written with one
+            bulk_create().
+        - chunk_size_IN - if set (greater than 0), streams the label from the
+            database chunk_size_IN rows at a time and computes results from
+            accumulated statistics with analyze_all_pairs_in_chunks() (numpy
+            only, no R), so the whole label is never in memory.  Results are
+            written with one bulk_create().  Takes precedence over do_batch_IN
+            and worker_count_IN.
         '''
 
         # return reference
         status_OUT = ""
         
-        # declare variables - set up database credentials
+        # declare variables
         me = "ReliabilityNamesAnalyzer.analyze_reliability_names"
-        db_username = ""
-        db_password = ""
-        pandas_db_engine = None
         selected_label = ""
         
         # declare variables - use django to verify selected label.
-        reliability_qs = None
-        label_list = None
-        label_in_list = []
-        coder_index = -1
+        label_exists = False
         
         # declare variables - SQLAlchemy lookup.
-        cleaned_label = ""
-        reliability_names_sql = ""
         reliability_names_df = None
         
         # declare variables - split into subjects and authors
@@ -856,9 +1621,15 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
         coder_1_user = -1
         coder_2_user = -1
         current_person_type = ""
+        person_type_to_df_map = None
+        results_list = None
+        worker_count = -1
+        do_stream = False
         
         # declare variables - R connection
         r_conn = None
+        use_r = False
+        acquired_rserve_connection = False
         
         # configuration - filter on a specific label.
         selected_label = label_IN
@@ -866,114 +1637,148 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
         # configuration - configure analysis
         indices_to_compare = indices_to_compare_IN
         self.indices_to_compare = indices_to_compare
+        
+        # configuration - worker processes
+        worker_count = worker_count_IN
+        if ( worker_count is None ):
+        
+            worker_count = self.worker_count
+            
+        #-- END check to see if worker count passed in --#
 
-        # configuration - init R connection
-        r_conn = self.get_rserve_connection()
-        r_conn.eval( "library( irr )" )
+        # configuration - streaming?
+        do_stream = ( ( chunk_size_IN is not None ) and ( chunk_size_IN > 0 ) )
+        
+        # configuration - are we using R in this process?
+        use_r = ( ( self.alpha_backend == self.ALPHA_BACKEND_R ) and ( do_batch_IN == False ) and ( worker_count <= 1 ) and ( do_stream == False ) )
         
         # got a label?
         if ( ( selected_label is not None ) and ( selected_label != "" ) ):
         
-            # first, use django to check if label is valid.
-            
-            # get list of label values.
-            label_list = Reliability_Names.objects.values_list( self.COLUMN_NAME_LABEL, flat = True )
+            # first, use django to check if label is valid (EXISTS query on
+            #     label, rather than pulling every label into memory).
+            label_exists = Reliability_Names.objects.filter( **{ self.COLUMN_NAME_LABEL : selected_label } ).exists()
         
-            # see if selected label is in list.
-            if ( selected_label in label_list ):
+            # is selected label in table?
+            if ( label_exists == True ):
             
                 # yes - switch over to SQLAlchemy and pandas.
         
                 self.output_debug_message( "Selected label: " + selected_label, method_IN = me )
                 
-                # escape out any illegal characters (PostgreSQL-specific).
-                cleaned_label = psycopg2.extensions.adapt( selected_label ).getquoted()
-                
-                self.output_debug_message( "Cleaned label: " + str( cleaned_label ), method_IN = me )
+                # R?  Get a connection for the analysis.
+                acquired_rserve_connection = False
+                if ( use_r == True ):
                 
-                # Convert to unicode?
-                cleaned_label = cleaned_label.decode()
+                    r_conn = self.acquire_rserve_connection()
+                    acquired_rserve_connection = True
+                    
+                #-- END check to see if R backend --#
                 
-                self.output_debug_message( "Cleaned Unicode label: " + str( cleaned_label ), method_IN = me )
-            
                 try:
             
-                    # yes - set up database credentials
-                    db_username = self.db_username
-                    db_password = self.db_password
-                    db_host = self.db_host
-                    db_name = self.db_name
-                    
-                    # Create SQLAlchemy database engine for pandas.
-                    pandas_db = sqlalchemy.create_engine( "postgresql://%s:%s@%s/%s" % ( db_username, db_password, db_host, db_name ) )
-                    
-                    # create SQL to load data from database into pandas data frame.
-                    reliability_names_sql = "SELECT * FROM context_analysis_reliability_names WHERE label = %s" % ( cleaned_label )
-    
-                    self.output_debug_message( "Reliability_Names SQL Query: " + reliability_names_sql, method_IN = me )
-                    
-                    # load the data
-                    reliability_names_df = pandas.read_sql_query( reliability_names_sql, pandas_db, parse_dates = [ 'create_date', 'last_modified' ] )
-                    
-                    # store coder info
-                    self.store_coder_info( reliability_names_df, indices_to_compare )
-                    
-                    # break out into author and subject.
-                    author_df = reliability_names_df[ reliability_names_df[ "person_type" ] == ManualArticleCoder.PERSON_TYPE_AUTHOR ]
-                    subject_df = reliability_names_df[ reliability_names_df[ "person_type" ] == ManualArticleCoder.PERSON_TYPE_SUBJECT ]
+                    # streaming?
+                    if ( do_stream == True ):
                     
-                    # loop over indices to compare
-                    for current_index in range( 1, indices_to_compare + 1 ):
-                    
-                        print( "==> current index = " + str( current_index ) )
-                    
-                        # now, get comparison index
-                        for comparison_index in range( current_index + 1, indices_to_compare + 1 ):
+                        # yes - accumulate chunk by chunk, then one insert.
+                        results_list = self.analyze_all_pairs_in_chunks( selected_label, indices_to_compare, chunk_size_IN )
+                        Reliability_Names_Results.objects.bulk_create( results_list )
                         
-                            print( "====> comparison index = " + str( comparison_index ) )
+                    else:
                     
-                            # ! pair-wise comparison
+                        # load the data - only the columns we need.
+                        reliability_names_df = self.load_reliability_names_df( selected_label, indices_to_compare )
+                        
+                        # convert hex hashes once, up front, rather than per pair.
+                        self.convert_hex_hash_columns( reliability_names_df, indices_to_compare )
+                        
+                        # store coder info
+                        self.store_coder_info( reliability_names_df, indices_to_compare )
+                        
+                        # break out into author and subject.
+                        author_df = reliability_names_df[ reliability_names_df[ "person_type" ] == ManualArticleCoder.PERSON_TYPE_AUTHOR ]
+                        subject_df = reliability_names_df[ reliability_names_df[ "person_type" ] == ManualArticleCoder.PERSON_TYPE_SUBJECT ]
+                        
+                        # batch or parallel?
+                        if ( ( do_batch_IN == True ) or ( worker_count > 1 ) ):
+                        
+                            # all pairs at once...
+                            person_type_to_df_map = {}
+                            person_type_to_df_map[ self.PERSON_TYPE_AUTHOR ] = author_df
+                            person_type_to_df_map[ self.PERSON_TYPE_SUBJECT ] = subject_df
                             
-                            # create results instance to hold results.
-                            results_instance = Reliability_Names_Results()
+                            if ( do_batch_IN == True ):
                             
-                            # populate general information
-                            results_instance.label = selected_label
-                            results_instance.coder1_coder_index = current_index
-                            results_instance.coder2_coder_index = comparison_index
+                                results_list = self.analyze_all_pairs( selected_label, person_type_to_df_map, indices_to_compare )
+                                
+                            else:
                             
-                            # user instances
-                            coder_1_user = self.get_coder_for_index( current_index )
-                            results_instance.coder1 = coder_1_user
-                            coder_2_user = self.get_coder_for_index( comparison_index )
-                            results_instance.coder2 = coder_2_user
-            
-                            # ! author
-                            current_person_type = self.PERSON_TYPE_AUTHOR
+                                results_list = self.analyze_pairs_in_parallel( selected_label, person_type_to_df_map, indices_to_compare, worker_count )
+                                
+                            #-- END check to see if batch or parallel --#
                             
-                            # call analyze_person_coding()
-                            results_instance = self.analyze_person_coding( current_index,
-                                                                           comparison_index,
-                                                                           author_df,
-                                                                           current_person_type,
-                                                                           results_instance )
-            
-                            # ! subject
-                            current_person_type = self.PERSON_TYPE_SUBJECT
+                            # ...then one insert.
+                            Reliability_Names_Results.objects.bulk_create( results_list )
                             
-                            # call analyze_person_coding()
-                            results_instance = self.analyze_person_coding( current_index,
-                                                                           comparison_index,
-                                                                           subject_df,
-                                                                           current_person_type,
-                                                                           results_instance )
-                                                                           
-                            # save the results.
-                            results_instance.save()
-    
-                        #-- END loop over comparison indices --#
+                            # skip the pair loop below.
+                            indices_to_compare = 0
+                            
+                        #-- END check to see if batch or parallel --#
+                        
+                        # loop over indices to compare
+                        for current_index in range( 1, indices_to_compare + 1 ):
                         
-                    #-- END loop over indices --#
+                            print( "==> current index = " + str( current_index ) )
+                        
+                            # now, get comparison index
+                            for comparison_index in range( current_index + 1, indices_to_compare + 1 ):
+                            
+                                print( "====> comparison index = " + str( comparison_index ) )
+                        
+                                # ! pair-wise comparison
+                                
+                                # create results instance to hold results.
+                                results_instance = Reliability_Names_Results()
+                                
+                                # populate general information
+                                results_instance.label = selected_label
+                                results_instance.coder1_coder_index = current_index
+                                results_instance.coder2_coder_index = comparison_index
+                                
+                                # user instances
+                                coder_1_user = self.get_coder_for_index( current_index )
+                                results_instance.coder1 = coder_1_user
+                                coder_2_user = self.get_coder_for_index( comparison_index )
+                                results_instance.coder2 = coder_2_user
+                
+                                # ! author
+                                current_person_type = self.PERSON_TYPE_AUTHOR
+                                
+                                # call analyze_person_coding()
+                                results_instance = self.analyze_person_coding( current_index,
+                                                                               comparison_index,
+                                                                               author_df,
+                                                                               current_person_type,
+                                                                               results_instance )
+                
+                                # ! subject
+                                current_person_type = self.PERSON_TYPE_SUBJECT
+                                
+                                # call analyze_person_coding()
+                                results_instance = self.analyze_person_coding( current_index,
+                                                                               comparison_index,
+                                                                               subject_df,
+                                                                               current_person_type,
+                                                                               results_instance )
+                                                                               
+                                # save the results.
+                                results_instance.save()
+        
+                            #-- END loop over comparison indices --#
+                            
+                        #-- END loop over indices --#
+                        
+                    #-- END check to see if streaming --#
                     
                     # ==> optionally, use pandas to output Excel.
                     
@@ -986,7 +1791,19 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
                     
                     self.output_debug_message( "In " + me + "(): " + status_OUT )
                 
-                #-- END try-except around database and R access --#
+                finally:
+                
+                    # close R connection, if we got one.
+                    if ( acquired_rserve_connection == True ):
+                    
+                        self.release_rserve_connection()
+                        
+                    #-- END check to see if we got a connection --#
+                
+                #-- END try-except-finally around database and R access --#
+                
+                # new results for label - drop cached results matrix.
+                Reliability_Names_Results.clear_results_matrix_cache( selected_label )
         
             else:
             
@@ -1002,13 +1819,350 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
             
         #-- END check to make sure we have a label.
         
-        self.close_rserve_connection()
-        
         return status_OUT
 
     #-- END method analyze_reliability_names() --#
 
        
+    def build_reliability_names_sql( self, label_IN, column_dtype_map_IN ):
+        
+        '''
+        Accepts label and map of column names to dtypes (see
+            get_reliability_names_column_dtype_map()).  Returns SQL that
+            selects those columns from Reliability_Names for rows with the
+            label (escaped - PostgreSQL-specific), ordered by ID (same order
+            as load_coder_data_df()).
+        '''
+        
+        # return reference
+        sql_OUT = ""
+        
+        # declare variables
+        me = "build_reliability_names_sql"
+        cleaned_label = ""
+        
+        # escape out any illegal characters (PostgreSQL-specific).
+        cleaned_label = psycopg2.extensions.adapt( label_IN ).getquoted()
+        
+        # Convert to unicode?
+        cleaned_label = cleaned_label.decode()
+        
+        self.output_debug_message( "Cleaned Unicode label: " + str( cleaned_label ), method_IN = me )
+        
+        # create SQL to load data from database into pandas data frame.
+        sql_OUT = "SELECT " + ", ".join( column_dtype_map_IN.keys() )
+        sql_OUT += " FROM " + self.RELIABILITY_NAMES_TABLE_NAME
+        sql_OUT += " WHERE " + self.COLUMN_NAME_LABEL + " = %s" % ( cleaned_label )
+        sql_OUT += " ORDER BY id"
+        
+        return sql_OUT
+        
+    #-- END method build_reliability_names_sql() --#
+    
+    
+    def build_value_array( self, person_df_IN, indices_to_compare_IN, column_info_list_IN ):
+        
+        '''
+        Accepts a data frame of Reliability_Name rows, the number of indices to
+            compare, and a list of column info dictionaries.  Returns a numpy
+            float64 array of rows x coder indices x columns, with each column's
+            values converted by get_column_values() (missing values are nan).
+            Coder index 1 is at position 0.
+        '''
+        
+        # return reference
+        array_OUT = None
+        
+        # declare variables
+        me = "build_value_array"
+        row_count = -1
+        current_index = -1
+        column_index = -1
+        current_column_info = None
+        
+        # make array, then fill it in.
+        row_count = len( person_df_IN )
+        array_OUT = numpy.full( ( row_count, indices_to_compare_IN, len( column_info_list_IN ) ), numpy.nan, dtype = numpy.float64 )
+        for column_index, current_column_info in enumerate( column_info_list_IN ):
+        
+            for current_index in range( 1, indices_to_compare_IN + 1 ):
+            
+                array_OUT[ :, current_index - 1, column_index ] = self.get_column_values( person_df_IN, current_index, current_column_info ).values.astype( numpy.float64 )
+                
+            #-- END loop over indices --#
+            
+        #-- END loop over columns --#
+        
+        return array_OUT
+        
+    #-- END method build_value_array() --#
+    
+    
+    def calculate_potter_pi( self, percentage_agreement_IN, column_info_IN, coder_count_IN ):
+        
+        '''
+        Accepts a percentage agreement, column info, and count of coders.  If
+            the column is nominal and has a value count, returns Potter's pi
+            (same as StatsHelper.potter_pi(), but from an already-computed
+            percentage agreement).  Otherwise, returns None.
+        '''
+        
+        # return reference
+        value_OUT = None
+        
+        # declare variables
+        column_level = None
+        column_value_count = -1
+        chance_agreement = None
+        
+        # unpack column info
+        column_level = column_info_IN.get( self.CTC_COLUMN_MEASUREMENT_LEVEL, None )
+        column_value_count = column_info_IN.get( self.CTC_COLUMN_VALUE_COUNT, None )
+        
+        # got a percentage, nominal, and value count?
+        if ( ( percentage_agreement_IN is not None )
+            and ( column_level == self.MEASUREMENT_LEVEL_NOMINAL )
+            and ( column_value_count is not None ) and ( column_value_count != "" ) and ( column_value_count > 0 ) ):
+        
+            # Pi = ( Po - Pe ) / ( 1 - Pe )
+            chance_agreement = StatsHelper.potter_pi_calc_p_sub_e( coder_count_IN = int( coder_count_IN ), option_count_IN = int( column_value_count ) )
+            value_OUT = ( float( percentage_agreement_IN ) - chance_agreement ) / ( 1.0 - chance_agreement )
+            
+        #-- END check to see if we can compute pi --#
+        
+        return value_OUT
+        
+    #-- END method calculate_potter_pi() --#
+    
+    
+    def compute_alpha_for_columns( self, index_1_IN, index_2_IN, person_df_IN, column_info_list_IN ):
+        
+        '''
+        Accepts 2 indices, a data frame of Reliability_Name rows, and a list of
+            column info dictionaries.  Stacks the values for both indices for
+            all the columns into a single units x coders x columns array, then
+            uses KrippendorffAlpha to compute alpha for every column in one
+            call.  Returns dictionary that maps each column's result column
+            name (CTC_RESULT_COLUMN_NAME) to its alpha.
+        '''
+        
+        # return reference
+        map_OUT = {}
+        
+        # declare variables
+        me = "compute_alpha_for_columns"
+        current_column_info = None
+        value_array_list = []
+        level_list = []
+        result_name_list = []
+        column_value_array = None
+        value_array = None
+        alpha_list = None
+        result_name = ""
+        alpha_value = None
+        
+        # got what we need?
+        if ( ( person_df_IN is not None ) and ( column_info_list_IN is not None ) and ( len( column_info_list_IN ) > 0 ) ):
+        
+            # build units x coders array for each column.
+            for current_column_info in column_info_list_IN:
+            
+                column_value_array = numpy.column_stack( [ self.get_column_values( person_df_IN, index_1_IN, current_column_info ).values.astype( numpy.float64 ),
+                                                           self.get_column_values( person_df_IN, index_2_IN, current_column_info ).values.astype( numpy.float64 ) ] )
+                value_array_list.append( column_value_array )
+                level_list.append( current_column_info.get( self.CTC_COLUMN_MEASUREMENT_LEVEL, None ) )
+                result_name_list.append( current_column_info.get( self.CTC_RESULT_COLUMN_NAME, None ) )
+                
+            #-- END loop over columns --#
+            
+            # stack into units x coders x columns, then compute.
+            value_array = numpy.stack( value_array_list, axis = 2 )
+            alpha_list = KrippendorffAlpha.compute_alpha_for_columns( value_array, level_list )
+            
+            # map results.
+            for result_name, alpha_value in zip( result_name_list, alpha_list ):
+            
+                map_OUT[ result_name ] = alpha_value
+                
+            #-- END loop over results --#
+        
+        #-- END check to see if we have what we need. --#
+        
+        return map_OUT
+        
+    #-- END method compute_alpha_for_columns() --#
+    
+    
+    def convert_hex_hash_columns( self, reliability_names_df_IN, indices_to_compare_IN ):
+        
+        '''
+        Accepts a data frame of Reliability_Names rows and the number of indices
+            to compare.  For each column spec with data type DATA_TYPE_HEX_HASH,
+            replaces that column for each index with its int64 values from
+            convert_hex_hash_values(), so the conversion is done once per label
+            rather than once per coder pair.  Updates the data frame in place,
+            and returns it.
+        '''
+        
+        # declare variables
+        me = "convert_hex_hash_columns"
+        current_column_info = None
+        current_index = -1
+        column_name = ""
+        
+        # loop over hex hash column specs.
+        for current_column_info in self.get_all_column_info_list():
+        
+            if ( current_column_info.get( self.CTC_COLUMN_DATA_TYPE, None ) == self.DATA_TYPE_HEX_HASH ):
+            
+                # convert column for each index that is still strings (object
+                #     or, pandas 3 and up, str dtype - anything not numeric).
+                for current_index in range( 1, indices_to_compare_IN + 1 ):
+                
+                    column_name = self.COLUMN_NAME_PREFIX_CODER + str( current_index ) + current_column_info.get( self.CTC_COLUMN_NAME_SUFFIX, None )
+                    if ( ( column_name in reliability_names_df_IN ) and ( pandas.api.types.is_numeric_dtype( reliability_names_df_IN[ column_name ] ) == False ) ):
+                    
+                        reliability_names_df_IN[ column_name ] = self.convert_hex_hash_values( reliability_names_df_IN[ column_name ], current_column_info )
+                        
+                    #-- END check to see if column needs converting --#
+                    
+                #-- END loop over indices --#
+                
+            #-- END check to see if hex hash column --#
+            
+        #-- END loop over column specs --#
+        
+        return reliability_names_df_IN
+        
+    #-- END method convert_hex_hash_columns() --#
+    
+    
+    def convert_hex_hash_values( self, values_IN, column_info_IN ):
+        
+        '''
+        Accepts a pandas Series of hexadecimal hash strings and the column info
+            for the column.  Converts any None to "-1", truncates as configured
+            (CTC_TRUNCATE_TO_LENGTH, from CTC_TRUNCATE_FROM) with the .str
+            accessor, then converts from base 16 to int64.  Only parses each
+            distinct value once (hashes repeat a lot), then maps codes back to
+            rows.  Returns new int64 Series with the same index.
+        '''
+        
+        # return reference
+        values_OUT = None
+        
+        # declare variables
+        me = "convert_hex_hash_values"
+        column_truncate_to_length = None
+        column_truncate_from = ""
+        string_values = None
+        code_array = None
+        unique_values = None
+        unique_int_array = None
+        
+        # unpack column info
+        column_truncate_to_length = column_info_IN.get( self.CTC_TRUNCATE_TO_LENGTH, None )
+        column_truncate_from = column_info_IN.get( self.CTC_TRUNCATE_FROM, None )
+        
+        # convert any None to "-1".
+        string_values = values_IN.fillna( "-1" ).astype( str )
+
+        # truncate?
+        if ( ( column_truncate_to_length is not None )
+            and ( int( column_truncate_to_length ) > 0 ) ):
+            
+            # chop from left or right?
+            if ( column_truncate_from == self.TRUNCATE_FROM_RIGHT ):
+            
+                # chop from the right.
+                string_values = string_values.str[ : int( column_truncate_to_length ) ]
+            
+            else:
+            
+                # chop from left side (the default).
+                string_values = string_values.str[ -1 * int( column_truncate_to_length ) : ]
+                
+            #-- END CHECK To see what end of string we truncate from. --#
+            
+        #-- END check to see if we truncate. --#
+        
+        # convert distinct values to base 10 integer, then map back to rows.
+        code_array, unique_values = pandas.factorize( string_values )
+        unique_int_array = numpy.array( [ int( current_value, 16 ) for current_value in unique_values ], dtype = numpy.int64 ) # not uint64 - R doesn't know what data type uint64 corresponds to.
+        values_OUT = pandas.Series( unique_int_array[ code_array ], index = values_IN.index, name = values_IN.name )
+        
+        return values_OUT
+        
+    #-- END method convert_hex_hash_values() --#
+    
+    
+    def create_pair_results_map( self, label_IN, indices_to_compare_IN ):
+        
+        '''
+        Accepts label and number of indices to compare.  Creates an unsaved
+            Reliability_Names_Results instance for each pair of indices, with
+            label, coder indices, and coders populated.  Returns OrderedDict
+            that maps ( index_1, index_2 ) tuples to results instances, in the
+            same order as the pair-by-pair loop in analyze_reliability_names().
+        '''
+        
+        # return reference
+        map_OUT = collections.OrderedDict()
+        
+        # declare variables
+        me = "create_pair_results_map"
+        current_index = -1
+        comparison_index = -1
+        results_instance = None
+        
+        # loop over pairs.
+        for current_index in range( 1, indices_to_compare_IN + 1 ):
+        
+            for comparison_index in range( current_index + 1, indices_to_compare_IN + 1 ):
+            
+                # create results instance to hold results.
+                results_instance = Reliability_Names_Results()
+                
+                # populate general information
+                results_instance.label = label_IN
+                results_instance.coder1_coder_index = current_index
+                results_instance.coder2_coder_index = comparison_index
+                
+                # user instances
+                results_instance.coder1 = self.get_coder_for_index( current_index )
+                results_instance.coder2 = self.get_coder_for_index( comparison_index )
+                
+                map_OUT[ ( current_index, comparison_index ) ] = results_instance
+                
+            #-- END loop over comparison indices --#
+            
+        #-- END loop over indices --#
+        
+        return map_OUT
+        
+    #-- END method create_pair_results_map() --#
+    
+    
+    def get_all_column_info_list( self ):
+        
+        '''
+        Returns list of all the column specs analysis uses - those in
+            DEFAULT_COLUMN_INFO_LIST, plus the non-zero person lookup and
+            person type specs.
+        '''
+        
+        # return reference
+        list_OUT = None
+        
+        list_OUT = list( self.DEFAULT_COLUMN_INFO_LIST )
+        list_OUT.append( self.COLUMN_INFO_PERSON_ID_LOOKUP_NON_ZERO )
+        list_OUT.append( self.COLUMN_INFO_PERSON_TYPE_INT_NON_ZERO )
+        
+        return list_OUT
+        
+    #-- END method get_all_column_info_list() --#
+    
+    
     def get_coder_for_index( self, index_IN ):
         
         '''
@@ -1034,6 +2188,421 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
     #-- END method get_coder_for_index() --#
     
 
+    def get_column_values( self, person_df_IN, index_IN, column_info_IN ):
+        
+        '''
+        Accepts a data frame of Reliability_Name rows, a coder index, and column
+            info.  Retrieves the column for that index and converts its values
+            based on the column's data type (for hex hashes that are still
+            strings, see convert_hex_hash_values() - columns already converted
+            by convert_hex_hash_columns() are used as-is).  Returns the
+            resulting pandas Series.  Does not alter the data frame passed in.
+        '''
+        
+        # return reference
+        values_OUT = None
+        
+        # declare variables
+        me = "get_column_values"
+        column_name = ""
+        column_name_suffix = ""
+        column_data_type = ""
+        
+        # unpack column info
+        column_name_suffix = column_info_IN.get( self.CTC_COLUMN_NAME_SUFFIX, None )
+        column_data_type = column_info_IN.get( self.CTC_COLUMN_DATA_TYPE, None )
+        
+        # build column name from index and suffix, then get values.
+        column_name = self.COLUMN_NAME_PREFIX_CODER + str( index_IN ) + column_name_suffix
+        values_OUT = person_df_IN[ column_name ]
+        
+        # got a hexadecimal hash value we need to convert to base 10 integer?
+        if ( ( column_data_type == self.DATA_TYPE_HEX_HASH ) and ( pandas.api.types.is_numeric_dtype( values_OUT ) == False ) ):
+        
+            # yes - convert.
+            values_OUT = self.convert_hex_hash_values( values_OUT, column_info_IN )
+
+        #-- END check to see if unconverted hex hash type. --#
+        
+        return values_OUT
+        
+    #-- END method get_column_values() --#
+    
+
+    def get_pandas_db_engine( self ):
+        
+        '''
+        Returns SQLAlchemy database engine for pandas, built from this
+            instance's database credentials.  Engines are cached at the class
+            level by database URL, so they (and their connection pools) are
+            reused across runs and analyzer instances.
+        '''
+        
+        # return reference
+        engine_OUT = None
+        
+        # declare variables
+        me = "get_pandas_db_engine"
+        db_host = ""
+        db_url = ""
+        
+        # build URL - include port if we have one.
+        db_host = self.db_host
+        if ( ( self.db_port is not None ) and ( self.db_port > 0 ) ):
+        
+            db_host = "%s:%s" % ( db_host, self.db_port )
+            
+        #-- END check to see if port --#
+        db_url = "postgresql://%s:%s@%s/%s" % ( self.db_username, self.db_password, db_host, self.db_name )
+        
+        # in cache?
+        engine_OUT = self.pandas_db_engine_cache.get( db_url, None )
+        if ( engine_OUT is None ):
+        
+            # no - Create SQLAlchemy database engine for pandas, then cache.
+            engine_OUT = sqlalchemy.create_engine( db_url )
+            self.pandas_db_engine_cache[ db_url ] = engine_OUT
+            
+        #-- END check to see if engine cached --#
+        
+        return engine_OUT
+        
+    #-- END method get_pandas_db_engine() --#
+    
+
+    def get_reliability_names_column_dtype_map( self, indices_to_compare_IN ):
+        
+        '''
+        Accepts number of indices to compare (if not greater than 0, uses
+            Reliability_Names.MAX_INDEX).  Returns OrderedDict of the
+            Reliability_Names columns the analysis uses - id, person_type, and,
+            for each index, coder ID plus the column for each column spec in
+            DEFAULT_COLUMN_INFO_LIST and the non-zero column specs - mapped to
+            the dtype they should be loaded as (see DATA_TYPE_TO_DTYPE_MAP;
+            coder IDs are DTYPE_CODER_ID).
+        '''
+        
+        # return reference
+        map_OUT = collections.OrderedDict()
+        
+        # declare variables
+        me = "get_reliability_names_column_dtype_map"
+        indices_to_compare = -1
+        column_info_list = None
+        current_index = -1
+        column_prefix = ""
+        current_column_info = None
+        column_name = ""
+        
+        # how many indices?
+        indices_to_compare = indices_to_compare_IN
+        if ( ( indices_to_compare is None ) or ( indices_to_compare <= 0 ) ):
+        
+            indices_to_compare = Reliability_Names.MAX_INDEX
+            
+        #-- END check to see if indices to compare --#
+        
+        # all column specs we analyze.
+        column_info_list = self.get_all_column_info_list()
+        
+        # general columns
+        map_OUT[ "id" ] = self.DTYPE_INT32
+        map_OUT[ "person_type" ] = self.DTYPE_CATEGORY
+        
+        # per-index columns
+        for current_index in range( 1, indices_to_compare + 1 ):
+        
+            column_prefix = self.COLUMN_NAME_PREFIX_CODER + str( current_index )
+            map_OUT[ column_prefix + self.COLUMN_NAME_SUFFIX_CODER_ID ] = self.DTYPE_CODER_ID
+            
+            for current_column_info in column_info_list:
+            
+                column_name = column_prefix + current_column_info.get( self.CTC_COLUMN_NAME_SUFFIX, None )
+                map_OUT[ column_name ] = self.DATA_TYPE_TO_DTYPE_MAP.get( current_column_info.get( self.CTC_COLUMN_DATA_TYPE, None ), self.DTYPE_OBJECT )
+                
+            #-- END loop over column specs --#
+            
+        #-- END loop over indices --#
+        
+        return map_OUT
+        
+    #-- END method get_reliability_names_column_dtype_map() --#
+    
+
+    def get_rserve_pool( self ):
+        
+        '''
+        Returns the RserveConnectionPool this instance uses - self.rserve_pool
+            if set, else the shared pool for this process and this instance's
+            rserve_host and rserve_port.
+        '''
+        
+        # return reference
+        instance_OUT = None
+        
+        instance_OUT = self.rserve_pool
+        if ( instance_OUT is None ):
+        
+            instance_OUT = RserveConnectionPool.get_shared_pool( self.rserve_host, self.rserve_port )
+            
+        #-- END check to see if pool set on instance --#
+        
+        return instance_OUT
+        
+    #-- END method get_rserve_pool() --#
+    
+
+    def load_coder_data_df( self, label_IN, indices_to_compare_IN ):
+        
+        '''
+        Accepts label and number of indices to compare.  Builds the same data
+            frame as load_reliability_names_df() (same columns, same dtypes),
+            but reads the coder values from long-format
+            Reliability_Names_Coder_Data in one query on its
+            ( label, coder_index ) index (see
+            Reliability_Names_Coder_Data.load_value_array()), then spreads them
+            into coderN_* columns.  Only id and person_type are read from
+            Reliability_Names.  Returns the data frame.
+        '''
+        
+        # return reference
+        df_OUT = None
+        
+        # declare variables
+        me = "load_coder_data_df"
+        column_dtype_map = None
+        indices_to_compare = -1
+        suffix_list = []
+        current_column_info = None
+        field_name_suffix = ""
+        base_row_list = None
+        base_id_array = None
+        id_array = None
+        coder_index_array = None
+        value_array = None
+        row_position_array = None
+        is_in_label_array = None
+        coder_position = -1
+        current_index = -1
+        suffix_position = -1
+        column_values = None
+        
+        # which columns?
+        column_dtype_map = self.get_reliability_names_column_dtype_map( indices_to_compare_IN )
+        indices_to_compare = indices_to_compare_IN
+        if ( ( indices_to_compare is None ) or ( indices_to_compare <= 0 ) ):
+        
+            indices_to_compare = Reliability_Names.MAX_INDEX
+            
+        #-- END check to see if indices to compare --#
+        
+        # suffixes - coder ID, then one per column spec (no leading "_").
+        suffix_list = [ Reliability_Names.FIELD_NAME_SUFFIX_CODER_ID ]
+        for current_column_info in self.get_all_column_info_list():
+        
+            field_name_suffix = current_column_info.get( self.CTC_COLUMN_NAME_SUFFIX, None ).lstrip( "_" )
+            if ( field_name_suffix not in suffix_list ):
+            
+                suffix_list.append( field_name_suffix )
+                
+            #-- END check to see if suffix already in list --#
+            
+        #-- END loop over column specs --#
+        
+        # rows in label.
+        base_row_list = list( Reliability_Names.objects.filter( label = label_IN ).order_by( "pk" ).values_list( "id", "person_type" ) )
+        df_OUT = pandas.DataFrame( base_row_list, columns = [ "id", "person_type" ] )
+        base_id_array = df_OUT[ "id" ].values
+        
+        # coder values
+        id_array, coder_index_array, value_array = Reliability_Names_Coder_Data.load_value_array( label_IN,
+                                                                                                  suffix_list,
+                                                                                                  coder_index_list_IN = list( range( 1, indices_to_compare + 1 ) ),
+                                                                                                  dtype_IN = object )
+        self.output_debug_message( "Loaded coder data for " + str( len( id_array ) ) + " of " + str( len( base_id_array ) ) + " Reliability_Names rows.", method_IN = me )
+        
+        # where does each coder data row go? (skip any that aren't in label.)
+        row_position_array = numpy.searchsorted( base_id_array, id_array )
+        is_in_label_array = ( row_position_array < len( base_id_array ) )
+        is_in_label_array[ is_in_label_array ] = ( base_id_array[ row_position_array[ is_in_label_array ] ] == id_array[ is_in_label_array ] )
+        
+        # spread into columns.
+        for coder_position, current_index in enumerate( coder_index_array ):
+        
+            for suffix_position, field_name_suffix in enumerate( suffix_list ):
+            
+                column_values = numpy.full( len( base_id_array ), None, dtype = object )
+                column_values[ row_position_array[ is_in_label_array ] ] = value_array[ is_in_label_array, coder_position, suffix_position ]
+                df_OUT[ self.COLUMN_NAME_PREFIX_CODER + str( current_index ) + "_" + field_name_suffix ] = column_values
+                
+            #-- END loop over suffixes --#
+            
+        #-- END loop over coder indexes --#
+        
+        # same columns, in same order, and dtypes as load from Reliability_Names.
+        df_OUT = df_OUT[ list( column_dtype_map.keys() ) ].copy()
+        df_OUT = self.set_column_dtypes( df_OUT, column_dtype_map )
+        
+        return df_OUT
+        
+    #-- END method load_coder_data_df() --#
+    
+
+    def load_reliability_names_chunks( self, label_IN, indices_to_compare_IN, chunk_size_IN ):
+        
+        '''
+        Accepts label, number of indices to compare, and chunk size.  Generator
+            - streams the same rows and columns as load_reliability_names_df()
+            through a server-side cursor, yielding a data frame of at most
+            chunk_size_IN rows at a time (dtypes set per chunk with
+            set_column_dtypes()), so the full label is never in memory at once.
+        '''
+        
+        # declare variables
+        me = "load_reliability_names_chunks"
+        column_dtype_map = None
+        reliability_names_sql = ""
+        db_connection = None
+        chunk_df = None
+        
+        # which columns?
+        column_dtype_map = self.get_reliability_names_column_dtype_map( indices_to_compare_IN )
+        reliability_names_sql = self.build_reliability_names_sql( label_IN, column_dtype_map )
+        
+        self.output_debug_message( "Reliability_Names SQL Query ( chunk size = " + str( chunk_size_IN ) + " ): " + reliability_names_sql, method_IN = me )
+        
+        # stream results (server-side cursor), chunk_size_IN rows at a time.
+        db_connection = self.get_pandas_db_engine().connect().execution_options( stream_results = True )
+        try:
+        
+            for chunk_df in pandas.read_sql_query( reliability_names_sql, db_connection, chunksize = chunk_size_IN ):
+            
+                yield self.set_column_dtypes( chunk_df, column_dtype_map )
+                
+            #-- END loop over chunks --#
+            
+        finally:
+        
+            db_connection.close()
+            
+        #-- END try-finally around streaming connection --#
+        
+    #-- END method load_reliability_names_chunks() --#
+    
+
+    def load_reliability_names_df( self, label_IN, indices_to_compare_IN ):
+        
+        '''
+        Accepts label and number of indices to compare.  Loads the
+            Reliability_Names rows with that label into a pandas data frame,
+            using the cached engine from get_pandas_db_engine().  Only selects
+            the columns in get_reliability_names_column_dtype_map(), and sets
+            their dtypes with set_column_dtypes().  If self.use_coder_data is
+            True, builds the same data frame from long-format
+            Reliability_Names_Coder_Data instead (see load_coder_data_df()).
+            Returns the data frame.
+        '''
+        
+        # return reference
+        df_OUT = None
+        
+        # declare variables
+        me = "load_reliability_names_df"
+        column_dtype_map = None
+        reliability_names_sql = ""
+        
+        # long format?
+        if ( self.use_coder_data == True ):
+        
+            df_OUT = self.load_coder_data_df( label_IN, indices_to_compare_IN )
+            
+        else:
+        
+            # which columns?
+            column_dtype_map = self.get_reliability_names_column_dtype_map( indices_to_compare_IN )
+            reliability_names_sql = self.build_reliability_names_sql( label_IN, column_dtype_map )
+            
+            self.output_debug_message( "Reliability_Names SQL Query: " + reliability_names_sql, method_IN = me )
+            
+            # load the data
+            df_OUT = pandas.read_sql_query( reliability_names_sql, self.get_pandas_db_engine() )
+            df_OUT = self.set_column_dtypes( df_OUT, column_dtype_map )
+            
+        #-- END check to see if load from coder data --#
+        
+        return df_OUT
+        
+    #-- END method load_reliability_names_df() --#
+    
+
+    def release_rserve_connection( self ):
+        
+        '''
+        Counterpart to acquire_rserve_connection().  If pooled, returns this
+            instance's Rserve connection to the pool (so it stays open and warm
+            for the next analyzer) and clears it from the instance.  If not,
+            closes it.
+        '''
+        
+        # declare variables
+        me = "release_rserve_connection"
+        my_connection = None
+        
+        # pooled?
+        if ( self.use_rserve_pool == True ):
+        
+            my_connection = self.rserve_connection
+            self.set_rserve_connection( None )
+            self.get_rserve_pool().release_connection( my_connection )
+            
+        else:
+        
+            self.close_rserve_connection()
+            
+        #-- END check to see if we use the pool --#
+        
+    #-- END method release_rserve_connection() --#
+    
+
+    def set_column_dtypes( self, reliability_names_df_IN, column_dtype_map_IN ):
+        
+        '''
+        Accepts data frame of Reliability_Names rows and map of column names to
+            dtypes (see get_reliability_names_column_dtype_map()).  Sets the
+            dtype of each column: int32 for integer columns (float64 if the
+            column has nulls, so they stay NaN), nullable Int64 for coder IDs
+            (so rows a coder is missing from don't turn IDs into floats),
+            category for person_type, and object (left alone) for hex hash
+            strings.  Updates the data frame in place, and returns it.
+        '''
+        
+        # declare variables
+        column_name = ""
+        column_dtype = ""
+        
+        # set dtypes.
+        for column_name, column_dtype in six.iteritems( column_dtype_map_IN ):
+        
+            # int32 with nulls?
+            if ( ( column_dtype == self.DTYPE_INT32 ) and ( reliability_names_df_IN[ column_name ].isnull().any() == True ) ):
+            
+                column_dtype = self.DTYPE_INT32_WITH_NULLS
+                
+            #-- END check to see if nulls in integer column --#
+            
+            if ( column_dtype != self.DTYPE_OBJECT ):
+            
+                reliability_names_df_IN[ column_name ] = reliability_names_df_IN[ column_name ].astype( column_dtype )
+                
+            #-- END check to see if we convert --#
+            
+        #-- END loop over columns --#
+        
+        return reliability_names_df_IN
+        
+    #-- END method set_column_dtypes() --#
+    
+
     def store_coder_info( self, reliability_names_df_IN, indices_to_compare_IN = -1 ):
         
         '''
@@ -1060,6 +2629,16 @@ class ReliabilityNamesAnalyzer( RserveHelper ):
                 
                 # get user ID for this instance from first item in this column..
                 user_id = reliability_names_df_IN[ column_name ].iloc[ 0 ]
+                if ( pandas.isna( user_id ) == True ):
+                
+                    # no coder for index in first row.
+                    user_id = None
+                    
+                else:
+                
+                    user_id = int( user_id )
+                    
+                #-- END check to see if coder ID --#
                 
                 # retrieve user instance based on ID.
                 try:
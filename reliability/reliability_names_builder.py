@@ -24,6 +24,8 @@ import six
 # django imports
 from django.core.exceptions import ObjectDoesNotExist
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Prefetch
 
 # python_utilities
 from python_utilities.exceptions.exception_helper import ExceptionHelper
@@ -34,12 +36,15 @@ from python_utilities.status.status_container import StatusContainer
 
 # context_text imports
 from context_text.models import Article
+from context_text.models import Article_Author
 from context_text.models import Article_Data
 from context_text.models import Article_Subject
+from context_text.models import Article_Subject_Quotation
 from context_text.models import Person
 
 # context_analysis imports
 from context_analysis.models import Reliability_Names
+from context_analysis.models import Reliability_Names_Coder_Data
 from context_analysis.reliability.index_helper import IndexHelper
 
 #-------------------------------------------------------------------------------
@@ -113,6 +118,12 @@ class ReliabilityNamesBuilder( object ):
     # index-to-coder mappings
     MAPPING_INDEX_TO_CODER = "index-to-coder"
     MAPPING_CODER_TO_INDEX = "coder-to-index"
+    
+    # bulk output
+    DEFAULT_BULK_CREATE_BATCH_SIZE = 1000
+    
+    # also write long-format Reliability_Names_Coder_Data rows?
+    DEFAULT_DO_OUTPUT_CODER_DATA = True
 
     
     #----------------------------------------------------------------------------
@@ -167,6 +178,9 @@ class ReliabilityNamesBuilder( object ):
         # debug variables
         self.debug_output_json_file_path = ""
         
+        # write Reliability_Names_Coder_Data along with Reliability_Names?
+        self.do_output_coder_data = self.DEFAULT_DO_OUTPUT_CODER_DATA
+        
     #-- END method __init__() --#
     
 
@@ -194,6 +208,68 @@ class ReliabilityNamesBuilder( object ):
     #-- END method add_coder_at_index() --#
     
 
+    def build_article_coder_article_data_map( self, article_id_list_IN ):
+        
+        '''
+        Accepts list of article IDs.  Retrieves the IDs of all Article_Data for
+            those articles that pass filter_article_data() in a single query,
+            and returns them in a dictionary that maps article ID to a
+            dictionary that maps coder ID to the list of that coder's
+            Article_Data IDs for the article.
+        '''
+        
+        # return reference
+        map_OUT = {}
+        
+        # declare variables
+        me = "build_article_coder_article_data_map"
+        article_data_qs = None
+        article_data_id = -1
+        article_id = -1
+        coder_id = -1
+        coder_to_id_list_map = None
+        id_list = None
+        
+        # got IDs?
+        if ( ( article_id_list_IN is not None ) and ( len( article_id_list_IN ) > 0 ) ):
+        
+            # get filtered Article_Data for the articles.
+            article_data_qs = Article_Data.objects.filter( article_id__in = article_id_list_IN )
+            article_data_qs = self.filter_article_data( article_data_qs )
+            article_data_qs = article_data_qs.order_by( "id" )
+            
+            # loop over just the IDs.
+            for article_data_id, article_id, coder_id in article_data_qs.values_list( "id", "article_id", "coder_id" ):
+            
+                # get coder map for article.
+                coder_to_id_list_map = map_OUT.get( article_id, None )
+                if ( coder_to_id_list_map is None ):
+                
+                    coder_to_id_list_map = {}
+                    map_OUT[ article_id ] = coder_to_id_list_map
+                    
+                #-- END check to see if article in map --#
+                
+                # get ID list for coder
+                id_list = coder_to_id_list_map.get( coder_id, None )
+                if ( id_list is None ):
+                
+                    id_list = []
+                    coder_to_id_list_map[ coder_id ] = id_list
+                    
+                #-- END check to see if coder in map --#
+                
+                id_list.append( article_data_id )
+                
+            #-- END loop over Article_Data --#
+        
+        #-- END check to see if IDs passed in --#
+        
+        return map_OUT
+        
+    #-- END method build_article_coder_article_data_map() --#
+
+
     def build_index_info( self, *args, **kwargs ):
         
         '''
@@ -265,7 +341,27 @@ class ReliabilityNamesBuilder( object ):
         return status_OUT
         
     #-- END method build_reliability_names_data() --#
-    
+
+
+    def clear_article_coder_cache( self, article_id_IN = None ):
+
+        '''
+        Invalidates nested IndexHelper's per-article index-to-coder cache, for
+            one article if ID passed in, else for all articles.  This is a
+            passthrough to the nested IndexHelper.
+        '''
+
+        # declare variables
+        my_index_helper = None
+
+        # get index_helper
+        my_index_helper = self.get_index_helper()
+
+        # clear.
+        my_index_helper.clear_article_coder_cache( article_id_IN = article_id_IN )
+
+    #-- END method clear_article_coder_cache() --#
+
     
     def filter_article_data( self, article_data_qs_IN ):
         
@@ -469,6 +565,55 @@ class ReliabilityNamesBuilder( object ):
     #-- END method get_exclude_user_id_list() --#
 
 
+    def get_first_quotation( self, article_subject_IN ):
+
+        '''
+        Accepts Article_Subject.  Returns its first quotation (lowest
+            paragraph_number, then lowest value_index), or None if no
+            quotations.  If quotations were prefetched by load_article_graph()
+            (already in order), uses them rather than querying again.
+        '''
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        me = "get_first_quotation"
+        prefetch_cache = None
+        quotation_list = None
+        quotation_qs = None
+
+        # got a subject?
+        if ( article_subject_IN is not None ):
+
+            # were quotations prefetched?
+            prefetch_cache = getattr( article_subject_IN, "_prefetched_objects_cache", {} )
+            if ( "article_subject_quotation_set" in prefetch_cache ):
+
+                # yes - prefetch is ordered, so first in list is first quote.
+                quotation_list = list( article_subject_IN.article_subject_quotation_set.all() )
+                if ( len( quotation_list ) > 0 ):
+
+                    instance_OUT = quotation_list[ 0 ]
+
+                #-- END check to see if any quotations --#
+
+            else:
+
+                # no - query, ordered by paragraph number, then index.
+                quotation_qs = article_subject_IN.article_subject_quotation_set.all()
+                quotation_qs = quotation_qs.order_by( "paragraph_number", "value_index" )
+                instance_OUT = quotation_qs.first()
+
+            #-- END check to see if quotations were prefetched --#
+
+        #-- END check to see if subject passed in --#
+
+        return instance_OUT
+
+    #-- END method get_first_quotation() --#
+
+
     def get_index_helper( self ):
         
         '''
@@ -559,6 +704,62 @@ class ReliabilityNamesBuilder( object ):
     #-- END method get_limit_to_user_id_list() --#
 
 
+    def load_article_graph( self, article_qs_IN ):
+        
+        '''
+        Accepts Article QuerySet.  Returns it with everything process_articles()
+            needs attached via select_related() and prefetch_related(), so the
+            whole set of articles, their (filtered) Article_Data, coders,
+            authors, subjects, persons, and subject quotations are retrieved in
+            a constant number of queries, rather than a few queries per
+            Article_Data.
+            
+        Postconditions: Article_Data are filtered using filter_article_data()
+            inside the prefetch, so article.article_data_set.all() for each
+            article in the returned QuerySet will only contain Article_Data
+            that pass the filters.  Quotations for each subject are ordered by
+            paragraph_number, then value_index.
+        '''
+        
+        # return reference
+        qs_OUT = None
+        
+        # declare variables
+        me = "load_article_graph"
+        quotation_qs = None
+        subject_qs = None
+        author_qs = None
+        article_data_qs = None
+        
+        # got a QuerySet?
+        if ( article_qs_IN is not None ):
+        
+            # quotations, in the order we use to find the first quote.
+            quotation_qs = Article_Subject_Quotation.objects.order_by( "paragraph_number", "value_index" )
+            
+            # subjects, with person and quotations.
+            subject_qs = Article_Subject.objects.select_related( "person" )
+            subject_qs = subject_qs.prefetch_related( Prefetch( "article_subject_quotation_set", queryset = quotation_qs ) )
+            
+            # authors, with person.
+            author_qs = Article_Author.objects.select_related( "person" )
+            
+            # Article_Data, filtered, with coder, authors and subjects.
+            article_data_qs = Article_Data.objects.select_related( "coder" )
+            article_data_qs = self.filter_article_data( article_data_qs )
+            article_data_qs = article_data_qs.prefetch_related( Prefetch( "article_author_set", queryset = author_qs ),
+                                                                Prefetch( "article_subject_set", queryset = subject_qs ) )
+            
+            # attach it all to the articles.
+            qs_OUT = article_qs_IN.prefetch_related( Prefetch( "article_data_set", queryset = article_data_qs ) )
+        
+        #-- END check to see if QuerySet passed in. --#
+        
+        return qs_OUT
+        
+    #-- END method load_article_graph() --#
+
+
     def map_index_to_coder_for_article( self, article_IN, mapping_type_IN = MAPPING_INDEX_TO_CODER, *args, **kwargs ):
 
         '''
@@ -602,7 +803,9 @@ class ReliabilityNamesBuilder( object ):
 
     def output_reliability_data( self,
                                  label_IN = "",
-                                 include_undetected_IN = False ):
+                                 include_undetected_IN = False,
+                                 do_bulk_create_IN = False,
+                                 batch_size_IN = DEFAULT_BULK_CREATE_BATCH_SIZE ):
     
         '''
         Accepts article_info_dict_IN, dictionary that maps article IDs to the
@@ -624,6 +827,16 @@ class ReliabilityNamesBuilder( object ):
            gets dictionaries of authors and sources and for each author and source,
            outputs a row to the reliability table containing coding information.
            
+        If do_bulk_create_IN is True, articles, persons, and Article_Data are
+           loaded up front into ID maps, rows are built in memory, then all
+           rows are written with bulk_create() in batches of batch_size_IN,
+           inside a single transaction.
+           
+        If self.do_output_coder_data is True, the long-format
+           Reliability_Names_Coder_Data rows for all the rows written are
+           written in bulk once all the rows are saved (batches of
+           batch_size_IN).
+           
         Preconditions: expects that you already ran process_articles() with this
            instance.
         '''
@@ -644,9 +857,25 @@ class ReliabilityNamesBuilder( object ):
         my_person_id = -1
         my_person_info_dict = {}
         reliability_row = -1
+        saved_row_list = []
         
-        # get map of article IDs to attribution info.
-        article_info_dict_IN = self.article_id_to_info_map
+        # bulk?
+        if ( do_bulk_create_IN == True ):
+        
+            # yes - call bulk method, which does all the work.
+            self.output_reliability_data_bulk( label_IN = label_IN,
+                                               include_undetected_IN = include_undetected_IN,
+                                               batch_size_IN = batch_size_IN )
+            
+            # nothing left to do here.
+            article_info_dict_IN = None
+            
+        else:
+        
+            # get map of article IDs to attribution info.
+            article_info_dict_IN = self.article_id_to_info_map
+            
+        #-- END check to see if bulk create. --#
         
         # make sure we have something to output.
         if article_info_dict_IN is not None:
@@ -687,6 +916,13 @@ class ReliabilityNamesBuilder( object ):
                                                                             label_IN = label_IN,
                                                                             include_undetected_IN = include_undetected_IN )
                         print ( "- author: " + str( reliability_row ) )
+                        
+                        # saved?
+                        if ( reliability_row is not None ):
+                        
+                            saved_row_list.append( reliability_row )
+                            
+                        #-- END check to see if row --#
                     
                     #-- END loop over author info ---#
                 
@@ -707,6 +943,13 @@ class ReliabilityNamesBuilder( object ):
                                                                             label_IN = label_IN,
                                                                             include_undetected_IN = include_undetected_IN )
                         print ( "- source: " + str( reliability_row ) )
+                        
+                        # saved?
+                        if ( reliability_row is not None ):
+                        
+                            saved_row_list.append( reliability_row )
+                            
+                        #-- END check to see if row --#
                     
                     #-- END loop over author info ---#
     
@@ -714,17 +957,205 @@ class ReliabilityNamesBuilder( object ):
             
             #-- END loop over article_info_dict_IN --#
             
+            # long-format coder data, too?  All at once, not per row.
+            if ( ( self.do_output_coder_data == True ) and ( len( saved_row_list ) > 0 ) ):
+            
+                Reliability_Names_Coder_Data.create_for_reliability_names_list( saved_row_list, batch_size_IN = batch_size_IN )
+                
+            #-- END check to see if output coder data --#
+            
         #-- END check to see if we got something passed in. --#
         
     #-- END method output_reliability_data --##
     
     
+    def output_reliability_data_bulk( self,
+                                      label_IN = "",
+                                      include_undetected_IN = False,
+                                      batch_size_IN = DEFAULT_BULK_CREATE_BATCH_SIZE ):
+    
+        '''
+        Bulk version of output_reliability_data().  Uses the data in
+           self.article_id_to_info_map built by process_articles().  Loads
+           Articles and Persons into ID-to-instance maps and builds maps of
+           article ID to index-to-coder map and of article ID to coder ID to
+           filtered Article_Data IDs, all in a few queries, then builds every Reliability_Names row in memory using
+           output_reliability_name_row() (without saving) and writes them with
+           bulk_create() in batches of batch_size_IN, inside one transaction.
+           If self.do_output_coder_data is True, also bulk_create()s the
+           long-format Reliability_Names_Coder_Data rows for them, in the same
+           transaction.
+           
+        Returns the list of Reliability_Names rows created.
+        
+        Preconditions: expects that you already ran process_articles() with this
+           instance.
+           
+        Postconditions: since rows are written with bulk_create(), save() is not
+           called and no signals are sent for the rows.
+        '''
+        
+        # return reference
+        list_OUT = []
+    
+        # declare variables.
+        me = "output_reliability_data_bulk"
+        my_logger = None
+        logging_message = ""
+        article_info_dict = None
+        person_id_list = None
+        article_id_to_instance_map = None
+        person_id_to_instance_map = None
+        article_id_to_coder_article_data_map = None
+        article_id_to_index_to_coder_map = None
+        my_article_id = -1
+        my_article_info = None
+        my_article = None
+        index_to_coder_map = None
+        coder_id_to_article_data_id_list = None
+        person_type_to_info_dict_map = None
+        current_person_type = None
+        current_person_info_dict = None
+        my_person_id = -1
+        my_person_info_dict = None
+        my_person = None
+        reliability_row = None
+        batch_size = -1
+        
+        # init logger
+        my_logger = self.m_exception_helper
+        
+        # get map of article IDs to attribution info.
+        article_info_dict = self.article_id_to_info_map
+        
+        # make sure we have something to output.
+        if ( ( article_info_dict is not None ) and ( len( article_info_dict ) > 0 ) ):
+        
+            # ! ----> load articles and persons
+            article_id_to_instance_map = Article.objects.in_bulk( list( article_info_dict.keys() ) )
+            
+            person_id_list = []
+            for my_article_id, my_article_info in six.iteritems( article_info_dict ):
+            
+                # add authors, then subjects.
+                person_id_list.extend( my_article_info.get( self.AUTHOR_INFO_DICT, {} ).keys() )
+                person_id_list.extend( my_article_info.get( self.SUBJECT_INFO_DICT, {} ).keys() )
+            
+            #-- END loop over articles to get person IDs --#
+            
+            person_id_to_instance_map = Person.objects.in_bulk( list( set( person_id_list ) ) )
+            
+            # ! ----> map article to index to coder
+            article_id_to_index_to_coder_map = self.get_index_helper().get_index_to_coder_map_for_article_id_list( list( article_info_dict.keys() ) )
+            
+            # ! ----> map article to coder to filtered Article_Data IDs
+            article_id_to_coder_article_data_map = self.build_article_coder_article_data_map( list( article_info_dict.keys() ) )
+            
+            # ! ----> build rows in memory
+            for my_article_id, my_article_info in six.iteritems( article_info_dict ):
+            
+                # get article.
+                my_article = article_id_to_instance_map.get( my_article_id, None )
+                if ( my_article is not None ):
+                
+                    # article's index-to-coder map.
+                    index_to_coder_map = article_id_to_index_to_coder_map.get( my_article_id, {} )
+                    
+                    # article's coder-to-Article_Data map.
+                    coder_id_to_article_data_id_list = article_id_to_coder_article_data_map.get( my_article_id, {} )
+                    
+                    # authors, then subjects.
+                    person_type_to_info_dict_map = {}
+                    person_type_to_info_dict_map[ self.PERSON_TYPE_AUTHOR ] = my_article_info.get( self.AUTHOR_INFO_DICT, {} )
+                    person_type_to_info_dict_map[ self.PERSON_TYPE_SUBJECT ] = my_article_info.get( self.SUBJECT_INFO_DICT, {} )
+                    for current_person_type in [ self.PERSON_TYPE_AUTHOR, self.PERSON_TYPE_SUBJECT ]:
+                    
+                        current_person_info_dict = person_type_to_info_dict_map.get( current_person_type, None )
+                        if ( current_person_info_dict is not None ):
+                        
+                            # loop over people.
+                            for my_person_id, my_person_info_dict in six.iteritems( current_person_info_dict ):
+                            
+                                # build row, but do not save.
+                                my_person = person_id_to_instance_map.get( my_person_id, None )
+                                reliability_row = self.output_reliability_name_row( my_article,
+                                                                                    my_person_info_dict,
+                                                                                    current_person_type,
+                                                                                    label_IN = label_IN,
+                                                                                    include_undetected_IN = include_undetected_IN,
+                                                                                    do_save_IN = False,
+                                                                                    person_IN = my_person,
+                                                                                    index_to_coder_map_IN = index_to_coder_map,
+                                                                                    coder_id_to_article_data_id_list_IN = coder_id_to_article_data_id_list )
+                                
+                                # got a row?
+                                if ( reliability_row is not None ):
+                                
+                                    # bulk_create() doesn't call save(), so
+                                    #     set disagreement flags here.
+                                    reliability_row.update_disagreement_flags()
+                                    list_OUT.append( reliability_row )
+                                    
+                                #-- END check to see if row --#
+                            
+                            #-- END loop over person info --#
+                            
+                        #-- END check to see if person info --#
+                        
+                    #-- END loop over person types --#
+                    
+                else:
+                
+                    # no article for ID - output a message.
+                    logging_message = "ERROR - no Article found for ID " + str( my_article_id ) + ", moving on."
+                    my_logger.output_debug_message( logging_message, method_IN = me, indent_with_IN = "====> ", do_print_IN = True )
+                
+                #-- END check to see if article found. --#
+                
+            #-- END loop over articles --#
+            
+            # ! ----> write rows
+            batch_size = batch_size_IN
+            if ( ( batch_size is None ) or ( batch_size <= 0 ) ):
+            
+                # use default.
+                batch_size = self.DEFAULT_BULK_CREATE_BATCH_SIZE
+                
+            #-- END check to see if batch size --#
+            
+            with transaction.atomic():
+            
+                Reliability_Names.objects.bulk_create( list_OUT, batch_size = batch_size )
+                
+                # long-format coder data, too?
+                if ( self.do_output_coder_data == True ):
+                
+                    Reliability_Names_Coder_Data.create_for_reliability_names_list( list_OUT, batch_size_IN = batch_size )
+                    
+                #-- END check to see if output coder data --#
+                
+            #-- END with transaction.atomic() --#
+            
+            logging_message = "Created " + str( len( list_OUT ) ) + " Reliability_Names rows for label \"" + str( label_IN ) + "\" ( batch size = " + str( batch_size ) + " )."
+            my_logger.output_debug_message( logging_message, method_IN = me, indent_with_IN = "----> ", do_print_IN = True )
+            
+        #-- END check to see if anything to output. --#
+        
+        return list_OUT
+        
+    #-- END method output_reliability_data_bulk() --#
+    
+    
     def output_reliability_name_row( self,
                                      article_IN,
                                      person_info_dict_IN,
                                      article_person_type_IN,
                                      label_IN = "",
-                                     include_undetected_IN = False ):
+                                     include_undetected_IN = False,
+                                     do_save_IN = True,
+                                     person_IN = None,
+                                     index_to_coder_map_IN = None,
+                                     coder_id_to_article_data_id_list_IN = None ):
         
         '''
         Accepts:
@@ -744,9 +1175,21 @@ class ReliabilityNamesBuilder( object ):
         - include_undetected_IN - boolean flag - if True, include rows for
             Authors or Subjects detected by someone, but not by any coders
             included in the current specifications.  Defaults to False.
+        - do_save_IN - boolean flag - if True (the default), saves the row
+            before returning it.  If False, row is returned unsaved (for
+            bulk_create()).
+        - person_IN - optional Person for the person ID in person_info_dict_IN.
+            If None, Person is looked up.
+        - index_to_coder_map_IN - optional map of indices to coders for the
+            article, as returned by map_index_to_coder_for_article().  If None,
+            the map is built for the article.
+        - coder_id_to_article_data_id_list_IN - optional map of coder IDs to
+            list of IDs of that coder's filtered Article_Data for the article.
+            If None, Article_Data are queried per coder.
          
         Creates an instance of Reliability_Names, stores values from
-            the dictionary in the appropriate columns, then saves it.
+            the dictionary in the appropriate columns, then saves it (unless
+            do_save_IN is False).
            
         Returns the row model instance, or None if error.
         '''
@@ -786,6 +1229,7 @@ class ReliabilityNamesBuilder( object ):
         coder_article_data_count = -1
         coder_article_data = None
         coder_article_data_id = -1
+        coder_article_data_id_list = None
         
         # init logger
         my_logger = self.m_exception_helper        
@@ -803,7 +1247,13 @@ class ReliabilityNamesBuilder( object ):
             #     then loop over that in processing below (so no longer doing
             #     something with every coder, just looping over indices that had
             #     at least one coder).
-            index_to_coder_map = self.map_index_to_coder_for_article( article_IN )
+            index_to_coder_map = index_to_coder_map_IN
+            if ( index_to_coder_map is None ):
+            
+                # not passed in - build it.
+                index_to_coder_map = self.map_index_to_coder_for_article( article_IN )
+                
+            #-- END check to see if index-to-coder map passed in. --#
                     
             # person_info
             if ( person_info_dict_IN is not None ):
@@ -824,7 +1274,13 @@ class ReliabilityNamesBuilder( object ):
                     
                     # get information from info dictionary
                     my_person_id = person_info_dict_IN.get( self.PERSON_ID, -1 )
-                    my_person = Person.objects.get( id = my_person_id )
+                    my_person = person_IN
+                    if ( my_person is None ):
+                    
+                        # not passed in - look it up.
+                        my_person = Person.objects.get( id = my_person_id )
+                        
+                    #-- END check to see if person passed in. --#
                     my_person_name = person_info_dict_IN.get( self.PERSON_NAME, None )
                     my_person_first_name = person_info_dict_IN.get( self.PERSON_FIRST_NAME, None )
                     my_person_last_name = person_info_dict_IN.get( self.PERSON_LAST_NAME, None )
@@ -872,24 +1328,37 @@ class ReliabilityNamesBuilder( object ):
                             #     record.
                             coder_article_data = None
                             coder_article_data_id = -1
-                            coder_article_data_qs = article_data_qs.filter( coder = current_coder_user )
-                                                       
-                            logging_message = "- in " + me + "(): before filtering, coder_article_data_qs.count() = " + str( coder_article_data_qs.count() )
-                            my_logger.output_debug_message( logging_message, method_IN = me, indent_with_IN = "**** ", do_print_IN = False )
                             
-                            # ! --------> if "automated" user, filter on coder_type
-                            coder_article_data_qs = self.filter_article_data( coder_article_data_qs )
-                            coder_article_data_count = coder_article_data_qs.count()
+                            # got pre-built map of coder ID to Article_Data IDs?
+                            if ( coder_id_to_article_data_id_list_IN is not None ):
+                            
+                                # yes - use it (already filtered).
+                                coder_article_data_id_list = coder_id_to_article_data_id_list_IN.get( current_coder_id, [] )
+                                coder_article_data_count = len( coder_article_data_id_list )
+                                
+                            else:
                             
-                            logging_message = "after filtering, coder_article_data_qs.count() = " + str( coder_article_data_qs.count() )
-                            my_logger.output_debug_message( logging_message, method_IN = me, indent_with_IN = "**** ", do_print_IN = False )            
+                                # no - query.
+                                coder_article_data_qs = article_data_qs.filter( coder = current_coder_user )
+                                                           
+                                logging_message = "- in " + me + "(): before filtering, coder_article_data_qs.count() = " + str( coder_article_data_qs.count() )
+                                my_logger.output_debug_message( logging_message, method_IN = me, indent_with_IN = "**** ", do_print_IN = False )
+                                
+                                # ! --------> if "automated" user, filter on coder_type
+                                coder_article_data_qs = self.filter_article_data( coder_article_data_qs )
+                                coder_article_data_id_list = list( coder_article_data_qs.values_list( "id", flat = True ) )
+                                coder_article_data_count = len( coder_article_data_id_list )
+                                
+                                logging_message = "after filtering, coder_article_data_qs.count() = " + str( coder_article_data_count )
+                                my_logger.output_debug_message( logging_message, method_IN = me, indent_with_IN = "**** ", do_print_IN = False )            
+
+                            #-- END check to see if pre-built Article_Data map --#
 
                             # how many?
                             if ( coder_article_data_count == 1 ):
                             
                                 # ...and store information.
-                                coder_article_data = coder_article_data_qs.get()
-                                coder_article_data_id = coder_article_data.id
+                                coder_article_data_id = coder_article_data_id_list[ 0 ]
                             
                                 # add current index to index_used_list.
                                 index_used_list.append( current_coder_index )
@@ -1026,8 +1495,13 @@ class ReliabilityNamesBuilder( object ):
                             
                         #-- END check to see if all indices used. --#
                         
-                        # save
-                        reliability_instance.save()
+                        # save?
+                        if ( do_save_IN == True ):
+                        
+                            # save
+                            reliability_instance.save()
+                            
+                        #-- END check to see if we save. --#
                         
                     else:
                     
@@ -1091,6 +1565,7 @@ class ReliabilityNamesBuilder( object ):
         article_data_id_list = None
         article_data_author_qs = None
         article_data_subject_qs = None
+        current_subject = None
         article_coder_id_list = None
         article_data_id = -1
         article_data_coder = None
@@ -1136,6 +1611,9 @@ class ReliabilityNamesBuilder( object ):
             
         article_qs = article_qs.order_by( "id" )
         
+        # ! load articles and all their coding in bulk.
+        article_qs = self.load_article_graph( article_qs )
+        
         # build a dictionary that maps article ID to assorted details about the coding
         #    of each article.
         article_to_info_dict = self.article_id_to_info_map
@@ -1158,13 +1636,12 @@ class ReliabilityNamesBuilder( object ):
             # get article_id
             article_id = current_article.id
         
-            # get article data for this article
+            # get article data for this article - already filtered on
+            #     automated coder_type, IDs of coders to include or exclude in
+            #     load_article_graph().  Do not filter again here, else we lose
+            #     the prefetched data.
             article_data_qs = current_article.article_data_set.all()
             
-            # ! filter on automated coder_type, IDs of coders to include or
-            #     exclude, if filters are specified.
-            article_data_qs = self.filter_article_data( article_data_qs )
-            
             # how many Article_Data?
             article_data_count = len( article_data_qs )
         
@@ -1252,8 +1729,19 @@ class ReliabilityNamesBuilder( object ):
                     # all subjects, or just sources?
                     if ( limit_to_sources_IN == True ):
     
-                        # just sources.
-                        article_data_subject_qs = current_article_data.get_quoted_article_sources_qs()
+                        # just sources - filter prefetched subjects in memory
+                        #     (same as get_quoted_article_sources_qs()).
+                        article_data_subject_qs = []
+                        for current_subject in current_article_data.article_subject_set.all():
+                        
+                            # quoted?
+                            if ( current_subject.subject_type == self.SUBJECT_TYPE_QUOTED ):
+                            
+                                article_data_subject_qs.append( current_subject )
+                                
+                            #-- END check to see if subject is a source --#
+                            
+                        #-- END loop over subjects --#
                         
                     else:
                     
@@ -1349,8 +1837,6 @@ class ReliabilityNamesBuilder( object ):
 
         # declare variables - subject-specific processing.
         is_subject = False
-        subject_quote_qs = None
-        subject_quote_count = -1
         subject_first_quote = None
         first_quote_graf = -1
         first_quote_index = -1
@@ -1462,18 +1948,9 @@ class ReliabilityNamesBuilder( object ):
                                 # FIELD_NAME_SUFFIX_FIRST_QUOTE_INDEX = "first_quote_index"
                                 
                                 # check to see if person has any quotes.
-                                subject_quote_qs = current_article_person.article_subject_quotation_set.all()
-                                subject_quote_count = subject_quote_qs.count()
-                                if ( subject_quote_count > 0 ):
+                                subject_first_quote = self.get_first_quotation( current_article_person )
+                                if ( subject_first_quote is not None ):
                                 
-                                    # we do.  Order by paragraph number, then
-                                    #    index.
-                                    subject_quote_qs = subject_quote_qs.order_by( "paragraph_number", "value_index" )
-                                    
-                                    # get the first record in the list.
-                                    subject_quote_qs = subject_quote_qs[ : 1 ]
-                                    subject_first_quote = subject_quote_qs.get()
-                                    
                                     # retrieve and store the paragraph and index
                                     #    values
                                     first_quote_graf = subject_first_quote.paragraph_number
@@ -12,15 +12,22 @@ context_analysis is distributed in the hope that it will be useful, but WITHOUT
 You should have received a copy of the GNU Lesser General Public License along with http://github.com/jonathanmorgan/context_analysis. If not, see http://www.gnu.org/licenses/.
 '''
 
+# python built-in libraries
+import collections
+
 # python package imports
 import six
 
 # django imports
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Prefetch
 
 # context_text imports
 from context_text.models import Article
+from context_text.models import Article_Author
 from context_text.models import Article_Data
+from context_text.models import Article_Subject
 from context_text.models import Person
 
 # context_analysis imports
@@ -48,8 +55,23 @@ class ReliabilityTiesBuilder( object ):
     PERSON_TYPE_AUTHOR = Reliability_Ties.PERSON_TYPE_AUTHOR
     PERSON_TYPE_SOURCE = Reliability_Ties.PERSON_TYPE_SOURCE
     
-    # information about table.
-    TABLE_MAX_CODERS = 3
+    # information about table - Reliability_Ties has coder1 through coder10.
+    TABLE_MAX_CODERS = 10
+    
+    # Article_Subject subject_types
+    SUBJECT_TYPE_QUOTED = Article_Subject.SUBJECT_TYPE_QUOTED
+    
+    # bulk flush of accumulated ties
+    DEFAULT_BULK_BATCH_SIZE = 1000
+    
+    # accumulated tie info dictionary keys
+    TIE_INFO_AUTHOR = "author"
+    TIE_INFO_SOURCE = "source"
+    TIE_INFO_INDEX_TO_COUNT_MAP = "index_to_count_map"
+    TIE_INFO_INDEX_TO_CODER_LIST_MAP = "index_to_coder_list_map"
+    
+    # debug flag
+    DEBUG = False
 
     
     #----------------------------------------------------------------------------
@@ -69,9 +91,90 @@ class ReliabilityTiesBuilder( object ):
         # variable to hold desired automated coder type
         self.limit_to_automated_coder_type = ""
         
+        # highest coder index to build ties for (no more than
+        #     TABLE_MAX_CODERS).
+        self.table_max_coders = self.TABLE_MAX_CODERS
+        
+        # accumulate ties in memory, then write with flush_ties()?  If False,
+        #     each tie is written as it is found (update_reliability_row()).
+        self.do_accumulate_ties = True
+        self.bulk_batch_size = self.DEFAULT_BULK_BATCH_SIZE
+        
+        # accumulated ties - ( author ID, source ID ) to tie info dictionary.
+        self.tie_key_to_info_map = collections.OrderedDict()
+        
     #-- END method __init__() --#
     
 
+    def accumulate_tie( self, author_person_IN, source_person_IN, coder_user_IN ):
+        
+        '''
+        In-memory counterpart to update_reliability_row().  Accepts author and
+            source persons and coder User.  Records the tie in
+            self.tie_key_to_info_map - a mention for the coder's index, and
+            the coder in the list of coders seen for that index - to be
+            written later by flush_ties().  Like update_reliability_row(), the
+            tie is recorded (so gets a row) even if the coder has no index, but
+            then nothing is counted.
+        '''
+        
+        # return reference
+        status_OUT = ""
+        
+        # declare variables
+        me = "accumulate_tie"
+        tie_key = None
+        tie_info = None
+        coder_index = -1
+        coder_list = None
+        
+        # make sure we have an author, a source, and a coder.
+        if ( ( author_person_IN is not None ) and ( source_person_IN is not None ) and ( coder_user_IN is not None ) ):
+        
+            # get info for this author and source.
+            tie_key = ( author_person_IN.id, source_person_IN.id )
+            tie_info = self.tie_key_to_info_map.get( tie_key, None )
+            if ( tie_info is None ):
+            
+                # first time - make info.
+                tie_info = {}
+                tie_info[ self.TIE_INFO_AUTHOR ] = author_person_IN
+                tie_info[ self.TIE_INFO_SOURCE ] = source_person_IN
+                tie_info[ self.TIE_INFO_INDEX_TO_COUNT_MAP ] = collections.Counter()
+                tie_info[ self.TIE_INFO_INDEX_TO_CODER_LIST_MAP ] = {}
+                self.tie_key_to_info_map[ tie_key ] = tie_info
+                
+            #-- END check to see if tie already seen --#
+            
+            # get index for coder.
+            coder_index = self.coder_id_to_index_map.get( coder_user_IN.id, -1 )
+            if ( coder_index > 0 ):
+            
+                # count the mention...
+                tie_info[ self.TIE_INFO_INDEX_TO_COUNT_MAP ][ coder_index ] += 1
+                
+                # ...and remember the coder.
+                coder_list = tie_info[ self.TIE_INFO_INDEX_TO_CODER_LIST_MAP ].setdefault( coder_index, [] )
+                if ( coder_user_IN.id not in [ current_coder.id for current_coder in coder_list ] ):
+                
+                    coder_list.append( coder_user_IN )
+                    
+                #-- END check to see if coder already in list --#
+            
+            else:
+            
+                # error - index not greater than 0.
+                print( "ERROR In " + me + ": coder index = " + str( coder_index ) + " for coder " + str( coder_user_IN ) + ".  Should be 1 or greater." )
+            
+            #-- END check to see if index greater than 0 --#
+            
+        #-- END check to see if we have author, source, and coder --#
+        
+        return status_OUT
+        
+    #-- END method accumulate_tie() --#
+    
+
     def filter_article_data( self, article_data_qs_IN ):
         
         '''
@@ -105,6 +208,200 @@ class ReliabilityTiesBuilder( object ):
     #-- END method filter_article_data() --#
 
 
+    def flush_ties( self ):
+        
+        '''
+        Writes the ties accumulated by accumulate_tie() to Reliability_Ties,
+            with the same results as calling update_reliability_row() for each
+            tie.  Loads existing rows for the label in one query, updates their
+            mention counts, coders, and coder ID lists in memory, then, in one
+            transaction, bulk_create()s new rows and bulk_update()s existing
+            ones in batches of self.bulk_batch_size.  Clears the accumulated
+            ties.  Returns count of rows written.
+        '''
+        
+        # return reference
+        count_OUT = 0
+        
+        # declare variables
+        me = "flush_ties"
+        reliability_label = ""
+        author_id_list = None
+        reliability_qs = None
+        current_row = None
+        tie_key = None
+        tie_key_to_row_list_map = None
+        tie_info = None
+        row_list = None
+        reliability_row = None
+        create_list = None
+        update_list = None
+        update_field_name_list = None
+        coder_index = -1
+        mention_count = -1
+        coder_list = None
+        current_field = None
+        attr_name = ""
+        row_coder = None
+        coder_id_list_string = ""
+        coder_id_list = None
+        current_coder = None
+        
+        # anything to flush?
+        if ( len( self.tie_key_to_info_map ) > 0 ):
+        
+            # get label
+            reliability_label = self.reliability_row_label
+            
+            # load existing rows for the authors we have, all at once.
+            author_id_list = list( set( [ tie_key[ 0 ] for tie_key in self.tie_key_to_info_map ] ) )
+            reliability_qs = Reliability_Ties.objects.filter( person_id__in = author_id_list )
+            reliability_qs = reliability_qs.filter( person_type = Reliability_Ties.PERSON_TYPE_AUTHOR )
+            reliability_qs = reliability_qs.filter( relation_type = Reliability_Ties.RELATION_AUTHOR_TO_SOURCE )
+            
+            # got a label?
+            if ( ( reliability_label is not None ) and ( reliability_label != "" ) ):
+            
+                # yes - filter on it.
+                reliability_qs = reliability_qs.filter( label = reliability_label )
+            
+            #-- END check for label --#
+            
+            tie_key_to_row_list_map = {}
+            for current_row in reliability_qs:
+            
+                tie_key = ( current_row.person_id, current_row.relation_person_id )
+                tie_key_to_row_list_map.setdefault( tie_key, [] ).append( current_row )
+                
+            #-- END loop over existing rows --#
+            
+            # apply accumulated info to rows.
+            create_list = []
+            update_list = []
+            for tie_key, tie_info in six.iteritems( self.tie_key_to_info_map ):
+            
+                # existing row?
+                row_list = tie_key_to_row_list_map.get( tie_key, [] )
+                if ( len( row_list ) == 1 ):
+                
+                    # got one.  Update it.
+                    reliability_row = row_list[ 0 ]
+                    update_list.append( reliability_row )
+                    
+                elif ( len( row_list ) > 1 ):
+                
+                    # multiple matches.  Yikes.
+                    print( "ERROR In " + me + ": Multiple matches returned for author " + str( tie_info[ self.TIE_INFO_AUTHOR ] ) + "; source " + str( tie_info[ self.TIE_INFO_SOURCE ] ) + "; label = " + reliability_label )
+                    reliability_row = None
+                    
+                else:
+                
+                    # no existing row - create and populate.
+                    reliability_row = self.make_reliability_row( tie_info[ self.TIE_INFO_AUTHOR ], tie_info[ self.TIE_INFO_SOURCE ] )
+                    create_list.append( reliability_row )
+                    
+                #-- END check to see how many matches we have in reliability table --#
+                
+                # got a row?
+                if ( reliability_row is not None ):
+                
+                    # update coder information for each index.
+                    for coder_index, mention_count in six.iteritems( tie_info[ self.TIE_INFO_INDEX_TO_COUNT_MAP ] ):
+                    
+                        coder_list = tie_info[ self.TIE_INFO_INDEX_TO_CODER_LIST_MAP ][ coder_index ]
+                        
+                        # coder# - if none, first coder seen.
+                        attr_name = self.COLUMN_NAME_PREFIX_CODER + str( coder_index )
+                        row_coder = getattr( reliability_row, attr_name )
+                        if ( row_coder is None ):
+                        
+                            row_coder = coder_list[ 0 ]
+                            setattr( reliability_row, attr_name, row_coder )
+                            
+                        #-- END check to see if coder in row --#
+                        
+                        # coder#_id_list - IDs of all coders for this index, if
+                        #     more than one, in the order they were seen.
+                        attr_name = self.COLUMN_NAME_PREFIX_CODER + str( coder_index ) + self.COLUMN_NAME_SUFFIX_ID_LIST
+                        coder_id_list_string = getattr( reliability_row, attr_name )
+                        if ( ( coder_id_list_string is None ) or ( coder_id_list_string == "" ) ):
+                        
+                            coder_id_list = [ str( row_coder.id ) ]
+                            
+                        else:
+                        
+                            coder_id_list = coder_id_list_string.split( "," )
+                            
+                        #-- END check to see if existing ID list --#
+                        
+                        for current_coder in coder_list:
+                        
+                            if ( str( current_coder.id ) not in coder_id_list ):
+                            
+                                coder_id_list.append( str( current_coder.id ) )
+                                
+                            #-- END check to see if ID already in list --#
+                            
+                        #-- END loop over coders --#
+                        
+                        if ( len( coder_id_list ) > 1 ):
+                        
+                            setattr( reliability_row, attr_name, ",".join( coder_id_list ) )
+                            
+                        #-- END check to see if more than one coder --#
+                        
+                        # coder#_mention_count
+                        attr_name = self.COLUMN_NAME_PREFIX_CODER + str( coder_index ) + self.COLUMN_NAME_SUFFIX_MENTION_COUNT
+                        setattr( reliability_row, attr_name, ( getattr( reliability_row, attr_name ) or 0 ) + mention_count )
+                        
+                    #-- END loop over coder indices --#
+                    
+                #-- END check to see if row --#
+                
+            #-- END loop over accumulated ties --#
+            
+            # fields that can change on existing rows - coder#,
+            #     coder#_mention_count, coder#_id_list.
+            update_field_name_list = []
+            for current_field in Reliability_Ties._meta.fields:
+            
+                if ( current_field.name.startswith( self.COLUMN_NAME_PREFIX_CODER ) == True ):
+                
+                    update_field_name_list.append( current_field.name )
+                    
+                #-- END check to see if coder field --#
+                
+            #-- END loop over fields --#
+            
+            # write
+            with transaction.atomic():
+            
+                Reliability_Ties.objects.bulk_create( create_list, batch_size = self.bulk_batch_size )
+                if ( len( update_list ) > 0 ):
+                
+                    Reliability_Ties.objects.bulk_update( update_list, update_field_name_list, batch_size = self.bulk_batch_size )
+                    
+                #-- END check to see if updates --#
+                
+            #-- END with transaction.atomic() --#
+            
+            count_OUT = len( create_list ) + len( update_list )
+            
+            # ==> DEBUG
+            if ( self.DEBUG == True ):
+                print( "In " + me + ": created " + str( len( create_list ) ) + " rows, updated " + str( len( update_list ) ) + " rows." )
+            #-- END DEBUG --#
+            
+            # clear accumulated ties.
+            self.tie_key_to_info_map = collections.OrderedDict()
+            
+        #-- END check to see if anything to flush --#
+        
+        return count_OUT
+        
+    #-- END method flush_ties() --#
+
+
     def get_coder_for_index( self, index_IN ):
         
         '''
@@ -156,6 +453,37 @@ class ReliabilityTiesBuilder( object ):
     #-- END method get_coder_for_index() --#
     
         
+    def get_quoted_sources( self, article_data_IN ):
+        
+        '''
+        Accepts Article_Data.  Returns list of its quoted Article_Subjects
+            (same as get_quoted_article_sources_qs()), filtered in memory from
+            article_subject_set, so subjects prefetched by load_article_graph()
+            are used rather than another query.
+        '''
+        
+        # return reference
+        list_OUT = []
+        
+        # declare variables
+        current_subject = None
+        
+        for current_subject in article_data_IN.article_subject_set.all():
+        
+            # quoted?
+            if ( current_subject.subject_type == self.SUBJECT_TYPE_QUOTED ):
+            
+                list_OUT.append( current_subject )
+                
+            #-- END check to see if subject is a source --#
+            
+        #-- END loop over subjects --#
+        
+        return list_OUT
+        
+    #-- END method get_quoted_sources() --#
+
+
     def get_reliability_row( self, author_person_IN, source_person_IN ):
         
         '''
@@ -226,36 +554,7 @@ class ReliabilityTiesBuilder( object ):
                 else:
                 
                     # well, looks like no existing row - create and populate.
-                    reliability_row = Reliability_Ties()
-                    
-                    # label
-                    if ( ( reliability_label is not None ) and ( reliability_label != "" ) ):
-
-                        reliability_row.label = reliability_label
-                        
-                    #-- END check to see if label. --#
-                    
-                    # Author information
-                    reliability_row.person = author_person_IN
-                    reliability_row.person_name = author_name
-                    reliability_row.person_type = Reliability_Ties.PERSON_TYPE_AUTHOR
-                    reliability_row.relation_type = Reliability_Ties.RELATION_AUTHOR_TO_SOURCE
-                    
-                    # source information
-                    reliability_row.relation_person = source_person_IN
-                    reliability_row.relation_person_name = source_name
-                    reliability_row.relation_person_type = Reliability_Ties.PERSON_TYPE_SOURCE
-                    
-                    # Coding information
-                    reliability_row.coder1 = None
-                    reliability_row.coder1_mention_count = 0
-                    reliability_row.coder1_id_list = ""
-                    reliability_row.coder2 = None
-                    reliability_row.coder2_mention_count = 0
-                    reliability_row.coder2_id_list = ""
-                    reliability_row.coder3 = None
-                    reliability_row.coder3_mention_count = 0
-                    reliability_row.coder3_id_list = ""
+                    reliability_row = self.make_reliability_row( author_person_IN, source_person_IN )
                                         
                     print( "In " + me + ": reliability_row before save() - " + str( reliability_row ) )
                     
@@ -284,14 +583,173 @@ class ReliabilityTiesBuilder( object ):
     #-- END method get_reliability_row() --#
 
 
+    def group_article_data_by_index( self, article_IN ):
+        
+        '''
+        Accepts Article whose article_data_set has been prefetched by
+            load_article_graph() (filtered, ordered by coder ID descending).
+            Returns OrderedDict of coder index to the first Article_Data seen
+            for a coder with that index, in index order.  Article_Data from
+            coders with no index, or an index above self.table_max_coders, are
+            left out (printed if DEBUG).
+        '''
+        
+        # return reference
+        map_OUT = None
+        
+        # declare variables
+        me = "group_article_data_by_index"
+        index_to_article_data_map = None
+        current_article_data = None
+        coder_index = -1
+        
+        # loop over prefetched Article_Data, keeping first per index.
+        index_to_article_data_map = {}
+        for current_article_data in article_IN.article_data_set.all():
+        
+            # get index for this coder (coder_id, so no User lookup).
+            coder_index = self.coder_id_to_index_map.get( current_article_data.coder_id, -1 )
+            if ( ( coder_index > 0 ) and ( coder_index <= self.table_max_coders ) ):
+            
+                # if no article_data yet stored for that index, store this one.
+                if ( coder_index not in index_to_article_data_map ):
+                
+                    index_to_article_data_map[ coder_index ] = current_article_data
+                    
+                #-- END check to see if index already has Article_Data --#
+                
+            else:
+            
+                # ==> DEBUG
+                if ( self.DEBUG == True ):
+                    print( "-------> In " + me + ": Coder ID = " + str( current_article_data.coder_id ) + "; index = " + str( coder_index ) + " - not in 1 to " + str( self.table_max_coders ) + ", skipping." )
+                #-- END DEBUG --#
+                
+            #-- END check to see if index in range --#
+            
+        #-- END loop over Article_Data --#
+        
+        # in index order.
+        map_OUT = collections.OrderedDict( sorted( index_to_article_data_map.items() ) )
+        
+        return map_OUT
+        
+    #-- END method group_article_data_by_index() --#
+
+
+    def load_article_graph( self, article_qs_IN ):
+        
+        '''
+        Accepts Article QuerySet.  Returns it with everything process_articles()
+            needs attached via select_related() and prefetch_related() - the
+            (filtered) Article_Data, ordered by coder ID descending, with
+            coders, and authors and subjects with persons - so all the articles
+            are processed in a constant number of queries, rather than a few
+            queries per article and coder.
+        '''
+        
+        # return reference
+        qs_OUT = None
+        
+        # declare variables
+        me = "load_article_graph"
+        subject_qs = None
+        author_qs = None
+        article_data_qs = None
+        
+        # got a QuerySet?
+        if ( article_qs_IN is not None ):
+        
+            # authors and subjects, with person.
+            author_qs = Article_Author.objects.select_related( "person" )
+            subject_qs = Article_Subject.objects.select_related( "person" )
+            
+            # Article_Data, filtered, with coder, authors and subjects.
+            article_data_qs = Article_Data.objects.select_related( "coder" )
+            article_data_qs = self.filter_article_data( article_data_qs )
+            
+            # !hack
+            # order by coder ID, descending, so we always use coder 6 as
+            #    coder #1 if they coded an article.
+            article_data_qs = article_data_qs.order_by( "-coder__id" )
+            article_data_qs = article_data_qs.prefetch_related( Prefetch( "article_author_set", queryset = author_qs ),
+                                                                Prefetch( "article_subject_set", queryset = subject_qs ) )
+            
+            # attach it all to the articles.
+            qs_OUT = article_qs_IN.prefetch_related( Prefetch( "article_data_set", queryset = article_data_qs ) )
+        
+        #-- END check to see if QuerySet passed in. --#
+        
+        return qs_OUT
+        
+    #-- END method load_article_graph() --#
+
+
+    def make_reliability_row( self, author_person_IN, source_person_IN ):
+        
+        '''
+        Accepts author and source persons.  Creates a new Reliability_Ties
+            instance for them, with the label nested in this instance, and
+            coding information for coders 1 through self.table_max_coders
+            initialized.  Does not
+            save.  Returns the instance.
+        '''
+        
+        # return reference
+        instance_OUT = None
+        
+        # declare variables
+        reliability_label = ""
+        coder_index = -1
+        
+        # get label
+        reliability_label = self.reliability_row_label
+        
+        # create and populate.
+        instance_OUT = Reliability_Ties()
+        
+        # label
+        if ( ( reliability_label is not None ) and ( reliability_label != "" ) ):
+
+            instance_OUT.label = reliability_label
+            
+        #-- END check to see if label. --#
+        
+        # Author information
+        instance_OUT.person = author_person_IN
+        instance_OUT.person_name = author_person_IN.get_name_string()
+        instance_OUT.person_type = Reliability_Ties.PERSON_TYPE_AUTHOR
+        instance_OUT.relation_type = Reliability_Ties.RELATION_AUTHOR_TO_SOURCE
+        
+        # source information
+        instance_OUT.relation_person = source_person_IN
+        instance_OUT.relation_person_name = source_person_IN.get_name_string()
+        instance_OUT.relation_person_type = Reliability_Ties.PERSON_TYPE_SOURCE
+        
+        # Coding information, for each coder index.
+        for coder_index in range( 1, self.table_max_coders + 1 ):
+        
+            setattr( instance_OUT, self.COLUMN_NAME_PREFIX_CODER + str( coder_index ), None )
+            setattr( instance_OUT, self.COLUMN_NAME_PREFIX_CODER + str( coder_index ) + self.COLUMN_NAME_SUFFIX_MENTION_COUNT, 0 )
+            setattr( instance_OUT, self.COLUMN_NAME_PREFIX_CODER + str( coder_index ) + self.COLUMN_NAME_SUFFIX_ID_LIST, "" )
+            
+        #-- END loop over coder indices --#
+        
+        return instance_OUT
+        
+    #-- END method make_reliability_row() --#
+
+
     def process_articles( self, tag_list_IN = [] ):
 
         '''
-        Grabs articles with a tag in tag_list_IN.  For each, loops through their
-           Article_Data to update a dictionary that maps authors to author info,
-           sources cited in articles, and counts of the number of articles in
-           the selected set that mention each source, as coded by one to three
-           different coders.
+        Grabs articles with a tag in tag_list_IN, along with their Article_Data,
+           authors and sources, all at once (load_article_graph()).  For each
+           article, groups its Article_Data by coder index (one per index, up
+           to self.table_max_coders), then processes relations for all the
+           indices in one pass (process_article_relations()), to update
+           reliability ties for each author and the sources cited in the
+           article, by coder index.
         '''
         
         # declare variables - retrieving reliability sample.
@@ -299,20 +757,11 @@ class ReliabilityTiesBuilder( object ):
         article_qs = None
         article_count = -1
         current_article = None
-        article_data_qs = None
-        article_data_count = -1
         article_data_counter = -1
         
         # declare variables - compiling information for articles.
         article_id = -1
-        author_to_source_info_dict = None
-        coder_id_to_instance_dict = None
-        coder_id_to_index_dict = None
-        current_article_data = None
-        coder_index = -1
-        coder_1_article_data = None
-        coder_2_article_data = None
-        coder_3_article_data = None
+        index_to_article_data_map = None
 
         #-------------------------------------------------------------------------------
         # process articles to build data
@@ -329,137 +778,38 @@ class ReliabilityTiesBuilder( object ):
         article_qs = article_qs.order_by( "id" )
         
         #article_qs = article_qs[ : 2 ]
-            
-        # For reference, also build up a dictionary of coder IDs that reference
-        #    coder instances, so we know how many coders, and coder IDs to
-        #    index, from 1 up, so we can keep them straight when outputting
-        #    data.
-        coder_id_to_instance_dict = self.coder_id_to_instance_map
-        coder_id_to_index_dict = self.coder_id_to_index_map
         
-        # loop over the articles.
+        # assume that coder ID to index and instance maps are already set up
+        #     (self.coder_id_to_index_map, self.coder_id_to_instance_map).
+            
+        # loop over the articles, with everything we need prefetched.
         article_data_counter = 0
-        for current_article in article_qs:
-        
-            # initialize variables
-            article_coder_id_list = []
-            author_info_dict = {}
-            source_info_dict = {}
-            coder_1_article_data = None
-            coder_2_article_data = None
-            coder_3_article_data = None
+        for current_article in self.load_article_graph( article_qs ):
         
             # get article_id
             article_id = current_article.id
         
-            # get article data for this article
-            article_data_qs = current_article.article_data_set.all()
-            
-            # !filter on automated coder_type
-            article_data_qs = self.filter_article_data( article_data_qs )
-            
-            # !hack
-            # order by coder ID, descending, so we always use coder 6 as
-            #    coder #1 if they coded an article.
-            article_data_qs = article_data_qs.order_by( "-coder__id" )
-            
-            # how many Article_Data?
-            article_data_count = len( article_data_qs )
+            # one Article_Data per coder index.
+            index_to_article_data_map = self.group_article_data_by_index( current_article )
+            article_data_counter += len( index_to_article_data_map )
         
             # output summary row.
-            print( "- In " + me + ": Article ID = " + str( current_article.id ) + "; Article_Data count = " + str( article_data_count ) )
+            print( "- In " + me + ": Article ID = " + str( article_id ) + "; coder indices = " + str( list( index_to_article_data_map.keys() ) ) )
             
             # for each article, make or update row in reliability table that
             #    matches the author and source, and label if one is specified
             #    in this object's instance (self.reliability_row_label).
-            
-            # compile information.
-            
-            # loop over related Article_Data instances, filtering so we only
-            #    have one set of data for coder 1 (user ID 6, if no user 6,
-            #    user ID 4), and coder 2 (user ID 2).
-            for current_article_data in article_data_qs:
-            
-                article_data_counter += 1
-            
-                print( "---> In " + me + ": article data #" + str( article_data_counter ) + " - " + str( current_article_data ) )
-            
-                # get coder and coder's User ID.
-                article_data_coder = current_article_data.coder
-                article_data_coder_id = article_data_coder.id
-                
-                # assume that coder ID to index and instance maps are already
-                #    set up.
-                
-                # get index for this user.
-                coder_index = coder_id_to_index_dict.get( article_data_coder_id, -1 )
-                
-                print( "-------> In " + me + ": Coder ID = " + str( article_data_coder_id ) + "; index = " + str( coder_index ) )
-                
-                # if no article_data yet stored for that index, store this one.
-                #    If something already stored, move on.
-                if ( coder_index == 1 ):
-                
-                    # do we have article data stored yet?
-                    if ( coder_1_article_data is None ):
-                    
-                        # no - but we do now - store current.
-                        coder_1_article_data = current_article_data
-                        
-                    #-- END check to see if coder_1_article_data. --#
-                
-                elif ( coder_index == 2 ):
-                
-                    # do we have article data stored yet?
-                    if ( coder_2_article_data is None ):
-                    
-                        # no - but we do now - store current.
-                        coder_2_article_data = current_article_data
-                        
-                    #-- END check to see if coder_2_article_data. --#
-                
-                elif ( coder_index == 3 ):
-                
-                    # do we have article data stored yet?
-                    if ( coder_3_article_data is None ):
-                    
-                        # no - but we do now - store current.
-                        coder_3_article_data = current_article_data
-                        
-                    #-- END check to see if coder_3_article_data. --#
-                
-                #-- END check to see which index we have --#
-                        
-            #-- END loop over related Article_Data
-            
-            # call process_relations for coder 1 if instance.
-            if ( coder_1_article_data is not None ):
-
-                print( "\n\nIn " + me + ": article " + str( article_id ) + ", processing coder 1\n" )
-                self.process_relations( coder_1_article_data )
-                
-            #-- END check to see if coder_1_article_data --#
-            
-            # call process_relations for coder 2 if instance.
-            if ( coder_2_article_data is not None ):
-
-                # call process_relations for coder 2.
-                print( "\n\nIn " + me + ": article " + str( article_id ) + ", processing coder 2\n" )
-                self.process_relations( coder_2_article_data )
-                
-            #-- END check to see if coder_2_article_data --#
-                        
-            # call process_relations for coder 2 if instance.
-            if ( coder_3_article_data is not None ):
-
-                # call process_relations for coder 3.
-                print( "\n\nIn " + me + ": article " + str( article_id ) + ", processing coder 3\n" )
-                self.process_relations( coder_3_article_data )
-            
-            #-- END check to see if coder_3_article_data --#
+            self.process_article_relations( index_to_article_data_map )
         
         #-- END loop over articles. --#
         
+        # write accumulated ties.
+        if ( self.do_accumulate_ties == True ):
+        
+            self.flush_ties()
+            
+        #-- END check to see if accumulating ties --#
+        
         # summary
         print( "" )
 
@@ -474,6 +824,34 @@ class ReliabilityTiesBuilder( object ):
     #-- END method process_articles() --#
 
 
+    def process_article_relations( self, index_to_article_data_map_IN ):
+        
+        '''
+        Accepts OrderedDict of coder index to Article_Data for one article (see
+            group_article_data_by_index()).  Calls process_relations() for each
+            index's Article_Data, in index order.  Returns count of
+            Article_Data processed.
+        '''
+        
+        # return reference
+        count_OUT = 0
+        
+        # declare variables
+        coder_index = -1
+        article_data = None
+        
+        for coder_index, article_data in six.iteritems( index_to_article_data_map_IN ):
+        
+            self.process_relations( article_data )
+            count_OUT += 1
+            
+        #-- END loop over coder indices --#
+        
+        return count_OUT
+        
+    #-- END method process_article_relations() --#
+
+
     def process_relations( self, article_data_IN ):
         
         '''
@@ -504,8 +882,9 @@ class ReliabilityTiesBuilder( object ):
             # ... author QuerySet...
             article_author_qs = article_data_IN.article_author_set.all()
                         
-            # ...and source QuerySet.
-            article_source_qs = article_data_IN.get_quoted_article_sources_qs()
+            # ...and quoted sources (prefetched, if loaded with
+            #     load_article_graph()).
+            article_source_qs = self.get_quoted_sources( article_data_IN )
             
             # for each author...
             for current_author in article_author_qs:
@@ -519,8 +898,18 @@ class ReliabilityTiesBuilder( object ):
                     # get source person
                     source_person = current_source.person
                     
-                    # call method to update reliability row.
-                    self.update_reliability_row( author_person, source_person, article_data_coder )
+                    # accumulating, or writing each tie?
+                    if ( self.do_accumulate_ties == True ):
+                    
+                        # accumulate - written by flush_ties().
+                        self.accumulate_tie( author_person, source_person, article_data_coder )
+                        
+                    else:
+                    
+                        # call method to update reliability row.
+                        self.update_reliability_row( author_person, source_person, article_data_coder )
+                        
+                    #-- END check to see if accumulating ties --#
                 
                 #-- END loop over sources --#
 
@@ -613,11 +1002,12 @@ class ReliabilityTiesBuilder( object ):
                                         # already something there.  Parse it.
                                         coder_id_list = coder_id_list_string.split( "," )
                                         
-                                        # see if coder_id is already in list.
-                                        if ( coder_id not in coder_id_list ):
+                                        # see if coder passed in is already in
+                                        #     list (list holds strings).
+                                        if ( str( coder_user_id ) not in coder_id_list ):
                                         
                                             # not there.  Add it to list...
-                                            coder_id_list.append( str( coder_id ) )
+                                            coder_id_list.append( str( coder_user_id ) )
                                             
                                             # ...convert list to string...
                                             coder_id_list_string = ",".join( coder_id_list )
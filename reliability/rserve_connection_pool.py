@@ -0,0 +1,487 @@
+from __future__ import unicode_literals
+from __future__ import division
+
+'''
+Copyright 2016-2017 Jonathan Morgan
+
+This file is part of http://github.com/jonathanmorgan/context_analysis.
+
+context_analysis is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+
+context_analysis is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with http://github.com/jonathanmorgan/context_analysis. If not, see http://www.gnu.org/licenses/.
+'''
+
+'''
+Usage:
+
+# get the shared pool for this process and Rserve host and port.
+rserve_pool = RserveConnectionPool.get_shared_pool( rserve_host, rserve_port )
+
+# check out a warmed connection (irr already loaded).
+my_rserve_connection = rserve_pool.acquire_connection()
+
+# ...use it...
+
+# give it back, so the next caller can reuse it.
+rserve_pool.release_connection( my_rserve_connection )
+
+For tests, make a pool with a connection_factory_IN that returns a fake
+    connection (anything with eval(), close(), and isClosed).
+'''
+
+#==============================================================================#
+# ! imports
+#==============================================================================#
+
+# python built-in libraries
+import os
+import threading
+
+# python_utilities
+from python_utilities.exceptions.exception_helper import ExceptionHelper
+from python_utilities.R.rserve_helper import RserveHelper
+
+
+#-------------------------------------------------------------------------------
+# ! class definitions
+#-------------------------------------------------------------------------------
+
+
+class RserveConnectionPool( ExceptionHelper ):
+
+    '''
+    Keeps a pool of open, warmed Rserve connections (init commands like
+        "library( irr )" already run) that can be shared across
+        ReliabilityNamesAnalyzer instances in a process.  Connections are
+        health-checked when they are acquired, and replaced with a new
+        connection if the check fails.
+
+    Shared pools are kept per Rserve host and port, so callers that talk to
+        different Rserve servers never get each other's connections.
+
+    Connections are per-process - get_shared_pool() makes new pools if it is
+        called in a different process from the one that made the current
+        shared pools (for example, in a forked worker), so sockets are never
+        shared across processes.
+    '''
+
+
+    #---------------------------------------------------------------------------
+    # constants-ish
+    #---------------------------------------------------------------------------
+
+
+    # logging
+    LOGGER_NAME = "context_analysis.reliability.rserve_connection_pool.RserveConnectionPool"
+
+    # R commands run on each new connection.
+    DEFAULT_INIT_COMMAND_LIST = [ "library( irr )" ]
+
+    # R command used to check that a connection is alive.
+    HEALTH_CHECK_COMMAND = "1"
+
+    # maximum number of idle connections kept open.
+    DEFAULT_MAX_IDLE_COUNT = 4
+
+
+    #---------------------------------------------------------------------------
+    # NOT instance variables
+    # Class variables - overriden by __init__() per instance if same names, but
+    #    if not set there, shared!
+    #---------------------------------------------------------------------------
+
+
+    # shared pools, mapped by ( host, port ), and ID of the process that made
+    #     them.
+    shared_pool_map = {}
+    shared_pool_pid = None
+    shared_pool_lock = threading.Lock()
+
+
+    #---------------------------------------------------------------------------
+    # class methods
+    #---------------------------------------------------------------------------
+
+
+    @classmethod
+    def clear_shared_pool( cls ):
+
+        '''
+        Closes all idle connections in the shared pools for this process (if
+            there are any), then removes them, so the next call to
+            get_shared_pool() makes a new one.
+        '''
+
+        # declare variables
+        shared_pool = None
+
+        with cls.shared_pool_lock:
+
+            if ( cls.shared_pool_pid == os.getpid() ):
+
+                for shared_pool in cls.shared_pool_map.values():
+
+                    shared_pool.close_all()
+
+                #-- END loop over shared pools --#
+
+            #-- END check to see if shared pools for this process --#
+
+            cls.shared_pool_map = {}
+            cls.shared_pool_pid = None
+
+        #-- END with shared_pool_lock --#
+
+    #-- END class method clear_shared_pool() --#
+
+
+    @classmethod
+    def get_shared_pool( cls, host_IN = None, port_IN = None ):
+
+        '''
+        Accepts Rserve host and port (None for RserveHelper defaults).  Returns
+            the RserveConnectionPool shared by everything in this process that
+            connects to that host and port, creating it if needed (or if the
+            current pools were made by another process).
+        '''
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        pool_key = None
+
+        pool_key = ( host_IN, port_IN )
+
+        with cls.shared_pool_lock:
+
+            if ( cls.shared_pool_pid != os.getpid() ):
+
+                # none, or inherited from parent process - start over (do not
+                #     close the inherited connections, they belong to the
+                #     parent).
+                cls.shared_pool_map = {}
+                cls.shared_pool_pid = os.getpid()
+
+            #-- END check to see if pools from this process --#
+
+            instance_OUT = cls.shared_pool_map.get( pool_key, None )
+            if ( instance_OUT is None ):
+
+                instance_OUT = cls( host_IN = host_IN, port_IN = port_IN )
+                cls.shared_pool_map[ pool_key ] = instance_OUT
+
+            #-- END check to see if we need a new pool --#
+
+        #-- END with shared_pool_lock --#
+
+        return instance_OUT
+
+    #-- END class method get_shared_pool() --#
+
+
+    @classmethod
+    def set_shared_pool( cls, instance_IN ):
+
+        '''
+        Accepts a RserveConnectionPool (for example, one that uses a fake
+            connection factory in tests), and makes it the shared pool for this
+            process for its host and port.  Returns the instance.
+        '''
+
+        # declare variables
+        pool_key = None
+
+        pool_key = ( instance_IN.rserve_host, instance_IN.rserve_port )
+
+        with cls.shared_pool_lock:
+
+            if ( cls.shared_pool_pid != os.getpid() ):
+
+                cls.shared_pool_map = {}
+                cls.shared_pool_pid = os.getpid()
+
+            #-- END check to see if pools from this process --#
+
+            cls.shared_pool_map[ pool_key ] = instance_IN
+
+        #-- END with shared_pool_lock --#
+
+        return instance_IN
+
+    #-- END class method set_shared_pool() --#
+
+
+    #---------------------------------------------------------------------------
+    # instance methods
+    #---------------------------------------------------------------------------
+
+
+    def __init__( self, host_IN = None, port_IN = None, connection_factory_IN = None, init_command_list_IN = None, max_idle_count_IN = None ):
+
+        # call parent __init__()
+        super( RserveConnectionPool, self ).__init__()
+
+        # logging
+        self.set_logger_name( self.LOGGER_NAME )
+
+        # declare instance variables
+        self.rserve_host = host_IN
+        self.rserve_port = port_IN
+
+        # callable that accepts host and port, returns a new connection.
+        self.connection_factory = connection_factory_IN
+        if ( self.connection_factory is None ):
+
+            self.connection_factory = RserveHelper.create_rserve_connection
+
+        #-- END check to see if connection factory passed in --#
+
+        # commands to run on each new connection.
+        self.init_command_list = init_command_list_IN
+        if ( self.init_command_list is None ):
+
+            self.init_command_list = list( self.DEFAULT_INIT_COMMAND_LIST )
+
+        #-- END check to see if init commands passed in --#
+
+        # idle connections
+        self.max_idle_count = max_idle_count_IN
+        if ( self.max_idle_count is None ):
+
+            self.max_idle_count = self.DEFAULT_MAX_IDLE_COUNT
+
+        #-- END check to see if max idle count passed in --#
+        self.idle_connection_list = []
+        self.lock = threading.Lock()
+
+        # counts, for monitoring (and tests).
+        self.created_count = 0
+        self.reconnect_count = 0
+
+    #-- END method __init__() --#
+
+
+    def acquire_connection( self ):
+
+        '''
+        Returns an open, warmed Rserve connection.  Reuses an idle connection
+            if there is one that passes the health check, discarding any that
+            fail.  Otherwise, creates a new one.  Call release_connection()
+            when done.
+        '''
+
+        # return reference
+        connection_OUT = None
+
+        # declare variables
+        me = "acquire_connection"
+        current_connection = None
+
+        # look for a healthy idle connection.
+        while ( connection_OUT is None ):
+
+            # anything idle?
+            with self.lock:
+
+                current_connection = None
+                if ( len( self.idle_connection_list ) > 0 ):
+
+                    current_connection = self.idle_connection_list.pop()
+
+                #-- END check to see if idle connections --#
+
+            #-- END with lock --#
+
+            if ( current_connection is None ):
+
+                # nothing left - make a new one.
+                connection_OUT = self.create_connection()
+
+            elif ( self.is_connection_healthy( current_connection ) == True ):
+
+                # good to go.
+                connection_OUT = current_connection
+
+            else:
+
+                # dead - throw it away, try again.
+                self.output_debug_message( "Idle Rserve connection failed health check, discarding.", method_IN = me )
+                self.discard_connection( current_connection )
+                self.reconnect_count += 1
+
+            #-- END check to see if we have a usable connection --#
+
+        #-- END loop until we have a connection --#
+
+        return connection_OUT
+
+    #-- END method acquire_connection() --#
+
+
+    def close_all( self ):
+
+        '''
+        Closes and removes all idle connections.  Connections that are checked
+            out are not affected.
+        '''
+
+        # declare variables
+        connection_list = None
+        current_connection = None
+
+        with self.lock:
+
+            connection_list = self.idle_connection_list
+            self.idle_connection_list = []
+
+        #-- END with lock --#
+
+        for current_connection in connection_list:
+
+            self.discard_connection( current_connection )
+
+        #-- END loop over idle connections --#
+
+    #-- END method close_all() --#
+
+
+    def create_connection( self ):
+
+        '''
+        Creates a new connection using the connection factory, runs the init
+            commands on it, and returns it.
+        '''
+
+        # return reference
+        connection_OUT = None
+
+        # declare variables
+        current_command = ""
+
+        # connect
+        connection_OUT = self.connection_factory( self.rserve_host, self.rserve_port )
+
+        # warm it up.
+        for current_command in self.init_command_list:
+
+            connection_OUT.eval( current_command )
+
+        #-- END loop over init commands --#
+
+        self.created_count += 1
+
+        return connection_OUT
+
+    #-- END method create_connection() --#
+
+
+    def discard_connection( self, connection_IN ):
+
+        '''
+        Accepts a connection.  Closes it, ignoring any errors (it might already
+            be dead).
+        '''
+
+        # declare variables
+        me = "discard_connection"
+
+        try:
+
+            connection_IN.close()
+
+        except Exception as e:
+
+            self.output_debug_message( "Exception closing Rserve connection: " + str( e ), method_IN = me )
+
+        #-- END try-except around close() --#
+
+    #-- END method discard_connection() --#
+
+
+    def get_idle_count( self ):
+
+        '''
+        Returns the number of idle connections in the pool.
+        '''
+
+        with self.lock:
+
+            return len( self.idle_connection_list )
+
+        #-- END with lock --#
+
+    #-- END method get_idle_count() --#
+
+
+    def is_connection_healthy( self, connection_IN ):
+
+        '''
+        Accepts a connection.  Returns True if it is open and can evaluate a
+            trivial R expression, False otherwise.
+        '''
+
+        # return reference
+        is_healthy_OUT = False
+
+        # declare variables
+        me = "is_connection_healthy"
+
+        try:
+
+            if ( connection_IN.isClosed == False ):
+
+                connection_IN.eval( self.HEALTH_CHECK_COMMAND )
+                is_healthy_OUT = True
+
+            #-- END check to see if closed --#
+
+        except Exception as e:
+
+            self.output_debug_message( "Rserve health check failed: " + str( e ), method_IN = me )
+            is_healthy_OUT = False
+
+        #-- END try-except around health check --#
+
+        return is_healthy_OUT
+
+    #-- END method is_connection_healthy() --#
+
+
+    def release_connection( self, connection_IN ):
+
+        '''
+        Accepts a connection from acquire_connection().  If it is still open
+            and the pool has room, keeps it for reuse.  Otherwise, closes it.
+        '''
+
+        # declare variables
+        do_keep = False
+
+        if ( connection_IN is not None ):
+
+            with self.lock:
+
+                if ( ( connection_IN.isClosed == False ) and ( len( self.idle_connection_list ) < self.max_idle_count ) ):
+
+                    self.idle_connection_list.append( connection_IN )
+                    do_keep = True
+
+                #-- END check to see if we keep the connection --#
+
+            #-- END with lock --#
+
+            if ( do_keep == False ):
+
+                self.discard_connection( connection_IN )
+
+            #-- END check to see if we are keeping the connection --#
+
+        #-- END check to see if connection passed in --#
+
+    #-- END method release_connection() --#
+
+
+#-- END class RserveConnectionPool --#
@@ -0,0 +1,135 @@
+"""
+This file contains tests of the context_analysis AuthorSourceMatrix class.
+
+Functions tested:
+- AuthorSourceMatrix.add_tie()
+- AuthorSourceMatrix.add_article()
+- AuthorSourceMatrix.get_source_count_array()
+- AuthorSourceMatrix.get_shared_source_count_array()
+- AuthorSourceMatrix.get_article_count_array()
+- AuthorSourceMatrix.get_author_source_id_list()
+- AuthorSourceMatrix.get_source_author_id_list()
+- AuthorSourceMatrix.get_co_occurrence_matrix()
+- AuthorSourceMatrix.get_shared_source_id_lists()
+- AuthorSourceMatrix.get_related_author_id_lists()
+"""
+
+# django imports
+import django.test
+
+# context_analysis imports
+from context_analysis.network.author_source_matrix import AuthorSourceMatrix
+
+
+class AuthorSourceMatrixTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # ( author ID, source ID ) ties - author 10 quotes source 100 twice, and
+    #     shares source 101 with author 11.  Author 12 has no sources.
+    TEST_TIE_LIST = [ ( 10, 100 ), ( 10, 101 ), ( 11, 101 ), ( 10, 100 ), ( 11, 102 ) ]
+
+    # ( author ID, article ID ) links.
+    TEST_ARTICLE_LIST = [ ( 10, 1 ), ( 10, 2 ), ( 11, 2 ), ( 10, 1 ), ( 12, 3 ) ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def make_matrix( self ):
+
+        """
+        Returns AuthorSourceMatrix with TEST_ARTICLE_LIST and TEST_TIE_LIST
+            added - half the ties before a compact(), half after.
+        """
+
+        # return reference
+        matrix_OUT = None
+
+        # declare variables
+        author_id = -1
+        article_id = -1
+        source_id = -1
+
+        matrix_OUT = AuthorSourceMatrix()
+        for author_id, article_id in self.TEST_ARTICLE_LIST:
+
+            matrix_OUT.add_article( author_id, article_id )
+
+        #-- END loop over articles --#
+
+        for author_id, source_id in self.TEST_TIE_LIST[ : 2 ]:
+
+            matrix_OUT.add_tie( author_id, source_id )
+
+        #-- END loop over first ties --#
+
+        matrix_OUT.compact()
+        for author_id, source_id in self.TEST_TIE_LIST[ 2 : ]:
+
+            matrix_OUT.add_tie( author_id, source_id )
+
+        #-- END loop over rest of ties --#
+
+        return matrix_OUT
+
+    #-- END method make_matrix() --#
+
+
+    def test_counts( self ):
+
+        # declare variables
+        test_matrix = None
+
+        test_matrix = self.make_matrix()
+
+        # authors in the order first seen.
+        self.assertEqual( test_matrix.author_id_list, [ 10, 11, 12 ] )
+        self.assertEqual( test_matrix.get_source_count_array().tolist(), [ 2, 2, 0 ] )
+        self.assertEqual( test_matrix.get_shared_source_count_array().tolist(), [ 1, 1, 0 ] )
+        self.assertEqual( test_matrix.get_article_count_array().tolist(), [ 2, 1, 1 ] )
+        self.assertEqual( test_matrix.get_source_author_count_array().tolist(), [ 1, 2, 1 ] )
+
+        # mention counts kept.
+        self.assertEqual( test_matrix.tie_count_matrix[ 0, 0 ], 2 )
+
+    #-- END test method test_counts() --#
+
+
+    def test_id_lists( self ):
+
+        # declare variables
+        test_matrix = None
+
+        test_matrix = self.make_matrix()
+        self.assertEqual( test_matrix.get_author_source_id_list( 10 ), [ 100, 101 ] )
+        self.assertEqual( test_matrix.get_author_source_id_list( 12 ), [] )
+        self.assertEqual( test_matrix.get_source_author_id_list( 101 ), [ 10, 11 ] )
+        self.assertEqual( test_matrix.get_author_article_id_list( 10 ), [ 1, 2 ] )
+
+    #-- END test method test_id_lists() --#
+
+
+    def test_shared_sources( self ):
+
+        # declare variables
+        test_matrix = None
+        co_occurrence_matrix = None
+
+        test_matrix = self.make_matrix()
+
+        # one shared source between 10 and 11, diagonal is source count.
+        co_occurrence_matrix = test_matrix.get_co_occurrence_matrix()
+        self.assertEqual( co_occurrence_matrix.toarray().tolist(), [ [ 2, 1, 0 ], [ 1, 2, 0 ], [ 0, 0, 0 ] ] )
+        self.assertEqual( test_matrix.get_shared_source_id_lists(), [ [ 101 ], [ 101 ], [] ] )
+        self.assertEqual( test_matrix.get_related_author_id_lists(), [ [ 10, 11 ], [ 10, 11 ], None ] )
+
+    #-- END test method test_shared_sources() --#
+
+
+#-- END test class AuthorSourceMatrixTest --#
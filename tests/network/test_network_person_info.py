@@ -0,0 +1,293 @@
+"""
+This file contains tests of the context_analysis NetworkPersonInfo class's
+    snapshot (incremental) processing, against articles created in the test.
+
+Functions tested:
+- NetworkPersonInfo.make_snapshot()
+- NetworkPersonInfo.process_articles() - snapshot_path_IN and incremental_IN
+"""
+
+# python base imports
+import os
+import tempfile
+from unittest import mock
+
+# django imports
+from django.contrib.auth.models import User
+import django.test
+
+# context_text imports
+from context_text.models import Article
+from context_text.models import Article_Author
+from context_text.models import Article_Data
+from context_text.models import Article_Subject
+from context_text.models import Person
+
+# context_analysis imports
+from context_analysis.network.network_person_info import NetworkPersonInfo
+
+
+class NetworkPersonInfoSnapshotTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # tag for test articles
+    TEST_TAG = "network_snapshot_test"
+
+    # number of coders (one per index) and people.
+    TEST_CODER_COUNT = 2
+    TEST_PERSON_COUNT = 8
+
+    # per article, per coder: ( list of author person numbers, list of
+    #     ( subject person number, subject_type ) ) - person numbers are
+    #     positions in the list of people created in setUp().
+    TEST_ARTICLE_LIST = [
+        [ ( [ 0 ], [ ( 3, "quoted" ), ( 4, "quoted" ) ] ), ( [ 0 ], [ ( 3, "quoted" ) ] ) ],
+        [ ( [ 1 ], [ ( 3, "quoted" ), ( 5, "mentioned" ) ] ), ( [ 1 ], [ ( 3, "quoted" ), ( 5, "quoted" ) ] ) ],
+        [ ( [ 0, 2 ], [ ( 6, "quoted" ) ] ), ( [ 2 ], [ ( 6, "quoted" ), ( 7, "quoted" ) ] ) ],
+        [ ( [ 2 ], [ ( 4, "quoted" ) ] ), ( [ 2 ], [ ( 4, "quoted" ) ] ) ],
+    ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Creates coders, people, and TEST_ARTICLE_LIST's tagged
+            articles and coding.
+        """
+
+        # declare variables
+        coder_index = -1
+        article_coding_list = None
+        current_article = None
+        current_coder = None
+        author_number_list = None
+        subject_info_list = None
+        article_data = None
+        author_number = -1
+        subject_number = -1
+        subject_type = ""
+
+        self.coder_list = [ User.objects.create( username = "snapshot_coder_" + str( coder_index ) ) for coder_index in range( 1, self.TEST_CODER_COUNT + 1 ) ]
+        self.person_list = [ Person.objects.create( first_name = "Person", last_name = str( person_number ) ) for person_number in range( self.TEST_PERSON_COUNT ) ]
+        self.article_list = []
+        for article_coding_list in self.TEST_ARTICLE_LIST:
+
+            current_article = Article.objects.create( headline = "snapshot test" )
+            current_article.tags.add( self.TEST_TAG )
+            self.article_list.append( current_article )
+            for current_coder, ( author_number_list, subject_info_list ) in zip( self.coder_list, article_coding_list ):
+
+                article_data = Article_Data.objects.create( article = current_article, coder = current_coder )
+                for author_number in author_number_list:
+
+                    Article_Author.objects.create( article_data = article_data, person = self.person_list[ author_number ] )
+
+                #-- END loop over authors --#
+
+                for subject_number, subject_type in subject_info_list:
+
+                    Article_Subject.objects.create( article_data = article_data, person = self.person_list[ subject_number ], subject_type = subject_type )
+
+                #-- END loop over subjects --#
+
+            #-- END loop over coders --#
+
+        #-- END loop over articles --#
+
+        # snapshot file.
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.snapshot_path = os.path.join( self.temp_directory.name, "snapshot.npz" )
+
+    #-- END function setUp() --#
+
+
+    def tearDown( self ):
+
+        self.temp_directory.cleanup()
+
+    #-- END method tearDown() --#
+
+
+    def make_network_person_info( self, coder_index_list_IN = None ):
+
+        """
+        Accepts optional list of the index for each coder (defaults to coder
+            N at index N).  Returns NetworkPersonInfo with coders assigned.
+        """
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        coder_index_list = None
+        current_coder = None
+        coder_index = -1
+
+        coder_index_list = coder_index_list_IN
+        if ( coder_index_list is None ):
+
+            coder_index_list = range( 1, self.TEST_CODER_COUNT + 1 )
+
+        #-- END check to see if index list --#
+
+        instance_OUT = NetworkPersonInfo()
+        for current_coder, coder_index in zip( self.coder_list, coder_index_list ):
+
+            instance_OUT.add_coder_at_index( current_coder.id, coder_index, 1 )
+
+        #-- END loop over coders --#
+
+        return instance_OUT
+
+    #-- END method make_network_person_info() --#
+
+
+    def get_comparable_data_map( self, network_person_info_IN ):
+
+        """
+        Accepts NetworkPersonInfo that has processed articles.  Returns copy of
+            its coder_index_to_data_map with each index's NetworkPersonSummary
+            swapped for its data frame's columns as lists, so maps can be
+            compared with assertEqual().
+        """
+
+        # return reference
+        map_OUT = {}
+
+        # declare variables
+        coder_index = -1
+        index_data = None
+        comparable_data = None
+
+        for coder_index, index_data in network_person_info_IN.coder_index_to_data_map.items():
+
+            comparable_data = dict( index_data )
+            comparable_data[ NetworkPersonInfo.PROP_CODER_SUMMARY ] = index_data[ NetworkPersonInfo.PROP_CODER_SUMMARY ].to_data_frame().to_dict( "list" )
+            map_OUT[ coder_index ] = comparable_data
+
+        #-- END loop over indices --#
+
+        return map_OUT
+
+    #-- END method get_comparable_data_map() --#
+
+
+    def process( self, network_person_info_IN, incremental_IN ):
+
+        """
+        Accepts NetworkPersonInfo and incremental flag.  Processes test
+            articles with snapshot file.  Returns number of Article_Data
+            process_relations() was called for.
+        """
+
+        # return reference
+        count_OUT = -1
+
+        # declare variables
+        process_relations_mock = None
+
+        with mock.patch.object( network_person_info_IN, "process_relations", wraps = network_person_info_IN.process_relations ) as process_relations_mock:
+
+            network_person_info_IN.process_articles( [ self.TEST_TAG ], snapshot_path_IN = self.snapshot_path, incremental_IN = incremental_IN )
+
+        #-- END with patched process_relations() --#
+
+        count_OUT = process_relations_mock.call_count
+
+        return count_OUT
+
+    #-- END method process() --#
+
+
+    def test_incremental_matches_full( self ):
+
+        # declare variables
+        me = "test_incremental_matches_full"
+        incremental_info = None
+        full_info = None
+        article_data_count = -1
+        changed_subject = None
+        error_string = ""
+
+        article_data_count = len( self.TEST_ARTICLE_LIST ) * self.TEST_CODER_COUNT
+
+        # first run - everything processed, snapshot saved.
+        incremental_info = self.make_network_person_info()
+        self.assertEqual( self.process( incremental_info, True ), article_data_count )
+        self.assertTrue( os.path.exists( self.snapshot_path ) )
+
+        # nothing changed - nothing processed, same data.
+        full_info = self.make_network_person_info()
+        self.assertEqual( self.process( full_info, True ), 0 )
+        self.assertEqual( self.get_comparable_data_map( full_info ), self.get_comparable_data_map( incremental_info ) )
+
+        # change only Article_Author / Article_Subject rows (Article_Data
+        #     last_modified does not change):
+        # - article 1: coder 1's quoted source becomes a different person.
+        changed_subject = Article_Subject.objects.get( article_data__article = self.article_list[ 0 ], article_data__coder = self.coder_list[ 0 ], person = self.person_list[ 4 ] )
+        changed_subject.person = self.person_list[ 7 ]
+        changed_subject.save()
+
+        # - article 2: coder 1's mentioned source becomes quoted.
+        Article_Subject.objects.filter( article_data__article = self.article_list[ 1 ], article_data__coder = self.coder_list[ 0 ], subject_type = "mentioned" ).update( subject_type = "quoted" )
+
+        # - article 3: coder 1's second author removed.
+        Article_Author.objects.filter( article_data__article = self.article_list[ 2 ], article_data__coder = self.coder_list[ 0 ], person = self.person_list[ 0 ] ).delete()
+
+        # incremental - just the 3 changed articles' Article_Data.
+        incremental_info = self.make_network_person_info()
+        self.assertEqual( self.process( incremental_info, True ), 3 * self.TEST_CODER_COUNT )
+
+        # full - fresh snapshot, everything processed.
+        full_info = self.make_network_person_info()
+        self.assertEqual( self.process( full_info, False ), article_data_count )
+
+        error_string = "In " + me + "(): incremental coder_index_to_data_map doesn't match full run."
+        self.assertEqual( self.get_comparable_data_map( incremental_info ), self.get_comparable_data_map( full_info ), msg = error_string )
+        self.assertIn( self.person_list[ 7 ].id, incremental_info.coder_index_to_data_map[ 1 ][ NetworkPersonInfo.PROP_CODER_SOURCE_DATA ] )
+
+    #-- END test method test_incremental_matches_full() --#
+
+
+    def test_settings_change( self ):
+
+        # declare variables
+        me = "test_settings_change"
+        article_data_count = -1
+        swapped_info = None
+        full_info = None
+        error_string = ""
+
+        article_data_count = len( self.TEST_ARTICLE_LIST ) * self.TEST_CODER_COUNT
+        self.process( self.make_network_person_info(), True )
+
+        # same settings - snapshot reused.
+        self.assertEqual( self.process( self.make_network_person_info(), True ), 0 )
+
+        # coders swapped between indices - snapshot not reused.
+        swapped_info = self.make_network_person_info( [ 2, 1 ] )
+        error_string = "In " + me + "(): snapshot reused after coder index change."
+        self.assertEqual( self.process( swapped_info, True ), article_data_count, msg = error_string )
+        full_info = self.make_network_person_info( [ 2, 1 ] )
+        self.process( full_info, False )
+        self.assertEqual( self.get_comparable_data_map( swapped_info ), self.get_comparable_data_map( full_info ) )
+
+        # automated coder types changed - snapshot not reused.
+        swapped_info = self.make_network_person_info( [ 2, 1 ] )
+        swapped_info.automated_coder_type_include_list = [ "OpenCalais_REST_API_v2" ]
+        error_string = "In " + me + "(): snapshot reused after automated coder type change."
+        self.assertEqual( self.make_network_person_info( [ 2, 1 ] ).make_snapshot( [ self.TEST_TAG ] ).is_same_settings( swapped_info.make_snapshot( [ self.TEST_TAG ] ) ), False, msg = error_string )
+
+    #-- END test method test_settings_change() --#
+
+
+#-- END test class NetworkPersonInfoSnapshotTest --#
@@ -0,0 +1,224 @@
+"""
+This file contains tests of the context_analysis NetworkPersonSnapshot class.
+
+Functions tested:
+- NetworkPersonSnapshot.add_tie()
+- NetworkPersonSnapshot.add_article()
+- NetworkPersonSnapshot.build_index_matrix()
+- NetworkPersonSnapshot.get_changed_article_id_list()
+- NetworkPersonSnapshot.is_same_settings()
+- NetworkPersonSnapshot.make_article_data_array()
+- NetworkPersonSnapshot.make_article_person_array()
+- NetworkPersonSnapshot.make_coder_priority_array()
+- NetworkPersonSnapshot.remove_articles()
+- NetworkPersonSnapshot.save()
+- NetworkPersonSnapshot.load()
+"""
+
+# python base imports
+import datetime
+import os
+import tempfile
+
+# django imports
+import django.test
+
+# context_analysis imports
+from context_analysis.network.network_person_snapshot import NetworkPersonSnapshot
+
+
+class NetworkPersonSnapshotTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # ( index, article ID, author ID, source ID ) ties.
+    TEST_TIE_LIST = [ ( 1, 2, 10, 100 ), ( 1, 1, 11, 100 ), ( 1, 1, 11, 101 ), ( 2, 1, 10, 102 ) ]
+
+    # ( index, article ID, author ID ) links.
+    TEST_ARTICLE_LIST = [ ( 1, 2, 10 ), ( 1, 1, 11 ), ( 2, 1, 10 ) ]
+
+    # ( article ID, Article_Data ID, last_modified ) rows.
+    TEST_ARTICLE_DATA_LIST = [ ( 1, 5, datetime.datetime( 2020, 1, 1 ) ), ( 1, 6, datetime.datetime( 2020, 1, 2 ) ), ( 2, 7, datetime.datetime( 2020, 1, 3 ) ) ]
+
+    # ( article ID, Article_Data ID, row ID, person ID, subject_type,
+    #     last_modified ) Article_Subject rows.
+    TEST_ARTICLE_SUBJECT_LIST = [ ( 1, 5, 20, 100, "quoted", datetime.datetime( 2020, 1, 1 ) ), ( 2, 7, 21, 100, "quoted", datetime.datetime( 2020, 1, 3 ) ) ]
+
+    # ( index, coder ID, priority ) rows.
+    TEST_CODER_PRIORITY_LIST = [ ( 2, 4, 1 ), ( 1, 3, 1 ) ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def make_snapshot( self ):
+
+        """
+        Returns NetworkPersonSnapshot with TEST_ARTICLE_LIST, TEST_TIE_LIST,
+            and TEST_ARTICLE_DATA_LIST added.
+        """
+
+        # return reference
+        snapshot_OUT = None
+
+        # declare variables
+        index = -1
+        article_id = -1
+        author_id = -1
+        source_id = -1
+
+        snapshot_OUT = NetworkPersonSnapshot()
+        snapshot_OUT.tag_list = [ "test_tag" ]
+        for index, article_id, author_id in self.TEST_ARTICLE_LIST:
+
+            snapshot_OUT.add_article( index, article_id, author_id )
+
+        #-- END loop over articles --#
+
+        for index, article_id, author_id, source_id in self.TEST_TIE_LIST:
+
+            snapshot_OUT.add_tie( index, article_id, author_id, source_id )
+
+        #-- END loop over ties --#
+
+        snapshot_OUT.article_data_array = NetworkPersonSnapshot.make_article_data_array( self.TEST_ARTICLE_DATA_LIST )
+        snapshot_OUT.article_person_array = NetworkPersonSnapshot.make_article_person_array( self.TEST_ARTICLE_SUBJECT_LIST, NetworkPersonSnapshot.PERSON_ROW_TYPE_SUBJECT )
+        snapshot_OUT.coder_type_list = [ "OpenCalais_REST_API_v2" ]
+        snapshot_OUT.coder_priority_array = NetworkPersonSnapshot.make_coder_priority_array( self.TEST_CODER_PRIORITY_LIST )
+
+        return snapshot_OUT
+
+    #-- END method make_snapshot() --#
+
+
+    def test_build_index_matrix( self ):
+
+        # declare variables
+        test_snapshot = None
+        index_matrix = None
+
+        test_snapshot = self.make_snapshot()
+        self.assertEqual( test_snapshot.get_index_list(), [ 1, 2 ] )
+
+        # rows added in article ID order.
+        index_matrix = test_snapshot.build_index_matrix( 1 )
+        self.assertEqual( index_matrix.author_id_list, [ 11, 10 ] )
+        self.assertEqual( index_matrix.get_source_author_id_list( 100 ), [ 11, 10 ] )
+        self.assertEqual( index_matrix.get_shared_source_count_array().tolist(), [ 1, 1 ] )
+
+    #-- END test method test_build_index_matrix() --#
+
+
+    def test_changed_articles( self ):
+
+        # declare variables
+        test_snapshot = None
+        current_row_list = None
+        index_matrix = None
+
+        test_snapshot = self.make_snapshot()
+
+        # nothing changed.
+        self.assertEqual( test_snapshot.get_changed_article_id_list( NetworkPersonSnapshot.make_article_data_array( self.TEST_ARTICLE_DATA_LIST ) ), [] )
+
+        # article 1 Article_Data modified, article 3 new.
+        current_row_list = list( self.TEST_ARTICLE_DATA_LIST )
+        current_row_list[ 1 ] = ( 1, 6, datetime.datetime( 2020, 2, 1 ) )
+        current_row_list.append( ( 3, 8, datetime.datetime( 2020, 2, 1 ) ) )
+        self.assertEqual( test_snapshot.get_changed_article_id_list( NetworkPersonSnapshot.make_article_data_array( current_row_list ) ), [ 1, 3 ] )
+
+        # article 2 Article_Data removed.
+        self.assertEqual( test_snapshot.get_changed_article_id_list( NetworkPersonSnapshot.make_article_data_array( self.TEST_ARTICLE_DATA_LIST[ : 2 ] ) ), [ 2 ] )
+
+        # Article_Subject rows - unchanged, then article 2's subject_type and
+        #     article 1's person changed (Article_Data unchanged).
+        current_row_list = list( self.TEST_ARTICLE_SUBJECT_LIST )
+        self.assertEqual( test_snapshot.get_changed_article_id_list( NetworkPersonSnapshot.make_article_data_array( self.TEST_ARTICLE_DATA_LIST ), NetworkPersonSnapshot.make_article_person_array( current_row_list, NetworkPersonSnapshot.PERSON_ROW_TYPE_SUBJECT ) ), [] )
+        current_row_list[ 1 ] = ( 2, 7, 21, 100, "mentioned", datetime.datetime( 2020, 1, 3 ) )
+        self.assertEqual( test_snapshot.get_changed_article_id_list( NetworkPersonSnapshot.make_article_data_array( self.TEST_ARTICLE_DATA_LIST ), NetworkPersonSnapshot.make_article_person_array( current_row_list, NetworkPersonSnapshot.PERSON_ROW_TYPE_SUBJECT ) ), [ 2 ] )
+        current_row_list[ 0 ] = ( 1, 5, 20, 101, "quoted", datetime.datetime( 2020, 1, 1 ) )
+        self.assertEqual( test_snapshot.get_changed_article_id_list( NetworkPersonSnapshot.make_article_data_array( self.TEST_ARTICLE_DATA_LIST ), NetworkPersonSnapshot.make_article_person_array( current_row_list, NetworkPersonSnapshot.PERSON_ROW_TYPE_SUBJECT ) ), [ 1, 2 ] )
+
+        # removing article 1 leaves only article 2's rows.
+        test_snapshot.remove_articles( [ 1 ] )
+        self.assertEqual( test_snapshot.get_index_list(), [ 1, 2 ] )
+        index_matrix = test_snapshot.build_index_matrix( 1 )
+        self.assertEqual( index_matrix.author_id_list, [ 10 ] )
+        self.assertEqual( index_matrix.source_id_list, [ 100 ] )
+        self.assertEqual( test_snapshot.build_index_matrix( 2 ).author_id_list, [] )
+        self.assertEqual( test_snapshot.article_data_array[ :, 1 ].tolist(), [ 7 ] )
+        self.assertEqual( test_snapshot.article_person_array[ :, 3 ].tolist(), [ 21 ] )
+
+    #-- END test method test_changed_articles() --#
+
+
+    def test_is_same_settings( self ):
+
+        # declare variables
+        test_snapshot = None
+        other_snapshot = None
+
+        test_snapshot = self.make_snapshot()
+
+        # same settings, priority rows in another order.
+        other_snapshot = self.make_snapshot()
+        other_snapshot.coder_priority_array = NetworkPersonSnapshot.make_coder_priority_array( reversed( self.TEST_CODER_PRIORITY_LIST ) )
+        self.assertTrue( test_snapshot.is_same_settings( other_snapshot ) )
+
+        # different tags.
+        other_snapshot = self.make_snapshot()
+        other_snapshot.tag_list = [ "other_tag" ]
+        self.assertFalse( test_snapshot.is_same_settings( other_snapshot ) )
+
+        # different coder types.
+        other_snapshot = self.make_snapshot()
+        other_snapshot.coder_type_list = []
+        self.assertFalse( test_snapshot.is_same_settings( other_snapshot ) )
+
+        # different priority.
+        other_snapshot = self.make_snapshot()
+        other_snapshot.coder_priority_array = NetworkPersonSnapshot.make_coder_priority_array( [ ( 2, 4, 2 ), ( 1, 3, 1 ) ] )
+        self.assertFalse( test_snapshot.is_same_settings( other_snapshot ) )
+
+        # no settings (older snapshot file).
+        other_snapshot = self.make_snapshot()
+        other_snapshot.coder_priority_array = None
+        self.assertFalse( test_snapshot.is_same_settings( other_snapshot ) )
+
+    #-- END test method test_is_same_settings() --#
+
+
+    def test_save_load( self ):
+
+        # declare variables
+        test_snapshot = None
+        loaded_snapshot = None
+        temp_directory = ""
+        file_path = ""
+
+        test_snapshot = self.make_snapshot()
+        with tempfile.TemporaryDirectory() as temp_directory:
+
+            file_path = os.path.join( temp_directory, "snapshot.npz" )
+            test_snapshot.save( file_path )
+            loaded_snapshot = NetworkPersonSnapshot.load( file_path )
+
+        #-- END with TemporaryDirectory --#
+
+        self.assertEqual( loaded_snapshot.tag_list, [ "test_tag" ] )
+        self.assertEqual( loaded_snapshot.get_index_list(), [ 1, 2 ] )
+        self.assertEqual( loaded_snapshot.index_to_tie_array_map[ 1 ].tolist(), test_snapshot.index_to_tie_array_map[ 1 ].tolist() )
+        self.assertEqual( loaded_snapshot.index_to_article_array_map[ 2 ].tolist(), [ [ 1, 10 ] ] )
+        self.assertEqual( loaded_snapshot.article_data_array.tolist(), test_snapshot.article_data_array.tolist() )
+        self.assertEqual( loaded_snapshot.article_person_array.tolist(), test_snapshot.article_person_array.tolist() )
+        self.assertTrue( loaded_snapshot.is_same_settings( test_snapshot ) )
+
+    #-- END test method test_save_load() --#
+
+
+#-- END test class NetworkPersonSnapshotTest --#
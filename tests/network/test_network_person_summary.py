@@ -0,0 +1,103 @@
+"""
+This file contains tests of the context_analysis NetworkPersonSummary class.
+
+Functions tested:
+- NetworkPersonSummary.get_array()
+- NetworkPersonSummary.get_mean()
+- NetworkPersonSummary.get_median()
+- NetworkPersonSummary.get_percentile()
+- NetworkPersonSummary.get_sum()
+- NetworkPersonSummary.filter()
+- NetworkPersonSummary.filter_shared()
+"""
+
+# django imports
+import django.test
+
+# context_analysis imports
+from context_analysis.network.network_person_summary import NetworkPersonSummary
+
+
+class NetworkPersonSummaryTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # four authors - two with shared sources.
+    TEST_AUTHOR_ID_LIST = [ 10, 11, 12, 13 ]
+    TEST_SOURCE_COUNT_LIST = [ 4, 2, 1, 0 ]
+    TEST_SHARED_COUNT_LIST = [ 2, 1, 0, 0 ]
+    TEST_ARTICLE_COUNT_LIST = [ 3, 1, 1, 2 ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def make_summary( self ):
+
+        """
+        Returns NetworkPersonSummary of the TEST_* lists.
+        """
+
+        # return reference
+        summary_OUT = None
+
+        summary_OUT = NetworkPersonSummary( self.TEST_AUTHOR_ID_LIST, self.TEST_SOURCE_COUNT_LIST, self.TEST_SHARED_COUNT_LIST, self.TEST_ARTICLE_COUNT_LIST )
+
+        return summary_OUT
+
+    #-- END method make_summary() --#
+
+
+    def test_filter( self ):
+
+        # declare variables
+        test_summary = None
+        shared_summary = None
+        empty_summary = None
+
+        test_summary = self.make_summary()
+
+        # authors with shared sources.
+        shared_summary = test_summary.filter_shared()
+        self.assertEqual( len( shared_summary ), 2 )
+        self.assertEqual( shared_summary.author_id_array.tolist(), [ 10, 11 ] )
+        self.assertEqual( shared_summary.article_count_array.tolist(), [ 3, 1 ] )
+        self.assertEqual( shared_summary.get_mean( NetworkPersonSummary.COLUMN_SOURCE_COUNT ), 3.0 )
+
+        # chained filters, down to no authors.
+        empty_summary = shared_summary.filter( shared_summary.get_array( NetworkPersonSummary.COLUMN_ARTICLE_COUNT ) > 5 )
+        self.assertEqual( len( empty_summary ), 0 )
+        self.assertIsNone( empty_summary.get_mean( NetworkPersonSummary.COLUMN_SOURCE_COUNT ) )
+        self.assertEqual( empty_summary.get_sum( NetworkPersonSummary.COLUMN_SOURCE_COUNT ), 0 )
+
+    #-- END test method test_filter() --#
+
+
+    def test_statistics( self ):
+
+        # declare variables
+        test_summary = None
+
+        test_summary = self.make_summary()
+        self.assertEqual( test_summary.get_mean( NetworkPersonSummary.COLUMN_SOURCE_COUNT ), 1.75 )
+        self.assertEqual( test_summary.get_median( NetworkPersonSummary.COLUMN_ARTICLE_COUNT ), 1.5 )
+        self.assertEqual( test_summary.get_percentile( NetworkPersonSummary.COLUMN_SHARED_COUNT, 50 ), 0.5 )
+        self.assertEqual( test_summary.get_percentile( NetworkPersonSummary.COLUMN_SOURCE_COUNT, [ 0, 100 ] ), [ 0.0, 4.0 ] )
+        self.assertEqual( test_summary.get_sum( NetworkPersonSummary.COLUMN_ARTICLE_COUNT ), 7 )
+
+        # unknown column.
+        with self.assertRaises( ValueError ):
+
+            test_summary.get_mean( "not_a_column" )
+
+        #-- END with assertRaises() --#
+
+    #-- END test method test_statistics() --#
+
+
+#-- END test class NetworkPersonSummaryTest --#
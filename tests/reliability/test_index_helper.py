@@ -0,0 +1,274 @@
+"""
+This file contains tests of the context_analysis IndexHelper class's
+    per-article index-to-coder cache.
+
+Functions tested:
+- IndexHelper.get_index_to_coder_map_for_article()
+- IndexHelper.map_index_to_coder_for_article()
+- IndexHelper.clear_article_coder_cache()
+- IndexHelper.get_index_to_coder_map_for_article_id_list()
+"""
+
+# django imports
+from django.contrib.auth.models import User
+from django.db import connection
+import django.test
+from django.test.utils import CaptureQueriesContext
+
+# context_text imports
+from context_text.models import Article
+from context_text.models import Article_Data
+
+# context_analysis imports
+from context_analysis.reliability.index_helper import IndexHelper
+
+
+class IndexHelperCacheTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # number of articles, and index all coders share.
+    TEST_ARTICLE_COUNT = 3
+    TEST_INDEX = 1
+
+    # coder priorities - first coder is preferred.
+    TEST_CODER_PRIORITY_LIST = [ 2, 1 ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Creates coders, and articles coded by just the second
+            (lower priority) coder.
+        """
+
+        # declare variables
+        coder_number = -1
+        current_article = None
+
+        self.coder_list = [ User.objects.create( username = "index_helper_coder_" + str( coder_number ) ) for coder_number in range( len( self.TEST_CODER_PRIORITY_LIST ) ) ]
+        self.article_list = []
+        for coder_number in range( self.TEST_ARTICLE_COUNT ):
+
+            current_article = Article.objects.create( headline = "index helper test" )
+            Article_Data.objects.create( article = current_article, coder = self.coder_list[ 1 ] )
+            self.article_list.append( current_article )
+
+        #-- END loop over articles --#
+
+    #-- END function setUp() --#
+
+
+    def make_index_helper( self, max_size_IN = None ):
+
+        """
+        Accepts optional cache size.  Returns IndexHelper with both coders at
+            TEST_INDEX, with TEST_CODER_PRIORITY_LIST priorities.
+        """
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        current_coder = None
+        coder_priority = -1
+
+        instance_OUT = IndexHelper()
+        for current_coder, coder_priority in zip( self.coder_list, self.TEST_CODER_PRIORITY_LIST ):
+
+            instance_OUT.add_coder_at_index( current_coder.id, self.TEST_INDEX, coder_priority )
+
+        #-- END loop over coders --#
+
+        if ( max_size_IN is not None ):
+
+            instance_OUT.article_coder_cache_max_size = max_size_IN
+
+        #-- END check to see if cache size --#
+
+        return instance_OUT
+
+    #-- END method make_index_helper() --#
+
+
+    def count_map_queries( self, index_helper_IN, article_IN ):
+
+        """
+        Accepts IndexHelper and article.  Calls
+            get_index_to_coder_map_for_article() and returns the number of
+            queries it made.
+        """
+
+        # return reference
+        count_OUT = -1
+
+        # declare variables
+        captured_queries = None
+
+        with CaptureQueriesContext( connection ) as captured_queries:
+
+            index_helper_IN.get_index_to_coder_map_for_article( article_IN )
+
+        #-- END with CaptureQueriesContext --#
+
+        count_OUT = len( captured_queries )
+
+        return count_OUT
+
+    #-- END method count_map_queries() --#
+
+
+    def test_cache_hit( self ):
+
+        # declare variables
+        me = "test_cache_hit"
+        my_index_helper = None
+        test_article = None
+        index_to_coder_map = None
+        error_string = ""
+
+        my_index_helper = self.make_index_helper()
+        test_article = self.article_list[ 0 ]
+
+        # first call queries, second doesn't.
+        error_string = "In " + me + "(): first call for article should query."
+        self.assertGreater( self.count_map_queries( my_index_helper, test_article ), 0, msg = error_string )
+        error_string = "In " + me + "(): repeat call for article should be served from cache."
+        self.assertEqual( self.count_map_queries( my_index_helper, test_article ), 0, msg = error_string )
+
+        # map is right, and copies from map_index_to_coder_for_article() don't
+        #     alter cache.
+        index_to_coder_map = my_index_helper.map_index_to_coder_for_article( test_article )
+        self.assertEqual( index_to_coder_map, { self.TEST_INDEX : self.coder_list[ 1 ] } )
+        index_to_coder_map.clear()
+        self.assertEqual( my_index_helper.get_index_to_coder_map_for_article( test_article ), { self.TEST_INDEX : self.coder_list[ 1 ] } )
+        self.assertEqual( my_index_helper.map_index_to_coder_for_article( test_article, IndexHelper.MAPPING_CODER_TO_INDEX ), { self.coder_list[ 1 ] : [ self.TEST_INDEX ] } )
+
+    #-- END test method test_cache_hit() --#
+
+
+    def test_cache_eviction( self ):
+
+        # declare variables
+        me = "test_cache_eviction"
+        my_index_helper = None
+        article_0 = None
+        article_1 = None
+        article_2 = None
+        error_string = ""
+
+        my_index_helper = self.make_index_helper( max_size_IN = 2 )
+        article_0, article_1, article_2 = self.article_list
+
+        # fill cache, then use article 0 so article 1 is least recently used.
+        my_index_helper.get_index_to_coder_map_for_article( article_0 )
+        my_index_helper.get_index_to_coder_map_for_article( article_1 )
+        self.assertEqual( self.count_map_queries( my_index_helper, article_0 ), 0 )
+
+        # third article evicts article 1, not article 0.
+        my_index_helper.get_index_to_coder_map_for_article( article_2 )
+        self.assertEqual( len( my_index_helper.m_article_id_to_coder_map_cache ), 2 )
+        error_string = "In " + me + "(): recently used article 0 should still be cached."
+        self.assertEqual( self.count_map_queries( my_index_helper, article_0 ), 0, msg = error_string )
+        error_string = "In " + me + "(): least recently used article 1 should have been evicted."
+        self.assertNotIn( article_1.id, my_index_helper.m_article_id_to_coder_map_cache, msg = error_string )
+        self.assertGreater( self.count_map_queries( my_index_helper, article_1 ), 0, msg = error_string )
+        self.assertEqual( len( my_index_helper.m_article_id_to_coder_map_cache ), 2 )
+
+    #-- END test method test_cache_eviction() --#
+
+
+    def test_cache_invalidation( self ):
+
+        # declare variables
+        me = "test_cache_invalidation"
+        my_index_helper = None
+        article_0 = None
+        article_1 = None
+        error_string = ""
+
+        my_index_helper = self.make_index_helper()
+        article_0 = self.article_list[ 0 ]
+        article_1 = self.article_list[ 1 ]
+        my_index_helper.get_index_to_coder_map_for_article( article_0 )
+        my_index_helper.get_index_to_coder_map_for_article( article_1 )
+
+        # preferred coder codes article 0 - cached map is stale until cleared.
+        Article_Data.objects.create( article = article_0, coder = self.coder_list[ 0 ] )
+        self.assertEqual( my_index_helper.get_index_to_coder_map_for_article( article_0 ), { self.TEST_INDEX : self.coder_list[ 1 ] } )
+
+        # clear just article 0.
+        my_index_helper.clear_article_coder_cache( article_id_IN = article_0.id )
+        error_string = "In " + me + "(): article 0 should use preferred coder after its cache entry is cleared."
+        self.assertEqual( my_index_helper.get_index_to_coder_map_for_article( article_0 ), { self.TEST_INDEX : self.coder_list[ 0 ] }, msg = error_string )
+        error_string = "In " + me + "(): clearing article 0 should leave article 1 cached."
+        self.assertEqual( self.count_map_queries( my_index_helper, article_1 ), 0, msg = error_string )
+
+        # clear everything.
+        my_index_helper.clear_article_coder_cache()
+        self.assertEqual( len( my_index_helper.m_article_id_to_coder_map_cache ), 0 )
+        self.assertGreater( self.count_map_queries( my_index_helper, article_1 ), 0 )
+
+        # coder configuration change clears cache.
+        my_index_helper.add_coder_at_index( self.coder_list[ 1 ].id, self.TEST_INDEX + 1, 1 )
+        error_string = "In " + me + "(): add_coder_at_index() should clear cache."
+        self.assertEqual( len( my_index_helper.m_article_id_to_coder_map_cache ), 0, msg = error_string )
+        self.assertEqual( my_index_helper.get_index_to_coder_map_for_article( article_1 ), { self.TEST_INDEX : self.coder_list[ 1 ], self.TEST_INDEX + 1 : self.coder_list[ 1 ] } )
+        my_index_helper.build_index_info()
+        error_string = "In " + me + "(): build_index_info() should clear cache."
+        self.assertEqual( len( my_index_helper.m_article_id_to_coder_map_cache ), 0, msg = error_string )
+
+    #-- END test method test_cache_invalidation() --#
+
+
+    def test_map_for_article_id_list( self ):
+
+        # declare variables
+        me = "test_map_for_article_id_list"
+        my_index_helper = None
+        article_id_list = None
+        expected_map = None
+        test_map = None
+        captured_queries = None
+        current_article = None
+        error_string = ""
+
+        # preferred coder also codes the first article.
+        Article_Data.objects.create( article = self.article_list[ 0 ], coder = self.coder_list[ 0 ] )
+        article_id_list = [ current_article.id for current_article in self.article_list ]
+
+        # expected - one article at a time.
+        expected_map = {}
+        for current_article in self.article_list:
+
+            expected_map[ current_article.id ] = self.make_index_helper().get_index_to_coder_map_for_article( current_article )
+
+        #-- END loop over articles --#
+
+        # all articles, one query, not cached.
+        my_index_helper = self.make_index_helper()
+        with CaptureQueriesContext( connection ) as captured_queries:
+
+            test_map = my_index_helper.get_index_to_coder_map_for_article_id_list( article_id_list )
+
+        #-- END with CaptureQueriesContext --#
+
+        error_string = "In " + me + "(): maps for all articles should match per-article maps."
+        self.assertEqual( test_map, expected_map, msg = error_string )
+        self.assertEqual( test_map[ self.article_list[ 0 ].id ], { self.TEST_INDEX : self.coder_list[ 0 ] } )
+        error_string = "In " + me + "(): maps for all articles should take one query."
+        self.assertEqual( len( captured_queries ), 1, msg = error_string )
+        self.assertEqual( len( my_index_helper.m_article_id_to_coder_map_cache ), 0 )
+
+    #-- END test method test_map_for_article_id_list() --#
+
+
+#-- END test class IndexHelperCacheTest --#
@@ -0,0 +1,177 @@
+"""
+This file contains tests of the context_analysis KrippendorffAlpha class.
+
+Functions tested:
+- KrippendorffAlpha.compute_alpha()
+- KrippendorffAlpha.compute_alpha_for_columns()
+- KrippendorffAlpha.build_coincidence_matrix()
+- KrippendorffAlpha.compute_alpha_from_coincidence_matrix()
+"""
+
+# python package imports
+import numpy
+
+# django imports
+import django.test
+
+# context_analysis imports
+from context_analysis.reliability.krippendorff_alpha import KrippendorffAlpha
+
+
+class KrippendorffAlphaTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # Krippendorff's example reliability data (4 coders, 12 units, with missing
+    #     values), one row per unit - same data as irr::kripp.alpha() example.
+    TEST_DATA = [
+        [ 1, 1, numpy.nan, 1 ],
+        [ 2, 2, 3, 2 ],
+        [ 3, 3, 3, 3 ],
+        [ 3, 3, 3, 3 ],
+        [ 2, 2, 2, 2 ],
+        [ 1, 2, 3, 4 ],
+        [ 4, 4, 4, 4 ],
+        [ 1, 1, 2, 1 ],
+        [ 2, 2, 2, 2 ],
+        [ numpy.nan, 5, 5, 5 ],
+        [ numpy.nan, numpy.nan, 1, 1 ],
+        [ numpy.nan, numpy.nan, 3, numpy.nan ]
+    ]
+
+    # alpha for each level, as returned by irr::kripp.alpha().
+    TEST_LEVEL_TO_ALPHA_MAP = {
+        KrippendorffAlpha.MEASUREMENT_LEVEL_NOMINAL : 0.743,
+        KrippendorffAlpha.MEASUREMENT_LEVEL_ORDINAL : 0.815,
+        KrippendorffAlpha.MEASUREMENT_LEVEL_INTERVAL : 0.849,
+        KrippendorffAlpha.MEASUREMENT_LEVEL_RATIO : 0.797
+    }
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def test_compute_alpha( self ):
+
+        # declare variables
+        me = "test_compute_alpha"
+        value_array = None
+        measurement_level = None
+        should_be = None
+        alpha_value = None
+        error_string = ""
+
+        value_array = numpy.array( self.TEST_DATA )
+
+        # check each level.
+        for measurement_level in KrippendorffAlpha.MEASUREMENT_LEVEL_LIST:
+
+            should_be = self.TEST_LEVEL_TO_ALPHA_MAP[ measurement_level ]
+            alpha_value = KrippendorffAlpha.compute_alpha( value_array, measurement_level_IN = measurement_level )
+            error_string = "In " + me + "(): level " + measurement_level + " --> " + str( alpha_value ) + "; should = " + str( should_be )
+            self.assertAlmostEqual( alpha_value, should_be, places = 3, msg = error_string )
+
+        #-- END loop over measurement levels --#
+
+        # no disagreement possible - nan, like R.
+        alpha_value = KrippendorffAlpha.compute_alpha( numpy.array( [ [ 1, 1 ], [ 1, 1 ] ] ) )
+        self.assertTrue( numpy.isnan( alpha_value ), msg = "In " + me + "(): all same --> " + str( alpha_value ) + "; should = nan" )
+
+    #-- END test method test_compute_alpha() --#
+
+
+    def test_compute_alpha_for_columns( self ):
+
+        # declare variables
+        me = "test_compute_alpha_for_columns"
+        value_array = None
+        level_list = None
+        alpha_list = None
+        measurement_level = None
+        alpha_value = None
+        error_string = ""
+
+        # same data in every column, a different level for each.
+        level_list = KrippendorffAlpha.MEASUREMENT_LEVEL_LIST
+        value_array = numpy.stack( [ numpy.array( self.TEST_DATA ) ] * len( level_list ), axis = 2 )
+        alpha_list = KrippendorffAlpha.compute_alpha_for_columns( value_array, level_list )
+
+        self.assertEqual( len( alpha_list ), len( level_list ) )
+        for measurement_level, alpha_value in zip( level_list, alpha_list ):
+
+            error_string = "In " + me + "(): level " + measurement_level + " --> " + str( alpha_value )
+            self.assertAlmostEqual( alpha_value, self.TEST_LEVEL_TO_ALPHA_MAP[ measurement_level ], places = 3, msg = error_string )
+
+        #-- END loop over results --#
+
+    #-- END test method test_compute_alpha_for_columns() --#
+
+
+    def test_different_columns( self ):
+
+        # declare variables
+        me = "test_different_columns"
+        random_generator = None
+        value_array = None
+        level_list = None
+        alpha_list = None
+        column_index = -1
+        should_be = None
+        error_string = ""
+
+        # different values and missing values in each column - all at once
+        #     should match one at a time.
+        random_generator = numpy.random.default_rng( 42 )
+        value_array = random_generator.integers( 0, 6, size = ( 40, 3, 4 ) ).astype( numpy.float64 )
+        value_array[ random_generator.random( value_array.shape ) < 0.25 ] = numpy.nan
+        value_array[ :, :, 1 ] += 100
+        level_list = KrippendorffAlpha.MEASUREMENT_LEVEL_LIST
+        alpha_list = KrippendorffAlpha.compute_alpha_for_columns( value_array, level_list )
+        for column_index in range( len( level_list ) ):
+
+            should_be = KrippendorffAlpha.compute_alpha( value_array[ :, :, column_index ], measurement_level_IN = level_list[ column_index ] )
+            error_string = "In " + me + "(): column " + str( column_index ) + " --> " + str( alpha_list[ column_index ] ) + "; should = " + str( should_be )
+            self.assertAlmostEqual( alpha_list[ column_index ], should_be, places = 10, msg = error_string )
+
+        #-- END loop over columns --#
+
+    #-- END test method test_different_columns() --#
+
+
+    def test_high_cardinality( self ):
+
+        # declare variables
+        random_generator = None
+        unit_count = -1
+        value_array = None
+        values = None
+        coincidence_matrix = None
+        alpha_value = None
+
+        # 50,000 units, ~5,000 distinct values - coincidences stay sparse
+        #     (at most one entry per ordered pair of values per unit).
+        random_generator = numpy.random.default_rng( 7 )
+        unit_count = 50000
+        value_array = random_generator.integers( 0, 5000, size = ( unit_count, 2 ) ).astype( numpy.float64 )
+        value_array[ :, 1 ] = numpy.where( random_generator.random( unit_count ) < 0.8, value_array[ :, 0 ], value_array[ :, 1 ] )
+
+        values, coincidence_matrix = KrippendorffAlpha.build_coincidence_matrix( value_array )
+        self.assertEqual( len( values ), 5000 )
+        self.assertLessEqual( coincidence_matrix.nnz, 2 * unit_count )
+        self.assertAlmostEqual( coincidence_matrix.sum(), 2 * unit_count )
+
+        # about 80% agreement beyond chance.
+        alpha_value = KrippendorffAlpha.compute_alpha( value_array )
+        self.assertAlmostEqual( alpha_value, KrippendorffAlpha.compute_alpha_from_coincidence_matrix( values, coincidence_matrix ), places = 10 )
+        self.assertGreater( alpha_value, 0.75 )
+        self.assertLess( alpha_value, 0.85 )
+
+    #-- END test method test_high_cardinality() --#
+
+
+#-- END test class KrippendorffAlphaTest --#
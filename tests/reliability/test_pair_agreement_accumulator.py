@@ -0,0 +1,116 @@
+"""
+This file contains tests of the context_analysis PairAgreementAccumulator class.
+
+Functions tested:
+- PairAgreementAccumulator.add_values()
+- PairAgreementAccumulator.get_alpha()
+- PairAgreementAccumulator.get_percentage_agreement()
+"""
+
+# python package imports
+import numpy
+
+# django imports
+import django.test
+
+# context_analysis imports
+from context_analysis.reliability.krippendorff_alpha import KrippendorffAlpha
+from context_analysis.reliability.pair_agreement_accumulator import PairAgreementAccumulator
+
+
+class PairAgreementAccumulatorTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # two coders, with missing values and a 0 to filter out.
+    TEST_DATA = [
+        [ 1, 1 ],
+        [ 2, 2 ],
+        [ 3, 2 ],
+        [ numpy.nan, 3 ],
+        [ 4, 4 ],
+        [ 0, 4 ],
+        [ 1, 2 ],
+        [ numpy.nan, numpy.nan ],
+        [ 3, 3 ],
+        [ 2, 1 ],
+        [ 4, 4 ]
+    ]
+
+    # chunk size for feeding data in.
+    TEST_CHUNK_SIZE = 3
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def test_chunked_matches_whole( self ):
+
+        # declare variables
+        me = "test_chunked_matches_whole"
+        value_array = None
+        row_mask = None
+        my_accumulator = None
+        chunk_start = -1
+        chunk_end = -1
+        masked_array = None
+        measurement_level = None
+        should_be = None
+        error_string = ""
+
+        value_array = numpy.array( self.TEST_DATA, dtype = numpy.float64 )
+
+        # all rows, then only rows where both > 0.
+        for row_mask in [ None, ( value_array[ :, 0 ] > 0 ) & ( value_array[ :, 1 ] > 0 ) ]:
+
+            # feed in chunks.
+            my_accumulator = PairAgreementAccumulator()
+            for chunk_start in range( 0, len( value_array ), self.TEST_CHUNK_SIZE ):
+
+                chunk_end = chunk_start + self.TEST_CHUNK_SIZE
+                my_accumulator.add_values( value_array[ chunk_start : chunk_end, 0 ],
+                                           value_array[ chunk_start : chunk_end, 1 ],
+                                           row_mask_IN = None if ( row_mask is None ) else row_mask[ chunk_start : chunk_end ] )
+
+            #-- END loop over chunks --#
+
+            # compare to all at once.
+            masked_array = value_array if ( row_mask is None ) else value_array[ row_mask ]
+            self.assertEqual( my_accumulator.row_count, len( masked_array ) )
+
+            should_be = ( masked_array[ :, 0 ] == masked_array[ :, 1 ] ).mean()
+            error_string = "In " + me + "(): percentage --> " + str( my_accumulator.get_percentage_agreement() ) + "; should = " + str( should_be )
+            self.assertAlmostEqual( my_accumulator.get_percentage_agreement(), should_be, msg = error_string )
+
+            for measurement_level in KrippendorffAlpha.MEASUREMENT_LEVEL_LIST:
+
+                should_be = KrippendorffAlpha.compute_alpha( masked_array, measurement_level_IN = measurement_level )
+                error_string = "In " + me + "(): level " + measurement_level + " --> " + str( my_accumulator.get_alpha( measurement_level ) ) + "; should = " + str( should_be )
+                self.assertAlmostEqual( my_accumulator.get_alpha( measurement_level ), should_be, msg = error_string )
+
+            #-- END loop over measurement levels --#
+
+        #-- END loop over row masks --#
+
+    #-- END test method test_chunked_matches_whole() --#
+
+
+    def test_empty( self ):
+
+        # declare variables
+        my_accumulator = None
+
+        # nothing added - no percentage, alpha is nan.
+        my_accumulator = PairAgreementAccumulator()
+        self.assertIsNone( my_accumulator.get_percentage_agreement() )
+        self.assertTrue( numpy.isnan( my_accumulator.get_alpha() ) )
+
+    #-- END test method test_empty() --#
+
+
+#-- END test class PairAgreementAccumulatorTest --#
@@ -0,0 +1,328 @@
+"""
+This file contains tests of the context_analysis ReliabilityNamesAnalyzer class
+    that run against data frames built in the test, so no database or Rserve
+    is needed (alpha backend is numpy).
+
+Functions tested:
+- ReliabilityNamesAnalyzer.analyze_all_pairs() (batched, vs. pair-by-pair)
+- ReliabilityNamesAnalyzer.analyze_pairs_in_parallel()
+- ReliabilityNamesAnalyzer.analyze_pair_task()
+- ReliabilityNamesAnalyzer.analyze_reliability_names() (Rserve connection
+    acquire and release)
+"""
+
+# python package imports
+import math
+import multiprocessing
+from unittest import mock
+
+# stats and analysis
+import numpy
+import pandas
+
+# django imports
+import django.test
+
+# context_analysis imports
+from context_analysis.models import Reliability_Names_Results
+from context_analysis.reliability.reliability_names_analyzer import ReliabilityNamesAnalyzer
+
+
+class ReliabilityNamesAnalyzerTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # label for results.
+    TEST_LABEL = "analyzer_test"
+
+    # number of coders, and rows per person type.
+    TEST_INDICES_TO_COMPARE = 3
+    TEST_ROW_COUNT = 40
+
+    # column suffix to values coders pick from (0 = not detected / no lookup).
+    TEST_COLUMN_SUFFIX_TO_VALUE_LIST_MAP = {
+        ReliabilityNamesAnalyzer.COLUMN_NAME_SUFFIX_DETECTED : [ 0, 1 ],
+        ReliabilityNamesAnalyzer.COLUMN_NAME_SUFFIX_PERSON_ID : [ 0, 11, 12, 13, 14 ],
+        ReliabilityNamesAnalyzer.COLUMN_NAME_SUFFIX_PERSON_TYPE_INT : [ 0, 1, 2, 3 ],
+        ReliabilityNamesAnalyzer.COLUMN_NAME_SUFFIX_FIRST_QUOTE_GRAF : [ 0, 1, 2, 5 ],
+        ReliabilityNamesAnalyzer.COLUMN_NAME_SUFFIX_FIRST_QUOTE_INDEX : [ 0, 10, 200 ],
+        ReliabilityNamesAnalyzer.COLUMN_NAME_SUFFIX_ORGANIZATION_HASH : [ 0, 1234567, 7654321 ]
+    }
+
+    # chance a coder agrees with coder 1 (so alphas are not all near 0).
+    TEST_AGREE_PROBABILITY = 0.7
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def assert_results_equal( self, expected_instance_IN, actual_instance_IN, message_IN ):
+
+        """
+        Asserts that every author* and subject* field on two
+            Reliability_Names_Results instances is equal (NaN equals NaN).
+        """
+
+        # declare variables
+        current_field = None
+        field_name = ""
+        expected_value = None
+        actual_value = None
+        error_string = ""
+
+        for current_field in Reliability_Names_Results._meta.fields:
+
+            field_name = current_field.name
+            if ( field_name.startswith( tuple( ReliabilityNamesAnalyzer.PERSON_TYPE_LIST ) ) == True ):
+
+                expected_value = getattr( expected_instance_IN, field_name )
+                actual_value = getattr( actual_instance_IN, field_name )
+                error_string = message_IN + " - " + field_name + ": " + str( actual_value ) + ", should be " + str( expected_value )
+                if ( ( isinstance( expected_value, float ) == True ) and ( math.isnan( expected_value ) == True ) ):
+
+                    self.assertTrue( ( isinstance( actual_value, float ) == True ) and ( math.isnan( actual_value ) == True ), msg = error_string )
+
+                else:
+
+                    self.assertEqual( actual_value, expected_value, msg = error_string )
+
+                #-- END check to see if NaN --#
+
+            #-- END check to see if person type field --#
+
+        #-- END loop over fields --#
+
+    #-- END method assert_results_equal() --#
+
+
+    def make_analyzer( self ):
+
+        """
+        Returns ReliabilityNamesAnalyzer that computes alpha in-process.
+        """
+
+        # return reference
+        instance_OUT = None
+
+        instance_OUT = ReliabilityNamesAnalyzer()
+        instance_OUT.alpha_backend = ReliabilityNamesAnalyzer.ALPHA_BACKEND_NUMPY
+        instance_OUT.indices_to_compare = self.TEST_INDICES_TO_COMPARE
+
+        return instance_OUT
+
+    #-- END method make_analyzer() --#
+
+
+    def make_person_type_to_df_map( self, seed_IN = 0 ):
+
+        """
+        Returns dictionary that maps each person type to a data frame of fake
+            Reliability_Names rows - coderN_* columns for each coder index,
+            coder 1 random, other coders mostly agreeing with coder 1, and the
+            last coder missing some rows (NaN).
+        """
+
+        # return reference
+        map_OUT = {}
+
+        # declare variables
+        random_state = None
+        current_person_type = None
+        column_map = None
+        column_suffix = ""
+        value_list = None
+        coder_1_array = None
+        current_index = -1
+        coder_array = None
+        agree_mask = None
+
+        random_state = numpy.random.RandomState( seed_IN )
+        for current_person_type in ReliabilityNamesAnalyzer.PERSON_TYPE_LIST:
+
+            column_map = {}
+            column_map[ "id" ] = numpy.arange( 1, self.TEST_ROW_COUNT + 1 )
+            for column_suffix, value_list in self.TEST_COLUMN_SUFFIX_TO_VALUE_LIST_MAP.items():
+
+                coder_1_array = random_state.choice( value_list, size = self.TEST_ROW_COUNT ).astype( float )
+                for current_index in range( 1, self.TEST_INDICES_TO_COMPARE + 1 ):
+
+                    coder_array = coder_1_array.copy()
+                    if ( current_index > 1 ):
+
+                        agree_mask = random_state.random_sample( self.TEST_ROW_COUNT ) < self.TEST_AGREE_PROBABILITY
+                        coder_array[ ~agree_mask ] = random_state.choice( value_list, size = int( numpy.sum( ~agree_mask ) ) )
+
+                    #-- END check to see if coder 1 --#
+
+                    # last coder didn't code every row.
+                    if ( current_index == self.TEST_INDICES_TO_COMPARE ):
+
+                        coder_array[ -3 : ] = numpy.nan
+
+                    #-- END check to see if last coder --#
+
+                    column_map[ ReliabilityNamesAnalyzer.COLUMN_NAME_PREFIX_CODER + str( current_index ) + column_suffix ] = coder_array
+
+                #-- END loop over coder indices --#
+
+            #-- END loop over columns --#
+
+            map_OUT[ current_person_type ] = pandas.DataFrame( column_map )
+
+        #-- END loop over person types --#
+
+        return map_OUT
+
+    #-- END method make_person_type_to_df_map() --#
+
+
+    def make_expected_results_map( self, person_type_to_df_map_IN ):
+
+        """
+        Accepts dictionary of person type to data frame.  Returns map of pair
+            of indices to Reliability_Names_Results, built pair-by-pair, the
+            way analyze_reliability_names() loops when not batched.
+        """
+
+        # return reference
+        map_OUT = None
+
+        # declare variables
+        my_analyzer = None
+        pair_key = None
+        results_instance = None
+        current_person_type = None
+
+        my_analyzer = self.make_analyzer()
+        map_OUT = my_analyzer.create_pair_results_map( self.TEST_LABEL, self.TEST_INDICES_TO_COMPARE )
+        for pair_key, results_instance in map_OUT.items():
+
+            for current_person_type in ReliabilityNamesAnalyzer.PERSON_TYPE_LIST:
+
+                my_analyzer.analyze_person_coding( pair_key[ 0 ], pair_key[ 1 ], person_type_to_df_map_IN[ current_person_type ], current_person_type, results_instance )
+
+            #-- END loop over person types --#
+
+        #-- END loop over pairs --#
+
+        return map_OUT
+
+    #-- END method make_expected_results_map() --#
+
+
+    def test_analyze_all_pairs( self ):
+
+        # declare variables
+        me = "test_analyze_all_pairs"
+        person_type_to_df_map = None
+        expected_map = None
+        batched_list = None
+        expected_instance = None
+        batched_instance = None
+
+        person_type_to_df_map = self.make_person_type_to_df_map( seed_IN = 1 )
+        expected_map = self.make_expected_results_map( person_type_to_df_map )
+
+        batched_list = self.make_analyzer().analyze_all_pairs( self.TEST_LABEL, person_type_to_df_map, self.TEST_INDICES_TO_COMPARE )
+        self.assertEqual( len( batched_list ), len( expected_map ) )
+        for expected_instance, batched_instance in zip( expected_map.values(), batched_list ):
+
+            self.assertEqual( ( batched_instance.coder1_coder_index, batched_instance.coder2_coder_index ), ( expected_instance.coder1_coder_index, expected_instance.coder2_coder_index ) )
+            self.assert_results_equal( expected_instance, batched_instance, "In " + me + "(): batched" )
+
+        #-- END loop over batched results --#
+
+    #-- END test method test_analyze_all_pairs() --#
+
+
+    def test_analyze_pairs_in_parallel( self ):
+
+        # declare variables
+        me = "test_analyze_pairs_in_parallel"
+        person_type_to_df_map = None
+        expected_map = None
+        serial_list = None
+        parallel_list = None
+        expected_instance = None
+        serial_instance = None
+        parallel_instance = None
+
+        person_type_to_df_map = self.make_person_type_to_df_map()
+
+        # expected - pair-by-pair, the way analyze_reliability_names() loops.
+        expected_map = self.make_expected_results_map( person_type_to_df_map )
+
+        # serial (1 worker - runs tasks in this process).
+        serial_list = self.make_analyzer().analyze_pairs_in_parallel( self.TEST_LABEL, person_type_to_df_map, self.TEST_INDICES_TO_COMPARE, 1 )
+        self.assertEqual( len( serial_list ), len( expected_map ) )
+        for expected_instance, serial_instance in zip( expected_map.values(), serial_list ):
+
+            self.assertEqual( ( serial_instance.coder1_coder_index, serial_instance.coder2_coder_index ), ( expected_instance.coder1_coder_index, expected_instance.coder2_coder_index ) )
+            self.assert_results_equal( expected_instance, serial_instance, "In " + me + "(): serial" )
+
+        #-- END loop over serial results --#
+
+        # parallel - only if we can fork.
+        if ( ReliabilityNamesAnalyzer.PAIR_WORKER_START_METHOD in multiprocessing.get_all_start_methods() ):
+
+            parallel_list = self.make_analyzer().analyze_pairs_in_parallel( self.TEST_LABEL, person_type_to_df_map, self.TEST_INDICES_TO_COMPARE, 2 )
+            self.assertEqual( len( parallel_list ), len( serial_list ) )
+            for serial_instance, parallel_instance in zip( serial_list, parallel_list ):
+
+                self.assertEqual( ( parallel_instance.coder1_coder_index, parallel_instance.coder2_coder_index ), ( serial_instance.coder1_coder_index, serial_instance.coder2_coder_index ) )
+                self.assert_results_equal( serial_instance, parallel_instance, "In " + me + "(): parallel" )
+
+            #-- END loop over parallel results --#
+
+        #-- END check to see if fork available --#
+
+    #-- END test method test_analyze_pairs_in_parallel() --#
+
+
+    def test_analyze_reliability_names_rserve_connection( self ):
+
+        # declare variables
+        me = "test_analyze_reliability_names_rserve_connection"
+        test_analyzer = None
+        mock_reliability_names = None
+        mock_acquire = None
+        mock_release = None
+        status_message = ""
+        error_string = ""
+
+        test_analyzer = self.make_analyzer()
+        test_analyzer.alpha_backend = ReliabilityNamesAnalyzer.ALPHA_BACKEND_R
+        with mock.patch( "context_analysis.reliability.reliability_names_analyzer.Reliability_Names" ) as mock_reliability_names, \
+             mock.patch.object( test_analyzer, "acquire_rserve_connection" ) as mock_acquire, \
+             mock.patch.object( test_analyzer, "release_rserve_connection" ) as mock_release:
+
+            # unknown label - no connection.
+            mock_reliability_names.objects.filter.return_value.exists.return_value = False
+            status_message = test_analyzer.analyze_reliability_names( self.TEST_LABEL, self.TEST_INDICES_TO_COMPARE )
+            self.assertEqual( status_message, "No matches for label " + self.TEST_LABEL )
+            error_string = "In " + me + "(): no Rserve connection should be acquired for unknown label."
+            self.assertEqual( ( mock_acquire.call_count, mock_release.call_count ), ( 0, 0 ), msg = error_string )
+
+            # error during analysis - connection still released.
+            mock_reliability_names.objects.filter.return_value.exists.return_value = True
+            with mock.patch.object( test_analyzer, "load_reliability_names_df", side_effect = RuntimeError( "load failed" ) ):
+
+                status_message = test_analyzer.analyze_reliability_names( self.TEST_LABEL, self.TEST_INDICES_TO_COMPARE )
+
+            #-- END with mock.patch.object() --#
+
+            self.assertEqual( status_message, "Exception caught: load failed" )
+            error_string = "In " + me + "(): Rserve connection should be released after exception."
+            self.assertEqual( ( mock_acquire.call_count, mock_release.call_count ), ( 1, 1 ), msg = error_string )
+
+        #-- END with mock.patch() --#
+
+    #-- END test method test_analyze_reliability_names_rserve_connection() --#
+
+
+#-- END test class ReliabilityNamesAnalyzerTest --#
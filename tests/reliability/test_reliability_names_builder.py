@@ -0,0 +1,300 @@
+"""
+This file contains tests of the context_analysis ReliabilityNamesBuilder class.
+
+Functions tested:
+- ReliabilityNamesBuilder.process_articles()
+- ReliabilityNamesBuilder.output_reliability_data() - do_bulk_create_IN
+"""
+
+# python package imports
+from unittest import mock
+
+# django imports
+from django.contrib.auth.models import User
+from django.db import connection
+import django.test
+from django.test.utils import CaptureQueriesContext
+
+# context_text imports
+from context_text.models import Article
+from context_text.models import Article_Author
+from context_text.models import Article_Data
+from context_text.models import Article_Subject
+from context_text.models import Article_Subject_Quotation
+from context_text.models import Person
+from context_text.tests.test_helper import TestHelper
+
+# context_analysis imports
+from context_analysis.models import Reliability_Names
+from context_analysis.models import Reliability_Names_Coder_Data
+from context_analysis.reliability.index_helper import IndexHelper
+from context_analysis.reliability.reliability_names_builder import ReliabilityNamesBuilder
+
+
+class ReliabilityNamesBuilderTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Call function that we'll re-use.
+        """
+
+        # call TestHelper.standardSetUp()
+        TestHelper.standardSetUp( self )
+
+    #-- END function setUp() --#
+
+
+    def count_process_articles_queries( self, article_id_list_IN, limit_to_sources_IN = False ):
+
+        """
+        Accepts list of article IDs.  Runs a fresh ReliabilityNamesBuilder's
+            process_articles() against them and returns the number of queries
+            it made.
+        """
+
+        # return reference
+        count_OUT = -1
+
+        # declare variables
+        my_builder = None
+        captured_queries = None
+
+        # process articles, capturing queries.
+        my_builder = ReliabilityNamesBuilder()
+        with CaptureQueriesContext( connection ) as captured_queries:
+
+            my_builder.process_articles( article_id_in_list_IN = article_id_list_IN, limit_to_sources_IN = limit_to_sources_IN )
+
+        #-- END with CaptureQueriesContext --#
+
+        count_OUT = len( captured_queries )
+
+        return count_OUT
+
+    #-- END method count_process_articles_queries() --#
+
+
+    def test_process_articles_query_count( self ):
+
+        # declare variables
+        me = "test_process_articles_query_count"
+        article_id_list = None
+        single_count = -1
+        all_count = -1
+        error_string = ""
+        limit_to_sources = None
+
+        # get IDs of all articles in the test data.
+        article_id_list = list( Article.objects.all().order_by( "id" ).values_list( "id", flat = True ) )
+
+        # query count should not grow with the number of articles - at most
+        #     one query each for articles, Article_Data (+ coder), authors
+        #     (+ person), subjects (+ person), and quotations.
+        for limit_to_sources in [ False, True ]:
+
+            single_count = self.count_process_articles_queries( article_id_list[ : 1 ], limit_to_sources_IN = limit_to_sources )
+            all_count = self.count_process_articles_queries( article_id_list, limit_to_sources_IN = limit_to_sources )
+            error_string = "In " + me + "(): limit_to_sources = " + str( limit_to_sources ) + "; queries for 1 article = " + str( single_count ) + "; for " + str( len( article_id_list ) ) + " articles = " + str( all_count )
+            self.assertLessEqual( single_count, 5, msg = error_string )
+            self.assertLessEqual( all_count, 5, msg = error_string )
+
+        #-- END loop over limit_to_sources values --#
+
+    #-- END test method test_process_articles_query_count() --#
+
+
+#-- END test class ReliabilityNamesBuilderTest --#
+
+
+class ReliabilityNamesBuilderOutputTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # labels for per-row and bulk output.
+    TEST_LABEL_PER_ROW = "builder_output_per_row"
+    TEST_LABEL_BULK = "builder_output_bulk"
+
+    # number of coders (one per index) and people.
+    TEST_CODER_COUNT = 3
+    TEST_PERSON_COUNT = 6
+
+    # per article, per coder: ( list of author person numbers, list of
+    #     ( subject person number, subject_type, paragraph number of quote or
+    #     None ) ) - person numbers are positions in the list of people created
+    #     in setUp().  Third coder doesn't code the last article.
+    TEST_ARTICLE_LIST = [
+        [ ( [ 0 ], [ ( 2, "quoted", 3 ), ( 3, "mentioned", None ) ] ), ( [ 0 ], [ ( 2, "quoted", 4 ) ] ), ( [ 1 ], [ ( 2, "quoted", 3 ), ( 3, "quoted", 1 ) ] ) ],
+        [ ( [ 1 ], [ ( 4, "quoted", 2 ) ] ), ( [ 1 ], [ ( 4, "quoted", 2 ), ( 5, "mentioned", None ) ] ) ],
+    ]
+
+    # Reliability_Names and Reliability_Names_Coder_Data fields that differ
+    #     between runs.
+    TEST_EXCLUDE_FIELD_NAME_LIST = [ "id", "label", "create_date", "last_modified", "reliability_names" ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Creates coders, people, and TEST_ARTICLE_LIST's articles
+            and coding.
+        """
+
+        # declare variables
+        coder_index = -1
+        article_coding_list = None
+        current_article = None
+        current_coder = None
+        author_number_list = None
+        subject_info_list = None
+        article_data = None
+        author_number = -1
+        subject_number = -1
+        subject_type = ""
+        paragraph_number = -1
+        article_subject = None
+
+        self.coder_list = [ User.objects.create( username = "output_coder_" + str( coder_index ) ) for coder_index in range( 1, self.TEST_CODER_COUNT + 1 ) ]
+        self.person_list = [ Person.objects.create( first_name = "Person", last_name = str( person_number ), full_name_string = "Person " + str( person_number ) ) for person_number in range( self.TEST_PERSON_COUNT ) ]
+        self.article_id_list = []
+        for article_coding_list in self.TEST_ARTICLE_LIST:
+
+            current_article = Article.objects.create( headline = "output test" )
+            self.article_id_list.append( current_article.id )
+            for current_coder, ( author_number_list, subject_info_list ) in zip( self.coder_list, article_coding_list ):
+
+                article_data = Article_Data.objects.create( article = current_article, coder = current_coder )
+                for author_number in author_number_list:
+
+                    Article_Author.objects.create( article_data = article_data, person = self.person_list[ author_number ] )
+
+                #-- END loop over authors --#
+
+                for subject_number, subject_type, paragraph_number in subject_info_list:
+
+                    article_subject = Article_Subject.objects.create( article_data = article_data, person = self.person_list[ subject_number ], subject_type = subject_type )
+                    if ( paragraph_number is not None ):
+
+                        Article_Subject_Quotation.objects.create( article_subject = article_subject, paragraph_number = paragraph_number, value_index = 10 * paragraph_number )
+
+                    #-- END check to see if quotation --#
+
+                #-- END loop over subjects --#
+
+            #-- END loop over coders --#
+
+        #-- END loop over articles --#
+
+    #-- END function setUp() --#
+
+
+    def output( self, label_IN, do_bulk_create_IN ):
+
+        """
+        Accepts label and bulk flag.  Processes test articles with a fresh
+            ReliabilityNamesBuilder (coder N at index N), then outputs
+            Reliability_Names rows with the label passed in.
+        """
+
+        # declare variables
+        my_builder = None
+        current_coder = None
+        coder_index = -1
+
+        my_builder = ReliabilityNamesBuilder()
+        for coder_index, current_coder in enumerate( self.coder_list, 1 ):
+
+            my_builder.add_coder_at_index( current_coder.id, coder_index, 1 )
+
+        #-- END loop over coders --#
+
+        my_builder.process_articles( article_id_in_list_IN = self.article_id_list )
+        my_builder.output_reliability_data( label_IN = label_IN, do_bulk_create_IN = do_bulk_create_IN, batch_size_IN = 2 )
+
+    #-- END method output() --#
+
+
+    def get_comparable_row_list( self, model_IN, label_IN, order_by_list_IN ):
+
+        """
+        Accepts model class, label, and list of fields to order by.  Returns
+            list of dictionaries of the label's rows' values, minus fields in
+            TEST_EXCLUDE_FIELD_NAME_LIST, so two labels' rows can be compared
+            with assertEqual().
+        """
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        field_name_list = None
+        current_field = None
+
+        field_name_list = [ current_field.attname for current_field in model_IN._meta.concrete_fields if current_field.name not in self.TEST_EXCLUDE_FIELD_NAME_LIST ]
+        list_OUT = list( model_IN.objects.filter( label = label_IN ).order_by( *order_by_list_IN ).values( *field_name_list ) )
+
+        return list_OUT
+
+    #-- END method get_comparable_row_list() --#
+
+
+    def test_bulk_output_matches_per_row( self ):
+
+        # declare variables
+        me = "test_bulk_output_matches_per_row"
+        per_row_list = None
+        bulk_list = None
+        order_by_list = None
+        mock_get_map = None
+        error_string = ""
+
+        self.output( self.TEST_LABEL_PER_ROW, False )
+
+        # bulk builds index-to-coder maps up front, not per article.
+        with mock.patch.object( IndexHelper, "get_index_to_coder_map_for_article" ) as mock_get_map:
+
+            self.output( self.TEST_LABEL_BULK, True )
+
+        #-- END with mock.patch.object() --#
+
+        error_string = "In " + me + "(): bulk output should not look up index-to-coder map per article."
+        self.assertEqual( mock_get_map.call_count, 0, msg = error_string )
+
+        # Reliability_Names - authors and sources from both articles.
+        order_by_list = [ "article_id", "person_type", "person_id" ]
+        per_row_list = self.get_comparable_row_list( Reliability_Names, self.TEST_LABEL_PER_ROW, order_by_list )
+        bulk_list = self.get_comparable_row_list( Reliability_Names, self.TEST_LABEL_BULK, order_by_list )
+        self.assertEqual( len( per_row_list ), 7 )
+        error_string = "In " + me + "(): bulk Reliability_Names rows don't match per-row rows."
+        self.assertEqual( bulk_list, per_row_list, msg = error_string )
+
+        # Reliability_Names_Coder_Data - one per coder index per row.
+        order_by_list = [ "reliability_names__article_id", "reliability_names__person_type", "reliability_names__person_id", "coder_index" ]
+        per_row_list = self.get_comparable_row_list( Reliability_Names_Coder_Data, self.TEST_LABEL_PER_ROW, order_by_list )
+        bulk_list = self.get_comparable_row_list( Reliability_Names_Coder_Data, self.TEST_LABEL_BULK, order_by_list )
+        self.assertGreater( len( per_row_list ), 0 )
+        error_string = "In " + me + "(): bulk Reliability_Names_Coder_Data rows don't match per-row rows."
+        self.assertEqual( bulk_list, per_row_list, msg = error_string )
+
+    #-- END test method test_bulk_output_matches_per_row() --#
+
+
+#-- END test class ReliabilityNamesBuilderOutputTest --#
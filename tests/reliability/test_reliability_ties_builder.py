@@ -0,0 +1,444 @@
+"""
+This file contains tests of the context_analysis ReliabilityTiesBuilder class.
+
+Functions tested:
+- ReliabilityTiesBuilder.load_article_graph()
+- ReliabilityTiesBuilder.group_article_data_by_index()
+- ReliabilityTiesBuilder.process_article_relations()
+- ReliabilityTiesBuilder.process_articles() - vs. one Article_Data per coder
+    slot, processed slot by slot (how it worked with 3 hard-coded slots)
+- ReliabilityTiesBuilder.flush_ties() - vs. update_reliability_row()
+"""
+
+# django imports
+from django.contrib.auth.models import User
+from django.db import connection
+import django.test
+from django.test.utils import CaptureQueriesContext
+
+# context_text imports
+from context_text.models import Article
+from context_text.models import Article_Author
+from context_text.models import Article_Data
+from context_text.models import Article_Subject
+from context_text.models import Person
+from context_text.tests.test_helper import TestHelper
+
+# context_analysis imports
+from context_analysis.models import Reliability_Ties
+from context_analysis.reliability.reliability_ties_builder import ReliabilityTiesBuilder
+
+
+class ReliabilityTiesBuilderTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Call function that we'll re-use.
+        """
+
+        # call TestHelper.standardSetUp()
+        TestHelper.standardSetUp( self )
+
+    #-- END function setUp() --#
+
+
+    def make_builder( self ):
+
+        """
+        Returns ReliabilityTiesBuilder with each coder in the test Article_Data
+            given their own index, in coder ID order, up to TABLE_MAX_CODERS.
+        """
+
+        # return reference
+        builder_OUT = None
+
+        # declare variables
+        coder_id_list = None
+        coder_index = -1
+        coder_id = -1
+
+        builder_OUT = ReliabilityTiesBuilder()
+        coder_id_list = sorted( set( Article_Data.objects.values_list( "coder_id", flat = True ) ) )
+        for coder_index, coder_id in enumerate( coder_id_list[ : ReliabilityTiesBuilder.TABLE_MAX_CODERS ], 1 ):
+
+            builder_OUT.coder_id_to_index_map[ coder_id ] = coder_index
+
+        #-- END loop over coder IDs --#
+
+        return builder_OUT
+
+    #-- END method make_builder() --#
+
+
+    def test_process_article_relations_query_count( self ):
+
+        # declare variables
+        me = "test_process_article_relations_query_count"
+        my_builder = None
+        captured_queries = None
+        current_article = None
+        index_to_article_data_map = None
+        index_list = None
+        error_string = ""
+
+        # all articles, all indices - prefetched, so query count should not
+        #     grow with the number of articles or coders - at most one query
+        #     each for articles, Article_Data (+ coder), authors (+ person),
+        #     and subjects (+ person).
+        my_builder = self.make_builder()
+        with CaptureQueriesContext( connection ) as captured_queries:
+
+            for current_article in my_builder.load_article_graph( Article.objects.all().order_by( "id" ) ):
+
+                index_to_article_data_map = my_builder.group_article_data_by_index( current_article )
+
+                # one Article_Data per index, in index order.
+                index_list = list( index_to_article_data_map.keys() )
+                self.assertEqual( index_list, sorted( set( index_list ) ) )
+
+                my_builder.process_article_relations( index_to_article_data_map )
+
+            #-- END loop over articles --#
+
+        #-- END with CaptureQueriesContext --#
+
+        error_string = "In " + me + "(): queries = " + str( len( captured_queries ) )
+        self.assertLessEqual( len( captured_queries ), 4, msg = error_string )
+
+    #-- END test method test_process_article_relations_query_count() --#
+
+
+#-- END test class ReliabilityTiesBuilderTest --#
+
+
+class ReliabilityTiesBuilderDispatchTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # tag for test articles
+    TEST_TAG = "ties_dispatch_test"
+
+    # labels for rows built each way.
+    TEST_LABEL_SLOT = "ties_slot"
+    TEST_LABEL_DISPATCH = "ties_dispatch"
+
+    # number of coders and people.
+    TEST_CODER_COUNT = 6
+    TEST_PERSON_COUNT = 8
+
+    # per article, map of coder number (position in list of coders created in
+    #     setUp()) to ( list of author person numbers, list of ( subject person
+    #     number, subject_type ) ) - person numbers are positions in the list
+    #     of people created in setUp().
+    TEST_ARTICLE_LIST = [
+        { 0 : ( [ 0 ], [ ( 2, "quoted" ), ( 3, "quoted" ) ] ), 1 : ( [ 0 ], [ ( 2, "quoted" ) ] ), 2 : ( [ 0 ], [ ( 2, "quoted" ), ( 4, "mentioned" ) ] ), 3 : ( [ 0 ], [ ( 3, "quoted" ) ] ), 4 : ( [ 0 ], [ ( 2, "quoted" ) ] ), 5 : ( [ 0 ], [ ( 4, "quoted" ) ] ) },
+        { 0 : ( [ 0, 1 ], [ ( 2, "quoted" ), ( 5, "quoted" ) ] ), 1 : ( [ 1 ], [ ( 5, "quoted" ) ] ), 4 : ( [ 1 ], [ ( 5, "quoted" ), ( 6, "quoted" ) ] ) },
+        { 3 : ( [ 0 ], [ ( 2, "quoted" ) ] ), 5 : ( [ 0 ], [ ( 2, "quoted" ), ( 7, "quoted" ) ] ), 2 : ( [ 1 ], [ ( 7, "mentioned" ) ] ) },
+        { 2 : ( [ 1 ], [ ( 6, "quoted" ) ] ), 1 : ( [ 1 ], [ ( 6, "quoted" ) ] ) },
+    ]
+
+    # coder number to index - 3 indices, coder 3 shares index 1 with coder 0
+    #     (and has the higher ID, so is used first), coders 4 and 5 have no
+    #     index.
+    TEST_THREE_CODER_INDEX_MAP = { 0 : 1, 1 : 2, 2 : 3, 3 : 1 }
+
+    # coder number to index - 5 indices, coder 5 shares index 2 with coder 1.
+    TEST_FIVE_CODER_INDEX_MAP = { 0 : 1, 1 : 2, 2 : 3, 3 : 4, 4 : 5, 5 : 2 }
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Creates coders, people, and TEST_ARTICLE_LIST's tagged
+            articles and coding.
+        """
+
+        # declare variables
+        coder_index = -1
+        article_coding_map = None
+        current_article = None
+        coder_number = -1
+        author_number_list = None
+        subject_info_list = None
+        article_data = None
+        author_number = -1
+        subject_number = -1
+        subject_type = ""
+
+        self.coder_list = [ User.objects.create( username = "ties_coder_" + str( coder_index ) ) for coder_index in range( 1, self.TEST_CODER_COUNT + 1 ) ]
+        self.person_list = [ Person.objects.create( first_name = "Person", last_name = str( person_number ) ) for person_number in range( self.TEST_PERSON_COUNT ) ]
+        for article_coding_map in self.TEST_ARTICLE_LIST:
+
+            current_article = Article.objects.create( headline = "ties dispatch test" )
+            current_article.tags.add( self.TEST_TAG )
+            for coder_number, ( author_number_list, subject_info_list ) in article_coding_map.items():
+
+                article_data = Article_Data.objects.create( article = current_article, coder = self.coder_list[ coder_number ] )
+                for author_number in author_number_list:
+
+                    Article_Author.objects.create( article_data = article_data, person = self.person_list[ author_number ] )
+
+                #-- END loop over authors --#
+
+                for subject_number, subject_type in subject_info_list:
+
+                    Article_Subject.objects.create( article_data = article_data, person = self.person_list[ subject_number ], subject_type = subject_type )
+
+                #-- END loop over subjects --#
+
+            #-- END loop over coders --#
+
+        #-- END loop over articles --#
+
+    #-- END function setUp() --#
+
+
+    def make_builder( self, label_IN, coder_number_to_index_map_IN ):
+
+        """
+        Accepts label and map of coder number to index.  Returns
+            ReliabilityTiesBuilder with label and coder indices set.
+        """
+
+        # return reference
+        builder_OUT = None
+
+        # declare variables
+        coder_number = -1
+        coder_index = -1
+
+        builder_OUT = ReliabilityTiesBuilder()
+        builder_OUT.reliability_row_label = label_IN
+        for coder_number, coder_index in coder_number_to_index_map_IN.items():
+
+            builder_OUT.coder_id_to_index_map[ self.coder_list[ coder_number ].id ] = coder_index
+
+        #-- END loop over coders --#
+
+        return builder_OUT
+
+    #-- END method make_builder() --#
+
+
+    def process_articles_by_slot( self, builder_IN, slot_count_IN ):
+
+        """
+        Accepts ReliabilityTiesBuilder and number of coder slots.  Processes the
+            test articles the way process_articles() did before it grouped
+            Article_Data by index - queries each article's Article_Data,
+            ordered by coder ID descending, keeps the first one for each of
+            slots 1 through slot_count_IN, then calls process_relations() slot
+            by slot.  Flushes accumulated ties.
+        """
+
+        # declare variables
+        current_article = None
+        article_data_qs = None
+        slot_list = None
+        current_article_data = None
+        coder_index = -1
+
+        for current_article in Article.objects.filter( tags__name__in = [ self.TEST_TAG ] ).order_by( "id" ):
+
+            article_data_qs = builder_IN.filter_article_data( current_article.article_data_set.all() )
+            article_data_qs = article_data_qs.order_by( "-coder__id" )
+            slot_list = [ None ] * slot_count_IN
+            for current_article_data in article_data_qs:
+
+                coder_index = builder_IN.coder_id_to_index_map.get( current_article_data.coder.id, -1 )
+                if ( ( coder_index > 0 ) and ( coder_index <= slot_count_IN ) and ( slot_list[ coder_index - 1 ] is None ) ):
+
+                    slot_list[ coder_index - 1 ] = current_article_data
+
+                #-- END check to see if empty slot for index --#
+
+            #-- END loop over Article_Data --#
+
+            for current_article_data in slot_list:
+
+                if ( current_article_data is not None ):
+
+                    builder_IN.process_relations( current_article_data )
+
+                #-- END check to see if Article_Data in slot --#
+
+            #-- END loop over slots --#
+
+        #-- END loop over articles --#
+
+        builder_IN.flush_ties()
+
+    #-- END method process_articles_by_slot() --#
+
+
+    def get_tie_map( self, label_IN ):
+
+        """
+        Accepts label.  Returns map of ( author ID, source ID ) to list of (
+            coder ID, mention count, coder ID list ) for coder indices 1
+            through TABLE_MAX_CODERS, for the Reliability_Ties rows with that
+            label (count 0 and ID list "" for indices a row has no values for).
+        """
+
+        # return reference
+        map_OUT = {}
+
+        # declare variables
+        current_row = None
+        coder_value_list = None
+        coder_index = -1
+        field_name_prefix = ""
+
+        for current_row in Reliability_Ties.objects.filter( label = label_IN ):
+
+            coder_value_list = []
+            for coder_index in range( 1, ReliabilityTiesBuilder.TABLE_MAX_CODERS + 1 ):
+
+                field_name_prefix = ReliabilityTiesBuilder.COLUMN_NAME_PREFIX_CODER + str( coder_index )
+                coder_value_list.append( ( getattr( current_row, field_name_prefix + "_id" ),
+                                           getattr( current_row, field_name_prefix + ReliabilityTiesBuilder.COLUMN_NAME_SUFFIX_MENTION_COUNT ) or 0,
+                                           getattr( current_row, field_name_prefix + ReliabilityTiesBuilder.COLUMN_NAME_SUFFIX_ID_LIST ) or "" ) )
+
+            #-- END loop over coder indices --#
+
+            map_OUT[ ( current_row.person_id, current_row.relation_person_id ) ] = coder_value_list
+
+        #-- END loop over rows --#
+
+        return map_OUT
+
+    #-- END method get_tie_map() --#
+
+
+    def assert_dispatch_matches_slots( self, coder_number_to_index_map_IN, slot_count_IN, message_IN ):
+
+        """
+        Accepts map of coder number to index, number of slots, and message.
+            Builds ties for the test articles with process_articles() and with
+            process_articles_by_slot(), and asserts that the rows match.
+            Returns the tie map.
+        """
+
+        # return reference
+        map_OUT = None
+
+        # declare variables
+        slot_tie_map = None
+
+        self.process_articles_by_slot( self.make_builder( self.TEST_LABEL_SLOT, coder_number_to_index_map_IN ), slot_count_IN )
+        self.make_builder( self.TEST_LABEL_DISPATCH, coder_number_to_index_map_IN ).process_articles( [ self.TEST_TAG ] )
+
+        slot_tie_map = self.get_tie_map( self.TEST_LABEL_SLOT )
+        map_OUT = self.get_tie_map( self.TEST_LABEL_DISPATCH )
+        self.assertGreater( len( map_OUT ), 0, msg = message_IN )
+        self.assertEqual( map_OUT, slot_tie_map, msg = message_IN )
+
+        return map_OUT
+
+    #-- END method assert_dispatch_matches_slots() --#
+
+
+    def test_three_coders( self ):
+
+        # declare variables
+        me = "test_three_coders"
+        tie_map = None
+        tie_key = None
+        error_string = ""
+
+        error_string = "In " + me + "(): process_articles() ties don't match 3-slot ties."
+        tie_map = self.assert_dispatch_matches_slots( self.TEST_THREE_CODER_INDEX_MAP, 3, error_string )
+
+        # index 1 - coder 3 (higher ID) used in article 1 (coder 0's mention
+        #     of person 2 not counted), coder 0 in article 2, coder 3 in
+        #     article 3.
+        tie_key = ( self.person_list[ 0 ].id, self.person_list[ 2 ].id )
+        self.assertEqual( tie_map[ tie_key ][ 0 ], ( self.coder_list[ 0 ].id, 2, str( self.coder_list[ 0 ].id ) + "," + str( self.coder_list[ 3 ].id ) ) )
+
+    #-- END test method test_three_coders() --#
+
+
+    def test_more_than_three_coders( self ):
+
+        # declare variables
+        me = "test_more_than_three_coders"
+        tie_map = None
+        tie_key = None
+        error_string = ""
+
+        error_string = "In " + me + "(): process_articles() ties don't match 5-slot ties."
+        tie_map = self.assert_dispatch_matches_slots( self.TEST_FIVE_CODER_INDEX_MAP, 5, error_string )
+
+        # indices 4 and 5 have ties.
+        tie_key = ( self.person_list[ 0 ].id, self.person_list[ 2 ].id )
+        self.assertEqual( tie_map[ tie_key ][ 4 ], ( self.coder_list[ 4 ].id, 1, "" ) )
+        tie_key = ( self.person_list[ 1 ].id, self.person_list[ 6 ].id )
+        self.assertEqual( tie_map[ tie_key ][ 4 ], ( self.coder_list[ 4 ].id, 1, "" ) )
+        self.assertEqual( tie_map[ tie_key ][ 3 ], ( None, 0, "" ) )
+
+    #-- END test method test_more_than_three_coders() --#
+
+
+    def test_flush_matches_update_reliability_row( self ):
+
+        # declare variables
+        me = "test_flush_matches_update_reliability_row"
+        coder_number_to_index_map = None
+        per_tie_builder = None
+        flush_builder = None
+        run_number = -1
+        tie_map = None
+        tie_key = None
+        error_string = ""
+
+        for coder_number_to_index_map in ( self.TEST_FIVE_CODER_INDEX_MAP, self.TEST_THREE_CODER_INDEX_MAP ):
+
+            Reliability_Ties.objects.all().delete()
+
+            # run twice, so second run updates existing rows.
+            for run_number in range( 1, 3 ):
+
+                per_tie_builder = self.make_builder( self.TEST_LABEL_SLOT, coder_number_to_index_map )
+                per_tie_builder.do_accumulate_ties = False
+                per_tie_builder.process_articles( [ self.TEST_TAG ] )
+
+                flush_builder = self.make_builder( self.TEST_LABEL_DISPATCH, coder_number_to_index_map )
+                flush_builder.process_articles( [ self.TEST_TAG ] )
+
+                error_string = "In " + me + "(): run " + str( run_number ) + " - accumulate and flush ties don't match per-tie ties for index map " + str( coder_number_to_index_map )
+                tie_map = self.get_tie_map( self.TEST_LABEL_DISPATCH )
+                self.assertGreater( len( tie_map ), 0, msg = error_string )
+                self.assertEqual( tie_map, self.get_tie_map( self.TEST_LABEL_SLOT ), msg = error_string )
+
+            #-- END loop over runs --#
+
+        #-- END loop over index maps --#
+
+        # coder ID list - each coder for the index once, in the order seen
+        #     (3 coder map - coders 0 and 3 share index 1).
+        tie_key = ( self.person_list[ 0 ].id, self.person_list[ 2 ].id )
+        self.assertEqual( tie_map[ tie_key ][ 0 ], ( self.coder_list[ 0 ].id, 4, str( self.coder_list[ 0 ].id ) + "," + str( self.coder_list[ 3 ].id ) ) )
+
+    #-- END test method test_flush_matches_update_reliability_row() --#
+
+
+#-- END test class ReliabilityTiesBuilderDispatchTest --#
@@ -0,0 +1,260 @@
+"""
+This file contains tests of the context_analysis RserveConnectionPool class.
+    Uses a fake stand-in for pyRserve connections, so Rserve does not need to
+    be running.
+
+Functions tested:
+- RserveConnectionPool.acquire_connection()
+- RserveConnectionPool.release_connection()
+- RserveConnectionPool.get_shared_pool()
+- ReliabilityNamesAnalyzer.get_rserve_pool()
+"""
+
+# django imports
+import django.test
+
+# context_analysis imports
+from context_analysis.reliability.reliability_names_analyzer import ReliabilityNamesAnalyzer
+from context_analysis.reliability.rserve_connection_pool import RserveConnectionPool
+
+
+class FakeRserveConnection( object ):
+
+    """
+    Fake pyRserve connection - records the commands it is asked to eval(), and
+        can be told to fail.
+    """
+
+    def __init__( self, host_IN = None, port_IN = None ):
+
+        self.host = host_IN
+        self.port = port_IN
+        self.isClosed = False
+        self.is_broken = False
+        self.eval_list = []
+
+    #-- END method __init__() --#
+
+    def close( self ):
+
+        self.isClosed = True
+
+    #-- END method close() --#
+
+    def eval( self, command_IN ):
+
+        if ( self.is_broken == True ):
+
+            raise EOFError( "fake connection is broken" )
+
+        #-- END check to see if broken --#
+
+        self.eval_list.append( command_IN )
+
+    #-- END method eval() --#
+
+#-- END class FakeRserveConnection --#
+
+
+class RserveConnectionPoolTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def make_pool( self, max_idle_count_IN = None, host_IN = None, port_IN = None ):
+
+        """
+        Returns a RserveConnectionPool that makes FakeRserveConnections.
+        """
+
+        return RserveConnectionPool( host_IN = host_IN, port_IN = port_IN, connection_factory_IN = FakeRserveConnection, max_idle_count_IN = max_idle_count_IN )
+
+    #-- END method make_pool() --#
+
+
+    def test_acquire_connection( self ):
+
+        # declare variables
+        me = "test_acquire_connection"
+        my_pool = None
+        connection_1 = None
+        connection_2 = None
+
+        my_pool = self.make_pool()
+
+        # new connection, warmed.
+        connection_1 = my_pool.acquire_connection()
+        self.assertEqual( connection_1.eval_list, RserveConnectionPool.DEFAULT_INIT_COMMAND_LIST, msg = "In " + me + "(): init commands not run." )
+        self.assertEqual( my_pool.created_count, 1 )
+
+        # release, then acquire - same connection, not re-initialized.
+        my_pool.release_connection( connection_1 )
+        self.assertEqual( my_pool.get_idle_count(), 1 )
+        connection_2 = my_pool.acquire_connection()
+        self.assertIs( connection_2, connection_1, msg = "In " + me + "(): idle connection not reused." )
+        self.assertEqual( my_pool.created_count, 1 )
+        self.assertEqual( connection_2.eval_list.count( "library( irr )" ), 1 )
+
+    #-- END test method test_acquire_connection() --#
+
+
+    def test_reconnect( self ):
+
+        # declare variables
+        me = "test_reconnect"
+        my_pool = None
+        connection_1 = None
+        connection_2 = None
+
+        my_pool = self.make_pool()
+
+        # idle connection that dies - replaced with new one.
+        connection_1 = my_pool.acquire_connection()
+        my_pool.release_connection( connection_1 )
+        connection_1.is_broken = True
+        connection_2 = my_pool.acquire_connection()
+        self.assertIsNot( connection_2, connection_1, msg = "In " + me + "(): broken connection reused." )
+        self.assertTrue( connection_1.isClosed )
+        self.assertEqual( my_pool.created_count, 2 )
+        self.assertEqual( my_pool.reconnect_count, 1 )
+
+        # closed connection is not kept on release.
+        connection_2.close()
+        my_pool.release_connection( connection_2 )
+        self.assertEqual( my_pool.get_idle_count(), 0 )
+
+    #-- END test method test_reconnect() --#
+
+
+    def test_release_connection( self ):
+
+        # declare variables
+        my_pool = None
+        connection_list = None
+
+        # only keep max idle count.
+        my_pool = self.make_pool( max_idle_count_IN = 2 )
+        connection_list = [ my_pool.acquire_connection() for i in range( 3 ) ]
+        for current_connection in connection_list:
+
+            my_pool.release_connection( current_connection )
+
+        #-- END loop over connections --#
+
+        self.assertEqual( my_pool.get_idle_count(), 2 )
+        self.assertTrue( connection_list[ 2 ].isClosed )
+
+        # close_all() closes idle.
+        my_pool.close_all()
+        self.assertEqual( my_pool.get_idle_count(), 0 )
+        self.assertTrue( connection_list[ 0 ].isClosed )
+        self.assertTrue( connection_list[ 1 ].isClosed )
+
+    #-- END test method test_release_connection() --#
+
+
+    def test_shared_pool( self ):
+
+        # declare variables
+        my_pool = None
+
+        # set, then get.
+        my_pool = self.make_pool()
+        RserveConnectionPool.set_shared_pool( my_pool )
+        try:
+
+            self.assertIs( RserveConnectionPool.get_shared_pool(), my_pool )
+
+        finally:
+
+            RserveConnectionPool.clear_shared_pool()
+
+        #-- END try-finally around shared pool --#
+
+        self.assertIsNot( RserveConnectionPool.get_shared_pool(), my_pool )
+        RserveConnectionPool.clear_shared_pool()
+
+    #-- END test method test_shared_pool() --#
+
+
+    def test_shared_pool_host_port( self ):
+
+        # declare variables
+        me = "test_shared_pool_host_port"
+        pool_1 = None
+        pool_2 = None
+        connection_2 = None
+
+        RserveConnectionPool.clear_shared_pool()
+        try:
+
+            # one pool per host and port.
+            pool_1 = RserveConnectionPool.get_shared_pool( "host-1", 6311 )
+            pool_2 = RserveConnectionPool.get_shared_pool( "host-2", 6311 )
+            self.assertIsNot( pool_1, pool_2, msg = "In " + me + "(): different hosts share a pool." )
+            self.assertIsNot( RserveConnectionPool.get_shared_pool( "host-1", 6312 ), pool_1, msg = "In " + me + "(): different ports share a pool." )
+            self.assertIs( RserveConnectionPool.get_shared_pool( "host-1", 6311 ), pool_1 )
+            self.assertEqual( ( pool_2.rserve_host, pool_2.rserve_port ), ( "host-2", 6311 ) )
+
+            # set_shared_pool() only replaces the pool for its host and port.
+            pool_2 = RserveConnectionPool.set_shared_pool( self.make_pool( host_IN = "host-2", port_IN = 6311 ) )
+            self.assertIs( RserveConnectionPool.get_shared_pool( "host-1", 6311 ), pool_1 )
+            connection_2 = RserveConnectionPool.get_shared_pool( "host-2", 6311 ).acquire_connection()
+            self.assertEqual( ( connection_2.host, connection_2.port ), ( "host-2", 6311 ) )
+
+        finally:
+
+            RserveConnectionPool.clear_shared_pool()
+
+        #-- END try-finally around shared pool --#
+
+    #-- END test method test_shared_pool_host_port() --#
+
+
+    def test_analyzer_get_rserve_pool( self ):
+
+        # declare variables
+        me = "test_analyzer_get_rserve_pool"
+        analyzer_1 = None
+        analyzer_2 = None
+        analyzer_3 = None
+        pool_1 = None
+        pool_2 = None
+
+        RserveConnectionPool.clear_shared_pool()
+        try:
+
+            analyzer_1 = ReliabilityNamesAnalyzer()
+            analyzer_1.rserve_host = "host-1"
+            analyzer_1.rserve_port = 6311
+            analyzer_2 = ReliabilityNamesAnalyzer()
+            analyzer_2.rserve_host = "host-2"
+            analyzer_2.rserve_port = 6311
+            analyzer_3 = ReliabilityNamesAnalyzer()
+            analyzer_3.rserve_host = "host-1"
+            analyzer_3.rserve_port = 6311
+
+            pool_1 = analyzer_1.get_rserve_pool()
+            pool_2 = analyzer_2.get_rserve_pool()
+            self.assertIsNot( pool_1, pool_2, msg = "In " + me + "(): analyzers with different hosts share a pool." )
+            self.assertEqual( ( pool_1.rserve_host, pool_1.rserve_port ), ( "host-1", 6311 ) )
+            self.assertEqual( ( pool_2.rserve_host, pool_2.rserve_port ), ( "host-2", 6311 ) )
+            self.assertIs( analyzer_3.get_rserve_pool(), pool_1, msg = "In " + me + "(): analyzers with the same host do not share a pool." )
+
+        finally:
+
+            RserveConnectionPool.clear_shared_pool()
+
+        #-- END try-finally around shared pool --#
+
+    #-- END test method test_analyzer_get_rserve_pool() --#
+
+
+#-- END test class RserveConnectionPoolTest --#
@@ -0,0 +1,98 @@
+"""
+This file contains tests of the context_analysis LRUCache class.
+
+Functions tested:
+- LRUCache.get()
+- LRUCache.set()
+- LRUCache.pop()
+- LRUCache.pop_matching()
+- LRUCache.clear()
+"""
+
+# django imports
+import django.test
+
+# context_analysis imports
+from context_analysis.lru_cache import LRUCache
+
+
+class LRUCacheTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # cache size
+    TEST_MAX_SIZE = 2
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def test_eviction( self ):
+
+        # declare variables
+        me = "test_eviction"
+        test_cache = None
+        error_string = ""
+
+        test_cache = LRUCache( self.TEST_MAX_SIZE )
+        test_cache.set( "a", 1 )
+        test_cache.set( "b", 2 )
+
+        # "in" doesn't change order, get() does - "b" is now least recently used.
+        self.assertIn( "b", test_cache )
+        self.assertEqual( test_cache.get( "a" ), 1 )
+        test_cache.set( "c", 3 )
+        error_string = "In " + me + "(): least recently used key should have been evicted."
+        self.assertNotIn( "b", test_cache, msg = error_string )
+        self.assertEqual( len( test_cache ), self.TEST_MAX_SIZE )
+        self.assertEqual( test_cache.get( "b", "missing" ), "missing" )
+
+        # replacing a value makes it most recently used.
+        test_cache.set( "a", 10 )
+        test_cache.set( "d", 4 )
+        self.assertEqual( ( test_cache.get( "a" ), test_cache.get( "c" ), test_cache.get( "d" ) ), ( 10, None, 4 ) )
+
+        # max size passed to set() overrides, None or 0 is unbounded.
+        test_cache.set( "e", 5, max_size_IN = 1 )
+        self.assertEqual( len( test_cache ), 1 )
+        test_cache.max_size = None
+        test_cache.set( "f", 6 )
+        test_cache.set( "g", 7, max_size_IN = 0 )
+        self.assertEqual( len( test_cache ), 3 )
+
+    #-- END test method test_eviction() --#
+
+
+    def test_invalidation( self ):
+
+        # declare variables
+        me = "test_invalidation"
+        test_cache = None
+        error_string = ""
+
+        test_cache = LRUCache()
+        test_cache.set( ( 1, "detail" ), "one detail" )
+        test_cache.set( ( 1, "summary" ), "one summary" )
+        test_cache.set( ( 2, "detail" ), "two detail" )
+
+        self.assertEqual( test_cache.pop( ( 2, "detail" ) ), "two detail" )
+        self.assertEqual( test_cache.pop( ( 2, "detail" ) ), None )
+
+        test_cache.set( ( 2, "detail" ), "two detail" )
+        error_string = "In " + me + "(): pop_matching() should remove just matching keys."
+        self.assertEqual( test_cache.pop_matching( lambda cache_key : cache_key[ 0 ] == 1 ), 2, msg = error_string )
+        self.assertEqual( len( test_cache ), 1, msg = error_string )
+        self.assertIn( ( 2, "detail" ), test_cache, msg = error_string )
+
+        test_cache.clear()
+        self.assertEqual( len( test_cache ), 0 )
+
+    #-- END test method test_invalidation() --#
+
+
+#-- END test class LRUCacheTest --#
@@ -0,0 +1,529 @@
+"""
+This file contains tests of the context_analysis Reliability_Names model:
+- stored disagreement flags - instances are not saved, so no database is
+    needed.
+- indexes - EXPLAIN of the hot label filter, with and without the composite
+    index, against the test database (SQLite or PostgreSQL).
+
+Functions tested:
+- Reliability_Names.update_disagreement_flags()
+- Reliability_Names.has_disagreement()
+- Reliability_Names.copy_index_values()
+- Reliability_Names.build_field_name()
+- Reliability_Names.get_coder_value_matrix()
+- Reliability_Names.get_field_values()
+- Reliability_Names.merge_instances()
+- Reliability_Names.get_keyset_key()
+- Reliability_Names.get_keyset_filter()
+- Reliability_Names.parse_keyset_key()
+- Reliability_Names.estimate_count()
+- Reliability_Names.get_plan_row_estimate()
+- Reliability_Names_Coder_Data.build_from_reliability_names()
+"""
+
+# python built-in libraries
+import json
+from unittest import mock
+
+# django imports
+from django.db import connection
+import django.test
+
+# python_utilities imports
+from python_utilities.status.status_container import StatusContainer
+
+# context_analysis imports
+from context_analysis.models import Reliability_Names
+from context_analysis.models import Reliability_Names_Coder_Data
+
+
+class FakeExplainQuerySet( object ):
+
+    '''
+    Stands in for a QuerySet in estimate_count() tests - explain() returns the
+        plan passed in, count() returns the count passed in and records that
+        it was called.
+    '''
+
+    def __init__( self, plan_IN, count_IN ):
+
+        self.plan = plan_IN
+        self.count_value = count_IN
+        self.count_called = False
+
+    #-- END method __init__() --#
+
+    def explain( self, **kwargs ):
+
+        return self.plan
+
+    #-- END method explain() --#
+
+    def count( self ):
+
+        self.count_called = True
+        return self.count_value
+
+    #-- END method count() --#
+
+#-- END class FakeExplainQuerySet --#
+
+
+class Reliability_NamesTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # values per coder index - index 3 disagrees on person ID, index 4 on first
+    #     quote graf only.
+    TEST_CODER_VALUES = {
+        1 : { "detected" : 1, "person_id" : 10, "person_type" : "source", "first_quote_graf" : 2 },
+        2 : { "detected" : 1, "person_id" : 10, "person_type" : "source", "first_quote_graf" : 2 },
+        3 : { "detected" : 1, "person_id" : 11, "person_type" : "source", "first_quote_graf" : 2 },
+        4 : { "detected" : 1, "person_id" : 10, "person_type" : "source", "first_quote_graf" : 5 },
+    }
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def make_instance( self, coder_count_IN ):
+
+        """
+        Returns unsaved Reliability_Names with values for coders 1 through
+            coder_count_IN from TEST_CODER_VALUES.  Other coders are left empty,
+            so only compare up to coder_count_IN.
+        """
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        current_index = -1
+        current_suffix = ""
+        current_value = None
+
+        instance_OUT = Reliability_Names()
+        for current_index in range( 1, coder_count_IN + 1 ):
+
+            for current_suffix, current_value in self.TEST_CODER_VALUES[ current_index ].items():
+
+                setattr( instance_OUT, Reliability_Names.build_field_name( current_index, current_suffix ), current_value )
+
+            #-- END loop over values --#
+
+        #-- END loop over coders --#
+
+        return instance_OUT
+
+    #-- END method make_instance() --#
+
+
+    def test_build_coder_data( self ):
+
+        # declare variables
+        test_instance = None
+        coder_data_list = None
+        coder_data = None
+
+        # three coders - third has a coder, but no other values.
+        test_instance = self.make_instance( 2 )
+        test_instance.id = 42
+        test_instance.label = "coder_data_test"
+        test_instance.coder3_id = 7
+
+        coder_data_list = Reliability_Names_Coder_Data.build_from_reliability_names( test_instance )
+        self.assertEqual( [ coder_data.coder_index for coder_data in coder_data_list ], [ 1, 2, 3 ] )
+
+        # values copied, with label and ID.
+        coder_data = coder_data_list[ 0 ]
+        self.assertEqual( coder_data.reliability_names_id, 42 )
+        self.assertEqual( coder_data.label, "coder_data_test" )
+        self.assertEqual( coder_data.person_id, 10 )
+        self.assertEqual( coder_data.first_quote_graph, 2 )
+        self.assertEqual( coder_data_list[ 2 ].coder_id, 7 )
+        self.assertIsNone( coder_data_list[ 2 ].person_id )
+
+    #-- END test method test_build_coder_data() --#
+
+
+    def test_build_field_name( self ):
+
+        # precomputed and built names match.
+        self.assertEqual( Reliability_Names.build_field_name( 3, "person_id" ), "coder3_person_id" )
+        self.assertEqual( Reliability_Names.build_field_name( 10, "" ), "coder10" )
+        self.assertEqual( Reliability_Names.build_field_name( 2, "_detected" ), "coder2_detected" )
+        self.assertEqual( Reliability_Names.INDEX_SUFFIX_TO_ATTNAME_MAP[ ( 10, "" ) ], "coder10_id" )
+
+    #-- END test method test_build_field_name() --#
+
+
+    def test_get_coder_value_matrix( self ):
+
+        # declare variables
+        test_instance = None
+        coder_value_matrix = None
+
+        test_instance = self.make_instance( 3 )
+        test_instance.coder2_id = 5
+
+        # all coders, two suffixes.
+        coder_value_matrix = test_instance.get_coder_value_matrix( [ "person_id", "" ] )
+        self.assertEqual( len( coder_value_matrix ), Reliability_Names.MAX_INDEX )
+        self.assertEqual( coder_value_matrix[ 0 ], [ 10, None ] )
+        self.assertEqual( coder_value_matrix[ 1 ], [ 10, 5 ] )
+        self.assertEqual( coder_value_matrix[ 2 ], [ 11, None ] )
+        self.assertEqual( coder_value_matrix[ 3 ], [ None, None ] )
+
+        # one coder, one suffix.
+        self.assertEqual( test_instance.get_coder_value_matrix( [ "detected" ], 1 ), [ [ 1 ] ] )
+
+    #-- END test method test_get_coder_value_matrix() --#
+
+
+    def test_get_field_values( self ):
+
+        # declare variables
+        test_instance = None
+        field_value_dict = None
+
+        test_instance = self.make_instance( 3 )
+        test_instance.coder2_id = 5
+
+        # omit empty (default) - just the coders with values.
+        self.assertEqual( test_instance.get_field_values( "person_id" ), { 1 : 10, 2 : 10, 3 : 11 } )
+        self.assertEqual( test_instance.get_field_values( "person_id", empty_values_IN = ( None, 11 ) ), { 1 : 10, 2 : 10 } )
+        self.assertEqual( test_instance.get_field_values( "" ), { 2 : 5 } )
+
+        # all coders.
+        field_value_dict = test_instance.get_field_values( "first_quote_graf", omit_empty_IN = False )
+        self.assertEqual( len( field_value_dict ), Reliability_Names.MAX_INDEX )
+        self.assertEqual( ( field_value_dict[ 1 ], field_value_dict[ Reliability_Names.MAX_INDEX ] ), ( 2, None ) )
+
+        # not a coder field - default for every coder.
+        self.assertEqual( set( test_instance.get_field_values( "no_such_field", default_IN = -1, omit_empty_IN = False ).values() ), { -1 } )
+
+    #-- END test method test_get_field_values() --#
+
+
+    def test_get_keyset_key( self ):
+
+        # declare variables
+        test_instance = None
+        keyset_key = None
+        keyset_q_string = ""
+
+        test_instance = self.make_instance( 2 )
+        test_instance.id = 42
+        test_instance.article_id = 7
+        test_instance.person_type = "author"
+
+        # key is KEYSET_COLUMN_LIST values, survives JSON.
+        keyset_key = Reliability_Names.get_keyset_key( test_instance )
+        self.assertEqual( len( keyset_key ), len( Reliability_Names.KEYSET_COLUMN_LIST ) )
+        self.assertEqual( keyset_key[ 0 ], 7 )
+        self.assertEqual( keyset_key[ -1 ], 42 )
+        self.assertEqual( json.loads( json.dumps( keyset_key ) ), keyset_key )
+
+        # NULL columns only match NULL, non-NULL columns can go greater.
+        keyset_q_string = str( Reliability_Names.get_keyset_filter( [ 7, "author", None, None, None, None, 42 ] ) )
+        self.assertIn( "'article_id__gt', 7", keyset_q_string )
+        self.assertIn( "'person_last_name__isnull', True", keyset_q_string )
+        self.assertIn( "'id__gt', 42", keyset_q_string )
+        self.assertNotIn( "person_last_name__gt", keyset_q_string )
+
+    #-- END test method test_get_keyset_key() --#
+
+
+    def test_parse_keyset_key( self ):
+
+        # declare variables
+        good_key = None
+
+        good_key = [ 7, "author", None, "Doe", "Jane Doe", 3, 42 ]
+        self.assertEqual( Reliability_Names.parse_keyset_key( json.dumps( good_key ) ), good_key )
+
+        # empty, malformed, or tampered - first page.
+        self.assertIsNone( Reliability_Names.parse_keyset_key( None ) )
+        self.assertIsNone( Reliability_Names.parse_keyset_key( "" ) )
+        self.assertIsNone( Reliability_Names.parse_keyset_key( "[7, \"author\"" ) )
+        self.assertIsNone( Reliability_Names.parse_keyset_key( "42" ) )
+        self.assertIsNone( Reliability_Names.parse_keyset_key( json.dumps( good_key[ : 3 ] ) ) )
+        self.assertIsNone( Reliability_Names.parse_keyset_key( json.dumps( good_key[ : 6 ] + [ { "id" : 42 } ] ) ) )
+
+    #-- END test method test_parse_keyset_key() --#
+
+
+    def test_estimate_count( self ):
+
+        # declare variables
+        me = "test_estimate_count"
+        test_qs = None
+        count_value = -1
+        is_estimate = None
+
+        # plan formats - single object (Django 4.2+), list of plans
+        #     (PostgreSQL), and ones we can't read.
+        self.assertEqual( Reliability_Names.get_plan_row_estimate( json.dumps( { "Plan" : { "Plan Rows" : 50000 } } ) ), 50000 )
+        self.assertEqual( Reliability_Names.get_plan_row_estimate( json.dumps( [ { "Plan" : { "Plan Rows" : 50000 } } ] ) ), 50000 )
+        self.assertIsNone( Reliability_Names.get_plan_row_estimate( "Seq Scan on context_analysis_reliability_names" ) )
+        self.assertIsNone( Reliability_Names.get_plan_row_estimate( json.dumps( { "Plan" : {} } ) ) )
+        self.assertIsNone( Reliability_Names.get_plan_row_estimate( json.dumps( [] ) ) )
+
+        with mock.patch( "context_analysis.models.connection" ) as mock_connection:
+
+            mock_connection.vendor = "postgresql"
+
+            # big estimate - used as is.
+            test_qs = FakeExplainQuerySet( json.dumps( { "Plan" : { "Node Type" : "Seq Scan", "Plan Rows" : 50000 } } ), 49000 )
+            count_value, is_estimate = Reliability_Names.estimate_count( test_qs )
+            self.assertEqual( ( count_value, is_estimate ), ( 50000, True ) )
+            self.assertFalse( test_qs.count_called )
+
+            # small estimate - counted.
+            test_qs = FakeExplainQuerySet( json.dumps( { "Plan" : { "Plan Rows" : 12 } } ), 10 )
+            self.assertEqual( Reliability_Names.estimate_count( test_qs ), ( 10, False ) )
+
+            # unreadable plan - counted, not an error.
+            test_qs = FakeExplainQuerySet( "not json", 60000 )
+            self.assertEqual( Reliability_Names.estimate_count( test_qs ), ( 60000, False ), msg = "In " + me + "(): unreadable plan should fall back to count()." )
+
+        #-- END with mock.patch() --#
+
+        # not PostgreSQL - counted.
+        with mock.patch( "context_analysis.models.connection" ) as mock_connection:
+
+            mock_connection.vendor = "sqlite"
+            test_qs = FakeExplainQuerySet( None, 3 )
+            self.assertEqual( Reliability_Names.estimate_count( test_qs ), ( 3, False ) )
+
+        #-- END with mock.patch() --#
+
+    #-- END test method test_estimate_count() --#
+
+
+    def test_copy_index_values( self ):
+
+        # declare variables
+        into_instance = None
+        from_instance = None
+
+        # start with two coders who agree (coder 3 is empty, and empty never
+        #     disagrees).
+        into_instance = self.make_instance( 2 )
+        into_instance.update_disagreement_flags()
+        self.assertFalse( into_instance.has_disagreement( 2, use_stored_flags_IN = True ) )
+        self.assertFalse( into_instance.has_disagreement( 3, use_stored_flags_IN = True ) )
+        self.assertEqual( into_instance.disagree_person_id_mask & ( 1 << 2 ), 0 )
+
+        # copying in coder 3 updates flags - agrees on detected, not person ID.
+        from_instance = self.make_instance( 3 )
+        into_instance.copy_index_values( 3, from_instance )
+        self.assertEqual( into_instance.disagree_detected_mask & ( 1 << 2 ), 0 )
+        self.assertEqual( into_instance.disagree_person_id_mask & ( 1 << 2 ), 1 << 2 )
+        self.assertTrue( into_instance.has_disagreement( 3, use_stored_flags_IN = True ) )
+
+    #-- END test method test_copy_index_values() --#
+
+
+    def test_merge_instances( self ):
+
+        # declare variables
+        me = "test_merge_instances"
+        into_instance = None
+        from_instance = None
+        merge_status = None
+        current_suffix = ""
+        current_value = None
+
+        # INTO has coders 1 and 2, FROM only coder 3.
+        into_instance = self.make_instance( 2 )
+        from_instance = Reliability_Names()
+        from_instance.id = 7
+        for current_suffix, current_value in self.TEST_CODER_VALUES[ 3 ].items():
+
+            setattr( from_instance, Reliability_Names.build_field_name( 3, current_suffix ), current_value )
+
+        #-- END loop over values --#
+
+        # merge - coder 3 copied, note added, nothing saved.
+        merge_status = Reliability_Names.merge_instances( from_instance, into_instance )
+        self.assertEqual( merge_status.get_status_code(), StatusContainer.STATUS_CODE_SUCCESS, msg = "In " + me + "(): " + str( merge_status.get_message_list() ) )
+        self.assertEqual( into_instance.coder3_person_id, 11 )
+        self.assertIn( "Reliability_Names ID = 7", into_instance.notes )
+        self.assertTrue( into_instance.has_disagreement( 3, use_stored_flags_IN = True ) )
+
+        # again - coder 3 populated in both, so error and no change.
+        from_instance.coder3_person_id = 12
+        merge_status = Reliability_Names.merge_instances( from_instance, into_instance )
+        self.assertEqual( merge_status.get_status_code(), StatusContainer.STATUS_CODE_ERROR )
+        self.assertEqual( into_instance.coder3_person_id, 11 )
+
+    #-- END test method test_merge_instances() --#
+
+
+    def test_update_disagreement_flags( self ):
+
+        # declare variables
+        me = "test_update_disagreement_flags"
+        test_instance = None
+        coder_count = -1
+        include_optional = None
+        stored_value = None
+        should_be = None
+        error_string = ""
+
+        # four coders, rest empty.
+        test_instance = self.make_instance( 4 )
+        test_instance.update_disagreement_flags()
+        self.assertIsNotNone( test_instance.disagree_coder_count )
+
+        # stored flags give same answer as recomputing, for each coder count.
+        for coder_count in range( 2, 5 ):
+
+            for include_optional in [ False, True ]:
+
+                stored_value = test_instance.has_disagreement( coder_count, include_optional_IN = include_optional, use_stored_flags_IN = True )
+                should_be = test_instance.has_disagreement( coder_count, include_optional_IN = include_optional )
+                error_string = "In " + me + "(): coder count " + str( coder_count ) + "; optional? " + str( include_optional ) + " --> " + str( stored_value ) + "; should = " + str( should_be )
+                self.assertEqual( stored_value, should_be, msg = error_string )
+
+            #-- END loop over include optional --#
+
+        #-- END loop over coder counts --#
+
+        # lowest coder count with disagreement.
+        self.assertEqual( test_instance.disagree_coder_count, 3 )
+        self.assertEqual( test_instance.disagree_optional_coder_count, 3 )
+        self.assertEqual( test_instance.disagree_first_quote_graf_mask & ( ( 1 << 4 ) - 1 ), 1 << 3 )
+
+        # all ten compared - empty coders disagree with coder 1.
+        self.assertTrue( test_instance.has_disagreement( 10, use_stored_flags_IN = True ) )
+
+        # class-level suffix list not changed by include_optional_IN.
+        self.assertEqual( len( Reliability_Names.DEFAULT_AGREEMENT_FIELD_SUFFIX_LIST ), 3 )
+
+    #-- END test method test_update_disagreement_flags() --#
+
+
+#-- END test class Reliability_NamesTest --#
+
+
+class Reliability_NamesIndexTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # benchmark fixture size
+    TEST_LABEL_COUNT = 5
+    TEST_ROWS_PER_LABEL = 200
+    TEST_LABEL_PREFIX = "index_test_"
+
+    # index on label plus default order.
+    TEST_INDEX_NAME = "rn_label_order_idx"
+
+    # all indexes that start with label (dropped to show plan without them).
+    TEST_LABEL_INDEX_NAME_LIST = [ "rn_label_order_idx", "rn_label_disagree_idx", "rn_label_disagree_opt_idx" ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Create benchmark fixture - TEST_LABEL_COUNT labels, each
+            with TEST_ROWS_PER_LABEL rows.
+        """
+
+        # declare variables
+        row_list = []
+        label_index = -1
+        row_index = -1
+
+        row_list = []
+        for label_index in range( self.TEST_LABEL_COUNT ):
+
+            for row_index in range( self.TEST_ROWS_PER_LABEL ):
+
+                row_list.append( Reliability_Names( label = self.TEST_LABEL_PREFIX + str( label_index ),
+                                                    person_type = "subject",
+                                                    person_name = "Person " + str( row_index ),
+                                                    person_last_name = str( row_index ) ) )
+
+            #-- END loop over rows --#
+
+        #-- END loop over labels --#
+
+        Reliability_Names.objects.bulk_create( row_list )
+
+        # PostgreSQL picks a sequential scan for small tables - turn that off
+        #     for this transaction, so plan shows if index can be used.
+        if ( connection.vendor == "postgresql" ):
+
+            with connection.cursor() as cursor:
+
+                cursor.execute( "SET LOCAL enable_seqscan = off" )
+
+            #-- END with cursor --#
+
+        #-- END check to see if PostgreSQL --#
+
+    #-- END function setUp() --#
+
+
+    def test_label_filter_plan( self ):
+
+        # declare variables
+        me = "test_label_filter_plan"
+        test_qs = None
+        plan_with_index = ""
+        plan_without_index = ""
+        index_name = ""
+        error_string = ""
+
+        # label filter, default order.
+        test_qs = Reliability_Names.objects.filter( label = self.TEST_LABEL_PREFIX + "1" )
+        test_qs = test_qs.order_by( *Reliability_Names.DEFAULT_ORDER_ID_COLUMN_LIST )
+        self.assertEqual( test_qs.count(), self.TEST_ROWS_PER_LABEL )
+
+        # with index
+        plan_with_index = test_qs.explain()
+        error_string = "In " + me + "(): plan doesn't use " + self.TEST_INDEX_NAME + ": " + plan_with_index
+        self.assertIn( self.TEST_INDEX_NAME, plan_with_index, msg = error_string )
+
+        # drop label indexes (rolled back at end of test).
+        with connection.cursor() as cursor:
+
+            for index_name in self.TEST_LABEL_INDEX_NAME_LIST:
+
+                cursor.execute( "DROP INDEX " + index_name )
+
+            #-- END loop over label indexes --#
+
+        #-- END with cursor --#
+
+        # without index - plan changes.  Same query with the label filter
+        #     repeated, so the SQL text differs - python's sqlite3 caches
+        #     prepared statements (and their plans) by SQL text.
+        test_qs = test_qs.filter( label = self.TEST_LABEL_PREFIX + "1" )
+        plan_without_index = test_qs.explain()
+        error_string = "In " + me + "(): plan still uses " + self.TEST_INDEX_NAME + ": " + plan_without_index
+        self.assertNotIn( self.TEST_INDEX_NAME, plan_without_index, msg = error_string )
+        self.assertNotEqual( plan_with_index, plan_without_index )
+
+        # same results either way.
+        self.assertEqual( test_qs.count(), self.TEST_ROWS_PER_LABEL )
+
+    #-- END test method test_label_filter_plan() --#
+
+
+#-- END test class Reliability_NamesIndexTest --#
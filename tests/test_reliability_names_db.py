@@ -0,0 +1,951 @@
+"""
+This file contains tests of the context_analysis Reliability_Names model that
+    need the database - rows are created in each test, no fixtures needed.
+
+Functions tested:
+- Reliability_Names.get_keyset_page()
+- Reliability_Names.lookup_disagreements()
+- Reliability_Names_Coder_Data.create_for_reliability_names_list()
+- Reliability_Names.merge_records() and
+    update_reliabilty_names_for_article() - Reliability_Names_Coder_Data kept
+    in sync (save() alone doesn't touch it)
+- Reliability_Names_Coder_Data.load_value_array()
+- ReliabilityNamesAnalyzer.load_coder_data_df() (vs.
+    load_reliability_names_df())
+- manage.py backfill_reliability_names_disagreement
+- Reliability_Names.bulk_delete_records()
+- Reliability_Names.bulk_merge_records()
+- Reliability_Names.bulk_update_tags()
+"""
+
+# python package imports
+from unittest import mock
+import six
+
+# stats and analysis
+import numpy
+import pandas
+
+# django imports
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.query import QuerySet
+import django.test
+
+# python_utilities imports
+from python_utilities.status.status_container import StatusContainer
+
+# context_text imports
+from context_text.models import Article
+from context_text.models import Article_Data
+from context_text.models import Article_Subject
+from context_text.models import Person
+
+# context_analysis imports
+from context_analysis.models import Reliability_Names
+from context_analysis.models import Reliability_Names_Coder_Data
+from context_analysis.models import Reliability_Names_Eval
+from context_analysis.reliability.reliability_names_analyzer import ReliabilityNamesAnalyzer
+
+
+class Reliability_NamesDBTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # label for test rows.
+    TEST_LABEL = "db_test"
+
+    # ( person_type, person_last_name, person_first_name ) for keyset rows -
+    #     repeats, so ID has to break ties, and NULLs in the order columns.
+    TEST_KEYSET_ROW_LIST = [
+        ( "author", "Doe", "Jane" ),
+        ( "author", "Doe", "Jane" ),
+        ( "author", "Doe", None ),
+        ( "author", None, None ),
+        ( "author", None, None ),
+        ( "subject", "Adams", "Amy" ),
+        ( "subject", "Adams", "Amy" ),
+        ( "subject", "Adams", "Amy" ),
+        ( None, "Zed", "Zoe" ),
+        ( None, None, None ),
+        ( None, None, None ),
+        ( "author", "Doe", "Jane" ),
+    ]
+
+
+    # coder values for disagreement rows - one dict per row, field name suffix
+    #     to list of values for coders 1 through N (coders past the end of the
+    #     list are left empty).  Covers NULL vs. value, NULL vs. NULL, and
+    #     disagreements only in optional fields.
+    TEST_DISAGREE_ROW_LIST = [
+        # all agree.
+        { "detected" : [ 1, 1, 1 ], "person_id" : [ 5, 5, 5 ], "person_type" : [ "subject", "subject", "subject" ], "first_quote_graf" : [ 2, 2, 2 ] },
+        # coder 2 differs on person.
+        { "detected" : [ 1, 1, 1 ], "person_id" : [ 5, 6, 5 ], "person_type" : [ "subject", "subject", "subject" ] },
+        # coder 3 NULL person, others agree.
+        { "detected" : [ 1, 1, 1 ], "person_id" : [ 5, 5, None ], "person_type" : [ "subject", "subject", "subject" ] },
+        # coder 1 NULL, coders 2 and 3 differ from each other.
+        { "detected" : [ 1, 1, 1 ], "person_id" : [ None, 5, 6 ], "person_type" : [ "subject", "subject", "subject" ] },
+        # NULL vs. NULL only.
+        { "detected" : [ 1, 1, 1 ], "person_id" : [ None, None, None ], "person_type" : [ "subject", "subject", "subject" ] },
+        # only first quote graf differs (optional).
+        { "detected" : [ 1, 1, 1 ], "person_id" : [ 5, 5, 5 ], "person_type" : [ "subject", "subject", "subject" ], "first_quote_graf" : [ 2, 3, 2 ] },
+        # only first quote graf differs, NULL vs. value.
+        { "detected" : [ 1, 1, 1 ], "person_id" : [ 5, 5, 5 ], "person_type" : [ "subject", "subject", "subject" ], "first_quote_graf" : [ 2, 2, None ] },
+        # only organization hash differs (optional).
+        { "detected" : [ 1, 1, 1 ], "person_id" : [ 5, 5, 5 ], "person_type" : [ "subject", "subject", "subject" ], "organization_hash" : [ "abc", "abc", "def" ] },
+        # four coders, coder 4 differs on type.
+        { "detected" : [ 1, 1, 1, 1 ], "person_id" : [ 5, 5, 5, 5 ], "person_type" : [ "subject", "subject", "subject", "author" ] },
+    ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def make_disagree_rows( self, label_IN, save_IN = True ):
+
+        """
+        Accepts label and flag for whether to save() each row (computes stored
+            flags) or bulk_create() them (flags not computed).  Creates a
+            Reliability_Names row for each item in TEST_DISAGREE_ROW_LIST.
+            Returns list of the rows.
+        """
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        row_info = None
+        test_instance = None
+        field_name_suffix = ""
+        value_list = None
+        coder_index = -1
+        field_value = None
+
+        for row_info in self.TEST_DISAGREE_ROW_LIST:
+
+            test_instance = Reliability_Names( label = label_IN, person_type = "subject", person_name = "same name" )
+            for field_name_suffix, value_list in six.iteritems( row_info ):
+
+                for coder_index, field_value in enumerate( value_list, 1 ):
+
+                    setattr( test_instance, Reliability_Names.build_field_name( coder_index, field_name_suffix ), field_value )
+
+                #-- END loop over coder values --#
+
+            #-- END loop over fields --#
+
+            if ( save_IN == True ):
+
+                test_instance.save()
+
+            #-- END check to see if we save --#
+
+            list_OUT.append( test_instance )
+
+        #-- END loop over rows --#
+
+        if ( save_IN == False ):
+
+            list_OUT = Reliability_Names.objects.bulk_create( list_OUT )
+
+        #-- END check to see if bulk create --#
+
+        return list_OUT
+
+    #-- END method make_disagree_rows() --#
+
+
+    def test_lookup_disagreements( self ):
+
+        # declare variables
+        me = "test_lookup_disagreements"
+        row_list = None
+        coder_count = -1
+        include_optional = None
+        flag_qs = None
+        raw_qs = None
+        flag_id_list = None
+        raw_id_list = None
+        python_id_list = None
+        error_string = ""
+
+        row_list = self.make_disagree_rows( self.TEST_LABEL )
+
+        # a row with another label, to make sure label filter works.
+        Reliability_Names.objects.create( label = "other_label", coder1_person_id = 1, coder2_person_id = 2 )
+
+        for coder_count in range( 2, 5 ):
+
+            for include_optional in [ False, True ]:
+
+                # stored flags - QuerySet.
+                flag_qs = Reliability_Names.lookup_disagreements( label_IN = self.TEST_LABEL, coder_count_IN = coder_count, include_optional_IN = include_optional, use_stored_flags_IN = True )
+                self.assertIsInstance( flag_qs, QuerySet )
+                flag_id_list = sorted( [ instance.id for instance in flag_qs ] )
+
+                # raw SQL - RawQuerySet.
+                raw_qs = Reliability_Names.lookup_disagreements( label_IN = self.TEST_LABEL, coder_count_IN = coder_count, include_optional_IN = include_optional )
+                self.assertNotIsInstance( raw_qs, QuerySet )
+                raw_id_list = sorted( [ instance.id for instance in raw_qs ] )
+
+                # python, from stored flags.
+                python_id_list = sorted( [ instance.id for instance in row_list if ( instance.has_disagreement( coder_count, include_optional_IN = include_optional, use_stored_flags_IN = True ) == True ) ] )
+
+                error_string = "In " + me + "(): coder count " + str( coder_count ) + "; optional? " + str( include_optional ) + " - flags: " + str( flag_id_list ) + "; raw: " + str( raw_id_list ) + "; python: " + str( python_id_list )
+                self.assertEqual( flag_id_list, raw_id_list, msg = error_string )
+                self.assertEqual( raw_id_list, python_id_list, msg = error_string )
+
+            #-- END loop over include optional --#
+
+        #-- END loop over coder counts --#
+
+        # spot checks - as with SQL "!=", NULL never disagrees, non-NULL
+        #     coders after a NULL still compared to each other, and first
+        #     quote graf only counts when optional included.
+        flag_id_list = [ instance.id for instance in Reliability_Names.lookup_disagreements( label_IN = self.TEST_LABEL, coder_count_IN = 3, use_stored_flags_IN = True ) ]
+        self.assertIn( row_list[ 1 ].id, flag_id_list )
+        self.assertNotIn( row_list[ 2 ].id, flag_id_list )
+        self.assertIn( row_list[ 3 ].id, flag_id_list )
+        self.assertNotIn( row_list[ 4 ].id, flag_id_list )
+        self.assertNotIn( row_list[ 5 ].id, flag_id_list )
+        flag_id_list = [ instance.id for instance in Reliability_Names.lookup_disagreements( label_IN = self.TEST_LABEL, coder_count_IN = 2, use_stored_flags_IN = True ) ]
+        self.assertNotIn( row_list[ 3 ].id, flag_id_list )
+        flag_id_list = [ instance.id for instance in Reliability_Names.lookup_disagreements( label_IN = self.TEST_LABEL, coder_count_IN = 3, include_optional_IN = True, use_stored_flags_IN = True ) ]
+        self.assertIn( row_list[ 5 ].id, flag_id_list )
+        self.assertNotIn( row_list[ 6 ].id, flag_id_list )
+        self.assertIn( row_list[ 7 ].id, flag_id_list )
+        self.assertNotIn( row_list[ 8 ].id, flag_id_list )
+
+    #-- END test method test_lookup_disagreements() --#
+
+
+    def test_backfill_command( self ):
+
+        # declare variables
+        me = "test_backfill_command"
+        row_list = None
+        output_buffer = None
+        test_instance = None
+        expected_instance = None
+        field_name = ""
+        error_string = ""
+
+        # rows with no flags, plus a row in another label.
+        row_list = self.make_disagree_rows( self.TEST_LABEL, save_IN = False )
+        Reliability_Names.objects.bulk_create( [ Reliability_Names( label = "other_label", coder1_person_id = 1, coder2_person_id = 2 ) ] )
+        self.assertEqual( Reliability_Names.objects.filter( label = self.TEST_LABEL, disagree_coder_count__isnull = True ).count(), len( row_list ) )
+
+        # not computed - stored flag lookup falls back to raw SQL.
+        self.assertNotIsInstance( Reliability_Names.lookup_disagreements( label_IN = self.TEST_LABEL, use_stored_flags_IN = True ), QuerySet )
+
+        # backfill the label.
+        output_buffer = six.StringIO()
+        call_command( "backfill_reliability_names_disagreement", "--label", self.TEST_LABEL, "--batch-size", "4", stdout = output_buffer )
+        self.assertIn( "Updated disagreement flags for " + str( len( row_list ) ) + " Reliability_Names rows", output_buffer.getvalue() )
+
+        # flags match what save() computes.
+        for test_instance in Reliability_Names.objects.filter( label = self.TEST_LABEL ):
+
+            expected_instance = Reliability_Names.objects.get( id = test_instance.id )
+            expected_instance.update_disagreement_flags()
+            for field_name in Reliability_Names.get_disagree_field_name_list():
+
+                error_string = "In " + me + "(): row " + str( test_instance.id ) + ", " + field_name + " = " + str( getattr( test_instance, field_name ) ) + "; should = " + str( getattr( expected_instance, field_name ) )
+                self.assertEqual( getattr( test_instance, field_name ), getattr( expected_instance, field_name ), msg = error_string )
+
+            #-- END loop over flag fields --#
+
+        #-- END loop over backfilled rows --#
+
+        # other label not touched, and stored flag lookup now a QuerySet.
+        self.assertIsNone( Reliability_Names.objects.get( label = "other_label" ).disagree_coder_count )
+        self.assertIsInstance( Reliability_Names.lookup_disagreements( label_IN = self.TEST_LABEL, use_stored_flags_IN = True ), QuerySet )
+
+        # only uncomputed - nothing left for this label, just the other one.
+        output_buffer = six.StringIO()
+        call_command( "backfill_reliability_names_disagreement", "--only-uncomputed", stdout = output_buffer )
+        self.assertIn( "Updated disagreement flags for 1 Reliability_Names rows", output_buffer.getvalue() )
+        self.assertIsNotNone( Reliability_Names.objects.get( label = "other_label" ).disagree_coder_count )
+
+    #-- END test method test_backfill_command() --#
+
+
+    def test_get_keyset_page( self ):
+
+        # declare variables
+        me = "test_get_keyset_page"
+        person_type = None
+        last_name = None
+        first_name = None
+        test_qs = None
+        expected_id_list = None
+        page_size = -1
+        seen_id_list = None
+        page_count = -1
+        after_key = None
+        page_list = None
+        error_string = ""
+
+        for person_type, last_name, first_name in self.TEST_KEYSET_ROW_LIST:
+
+            Reliability_Names.objects.create( label = self.TEST_LABEL, person_type = person_type, person_last_name = last_name, person_first_name = first_name, person_name = "same name" )
+
+        #-- END loop over rows to create --#
+
+        # all rows, in keyset order, in one query.
+        test_qs = Reliability_Names.objects.filter( label = self.TEST_LABEL )
+        expected_id_list = [ instance.id for instance in Reliability_Names.get_keyset_page( test_qs, page_size_IN = 1000 )[ 0 ] ]
+        self.assertEqual( len( expected_id_list ), len( self.TEST_KEYSET_ROW_LIST ) )
+
+        # walk pages of several sizes - nothing skipped or repeated.
+        for page_size in [ 1, 2, 3, 5 ]:
+
+            seen_id_list = []
+            page_count = 0
+            after_key = None
+            while ( ( page_count == 0 ) or ( after_key is not None ) ):
+
+                page_list, after_key = Reliability_Names.get_keyset_page( test_qs, page_size_IN = page_size, after_key_IN = after_key )
+                self.assertLessEqual( len( page_list ), page_size )
+                seen_id_list.extend( [ instance.id for instance in page_list ] )
+                page_count += 1
+
+                # don't loop forever if the key stops moving.
+                self.assertLessEqual( page_count, len( self.TEST_KEYSET_ROW_LIST ) + 1 )
+
+            #-- END loop over pages --#
+
+            error_string = "In " + me + "(): page size " + str( page_size ) + " - got " + str( seen_id_list ) + ", should be " + str( expected_id_list )
+            self.assertEqual( seen_id_list, expected_id_list, msg = error_string )
+
+        #-- END loop over page sizes --#
+
+    #-- END test method test_get_keyset_page() --#
+
+
+#-- END test class Reliability_NamesDBTest --#
+
+
+class Reliability_Names_Coder_DataDBTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # label for test rows.
+    TEST_LABEL = "coder_data_test"
+
+    # number of coders.
+    TEST_CODER_COUNT = 3
+
+    # coder fields set on each row, in the order of the values below.
+    TEST_FIELD_SUFFIX_LIST = [ "detected", "person_id", "person_type_int", "first_quote_graf", "first_quote_index", "organization_hash" ]
+
+    # ( person_type, then per coder, values for TEST_FIELD_SUFFIX_LIST or None
+    #     if coder has no data for the row ).
+    TEST_ROW_LIST = [
+        ( "author", ( 1, 10, 1, None, None, "abc" ), ( 1, 10, 1, None, None, "abc" ), ( 1, 11, 1, None, None, "abd" ) ),
+        ( "subject", ( 1, 20, 2, 1, 15, "fff" ), ( 0, 0, 0, None, None, None ), ( 1, 20, 3, 2, 30, "fff" ) ),
+        ( "subject", ( 1, 21, 2, 4, 100, None ), ( 1, 21, 2, 4, 100, None ), None ),
+        ( "subject", ( 0, None, 0, None, None, None ), ( 1, 22, 3, 5, 7, "0a" ), ( 1, 22, 3, 5, 7, "0a" ) ),
+    ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Creates a User for each coder, and an Article for the
+            rows.
+        """
+
+        self.coder_list = [ User.objects.create( username = "coder_data_coder_" + str( coder_index ) ) for coder_index in range( 1, self.TEST_CODER_COUNT + 1 ) ]
+        self.article = Article.objects.create( headline = "coder data test" )
+
+    #-- END function setUp() --#
+
+
+    def make_rows( self ):
+
+        """
+        Creates and save()s a Reliability_Names row for each item in
+            TEST_ROW_LIST.  Returns list of the rows.
+        """
+
+        # return reference
+        list_OUT = []
+
+        # declare variables
+        row_info = None
+        test_instance = None
+        coder_index = -1
+        value_list = None
+        field_name_suffix = ""
+        field_value = None
+
+        for row_info in self.TEST_ROW_LIST:
+
+            test_instance = Reliability_Names( label = self.TEST_LABEL, article = self.article, person_type = row_info[ 0 ] )
+            for coder_index, value_list in enumerate( row_info[ 1 : ], 1 ):
+
+                if ( value_list is not None ):
+
+                    setattr( test_instance, Reliability_Names.build_field_name( coder_index, Reliability_Names.FIELD_NAME_SUFFIX_CODER ), self.coder_list[ coder_index - 1 ] )
+                    setattr( test_instance, Reliability_Names.build_field_name( coder_index, Reliability_Names.FIELD_NAME_SUFFIX_CODER_ID ), self.coder_list[ coder_index - 1 ].id )
+                    for field_name_suffix, field_value in zip( self.TEST_FIELD_SUFFIX_LIST, value_list ):
+
+                        setattr( test_instance, Reliability_Names.build_field_name( coder_index, field_name_suffix ), field_value )
+
+                    #-- END loop over fields --#
+
+                #-- END check to see if coder has data --#
+
+            #-- END loop over coders --#
+
+            test_instance.save()
+            list_OUT.append( test_instance )
+
+        #-- END loop over rows --#
+
+        # coder data, in bulk, as the builder writes it.
+        Reliability_Names_Coder_Data.create_for_reliability_names_list( list_OUT )
+
+        return list_OUT
+
+    #-- END method make_rows() --#
+
+
+    def get_coder_data_value( self, reliability_names_IN, coder_index_IN, field_name_IN ):
+
+        """
+        Accepts Reliability_Names instance, coder index, and
+            Reliability_Names_Coder_Data field name.  Returns value of the
+            field in the row's coder data for the index.
+        """
+
+        # return reference
+        value_OUT = None
+
+        value_OUT = Reliability_Names_Coder_Data.objects.get( reliability_names = reliability_names_IN, coder_index = coder_index_IN ).__dict__[ field_name_IN ]
+
+        return value_OUT
+
+    #-- END method get_coder_data_value() --#
+
+
+    def test_coder_data_sync( self ):
+
+        # declare variables
+        me = "test_coder_data_sync"
+        row_list = None
+        test_instance = None
+        merge_from_instance = None
+        new_label = ""
+        error_string = ""
+
+        # one row per coder with data.
+        row_list = self.make_rows()
+        self.assertEqual( Reliability_Names_Coder_Data.objects.filter( label = self.TEST_LABEL ).count(), 11 )
+        self.assertEqual( Reliability_Names_Coder_Data.objects.filter( reliability_names = row_list[ 2 ] ).count(), 2 )
+
+        # save() just saves the row - no coder data statements.
+        test_instance = row_list[ 0 ]
+        test_instance.coder2_person_id = 99
+        error_string = "In " + me + "(): save() should not write coder data."
+        with self.assertNumQueries( 1, msg = error_string ):
+
+            test_instance.save()
+
+        #-- END with assertNumQueries() --#
+        self.assertEqual( self.get_coder_data_value( test_instance, 2, "person_id" ), 10, msg = error_string )
+
+        # rebuild - delete and re-insert are atomic, so a failed insert
+        #     leaves the old coder data in place.
+        with mock.patch.object( Reliability_Names_Coder_Data.objects, "bulk_create", side_effect = RuntimeError( "insert failed" ) ):
+
+            with self.assertRaises( RuntimeError ):
+
+                Reliability_Names_Coder_Data.create_for_reliability_names_list( [ test_instance ] )
+
+            #-- END with assertRaises() --#
+
+        #-- END with patched bulk_create() --#
+        error_string = "In " + me + "(): failed rebuild should not delete coder data."
+        self.assertEqual( Reliability_Names_Coder_Data.objects.filter( reliability_names = test_instance ).count(), 3, msg = error_string )
+        Reliability_Names_Coder_Data.create_for_reliability_names_list( [ test_instance ] )
+        self.assertEqual( self.get_coder_data_value( test_instance, 2, "person_id" ), 99 )
+
+        # merge_records() - INTO's coder data gets FROM's coder 3.
+        merge_from_instance = Reliability_Names.objects.create( label = self.TEST_LABEL, person_type = "subject", coder3_detected = 1, coder3_person_id = 23 )
+        test_instance = row_list[ 2 ]
+        Reliability_Names.merge_records( merge_from_instance.id, test_instance.id, delete_from_record_IN = True )
+        error_string = "In " + me + "(): merge_records() did not update INTO's coder data."
+        self.assertEqual( self.get_coder_data_value( test_instance, 3, "person_id" ), 23, msg = error_string )
+        self.assertEqual( Reliability_Names_Coder_Data.objects.filter( reliability_names = test_instance ).count(), 3, msg = error_string )
+
+        # update_reliabilty_names_for_article() - label change.
+        new_label = self.TEST_LABEL + "_2"
+        Reliability_Names.update_reliabilty_names_for_article( self.article.id, filter_label_IN = self.TEST_LABEL, new_label_IN = new_label )
+        error_string = "In " + me + "(): update_reliabilty_names_for_article() did not update coder data label."
+        self.assertEqual( set( Reliability_Names_Coder_Data.objects.filter( reliability_names__in = row_list ).values_list( "label", flat = True ) ), set( [ new_label ] ), msg = error_string )
+
+    #-- END test method test_coder_data_sync() --#
+
+
+    def test_load_value_array( self ):
+
+        # declare variables
+        me = "test_load_value_array"
+        row_list = None
+        id_array = None
+        coder_index_array = None
+        value_array = None
+        row_position = -1
+        row_info = None
+        coder_index = -1
+        value_list = None
+        expected_value = None
+
+        row_list = self.make_rows()
+
+        # all coders, numeric fields.
+        id_array, coder_index_array, value_array = Reliability_Names_Coder_Data.load_value_array( self.TEST_LABEL, [ "detected", "person_id", "first_quote_graf" ] )
+        self.assertEqual( id_array.tolist(), [ test_instance.id for test_instance in row_list ] )
+        self.assertEqual( coder_index_array.tolist(), [ 1, 2, 3 ] )
+        self.assertEqual( value_array.shape, ( len( row_list ), 3, 3 ) )
+        self.assertEqual( value_array.dtype, numpy.float64 )
+        for row_position, row_info in enumerate( self.TEST_ROW_LIST ):
+
+            for coder_index, value_list in enumerate( row_info[ 1 : ], 1 ):
+
+                # missing coder or None value - nan.
+                for field_position, source_position in enumerate( [ 0, 1, 3 ] ):
+
+                    expected_value = None if ( value_list is None ) else value_list[ source_position ]
+                    if ( expected_value is None ):
+
+                        self.assertTrue( numpy.isnan( value_array[ row_position, coder_index - 1, field_position ] ), msg = "In " + me + "(): row " + str( row_position ) + ", coder " + str( coder_index ) + " should be nan." )
+
+                    else:
+
+                        self.assertEqual( value_array[ row_position, coder_index - 1, field_position ], expected_value )
+
+                    #-- END check to see if missing --#
+
+                #-- END loop over fields --#
+
+            #-- END loop over coders --#
+
+        #-- END loop over rows --#
+
+        # one pair, string field.
+        id_array, coder_index_array, value_array = Reliability_Names_Coder_Data.load_value_array( self.TEST_LABEL, [ "organization_hash" ], coder_index_list_IN = [ 3, 1 ], dtype_IN = object )
+        self.assertEqual( coder_index_array.tolist(), [ 1, 3 ] )
+        self.assertEqual( id_array.tolist(), [ test_instance.id for test_instance in row_list ] )
+        self.assertEqual( value_array[ :, :, 0 ].tolist(), [ [ "abc", "abd" ], [ "fff", "fff" ], [ None, None ], [ None, "0a" ] ] )
+
+        # unknown label - empty.
+        id_array, coder_index_array, value_array = Reliability_Names_Coder_Data.load_value_array( "no_such_label", [ "detected" ] )
+        self.assertEqual( len( id_array ), 0 )
+        self.assertEqual( value_array.shape, ( 0, 0, 1 ) )
+
+    #-- END test method test_load_value_array() --#
+
+
+    def test_load_coder_data_df( self ):
+
+        # declare variables
+        me = "test_load_coder_data_df"
+        row_list = None
+        my_analyzer = None
+        reliability_names_df = None
+        coder_data_df = None
+        coder_index = -1
+        column_name = ""
+        expected_list = None
+        error_string = ""
+
+        row_list = self.make_rows()
+
+        # data frame from coderN_* columns - through this test's connection.
+        my_analyzer = ReliabilityNamesAnalyzer()
+        connection.ensure_connection()
+        with mock.patch.object( my_analyzer, "get_pandas_db_engine", return_value = connection.connection ):
+
+            reliability_names_df = my_analyzer.load_reliability_names_df( self.TEST_LABEL, self.TEST_CODER_COUNT )
+
+        #-- END with patched engine --#
+
+        # data frame from coder data.
+        coder_data_df = my_analyzer.load_coder_data_df( self.TEST_LABEL, self.TEST_CODER_COUNT )
+
+        self.assertEqual( len( reliability_names_df ), len( row_list ) )
+        pandas.testing.assert_frame_equal( coder_data_df, reliability_names_df )
+
+        # coder IDs stay integers, even for coder 3, who is missing a row.
+        for coder_index in range( 1, self.TEST_CODER_COUNT + 1 ):
+
+            column_name = Reliability_Names.build_field_name( coder_index, Reliability_Names.FIELD_NAME_SUFFIX_CODER_ID )
+            error_string = "In " + me + "(): " + column_name + " dtype = " + str( reliability_names_df[ column_name ].dtype )
+            self.assertEqual( str( reliability_names_df[ column_name ].dtype ), ReliabilityNamesAnalyzer.DTYPE_CODER_ID, msg = error_string )
+            expected_list = [ None if ( row_info[ coder_index ] is None ) else self.coder_list[ coder_index - 1 ].id for row_info in self.TEST_ROW_LIST ]
+            self.assertEqual( [ None if ( pandas.isna( coder_id ) == True ) else coder_id for coder_id in reliability_names_df[ column_name ].tolist() ], expected_list, msg = error_string )
+
+        #-- END loop over coder indices --#
+
+        # same through load_reliability_names_df() with use_coder_data.
+        my_analyzer.use_coder_data = True
+        pandas.testing.assert_frame_equal( my_analyzer.load_reliability_names_df( self.TEST_LABEL, self.TEST_CODER_COUNT ), reliability_names_df )
+
+    #-- END test method test_load_coder_data_df() --#
+
+
+#-- END test class Reliability_Names_Coder_DataDBTest --#
+
+
+class Reliability_Names_BulkDBTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # label for test rows and audit rows.
+    TEST_LABEL = "bulk_test"
+
+    # number of coders (one Article_Data, quoting the same person, per coder).
+    TEST_CODER_COUNT = 2
+
+    # query counts - same no matter how many rows (checked with different
+    #     numbers of rows).
+    TEST_DELETE_QUERY_COUNT = 13
+    TEST_MERGE_QUERY_COUNT = 20
+    TEST_ADD_TAGS_QUERY_COUNT = 12
+    TEST_REMOVE_TAGS_QUERY_COUNT = 9
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Creates a User for each coder, a person, an article, and
+            for each coder an Article_Data with an Article_Subject quoting the
+            person.
+        """
+
+        # declare variables
+        coder_index = -1
+        current_coder = None
+        article_data = None
+
+        # load content type into cache, so first call's query count matches.
+        ContentType.objects.get_for_model( Reliability_Names )
+
+        self.coder_list = [ User.objects.create( username = "bulk_coder_" + str( coder_index ) ) for coder_index in range( 1, self.TEST_CODER_COUNT + 1 ) ]
+        self.person = Person.objects.create( first_name = "Bulk", last_name = "Person" )
+        self.article = Article.objects.create( headline = "bulk test" )
+        self.article_data_list = []
+        self.article_subject_list = []
+        for current_coder in self.coder_list:
+
+            article_data = Article_Data.objects.create( article = self.article, coder = current_coder )
+            self.article_data_list.append( article_data )
+            self.article_subject_list.append( Article_Subject.objects.create( article_data = article_data, person = self.person, subject_type = Reliability_Names.SUBJECT_TYPE_QUOTED ) )
+
+        #-- END loop over coders --#
+
+    #-- END function setUp() --#
+
+
+    def make_row( self, coder_index_list_IN ):
+
+        """
+        Accepts list of coder indices (1 through TEST_CODER_COUNT).  Creates
+            and save()s a Reliability_Names row for the person with data for
+            each of those coders.  Returns the row.
+        """
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        coder_index = -1
+        field_name_suffix = ""
+        field_value = None
+
+        instance_OUT = Reliability_Names( label = self.TEST_LABEL, article = self.article, person = self.person, person_name = "Bulk Person", person_type = "subject" )
+        for coder_index in coder_index_list_IN:
+
+            for field_name_suffix, field_value in (
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_CODER, self.coder_list[ coder_index - 1 ] ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_CODER_ID, self.coder_list[ coder_index - 1 ].id ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_DETECTED, 1 ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_PERSON_ID, self.person.id ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE, Reliability_Names.SUBJECT_TYPE_QUOTED ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID, self.article_data_list[ coder_index - 1 ].id ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_PERSON_ID, self.article_subject_list[ coder_index - 1 ].id ) ):
+
+                setattr( instance_OUT, Reliability_Names.build_field_name( coder_index, field_name_suffix ), field_value )
+
+            #-- END loop over fields --#
+
+        #-- END loop over coders --#
+
+        instance_OUT.save()
+
+        return instance_OUT
+
+    #-- END method make_row() --#
+
+
+    def get_article_data_id_set( self, coder_index_list_IN ):
+
+        """
+        Accepts list of coder indices.  Returns set of the IDs of those
+            coders' Article_Data.
+        """
+
+        # return reference
+        set_OUT = None
+
+        set_OUT = set( [ self.article_data_list[ coder_index - 1 ].id for coder_index in coder_index_list_IN ] )
+
+        return set_OUT
+
+    #-- END method get_article_data_id_set() --#
+
+
+    def test_bulk_delete_records( self ):
+
+        # declare variables
+        me = "test_bulk_delete_records"
+        row_list = None
+        missing_id = -1
+        status = None
+        eval_qs = None
+        reliability_names_instance = None
+        eval_instance = None
+        error_string = ""
+
+        row_list = [ self.make_row( [ 1, 2 ] ), self.make_row( [ 1 ] ), self.make_row( [ 2 ] ) ]
+        missing_id = row_list[ -1 ].id + 100
+
+        # delete 1 row, then 2 rows and a missing ID - same number of queries.
+        with self.assertNumQueries( self.TEST_DELETE_QUERY_COUNT ):
+
+            status = Reliability_Names.bulk_delete_records( [ row_list[ 0 ].id ], label_IN = self.TEST_LABEL )
+
+        #-- END with query count check --#
+
+        self.assertEqual( status.get_status_code(), StatusContainer.STATUS_CODE_SUCCESS )
+        self.assertEqual( len( status.get_message_list() ), 1 )
+
+        with self.assertNumQueries( self.TEST_DELETE_QUERY_COUNT ):
+
+            status = Reliability_Names.bulk_delete_records( [ row_list[ 1 ].id, missing_id, row_list[ 2 ].id ], label_IN = self.TEST_LABEL )
+
+        #-- END with query count check --#
+
+        self.assertEqual( status.get_status_code(), StatusContainer.STATUS_CODE_SUCCESS )
+        self.assertEqual( len( status.get_message_list() ), 2 )
+
+        # rows and their coder data gone.
+        error_string = "In " + me + "(): Reliability_Names rows not deleted."
+        self.assertEqual( Reliability_Names.objects.filter( pk__in = [ reliability_names_instance.id for reliability_names_instance in row_list ] ).count(), 0, msg = error_string )
+        self.assertEqual( Reliability_Names_Coder_Data.objects.count(), 0 )
+
+        # one audit row per deleted row.
+        eval_qs = Reliability_Names_Eval.objects.filter( event_type = Reliability_Names_Eval.EVENT_TYPE_DELETE )
+        self.assertEqual( eval_qs.count(), len( row_list ) )
+        for reliability_names_instance, coder_index_list in zip( row_list, ( [ 1, 2 ], [ 1 ], [ 2 ] ) ):
+
+            eval_instance = eval_qs.get( original_reliability_names_id = reliability_names_instance.id )
+            error_string = "In " + me + "(): audit row for Reliability_Names " + str( reliability_names_instance.id ) + " is wrong."
+            self.assertEqual( eval_instance.is_deleted, True, msg = error_string )
+            self.assertEqual( eval_instance.reliability_names_id, None, msg = error_string )
+            self.assertEqual( eval_instance.label, self.TEST_LABEL, msg = error_string )
+            self.assertEqual( eval_instance.article_id, self.article.id, msg = error_string )
+            self.assertEqual( eval_instance.notes, "Deleting Reliability_Names row with ID " + str( reliability_names_instance.id ), msg = error_string )
+            self.assertEqual( set( eval_instance.article_datas.values_list( "id", flat = True ) ), self.get_article_data_id_set( coder_index_list ), msg = error_string )
+            self.assertEqual( set( eval_instance.persons.values_list( "id", flat = True ) ), set( [ self.person.id ] ), msg = error_string )
+
+        #-- END loop over deleted rows --#
+
+    #-- END test method test_bulk_delete_records() --#
+
+
+    def test_bulk_merge_records( self ):
+
+        # declare variables
+        me = "test_bulk_merge_records"
+        from_row_list = None
+        into_row_list = None
+        row_index = -1
+        missing_id = -1
+        status = None
+        into_instance = None
+        from_instance = None
+        eval_instance = None
+        error_string = ""
+
+        # FROMs have coder 2's data, INTOs coder 1's.
+        from_row_list = [ self.make_row( [ 2 ] ) for row_index in range( 3 ) ]
+        into_row_list = [ self.make_row( [ 1 ] ) for row_index in range( 3 ) ]
+        missing_id = into_row_list[ -1 ].id + 100
+
+        # merge 1 pair, then 2 pairs and a pair with a missing ID - same
+        #     number of queries.
+        with self.assertNumQueries( self.TEST_MERGE_QUERY_COUNT ):
+
+            status = Reliability_Names.bulk_merge_records( [ ( from_row_list[ 0 ].id, into_row_list[ 0 ].id ) ], delete_from_record_IN = True, label_IN = self.TEST_LABEL )
+
+        #-- END with query count check --#
+
+        self.assertEqual( status.get_status_code(), StatusContainer.STATUS_CODE_SUCCESS )
+
+        with self.assertNumQueries( self.TEST_MERGE_QUERY_COUNT ):
+
+            status = Reliability_Names.bulk_merge_records( [ ( from_row_list[ 1 ].id, into_row_list[ 1 ].id ), ( missing_id, into_row_list[ 0 ].id ), ( from_row_list[ 2 ].id, into_row_list[ 2 ].id ) ], delete_from_record_IN = True, label_IN = self.TEST_LABEL )
+
+        #-- END with query count check --#
+
+        # missing ID - error, named in a message, no audit row.
+        error_string = "In " + me + "(): missing ID not reported."
+        self.assertEqual( status.get_status_code(), StatusContainer.STATUS_CODE_ERROR, msg = error_string )
+        self.assertTrue( any( [ ( ( "no record(s) with ID(s) [" + str( missing_id ) + "]" ) in message ) for message in status.get_message_list() ] ), msg = error_string )
+        self.assertEqual( Reliability_Names_Eval.objects.filter( merged_from_reliability_names_id = missing_id ).count(), 0, msg = error_string )
+
+        # FROMs deleted, INTOs have both coders.
+        self.assertEqual( Reliability_Names.objects.filter( pk__in = [ from_instance.id for from_instance in from_row_list ] ).count(), 0 )
+        for from_instance, into_instance in zip( from_row_list, into_row_list ):
+
+            into_instance.refresh_from_db()
+            error_string = "In " + me + "(): Reliability_Names " + str( from_instance.id ) + " not merged into " + str( into_instance.id ) + "."
+            self.assertEqual( into_instance.coder2_id, self.coder_list[ 1 ].id, msg = error_string )
+            self.assertEqual( into_instance.coder2_article_data_id, self.article_data_list[ 1 ].id, msg = error_string )
+            self.assertEqual( into_instance.coder2_article_person_id, self.article_subject_list[ 1 ].id, msg = error_string )
+            self.assertEqual( set( Reliability_Names_Coder_Data.objects.filter( reliability_names = into_instance ).values_list( "coder_index", flat = True ) ), set( [ 1, 2 ] ), msg = error_string )
+
+            # audit row - linked to INTO, FROM and INTO Article_Data linked.
+            eval_instance = Reliability_Names_Eval.objects.get( event_type = Reliability_Names_Eval.EVENT_TYPE_MERGE, merged_from_reliability_names_id = from_instance.id )
+            error_string = "In " + me + "(): merge audit row for Reliability_Names " + str( from_instance.id ) + " is wrong."
+            self.assertEqual( eval_instance.reliability_names_id, into_instance.id, msg = error_string )
+            self.assertEqual( eval_instance.merged_to_reliability_names_id, into_instance.id, msg = error_string )
+            self.assertEqual( eval_instance.label, self.TEST_LABEL, msg = error_string )
+            self.assertEqual( set( eval_instance.merged_from_ad.values_list( "id", flat = True ) ), self.get_article_data_id_set( [ 2 ] ), msg = error_string )
+            self.assertEqual( set( eval_instance.merged_to_ad.values_list( "id", flat = True ) ), self.get_article_data_id_set( [ 1 ] ), msg = error_string )
+            self.assertEqual( set( eval_instance.article_datas.values_list( "id", flat = True ) ), self.get_article_data_id_set( [ 1, 2 ] ), msg = error_string )
+            self.assertEqual( set( eval_instance.persons.values_list( "id", flat = True ) ), set( [ self.person.id ] ), msg = error_string )
+
+        #-- END loop over pairs --#
+
+        self.assertEqual( Reliability_Names_Eval.objects.filter( event_type = Reliability_Names_Eval.EVENT_TYPE_MERGE ).count(), len( from_row_list ) )
+
+    #-- END test method test_bulk_merge_records() --#
+
+
+    def test_bulk_update_tags( self ):
+
+        # declare variables
+        me = "test_bulk_update_tags"
+        row_list = None
+        id_list = None
+        missing_id = -1
+        eval_list = None
+        reliability_names_instance = None
+        eval_instance = None
+        error_string = ""
+
+        row_list = [ self.make_row( [ 1, 2 ] ), self.make_row( [ 1 ] ), self.make_row( [ 2 ] ) ]
+        id_list = [ reliability_names_instance.id for reliability_names_instance in row_list ]
+        missing_id = id_list[ -1 ] + 100
+        row_list[ 1 ].tags.add( "already" )
+        row_list[ 2 ].tags.add( "new" )
+
+        # add to 1 row, then to all rows plus a missing ID - same number of
+        #     queries.
+        with self.assertNumQueries( self.TEST_ADD_TAGS_QUERY_COUNT ):
+
+            eval_list = Reliability_Names.bulk_update_tags( id_list[ : 1 ], [ "already", "new" ], label_IN = self.TEST_LABEL )
+
+        #-- END with query count check --#
+
+        self.assertEqual( len( eval_list ), 1 )
+
+        with self.assertNumQueries( self.TEST_ADD_TAGS_QUERY_COUNT ):
+
+            eval_list = Reliability_Names.bulk_update_tags( id_list + [ missing_id ], [ "already", "new" ], label_IN = self.TEST_LABEL )
+
+        #-- END with query count check --#
+
+        self.assertEqual( [ eval_instance.original_reliability_names_id for eval_instance in eval_list ], id_list )
+        for reliability_names_instance in row_list:
+
+            error_string = "In " + me + "(): tags for Reliability_Names " + str( reliability_names_instance.id ) + " not added."
+            self.assertEqual( set( reliability_names_instance.tags.names() ), set( [ "already", "new" ] ), msg = error_string )
+
+        #-- END loop over rows --#
+
+        # audit rows - one per row per call, linked to row, Article_Data, and
+        #     person.
+        for eval_instance, coder_index_list in zip( eval_list, ( [ 1, 2 ], [ 1 ], [ 2 ] ) ):
+
+            eval_instance.refresh_from_db()
+            error_string = "In " + me + "(): add tags audit row " + str( eval_instance.id ) + " is wrong."
+            self.assertEqual( eval_instance.event_type, Reliability_Names_Eval.EVENT_TYPE_ADD_TAGS, msg = error_string )
+            self.assertEqual( eval_instance.reliability_names_id, eval_instance.original_reliability_names_id, msg = error_string )
+            self.assertEqual( eval_instance.label, self.TEST_LABEL, msg = error_string )
+            self.assertEqual( eval_instance.notes, "Added tag(s): already, new", msg = error_string )
+            self.assertEqual( set( eval_instance.article_datas.values_list( "id", flat = True ) ), self.get_article_data_id_set( coder_index_list ), msg = error_string )
+            self.assertEqual( set( eval_instance.persons.values_list( "id", flat = True ) ), set( [ self.person.id ] ), msg = error_string )
+
+        #-- END loop over audit rows --#
+
+        self.assertEqual( Reliability_Names_Eval.objects.filter( event_type = Reliability_Names_Eval.EVENT_TYPE_ADD_TAGS ).count(), len( row_list ) + 1 )
+
+        # remove from 1 row, then from the rest - same number of queries.
+        with self.assertNumQueries( self.TEST_REMOVE_TAGS_QUERY_COUNT ):
+
+            eval_list = Reliability_Names.bulk_update_tags( id_list[ : 1 ], [ "already" ], do_remove_IN = True, label_IN = self.TEST_LABEL )
+
+        #-- END with query count check --#
+
+        with self.assertNumQueries( self.TEST_REMOVE_TAGS_QUERY_COUNT ):
+
+            eval_list = Reliability_Names.bulk_update_tags( id_list[ 1 : ] + [ missing_id ], [ "already" ], do_remove_IN = True, label_IN = self.TEST_LABEL )
+
+        #-- END with query count check --#
+
+        self.assertEqual( len( eval_list ), len( row_list ) - 1 )
+        for reliability_names_instance in row_list:
+
+            error_string = "In " + me + "(): tag for Reliability_Names " + str( reliability_names_instance.id ) + " not removed."
+            self.assertEqual( list( reliability_names_instance.tags.names() ), [ "new" ], msg = error_string )
+
+        #-- END loop over rows --#
+
+        eval_instance = Reliability_Names_Eval.objects.filter( event_type = Reliability_Names_Eval.EVENT_TYPE_REMOVE_TAGS ).order_by( "-id" ).first()
+        self.assertEqual( eval_instance.notes, "Removed tag(s): already" )
+        self.assertEqual( Reliability_Names_Eval.objects.filter( event_type = Reliability_Names_Eval.EVENT_TYPE_REMOVE_TAGS ).count(), len( row_list ) )
+
+    #-- END test method test_bulk_update_tags() --#
+
+
+#-- END test class Reliability_Names_BulkDBTest --#
@@ -0,0 +1,259 @@
+"""
+This file contains tests of the context_analysis Reliability_Names_Eval model's
+    string rendering - instances are not saved, so no database is needed - and
+    of creating audit rows from Reliability_Names rows made in the test.
+
+Functions tested:
+- Reliability_Names_Eval.create_from_reliability_names()
+- Reliability_Names_Eval.render_summary_string()
+- Reliability_Names_Eval.get_cached_render_string()
+- Reliability_Names_Eval.set_cached_render_string()
+- Reliability_Names_Eval.clear_render_cache()
+"""
+
+# django imports
+from django.contrib.auth.models import User
+import django.test
+
+# context_text imports
+from context_text.models import Article
+from context_text.models import Article_Data
+from context_text.models import Article_Subject
+from context_text.models import Person
+
+# context_analysis imports
+from context_analysis.models import Reliability_Names
+from context_analysis.models import Reliability_Names_Eval
+
+
+class Reliability_Names_EvalTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # Article_Data ID to coder ID for the test row's two coders.
+    TEST_ARTICLE_DATA_TO_CODER_MAP = { 101 : 5, 102 : 6 }
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def tearDown( self ):
+
+        # don't leave anything in the shared cache.
+        Reliability_Names_Eval.clear_render_cache()
+
+    #-- END method tearDown() --#
+
+
+    def test_render_cache( self ):
+
+        # declare variables
+        me = "test_render_cache"
+        original_max_size = -1
+
+        original_max_size = Reliability_Names_Eval.render_cache_max_size
+        Reliability_Names_Eval.render_cache_max_size = 2
+        try:
+
+            # least recently used dropped first.
+            Reliability_Names_Eval.set_cached_render_string( ( 1, "a" ), "one" )
+            Reliability_Names_Eval.set_cached_render_string( ( 2, "a" ), "two" )
+            self.assertEqual( Reliability_Names_Eval.get_cached_render_string( ( 1, "a" ) ), "one" )
+            Reliability_Names_Eval.set_cached_render_string( ( 3, "a" ), "three" )
+            self.assertIsNone( Reliability_Names_Eval.get_cached_render_string( ( 2, "a" ) ), msg = "In " + me + "(): least recently used not dropped." )
+            self.assertEqual( Reliability_Names_Eval.get_cached_render_string( ( 1, "a" ) ), "one" )
+
+            # clear one row.
+            Reliability_Names_Eval.clear_render_cache( 1 )
+            self.assertIsNone( Reliability_Names_Eval.get_cached_render_string( ( 1, "a" ) ) )
+            self.assertEqual( Reliability_Names_Eval.get_cached_render_string( ( 3, "a" ) ), "three" )
+
+        finally:
+
+            Reliability_Names_Eval.render_cache_max_size = original_max_size
+
+        #-- END try-finally around max size --#
+
+    #-- END test method test_render_cache() --#
+
+
+    def test_render_summary_string( self ):
+
+        # declare variables
+        test_instance = None
+        related_map = None
+        summary_string = ""
+        should_be = ""
+
+        # row with two coders' Article_Data.
+        test_instance = Reliability_Names()
+        test_instance.id = 42
+        test_instance.article_id = 7
+        test_instance.person_name = "Jane Doe"
+        test_instance.coder1_article_data_id = 101
+        test_instance.coder2_article_data_id = 102
+
+        related_map = {}
+        related_map[ Reliability_Names_Eval.RELATED_MAP_KEY_ARTICLE_DATA ] = dict( [ ( article_data_id, Article_Data( id = article_data_id, coder_id = coder_id ) ) for article_data_id, coder_id in self.TEST_ARTICLE_DATA_TO_CODER_MAP.items() ] )
+        related_map[ Reliability_Names_Eval.RELATED_MAP_KEY_ARTICLE_AUTHOR ] = {}
+        related_map[ Reliability_Names_Eval.RELATED_MAP_KEY_ARTICLE_SUBJECT ] = {}
+
+        summary_string = Reliability_Names_Eval.render_summary_string( test_instance, related_map )
+        should_be = "| 42 | Jane Doe | Article [7](http://research.local/research/context/text/article/article_data/view_with_text/?article_id=7) | Article_Data: "
+        should_be += "[101 (coder=5)](http://research.local/research/context/text/article/article_data/view/?article_id=7&article_data_id_select=101); "
+        should_be += "[102 (coder=6)](http://research.local/research/context/text/article/article_data/view/?article_id=7&article_data_id_select=102)"
+        should_be += " | CORRECT | MISSED | None |"
+        self.assertEqual( summary_string, should_be )
+
+    #-- END test method test_render_summary_string() --#
+
+
+#-- END test class Reliability_Names_EvalTest --#
+
+
+class Reliability_Names_EvalDBTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # label for test rows and audit rows.
+    TEST_LABEL = "eval_db_test"
+
+    # number of coders (one Article_Data, quoting their own person, per coder).
+    TEST_CODER_COUNT = 3
+
+    # create_from_reliability_names() query count - same no matter how many
+    #     coders have data.
+    TEST_CREATE_QUERY_COUNT = 5
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Creates an article, and for each coder a User, a person,
+            and an Article_Data with an Article_Subject quoting the person.
+        """
+
+        # declare variables
+        coder_index = -1
+        current_coder = None
+        current_person = None
+        article_data = None
+
+        self.article = Article.objects.create( headline = "eval db test" )
+        self.coder_list = []
+        self.person_list = []
+        self.article_data_list = []
+        self.article_subject_list = []
+        for coder_index in range( 1, self.TEST_CODER_COUNT + 1 ):
+
+            current_coder = User.objects.create( username = "eval_db_coder_" + str( coder_index ) )
+            current_person = Person.objects.create( first_name = "Eval", last_name = str( coder_index ) )
+            article_data = Article_Data.objects.create( article = self.article, coder = current_coder )
+            self.coder_list.append( current_coder )
+            self.person_list.append( current_person )
+            self.article_data_list.append( article_data )
+            self.article_subject_list.append( Article_Subject.objects.create( article_data = article_data, person = current_person, subject_type = Reliability_Names.SUBJECT_TYPE_QUOTED ) )
+
+        #-- END loop over coders --#
+
+    #-- END function setUp() --#
+
+
+    def make_row( self, coder_index_list_IN ):
+
+        """
+        Accepts list of coder indices (1 through TEST_CODER_COUNT).  Creates
+            and save()s a Reliability_Names row with data for each of those
+            coders.  Returns the row.
+        """
+
+        # return reference
+        instance_OUT = None
+
+        # declare variables
+        coder_index = -1
+        list_index = -1
+        field_name_suffix = ""
+        field_value = None
+
+        instance_OUT = Reliability_Names( label = self.TEST_LABEL, article = self.article, person_name = "Eval Person", person_type = "subject" )
+        for coder_index in coder_index_list_IN:
+
+            list_index = coder_index - 1
+            for field_name_suffix, field_value in (
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_CODER, self.coder_list[ list_index ] ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_DETECTED, 1 ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_PERSON_ID, self.person_list[ list_index ].id ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE, Reliability_Names.SUBJECT_TYPE_QUOTED ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID, self.article_data_list[ list_index ].id ),
+                    ( Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_PERSON_ID, self.article_subject_list[ list_index ].id ) ):
+
+                setattr( instance_OUT, Reliability_Names.build_field_name( coder_index, field_name_suffix ), field_value )
+
+            #-- END loop over fields --#
+
+        #-- END loop over coders --#
+
+        instance_OUT.save()
+
+        return instance_OUT
+
+    #-- END method make_row() --#
+
+
+    def test_create_from_reliability_names( self ):
+
+        # declare variables
+        me = "test_create_from_reliability_names"
+        coder_index_list = None
+        reliability_names_instance = None
+        eval_instance = None
+        error_string = ""
+
+        # 1 coder, then all coders - same number of queries.
+        for coder_index_list in ( [ 2 ], list( range( 1, self.TEST_CODER_COUNT + 1 ) ) ):
+
+            reliability_names_instance = self.make_row( coder_index_list )
+            with self.assertNumQueries( self.TEST_CREATE_QUERY_COUNT ):
+
+                eval_instance = Reliability_Names_Eval.create_from_reliability_names(
+                        reliability_names_instance.id,
+                        label_IN = self.TEST_LABEL,
+                        notes_IN = "test notes",
+                        reliability_names_instance_IN = reliability_names_instance,
+                        event_type_IN = Reliability_Names_Eval.EVENT_TYPE_MERGE
+                    )
+
+            #-- END with query count check --#
+
+            eval_instance = Reliability_Names_Eval.objects.get( pk = eval_instance.id )
+            error_string = "In " + me + "(): audit row for coders " + str( coder_index_list ) + " is wrong."
+            self.assertEqual( eval_instance.reliability_names_id, reliability_names_instance.id, msg = error_string )
+            self.assertEqual( eval_instance.original_reliability_names_id, reliability_names_instance.id, msg = error_string )
+            self.assertEqual( eval_instance.article_id, self.article.id, msg = error_string )
+            self.assertEqual( eval_instance.person_name, "Eval Person", msg = error_string )
+            self.assertEqual( eval_instance.label, self.TEST_LABEL, msg = error_string )
+            self.assertEqual( eval_instance.notes, "test notes", msg = error_string )
+            self.assertEqual( eval_instance.event_type, Reliability_Names_Eval.EVENT_TYPE_MERGE, msg = error_string )
+            self.assertEqual( set( eval_instance.article_datas.values_list( "id", flat = True ) ), set( [ self.article_data_list[ coder_index - 1 ].id for coder_index in coder_index_list ] ), msg = error_string )
+            self.assertEqual( set( eval_instance.persons.values_list( "id", flat = True ) ), set( [ self.person_list[ coder_index - 1 ].id for coder_index in coder_index_list ] ), msg = error_string )
+
+        #-- END loop over coder lists --#
+
+    #-- END test method test_create_from_reliability_names() --#
+
+
+#-- END test class Reliability_Names_EvalDBTest --#
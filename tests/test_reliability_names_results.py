@@ -0,0 +1,410 @@
+"""
+This file contains tests of the context_analysis Reliability_Names_Results
+    model's results matrix - Reliability_Names_ResultsTest builds matrices by
+    hand, so no database is needed; Reliability_Names_ResultsDBTest creates
+    rows in the database.
+
+Functions tested:
+- Reliability_Names_Results.build_results_matrix_from_rows()
+- Reliability_Names_Results.build_results_row_list()
+- Reliability_Names_Results.calculate_results_sums_and_averages()
+- Reliability_Names_Results.get_results_matrix()
+- Reliability_Names_Results.get_results_stamp()
+- Reliability_Names_Results.clear_results_matrix_cache() (from
+    ReliabilityNamesAnalyzer.analyze_reliability_names())
+- views.reliability_names_results_csv()
+- views.reliability_names_results_json()
+"""
+
+# python package imports
+import csv
+import datetime
+import decimal
+import json
+from unittest import mock
+
+# stats and analysis
+import numpy
+
+# django imports
+from django.contrib.auth.models import User
+from django.db import connection
+import django.test
+from django.urls import reverse
+
+# context_analysis imports
+from context_analysis.models import Reliability_Names
+from context_analysis.models import Reliability_Names_Results
+from context_analysis.reliability.reliability_names_analyzer import ReliabilityNamesAnalyzer
+
+
+class Reliability_Names_ResultsTest( django.test.SimpleTestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # test label
+    TEST_LABEL = "test_results"
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def make_matrix_dict( self ):
+
+        """
+        Returns results matrix dictionary with two coder pairs - values are
+            column position + 1 for the first row (int for author_count,
+            Decimal for the rest), and NULL except for author_count = 4 for
+            the second.
+        """
+
+        # return reference
+        matrix_dict_OUT = None
+
+        # declare variables
+        column_count = -1
+        value_list_1 = None
+        value_list_2 = None
+        row_list = None
+
+        column_count = len( Reliability_Names_Results.METRIC_COLUMN_NAME_LIST )
+        value_list_1 = [ 1 ] + [ decimal.Decimal( column_number ) for column_number in range( 2, column_count + 1 ) ]
+        value_list_2 = [ 4 ] + ( [ None ] * ( column_count - 1 ) )
+        row_list = [ ( self.TEST_LABEL, 11, 1, 2, 5, 6 ) + tuple( value_list_1 ), ( self.TEST_LABEL, 12, 1, 3, 5, None ) + tuple( value_list_2 ) ]
+
+        matrix_dict_OUT = Reliability_Names_Results.build_results_matrix_from_rows( self.TEST_LABEL, row_list )
+        matrix_dict_OUT[ Reliability_Names_Results.RESULTS_MATRIX_KEY_STAMP ] = ( 2, None )
+
+        return matrix_dict_OUT
+
+    #-- END method make_matrix_dict() --#
+
+
+    def tearDown( self ):
+
+        # don't leave anything in the shared cache.
+        Reliability_Names_Results.clear_results_matrix_cache()
+
+    #-- END method tearDown() --#
+
+
+    def test_build_results_row_list( self ):
+
+        # declare variables
+        row_list = None
+
+        row_list = Reliability_Names_Results.build_results_row_list( self.make_matrix_dict() )
+        self.assertEqual( len( row_list ), 2 )
+        self.assertEqual( row_list[ 0 ][ "id" ], 11 )
+        self.assertEqual( row_list[ 0 ][ "coder2_id" ], 6 )
+        self.assertEqual( row_list[ 0 ][ "author_detect_percent" ], decimal.Decimal( 2 ) )
+        self.assertIsInstance( row_list[ 0 ][ "author_detect_percent" ], decimal.Decimal )
+        self.assertEqual( row_list[ 1 ][ "author_count" ], 4 )
+        self.assertIsInstance( row_list[ 1 ][ "author_count" ], int )
+        self.assertIsNone( row_list[ 1 ][ "author_detect_percent" ] )
+        self.assertIsNone( row_list[ 1 ][ "coder2_id" ] )
+
+    #-- END test method test_build_results_row_list() --#
+
+
+    def test_calculate_results_sums_and_averages( self ):
+
+        # declare variables
+        me = "test_calculate_results_sums_and_averages"
+        sum_dictionary = None
+        average_dictionary = None
+        matrix_dict = None
+
+        # NULL skipped in sum, average divides by all rows.
+        sum_dictionary, average_dictionary = Reliability_Names_Results.calculate_results_sums_and_averages( self.make_matrix_dict() )
+        self.assertEqual( sum_dictionary[ "author_count" ], decimal.Decimal( 5 ) )
+        self.assertEqual( average_dictionary[ "author_count" ], decimal.Decimal( "2.5" ) )
+        self.assertEqual( sum_dictionary[ "author_detect_percent" ], decimal.Decimal( 2 ) )
+        self.assertEqual( average_dictionary[ "author_detect_percent" ], decimal.Decimal( 1 ), msg = "In " + me + "(): average should divide by row count, not non-NULL count." )
+        self.assertIsInstance( sum_dictionary[ "author_detect_percent" ], decimal.Decimal, msg = "In " + me + "(): sums should be Decimal." )
+        self.assertIsInstance( average_dictionary[ "author_detect_percent" ], decimal.Decimal, msg = "In " + me + "(): averages should be Decimal." )
+
+        # no rows - no averages.
+        matrix_dict = Reliability_Names_Results.build_results_matrix_from_rows( self.TEST_LABEL, [] )
+        self.assertEqual( matrix_dict[ Reliability_Names_Results.RESULTS_MATRIX_KEY_VALUE_MATRIX ].shape, ( 0, len( Reliability_Names_Results.METRIC_COLUMN_NAME_LIST ) ) )
+        sum_dictionary, average_dictionary = Reliability_Names_Results.calculate_results_sums_and_averages( matrix_dict )
+        self.assertEqual( sum_dictionary[ "author_count" ], decimal.Decimal( 0 ) )
+        self.assertIsNone( average_dictionary[ "author_count" ] )
+
+    #-- END test method test_calculate_results_sums_and_averages() --#
+
+
+#-- END test class Reliability_Names_ResultsTest --#
+
+
+class Reliability_Names_ResultsDBTest( django.test.TestCase ):
+
+    #----------------------------------------------------------------------------
+    # Constants-ish
+    #----------------------------------------------------------------------------
+
+
+    # test label
+    TEST_LABEL = "test_results_db"
+
+    # analyzer run - coders, and for each Reliability_Names row its
+    #     person_type then each coder's values for TEST_ANALYZER_FIELD_LIST
+    #     (every column varies, so no alpha is NaN).
+    TEST_ANALYZER_CODER_COUNT = 2
+    TEST_ANALYZER_FIELD_LIST = [ "detected", "person_id", "person_type_int", "first_quote_graf", "first_quote_index", "organization_hash" ]
+    TEST_ANALYZER_ROW_LIST = [
+        ( "author", ( 1, 1, 1, 1, 10, "a1" ), ( 1, 1, 1, 1, 10, "a1" ) ),
+        ( "author", ( 1, 2, 2, 2, 20, "b2" ), ( 1, 3, 2, 2, 20, "b2" ) ),
+        ( "author", ( 0, 3, 3, 3, 30, "c3" ), ( 1, 3, 3, 4, 30, "c3" ) ),
+        ( "author", ( 1, 4, 1, 4, 40, "d4" ), ( 0, 4, 2, 4, 50, "e5" ) ),
+        ( "subject", ( 1, 5, 1, 1, 10, "a1" ), ( 1, 5, 1, 1, 10, "a1" ) ),
+        ( "subject", ( 1, 6, 2, 2, 20, "b2" ), ( 1, 6, 2, 3, 20, "b2" ) ),
+        ( "subject", ( 0, 7, 3, 3, 30, "c3" ), ( 1, 8, 3, 3, 30, "d4" ) ),
+        ( "subject", ( 1, 9, 1, 4, 40, "d4" ), ( 0, 9, 3, 4, 45, "d4" ) ),
+    ]
+
+
+    #----------------------------------------------------------------------------
+    # instance methods
+    #----------------------------------------------------------------------------
+
+
+    def setUp( self ):
+
+        """
+        setup tasks.  Start with an empty results matrix cache.
+        """
+
+        Reliability_Names_Results.clear_results_matrix_cache()
+
+    #-- END function setUp() --#
+
+
+    def tearDown( self ):
+
+        # don't leave anything in the shared cache.
+        Reliability_Names_Results.clear_results_matrix_cache()
+
+    #-- END method tearDown() --#
+
+
+    def make_results( self, coder2_index_IN, author_count_IN, alpha_IN ):
+
+        """
+        Accepts coder 2 index, author count, and a Decimal to use for
+            author_detect_alpha.  Creates and returns a
+            Reliability_Names_Results row for coders 1 and coder2_index_IN in
+            TEST_LABEL.
+        """
+
+        # return reference
+        instance_OUT = None
+
+        instance_OUT = Reliability_Names_Results.objects.create( label = self.TEST_LABEL,
+                                                                 coder1_coder_index = 1,
+                                                                 coder2_coder_index = coder2_index_IN,
+                                                                 author_count = author_count_IN,
+                                                                 author_detect_alpha = alpha_IN )
+
+        return instance_OUT
+
+    #-- END method make_results() --#
+
+
+    def test_get_results_matrix( self ):
+
+        # declare variables
+        me = "test_get_results_matrix"
+        matrix_dict = None
+        cached_matrix_dict = None
+        row_list = None
+        sum_dictionary = None
+        average_dictionary = None
+
+        self.make_results( 2, 12, decimal.Decimal( "0.1234567891" ) )
+        self.make_results( 3, 7, None )
+
+        # build - stamp query and values_list() query.
+        with self.assertNumQueries( 2 ):
+
+            matrix_dict = Reliability_Names_Results.get_results_matrix( self.TEST_LABEL )
+
+        #-- END with assertNumQueries() --#
+
+        # values as loaded - counts stay int, Decimals keep every digit.
+        row_list = Reliability_Names_Results.build_results_row_list( matrix_dict )
+        self.assertEqual( [ row_dict[ "coder2_coder_index" ] for row_dict in row_list ], [ 2, 3 ] )
+        self.assertEqual( row_list[ 0 ][ "author_count" ], 12 )
+        self.assertIsInstance( row_list[ 0 ][ "author_count" ], int )
+        self.assertEqual( row_list[ 0 ][ "author_detect_alpha" ], decimal.Decimal( "0.1234567891" ) )
+        self.assertIsNone( row_list[ 1 ][ "author_detect_alpha" ] )
+
+        # sums and averages are exact Decimals.
+        sum_dictionary, average_dictionary = Reliability_Names_Results.calculate_results_sums_and_averages( matrix_dict )
+        self.assertEqual( sum_dictionary[ "author_count" ], decimal.Decimal( 19 ) )
+        self.assertEqual( average_dictionary[ "author_count" ], decimal.Decimal( "9.5" ) )
+        self.assertEqual( sum_dictionary[ "author_detect_alpha" ], decimal.Decimal( "0.1234567891" ) )
+
+        # cached - just the stamp query, same dictionary.
+        with self.assertNumQueries( 1 ):
+
+            cached_matrix_dict = Reliability_Names_Results.get_results_matrix( self.TEST_LABEL )
+
+        #-- END with assertNumQueries() --#
+        self.assertIs( cached_matrix_dict, matrix_dict, msg = "In " + me + "(): cached matrix not reused." )
+
+        # not using cache - rebuilt.
+        self.assertIsNot( Reliability_Names_Results.get_results_matrix( self.TEST_LABEL, use_cache_IN = False ), matrix_dict )
+
+    #-- END test method test_get_results_matrix() --#
+
+
+    def test_get_results_stamp( self ):
+
+        # declare variables
+        me = "test_get_results_stamp"
+        results_instance = None
+        matrix_dict = None
+        stamp_1 = None
+        stamp_2 = None
+        stamp_3 = None
+
+        # empty label.
+        self.assertEqual( Reliability_Names_Results.get_results_stamp( self.TEST_LABEL ), ( 0, None ) )
+
+        # one row.
+        results_instance = self.make_results( 2, 12, None )
+        matrix_dict = Reliability_Names_Results.get_results_matrix( self.TEST_LABEL )
+        stamp_1 = Reliability_Names_Results.get_results_stamp( self.TEST_LABEL )
+        self.assertEqual( stamp_1[ 0 ], 1 )
+
+        # update changes last_modified - cached matrix replaced.
+        Reliability_Names_Results.objects.filter( id = results_instance.id ).update( author_count = 13, last_modified = stamp_1[ 1 ] + datetime.timedelta( seconds = 1 ) )
+        stamp_2 = Reliability_Names_Results.get_results_stamp( self.TEST_LABEL )
+        self.assertNotEqual( stamp_2, stamp_1, msg = "In " + me + "(): stamp not changed by update." )
+        matrix_dict = Reliability_Names_Results.get_results_matrix( self.TEST_LABEL )
+        self.assertEqual( Reliability_Names_Results.build_results_row_list( matrix_dict )[ 0 ][ "author_count" ], 13 )
+
+        # add a row - count changes.
+        self.make_results( 3, 5, None )
+        stamp_3 = Reliability_Names_Results.get_results_stamp( self.TEST_LABEL )
+        self.assertEqual( stamp_3[ 0 ], 2 )
+        self.assertIsNot( Reliability_Names_Results.get_results_matrix( self.TEST_LABEL ), matrix_dict, msg = "In " + me + "(): stale matrix returned after insert." )
+        self.assertEqual( len( Reliability_Names_Results.get_results_matrix( self.TEST_LABEL )[ Reliability_Names_Results.RESULTS_MATRIX_KEY_ROW_INFO_LIST ] ), 2 )
+
+    #-- END test method test_get_results_stamp() --#
+
+
+    def test_analyzer_clears_cache( self ):
+
+        # declare variables
+        me = "test_analyzer_clears_cache"
+        coder_list = None
+        row_info = None
+        test_instance = None
+        coder_index = -1
+        coder_value_list = None
+        field_name = ""
+        field_value = None
+        my_analyzer = None
+        matrix_dict = None
+
+        # coders and Reliability_Names rows.
+        coder_list = [ User.objects.create( username = "results_coder_" + str( coder_index ) ) for coder_index in range( 1, self.TEST_ANALYZER_CODER_COUNT + 1 ) ]
+        for row_info in self.TEST_ANALYZER_ROW_LIST:
+
+            test_instance = Reliability_Names( label = self.TEST_LABEL, person_type = row_info[ 0 ] )
+            for coder_index, coder_value_list in enumerate( row_info[ 1 : ], 1 ):
+
+                setattr( test_instance, "coder" + str( coder_index ) + "_coder_id", coder_list[ coder_index - 1 ].id )
+                for field_name, field_value in zip( self.TEST_ANALYZER_FIELD_LIST, coder_value_list ):
+
+                    setattr( test_instance, "coder" + str( coder_index ) + "_" + field_name, field_value )
+
+                #-- END loop over fields --#
+
+            #-- END loop over coders --#
+
+            test_instance.save()
+
+        #-- END loop over rows --#
+
+        # cache the (empty) matrix for the label.
+        matrix_dict = Reliability_Names_Results.get_results_matrix( self.TEST_LABEL )
+        self.assertIn( self.TEST_LABEL, Reliability_Names_Results.results_matrix_cache )
+
+        # analyze - reads Reliability_Names through this test's connection.
+        my_analyzer = ReliabilityNamesAnalyzer()
+        my_analyzer.alpha_backend = ReliabilityNamesAnalyzer.ALPHA_BACKEND_NUMPY
+        connection.ensure_connection()
+        with mock.patch.object( my_analyzer, "get_pandas_db_engine", return_value = connection.connection ):
+
+            my_analyzer.analyze_reliability_names( self.TEST_LABEL, indices_to_compare_IN = self.TEST_ANALYZER_CODER_COUNT, do_batch_IN = True )
+
+        #-- END with patched engine --#
+
+        # results written, cache entry for label dropped.
+        self.assertEqual( Reliability_Names_Results.objects.filter( label = self.TEST_LABEL ).count(), 1 )
+        self.assertNotIn( self.TEST_LABEL, Reliability_Names_Results.results_matrix_cache, msg = "In " + me + "(): analyzer did not clear cached matrix." )
+        matrix_dict = Reliability_Names_Results.get_results_matrix( self.TEST_LABEL )
+        self.assertEqual( Reliability_Names_Results.build_results_row_list( matrix_dict )[ 0 ][ "author_count" ], 4 )
+
+    #-- END test method test_analyzer_clears_cache() --#
+
+
+    def test_results_views( self ):
+
+        # declare variables
+        me = "test_results_views"
+        test_user = None
+        query_dict = None
+        response = None
+        csv_row_list = None
+        header_row = None
+        response_data = None
+
+        self.make_results( 2, 12, decimal.Decimal( "0.1234567891" ) )
+        self.make_results( 3, 7, None )
+
+        # log in.
+        test_user = User.objects.create_user( username = "results_viewer", password = "results_viewer" )
+        self.client.force_login( test_user )
+        query_dict = { "reliability_names_results_label" : self.TEST_LABEL }
+
+        # CSV - header, then one row per pair, values as loaded.
+        response = self.client.get( reverse( "context_analysis-reliability-names-results-csv" ), query_dict )
+        self.assertEqual( response.status_code, 200 )
+        self.assertEqual( response[ "Content-Type" ], "text/csv" )
+        csv_row_list = list( csv.reader( response.content.decode( "utf-8" ).splitlines() ) )
+        header_row = csv_row_list[ 0 ]
+        self.assertEqual( header_row, Reliability_Names_Results.ROW_INFO_COLUMN_NAME_LIST + Reliability_Names_Results.METRIC_COLUMN_NAME_LIST )
+        self.assertEqual( len( csv_row_list ), 3 )
+        self.assertEqual( csv_row_list[ 1 ][ header_row.index( "author_count" ) ], "12", msg = "In " + me + "(): count written as float." )
+        self.assertEqual( csv_row_list[ 1 ][ header_row.index( "author_detect_alpha" ) ], "0.1234567891" )
+        self.assertEqual( csv_row_list[ 2 ][ header_row.index( "author_detect_alpha" ) ], "" )
+
+        # JSON - one dictionary per pair, plus averages.
+        response = self.client.get( reverse( "context_analysis-reliability-names-results-json" ), query_dict )
+        self.assertEqual( response.status_code, 200 )
+        response_data = json.loads( response.content.decode( "utf-8" ) )
+        self.assertEqual( response_data[ "label" ], self.TEST_LABEL )
+        self.assertEqual( len( response_data[ "results_list" ] ), 2 )
+        self.assertEqual( response_data[ "results_list" ][ 0 ][ "author_count" ], 12 )
+        self.assertEqual( decimal.Decimal( response_data[ "results_list" ][ 0 ][ "author_detect_alpha" ] ), decimal.Decimal( "0.1234567891" ) )
+        self.assertIsNone( response_data[ "results_list" ][ 1 ][ "author_detect_alpha" ] )
+        self.assertEqual( decimal.Decimal( response_data[ "average_dictionary" ][ "author_count" ] ), decimal.Decimal( "9.5" ) )
+
+        # not logged in - redirected.
+        self.client.logout()
+        response = self.client.get( reverse( "context_analysis-reliability-names-results-json" ), query_dict )
+        self.assertEqual( response.status_code, 302 )
+
+    #-- END test method test_results_views() --#
+
+
+#-- END test class Reliability_Names_ResultsDBTest --#
@@ -45,6 +45,13 @@ urlpatterns = [
     # view disagreements
     re_path( r'^reliability/names/disagreement/view$', context_analysis.views.reliability_names_disagreement_view, name = "context_analysis-reliability-names-disagreement-view" ),
 
+    # export disagreements as CSV
+    re_path( r'^reliability/names/disagreement/export$', context_analysis.views.reliability_names_disagreement_export, name = "context_analysis-reliability-names-disagreement-export" ),
+
     # view reliability results
     re_path( r'^reliability/names/results/view$', context_analysis.views.reliability_names_results_view, name = "context_analysis-reliability-names-results-view" ),
+
+    # download reliability results
+    re_path( r'^reliability/names/results/csv$', context_analysis.views.reliability_names_results_csv, name = "context_analysis-reliability-names-results-csv" ),
+    re_path( r'^reliability/names/results/json$', context_analysis.views.reliability_names_results_json, name = "context_analysis-reliability-names-results-json" ),
 ]
@@ -18,9 +18,9 @@ You should have received a copy of the GNU Lesser General Public License along w
 #===============================================================================
 
 # import Python libraries for CSV output
-#import csv
+import csv
 #import datetime
-#import json
+import json
 #from StringIO import StringIO
 #import pickle
 #import sys
@@ -42,11 +42,14 @@ from django.urls import reverse
 
 # Django query object for OR-ing selection criteria together.
 from django.db.models import Q
+from django.db.models.query import QuerySet
 
 # Import objects from the django.http library.
 #from django.http import Http404
 from django.http import HttpResponse
 from django.http import HttpResponseRedirect
+from django.http import JsonResponse
+from django.http import StreamingHttpResponse
 
 # django.shortcuts imports - remder() method
 #from django.shortcuts import get_object_or_404
@@ -59,6 +62,10 @@ from django.shortcuts import render
 # import django code for csrf security stuff.
 from django.template.context_processors import csrf
 
+# django utils
+from django.utils.http import urlencode
+from django.utils.text import slugify
+
 # python_utilities
 from python_utilities.dictionaries.dict_helper import DictHelper
 from python_utilities.django_utils.django_view_helper import DjangoViewHelper
@@ -126,6 +133,49 @@ def output_debug( message_IN, method_IN = "", indent_with_IN = "", logger_name_I
 #-- END method output_debug() --#
 
 
+# ! reliability names disagreement constants-ish.
+
+# per-coder disagreement details - field name suffixes, and the property name
+#     each is stored under, in the same order.
+DISAGREEMENT_DETAIL_SUFFIX_LIST = [
+    Reliability_Names.FIELD_NAME_SUFFIX_CODER,
+    Reliability_Names.FIELD_NAME_SUFFIX_DETECTED,
+    Reliability_Names.FIELD_NAME_SUFFIX_PERSON_ID,
+    Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE,
+    Reliability_Names.FIELD_NAME_SUFFIX_FIRST_QUOTE_GRAF,
+    Reliability_Names.FIELD_NAME_SUFFIX_FIRST_QUOTE_INDEX,
+    Reliability_Names.FIELD_NAME_SUFFIX_ORGANIZATION_HASH
+]
+DISAGREEMENT_DETAIL_PROP_NAME_LIST = [
+    Reliability_Names.PROP_NAME_CODER_ID,
+    Reliability_Names.PROP_NAME_CODER_DETECTED,
+    Reliability_Names.PROP_NAME_CODER_PERSON_ID,
+    Reliability_Names.PROP_NAME_CODER_PERSON_TYPE,
+    Reliability_Names.PROP_NAME_CODER_FIRST_QUOTE_GRAF,
+    Reliability_Names.PROP_NAME_CODER_FIRST_QUOTE_INDEX,
+    Reliability_Names.PROP_NAME_CODER_ORGANIZATION_HASH
+]
+
+# disagreement export file name.
+EXPORT_FILE_NAME_PREFIX = "reliability_names_disagreement-"
+
+
+class Echo( object ):
+
+    '''
+    Pseudo-buffer for csv.writer - write() returns the value instead of
+        storing it, so StreamingHttpResponse can send each row as it is made.
+    '''
+
+    def write( self, value_IN ):
+
+        return value_IN
+
+    #-- END method write() --#
+
+#-- END class Echo --#
+
+
 # ! reliability names results constants-ish.
 PREFIX_AUTHOR = "author_"
 PREFIX_SUBJECT = "subject_"
@@ -337,30 +387,28 @@ def reliability_names_disagreement_view( request_IN ):
     disagreement_flag_list = []
     disagreement_details_list = []
     disagreement_details_dict = {}
-    coder_index = -1
-    coder_string = ""
-    current_field_name = ""
+    coder_value_matrix = None
+    coder_value_list = None
+    
+    # declare variables - paging
+    page_size = -1
+    page_after_key_json = None
+    page_after_key = None
+    page_next_key = None
+    is_count_estimate = False
     reliability_names_eval_instance = None
+    reliability_names_eval_list = None
+    rendered_string_map = None
     
     # declare variables - delete
     delete_count = -1
-    delete_counter = -1
-    reliability_names_id = -1
-    reliability_names_instance = None
+    delete_status = None
     detail_string = ""
     detail_string_list = []
     
     # declare variables - merge
     from_id = -1
     into_id = -1
-    from_instance = None
-    into_instance = None
-    article_data_dict = None
-    from_article_data_list = None
-    into_article_data_list = None
-    coder_number = -1
-    article_data_id = None
-    article_data_instance = None
     merge_status = None
     
     # declare variables - add and remove tags
@@ -550,7 +598,8 @@ def reliability_names_disagreement_view( request_IN ):
                             reliability_names_qs = Reliability_Names.lookup_disagreements(
                                 label_IN = reliability_names_label,
                                 coder_count_IN = reliability_names_coder_count,
-                                include_optional_IN = reliability_names_include_optional_fields
+                                include_optional_IN = reliability_names_include_optional_fields,
+                                use_stored_flags_IN = True
                             )
 
                             # ORDER - lookup_disagreements() uses raw SQL, so it
@@ -627,18 +676,42 @@ def reliability_names_disagreement_view( request_IN ):
                         reliability_names_counter = 0
                         if ( reliability_names_qs is not None ):
             
-                            # get count of reliability rows.
-                            #record_count = reliability_names_qs.count()
+                            # page size and key of last row of previous page.
+                            page_size = cleaned_inputs.get( "reliability_names_page_size", None )
+                            if ( page_size is None ):
+                            
+                                page_size = Reliability_Names.DEFAULT_PAGE_SIZE
+                                
+                            #-- END check to see if page size --#
+                            page_after_key_json = request_inputs.get( ReliabilityNamesFilterForm.INPUT_NAME_PAGE_AFTER_KEY, None )
+                            page_after_key = Reliability_Names.parse_keyset_key( page_after_key_json )
+                            
+                            # QuerySet (filter, or stored disagreement flags) or
+                            #     RawQuerySet (flags not computed yet)?
+                            if ( isinstance( reliability_names_qs, QuerySet ) == True ):
+                            
+                                # count estimate, then one page, keyset-style.
+                                record_count, is_count_estimate = Reliability_Names.estimate_count( reliability_names_qs )
+                                reliability_names_instance_list, page_next_key = Reliability_Names.get_keyset_page( reliability_names_qs, page_size_IN = page_size, after_key_IN = page_after_key )
+                                
+                            else:
                             
-                            # to start, just make a list and pass it to the template.
-                            reliability_names_instance_list = list( reliability_names_qs )
+                                # raw SQL - no paging, so make a list and pass
+                                #     it to the template.
+                                reliability_names_instance_list = list( reliability_names_qs )
+                                record_count = len( reliability_names_instance_list )
+                                is_count_estimate = False
+                                page_next_key = None
+                                action_detail_list.append( "Disagreement flags not computed for this label, so all rows are shown.  Run the backfill_reliability_names_disagreement management command to enable paging." )
+                                
+                            #-- END check to see if QuerySet --#
             
                             # build list of dictionaries with disagreement information.
                             reliability_names_output_list = []
                             
                             # how many isntances we got?
                             output_count = len( reliability_names_instance_list )
-                            reliability_names_filter_summary = "Found " + str( output_count ) + " records that match " + reliability_names_filter_summary
+                            reliability_names_filter_summary = "Found " + ( "about " if ( is_count_estimate == True ) else "" ) + str( record_count ) + " records that match " + reliability_names_filter_summary
                             if ( output_count > 0 ):
                             
                                 # at least one - loop.
@@ -662,7 +735,7 @@ def reliability_names_disagreement_view( request_IN ):
                                     reliability_names_output_info[ Reliability_Names.PROP_NAME_PERSON_TYPE ] = reliability_names.person_type
                                     
                                     # got disagreement?
-                                    has_disagreement = reliability_names.has_disagreement( reliability_names_coder_count, include_optional_IN = reliability_names_include_optional_fields )
+                                    has_disagreement = reliability_names.has_disagreement( reliability_names_coder_count, include_optional_IN = reliability_names_include_optional_fields, use_stored_flags_IN = True )
                                     #disagreement_flag_list.append( has_disagreement )
                                     if ( has_disagreement == True ):
             
@@ -670,42 +743,12 @@ def reliability_names_disagreement_view( request_IN ):
                                         disagreement_details_list = []
                                     
                                         # create a record per coder we included when looking for
-                                        #     disagreements.
-                                        for coder_index in range( 1, int( reliability_names_coder_count ) + 1 ):
+                                        #     disagreements - all values read in one pass.
+                                        coder_value_matrix = reliability_names.get_coder_value_matrix( DISAGREEMENT_DETAIL_SUFFIX_LIST, coder_count_IN = int( reliability_names_coder_count ) )
+                                        for coder_value_list in coder_value_matrix:
                                         
                                             # create dictionary to hold details for this coder
-                                            disagreement_details_dict = {}
-                                            
-                                            # build column names based on index.
-                                            coder_string = "coder" + str( coder_index )
-                
-                                            # retrieve data - coder ID
-                                            current_field_name = coder_string + "_id"  # grabbing foreign key value directly.
-                                            disagreement_details_dict[ Reliability_Names.PROP_NAME_CODER_ID ] = getattr( reliability_names, current_field_name )
-                                        
-                                            # retrieve data - coder ID
-                                            current_field_name = coder_string + "_" + Reliability_Names.FIELD_NAME_SUFFIX_DETECTED  # + "_detected"
-                                            disagreement_details_dict[ Reliability_Names.PROP_NAME_CODER_DETECTED ] = getattr( reliability_names, current_field_name )
-                
-                                            # retrieve data - coder's selected person ID
-                                            current_field_name = coder_string + "_" + Reliability_Names.FIELD_NAME_SUFFIX_PERSON_ID  # + "_person_id"
-                                            disagreement_details_dict[ Reliability_Names.PROP_NAME_CODER_PERSON_ID ] = getattr( reliability_names, current_field_name )
-                
-                                            # retrieve data - coder's selected person type
-                                            current_field_name = coder_string + "_" + Reliability_Names.FIELD_NAME_SUFFIX_PERSON_TYPE  # + "_person_type"
-                                            disagreement_details_dict[ Reliability_Names.PROP_NAME_CODER_PERSON_TYPE ] = getattr( reliability_names, current_field_name )
-                
-                                            # retrieve data - coder's first quote paragraph number
-                                            current_field_name = coder_string + "_" + Reliability_Names.FIELD_NAME_SUFFIX_FIRST_QUOTE_GRAF  # + "_first_quote_graf"
-                                            disagreement_details_dict[ Reliability_Names.PROP_NAME_CODER_FIRST_QUOTE_GRAF ] = getattr( reliability_names, current_field_name )
-                
-                                            # retrieve data - coder's first quote index number
-                                            current_field_name = coder_string + "_" + Reliability_Names.FIELD_NAME_SUFFIX_FIRST_QUOTE_INDEX  # + "_first_quote_index"
-                                            disagreement_details_dict[ Reliability_Names.PROP_NAME_CODER_FIRST_QUOTE_INDEX ] = getattr( reliability_names, current_field_name )
-                
-                                            # retrieve data - organization string hash
-                                            current_field_name = coder_string + "_" + Reliability_Names.FIELD_NAME_SUFFIX_ORGANIZATION_HASH  # + "_organization_hash"
-                                            disagreement_details_dict[ Reliability_Names.PROP_NAME_CODER_ORGANIZATION_HASH ] = getattr( reliability_names, current_field_name )
+                                            disagreement_details_dict = dict( zip( DISAGREEMENT_DETAIL_PROP_NAME_LIST, coder_value_list ) )
                 
                                             # add to list.
                                             disagreement_details_list.append( disagreement_details_dict )
@@ -729,6 +772,22 @@ def reliability_names_disagreement_view( request_IN ):
                                 
                             #-- END check to see if anything in 
             
+                            # next page?
+                            if ( page_next_key is not None ):
+                            
+                                response_dictionary[ 'reliability_names_page_next_key' ] = json.dumps( page_next_key )
+                                
+                            #-- END check to see if next page --#
+                            response_dictionary[ 'input_name_page_after_key' ] = ReliabilityNamesFilterForm.INPUT_NAME_PAGE_AFTER_KEY
+                            response_dictionary[ 'reliability_names_filter_summary' ] = reliability_names_filter_summary
+                            
+                            # full disagreement list export.
+                            if ( reliability_names_filter_type == ReliabilityNamesFilterForm.RELIABILITY_NAMES_FILTER_TYPE_ONLY_DISAGREE ):
+                            
+                                response_dictionary[ 'reliability_names_export_url' ] = reverse( "context_analysis-reliability-names-disagreement-export" ) + "?" + urlencode( { "reliability_names_label" : reliability_names_label, "reliability_names_coder_count" : reliability_names_coder_count, "reliability_names_filter_type" : ReliabilityNamesFilterForm.RELIABILITY_NAMES_FILTER_TYPE_ONLY_DISAGREE, "reliability_names_include_optional_fields" : "on" if ( reliability_names_include_optional_fields == True ) else "" } )
+                                
+                            #-- END check to see if disagreement lookup --#
+            
                             # seed response dictionary.
                             response_dictionary[ 'reliability_names_label' ] = reliability_names_label
                             response_dictionary[ 'reliability_names_instance_list' ] = reliability_names_instance_list
@@ -763,42 +822,14 @@ def reliability_names_disagreement_view( request_IN ):
                     delete_count = len( select_id_list )
                     if ( delete_count > 0 ):
                         
-                        # loop over IDs, looking up record for each, then
-                        #     deleting it.
-                        delete_counter = 0
-                        for reliability_names_id in select_id_list:
-                        
-                            delete_counter += 1
-                            
-                            # lookup record for ID.
-                            reliability_names_instance = Reliability_Names.objects.get( pk = reliability_names_id )
-                            
-                            # make database record...
-                            reliability_names_eval_instance = Reliability_Names_Eval.create_from_reliability_names(
-                                    reliability_names_id,
-                                    label_IN = reliability_names_label,
-                                    notes_IN = "Deleting Reliability_Names row with ID " + str( reliability_names_id ),
-                                    reliability_names_instance_IN = reliability_names_instance,
-                                    event_type_IN = Reliability_Names_Eval.EVENT_TYPE_DELETE
-                                )
-                            
-                            # ...then use it to build detail string:
-                            #detail_string = build_reliability_name_detail_string( reliability_names_id )
-                            detail_string = reliability_names_eval_instance.build_detail_string()
-                            detail_string_list.append( detail_string )
-                            
-                            # remove reference to Reliability_Names row
-                            reliability_names_eval_instance.reliability_names = None
-                            reliability_names_eval_instance.is_deleted = True
-                            reliability_names_eval_instance.save()
-                            
-                            # delete it
-                            reliability_names_instance.delete()
-                            
-                        #-- END loop over selected IDs. --#
+                        # delete all at once, in one transaction, with an
+                        #     audit row for each (detail strings come back as
+                        #     status messages).
+                        delete_status = Reliability_Names.bulk_delete_records( select_id_list, label_IN = reliability_names_label )
+                        detail_string_list = delete_status.get_message_list()
                         
                         # update the action details list.
-                        action_summary = "Deleted " + str( delete_counter ) + " Reliability_Names records with IDs: " + str( select_id_list )
+                        action_summary = "Deleted " + str( delete_count ) + " Reliability_Names records with IDs: " + str( select_id_list )
                         action_detail_list.append( action_summary )
                         action_detail_list.extend( detail_string_list )
                         
@@ -828,83 +859,17 @@ def reliability_names_disagreement_view( request_IN ):
                         from_id = select_id_list[ 0 ]
                         into_id = merge_into_id_list[ 0 ]
                         
-                        # ...corresponding instances...
-                        from_instance = Reliability_Names.objects.get( id = from_id )
-                        into_instance = Reliability_Names.objects.get( id = into_id )
-                        
-                        # ...and associated Article_Data instances.
-                        
-                        # ==> FROM...
-                        article_data_dict = from_instance.get_field_values(
-                                Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID,
-                                default_IN = None,
-                                omit_empty_IN = True,
-                                empty_values_IN = ( None, )
-                            )
-                            
-                        # Build list of Article_Data instances.
-                        from_article_data_list = []
-                        for coder_number, article_data_id in six.iteritems( article_data_dict ):
-                        
-                            # get instance
-                            article_data_instance = Article_Data.objects.get( id = article_data_id )
-                            
-                            # add to list.
-                            from_article_data_list.append( article_data_instance )
-                            
-                        #-- END loop over from Article_Data records.
-                        
-                        # ==> ...AND TO
-                        article_data_dict = into_instance.get_field_values(
-                                Reliability_Names.FIELD_NAME_SUFFIX_ARTICLE_DATA_ID,
-                                default_IN = None,
-                                omit_empty_IN = True,
-                                empty_values_IN = ( None, )
-                            )
-                            
-                        # Build list of Article_Data instances.
-                        into_article_data_list = []
-                        for coder_number, article_data_id in six.iteritems( article_data_dict ):
-                        
-                            # get instance
-                            article_data_instance = Article_Data.objects.get( id = article_data_id )
-                            
-                            # add to list.
-                            into_article_data_list.append( article_data_instance )
-                            
-                        #-- END loop over into Article_Data records.
-                                                
-                        # call the merge method.
-                        merge_status = Reliability_Names.merge_records( from_id, into_id, delete_from_record_IN = False )
-                        
-                        # update the action details list.
-                        action_summary = "Status = \"" + str( merge_status.get_status_code() ) + "\": merging person data from Reliability_Names record " + str( from_id ) + " into Reliability_Names record " + str( into_id )
-                        action_detail_list.append( action_summary )
+                        # call the bulk merge method - merges, then makes an
+                        #     evaluation row for the destination (into) with
+                        #     FROM and INTO Article_Data references, in one
+                        #     transaction.
+                        merge_status = Reliability_Names.bulk_merge_records( [ ( from_id, into_id ) ], delete_from_record_IN = False, label_IN = reliability_names_label )
                         
-                        # get message list from status container and append it to action summary.
+                        # get message list from status container (status,
+                        #     merge details, then summary string with link) and
+                        #     append it to action summary.
                         merge_status_message_list = merge_status.get_message_list()
                         action_detail_list.extend( merge_status_message_list )
-                        
-                        # Make an evaluation row for the destination (into).
-                        reliability_names_eval_instance = Reliability_Names_Eval.create_from_reliability_names(
-                                into_id,
-                                label_IN = reliability_names_label,
-                                notes_IN = "; ".join( action_detail_list ),
-                                event_type_IN = Reliability_Names_Eval.EVENT_TYPE_MERGE
-                            )
-                            
-                        # add Reliability_Names IDs
-                        reliability_names_eval_instance.merged_from_reliability_names_id = from_id
-                        reliability_names_eval_instance.merged_to_reliability_names_id = into_id
-                        reliability_names_eval_instance.save()
-                        
-                        # add Article_Data references
-                        reliability_names_eval_instance.merged_from_ad.set( from_article_data_list )
-                        reliability_names_eval_instance.merged_to_ad.set( into_article_data_list )
-                                                
-                        # Add summary string to the output (includes link).
-                        detail_string = reliability_names_eval_instance.build_summary_string()
-                        action_detail_list.append( detail_string )
 
                     else:
                     
@@ -926,31 +891,9 @@ def reliability_names_disagreement_view( request_IN ):
                         select_count = len( select_id_list )
                         if ( select_count > 0 ):
                             
-                            # loop over IDs, looking up record for each, then
-                            #     add tag(s).
-                            add_tag_counter = 0
-                            for reliability_names_id in select_id_list:
-                            
-                                add_tag_counter += 1
-                                
-                                # lookup record for ID.
-                                reliability_names_instance = Reliability_Names.objects.get( pk = reliability_names_id )
-                                
-                                # add all tags in list
-                                reliability_names_instance.tags.add( *reliability_names_action_tag_list )
-                                                                
-                                # build a detail string:
-                                reliability_names_eval_instance = Reliability_Names_Eval.create_from_reliability_names(
-                                        reliability_names_id,
-                                        label_IN = reliability_names_label,
-                                        notes_IN = "Added tag(s): " + ", ".join( reliability_names_action_tag_list ),
-                                        reliability_names_instance_IN = reliability_names_instance,
-                                        event_type_IN = Reliability_Names_Eval.EVENT_TYPE_ADD_TAGS
-                                    )
-                                #detail_string = reliability_names_eval_instance.build_summary_string()
-                                #detail_string_list.append( detail_string )
-
-                            #-- END loop over selected IDs. --#
+                            # add tag(s) to all, with an audit row for each.
+                            reliability_names_eval_list = Reliability_Names.bulk_update_tags( select_id_list, reliability_names_action_tag_list, label_IN = reliability_names_label )
+                            add_tag_counter = len( reliability_names_eval_list )
                             
                             # update the action details list.
                             action_summary = "Added tag(s): " + str( reliability_names_action_tag_list ) + " to " + str( add_tag_counter ) + " Reliability_Names records."
@@ -983,31 +926,18 @@ def reliability_names_disagreement_view( request_IN ):
                         select_count = len( select_id_list )
                         if ( select_count > 0 ):
                             
-                            # loop over IDs, looking up record for each, then
-                            #     remove tags.
-                            remove_tag_counter = 0
-                            for reliability_names_id in select_id_list:
+                            # remove tag(s) from all, with an audit row for
+                            #     each.
+                            reliability_names_eval_list = Reliability_Names.bulk_update_tags( select_id_list, reliability_names_action_tag_list, do_remove_IN = True, label_IN = reliability_names_label )
+                            remove_tag_counter = len( reliability_names_eval_list )
                             
-                                remove_tag_counter += 1
-                                
-                                # lookup record for ID.
-                                reliability_names_instance = Reliability_Names.objects.get( pk = reliability_names_id )
-                                
-                                # remove all tags in list
-                                reliability_names_instance.tags.remove( *reliability_names_action_tag_list )
-                                                                
-                                # build a detail string:
-                                reliability_names_eval_instance = Reliability_Names_Eval.create_from_reliability_names(
-                                        reliability_names_id,
-                                        label_IN = reliability_names_label,
-                                        notes_IN = "Removed tag(s): " + ", ".join( reliability_names_action_tag_list ),
-                                        reliability_names_instance_IN = reliability_names_instance,
-                                        event_type_IN = Reliability_Names_Eval.EVENT_TYPE_REMOVE_TAGS
-                                    )
-                                detail_string = reliability_names_eval_instance.build_summary_string()
-                                detail_string_list.append( detail_string )
-    
-                            #-- END loop over selected IDs. --#
+                            # build detail strings, all at once:
+                            rendered_string_map = Reliability_Names_Eval.build_strings_for_rn_id_list(
+                                    [ reliability_names_eval_instance.original_reliability_names_id for reliability_names_eval_instance in reliability_names_eval_list ],
+                                    render_type_IN = Reliability_Names_Eval.RENDER_TYPE_SUMMARY,
+                                    rne_instance_map_IN = dict( [ ( reliability_names_eval_instance.original_reliability_names_id, reliability_names_eval_instance ) for reliability_names_eval_instance in reliability_names_eval_list ] )
+                                )
+                            detail_string_list.extend( list( rendered_string_map.values() ) )
                             
                             # update the action details list.
                             action_summary = "Removed tag(s): " + str( reliability_names_action_tag_list ) + " from " + str( remove_tag_counter ) + " Reliability_Names records."
@@ -1068,6 +998,80 @@ def reliability_names_disagreement_view( request_IN ):
 #-- END view method reliability_names_disagreement_view() --#
 
 
+@login_required
+def reliability_names_disagreement_export( request_IN ):
+
+    '''
+    Streams all the Reliability_Names rows with disagreements for the label,
+        coder count, and include optional flag in the GET parameters as a CSV
+        file, a chunk of rows at a time (see
+        Reliability_Names.generate_export_rows()).  GET parameters are
+        validated with ReliabilityNamesFilterForm, same as
+        reliability_names_disagreement_view() - if they are not valid (no
+        label, bad coder count), returns a 400 response with the form errors.
+    '''
+
+    # return reference
+    response_OUT = None
+
+    # declare variables
+    me = "reliability_names_disagreement_export"
+    request_inputs = None
+    reliability_names_filter_form = None
+    cleaned_inputs = {}
+    reliability_names_label = ""
+    reliability_names_coder_count = -1
+    reliability_names_include_optional_fields = False
+    reliability_names_qs = None
+    pseudo_buffer = None
+    csv_writer = None
+    row_generator = None
+
+    # validate inputs with the disagreement view's filter form.
+    request_inputs = request_IN.GET
+    reliability_names_filter_form = ReliabilityNamesFilterForm( request_inputs )
+    if ( reliability_names_filter_form.is_valid() == True ):
+
+        # inputs
+        cleaned_inputs = reliability_names_filter_form.cleaned_data
+        reliability_names_label = cleaned_inputs.get( "reliability_names_label", "" )
+        reliability_names_coder_count = cleaned_inputs.get( "reliability_names_coder_count", Reliability_Names.MAX_INDEX )
+        reliability_names_include_optional_fields = cleaned_inputs.get( "reliability_names_include_optional_fields", False )
+
+        # rows with disagreements.
+        reliability_names_qs = Reliability_Names.lookup_disagreements(
+            label_IN = reliability_names_label,
+            coder_count_IN = reliability_names_coder_count,
+            include_optional_IN = reliability_names_include_optional_fields,
+            use_stored_flags_IN = True
+        )
+
+        # QuerySet needs an order (raw SQL is ordered inside the method).
+        if ( isinstance( reliability_names_qs, QuerySet ) == True ):
+
+            reliability_names_qs = reliability_names_qs.order_by( *Reliability_Names.KEYSET_COLUMN_LIST )
+
+        #-- END check to see if QuerySet --#
+
+        # stream the rows.
+        pseudo_buffer = Echo()
+        csv_writer = csv.writer( pseudo_buffer )
+        row_generator = Reliability_Names.generate_export_rows( reliability_names_qs, coder_count_IN = reliability_names_coder_count )
+        response_OUT = StreamingHttpResponse( ( csv_writer.writerow( row_list ) for row_list in row_generator ), content_type = "text/csv" )
+        response_OUT[ "Content-Disposition" ] = 'attachment; filename="' + EXPORT_FILE_NAME_PREFIX + slugify( reliability_names_label ) + '.csv"'
+
+    else:
+
+        # not valid - no export, just the errors.
+        response_OUT = HttpResponse( reliability_names_filter_form.errors.as_text(), content_type = "text/plain", status = 400 )
+
+    #-- END check to see if filter form is valid --#
+
+    return response_OUT
+
+#-- END view method reliability_names_disagreement_export() --#
+
+
 @login_required
 def reliability_names_results_view( request_IN ):
 
@@ -1081,22 +1085,13 @@ def reliability_names_results_view( request_IN ):
     request_inputs = None
     reliability_names_results_form = None
     reliability_names_results_label = ""
-    reliability_names_results_qs = None
     results_count = -1
-    reliability_names_results_instance_list = None
     
     # declare variables - pulling together reliability info for output.
-    current_result = None
+    results_matrix_dict = None
     sum_dictionary = {}
-    sum_dict_helper = None
     average_dictionary = {}
-    #average_dict_helper = None
-    column_name_list = None
-    current_column_name = ""
-    result_counter = -1
-    current_result_value = None
-    current_sum = -1
-    current_average = -1
+    download_query_string = ""
     
     # initialize response dictionary
     response_dictionary = {}
@@ -1128,167 +1123,51 @@ def reliability_names_results_view( request_IN ):
 
         if ( reliability_names_results_form.is_valid() == True ):
 
-            # OK.  Filter on label.
-            reliability_names_results_qs = Reliability_Names_Results.objects.filter( label = reliability_names_results_label )
-            # response_dictionary[ 'output_string' ] = "ALL ( " + str( reliability_names_only_disagree ) + " )"
+            # OK.  Get results matrix for label (cached, one aggregate query
+            #     to check it is current).
+            results_matrix_dict = Reliability_Names_Results.get_results_matrix( reliability_names_results_label )
+            results_count = len( results_matrix_dict[ Reliability_Names_Results.RESULTS_MATRIX_KEY_ROW_INFO_LIST ] )
 
-            # order by:
-            reliability_names_results_qs = reliability_names_results_qs.order_by( "coder1_coder_index", "coder2_coder_index", "id" )
+            # got at least 1?
+            if ( results_count > 0 ):
             
-            # get count of queryset return items
-            if ( reliability_names_results_qs is not None ):
-
-                # get count of reliability rows.
-                results_count = reliability_names_results_qs.count()
-
-                # got at least 1?
-                if ( results_count > 0 ):
+                # yes - add rows to response dictionary so we can use them
+                #     when outputting.
+                response_dictionary[ 'results_row_list' ] = Reliability_Names_Results.build_results_row_list( results_matrix_dict )
+                  
+                # ! use matrix to calculate some averages, for both author and subject:
+                # - detect %
+                # - detect A
+                # - detect pi
+                # - lookup %
+                # - lookup A
+                # - lookup NZ %
+                # - lookup NZ A
+                # - lookup N
+                # - type %
+                # - type A
+                sum_dictionary, average_dictionary = Reliability_Names_Results.calculate_results_sums_and_averages( results_matrix_dict )
                 
-                    # yes - add query set to response dictionary so we can use
-                    #     it when outputting.
-                    response_dictionary[ 'reliability_names_results_qs' ] = reliability_names_results_qs
-                      
-                    # ! use QuerySet to calculate some averages, for both author and subject:
-                    # - detect %
-                    # - detect A
-                    # - detect pi
-                    # - lookup %
-                    # - lookup A
-                    # - lookup NZ %
-                    # - lookup NZ A
-                    # - lookup N
-                    # - type %
-                    # - type A
-                    
-                    # initialize dictionary to store sums.
-                    sum_dictionary = {}
-                    sum_dict_helper = DictHelper()
-                    sum_dict_helper.set_dictionary( sum_dictionary )
-                    
-                    # ! make list of column names.
-                    column_name_list = []
-    
-                    # authors
-                    column_name_list.append( "author_count" )
-                    column_name_list.append( "author_detect_percent" )
-                    column_name_list.append( "author_detect_alpha" )
-                    column_name_list.append( "author_detect_pi" )
-                    column_name_list.append( "author_lookup_percent" )
-                    column_name_list.append( "author_lookup_alpha" )
-                    column_name_list.append( "author_lookup_non_zero_percent" )
-                    column_name_list.append( "author_lookup_non_zero_alpha" )
-                    column_name_list.append( "author_lookup_non_zero_count" )
-                    column_name_list.append( "author_type_percent" )
-                    column_name_list.append( "author_type_alpha" )
-                    column_name_list.append( "author_type_pi" )
-                    column_name_list.append( "author_type_non_zero_percent" )
-                    column_name_list.append( "author_type_non_zero_alpha" )
-                    column_name_list.append( "author_type_non_zero_pi" )
-                    column_name_list.append( "author_type_non_zero_count" )
-                    
-                    # subjects
-                    column_name_list.append( "subject_count" )
-                    column_name_list.append( "subject_detect_percent" )
-                    column_name_list.append( "subject_detect_alpha" )
-                    column_name_list.append( "subject_detect_pi" )
-                    column_name_list.append( "subject_lookup_percent" )
-                    column_name_list.append( "subject_lookup_alpha" )
-                    column_name_list.append( "subject_lookup_non_zero_percent" )
-                    column_name_list.append( "subject_lookup_non_zero_alpha" )
-                    column_name_list.append( "subject_lookup_non_zero_count" )
-                    column_name_list.append( "subject_type_percent" )
-                    column_name_list.append( "subject_type_alpha" )
-                    column_name_list.append( "subject_type_pi" )
-                    column_name_list.append( "subject_type_non_zero_percent" )
-                    column_name_list.append( "subject_type_non_zero_alpha" )
-                    column_name_list.append( "subject_type_non_zero_pi" )
-                    column_name_list.append( "subject_type_non_zero_count" )
-                    column_name_list.append( "subject_first_quote_graf_percent" )
-                    column_name_list.append( "subject_first_quote_graf_alpha" )
-                    column_name_list.append( "subject_first_quote_graf_pi" )
-                    column_name_list.append( "subject_first_quote_graf_count" )
-                    column_name_list.append( "subject_first_quote_index_percent" )
-                    column_name_list.append( "subject_first_quote_index_alpha" )
-                    column_name_list.append( "subject_first_quote_index_pi" )
-                    column_name_list.append( "subject_first_quote_index_count" )
-                    column_name_list.append( "subject_organization_hash_percent" )
-                    column_name_list.append( "subject_organization_hash_alpha" )
-                    column_name_list.append( "subject_organization_hash_pi" )
-                    column_name_list.append( "subject_organization_hash_count" )
-                    
-                    # ! initialize all to 0
-                    for current_column_name in column_name_list:
-                    
-                        # set value for column name to 0.
-                        sum_dict_helper.set_value( current_column_name, 0 )
-                        
-                    #-- END loop over column names to set to 0. --#
-    
-                    # loop over results to first get sums for each field.
-                    result_counter = 0
-                    for current_result in reliability_names_results_qs:
-                        
-                        # increment counter
-                        result_counter += 1
-                        
-                        # update all counters
-                        for current_column_name in column_name_list:
-                        
-                            # retrieve value from current_result.
-                            current_result_value = getattr( current_result, current_column_name )
-                            
-                            # if not None, add it to the column's sum in the
-                            #     average dictionary.
-                            if ( current_result_value is not None ):
-
-                                # non-None - add it.
-                                sum_dict_helper.increment_decimal_value( current_column_name, current_result_value )
-                                
-                            #-- END check to see if value is non-None --#
-                        
-                        #-- END loop over column names --#
-    
-                    #-- END loop over results. --#
-                    
-                    # finally, loop over sums to calculate and store the
-                    #     averages.
-                    average_dictionary = {}
-                    for current_column_name in column_name_list:
-    
-                        # get sum
-                        current_sum = sum_dict_helper.get_value_as_decimal( current_column_name, None )
-                        
-                        # divide by record count.
-                        current_average = current_sum / result_counter
-                        
-                        # place the average in average_dictionary.
-                        average_dictionary[ current_column_name ] = current_average
-    
-                    #-- END loop over column names to calculate average. --#
-                    
-                    # place sum and average dictionaries in response.
-                    response_dictionary[ "sum_dictionary" ] = sum_dictionary
-                    response_dictionary[ "average_dictionary" ] = average_dictionary
-    
-                else:
-                    
-                    # no matches for label.
-                    response_dictionary[ 'output_string' ] = "ERROR - no QuerySet returned from call to filter() for label " + str( reliability_names_results_label )
-
-                #-- END check to see if any matching results --#
+                # place sum and average dictionaries in response.
+                response_dictionary[ "sum_dictionary" ] = sum_dictionary
+                response_dictionary[ "average_dictionary" ] = average_dictionary
                 
-                # seed response dictionary.
-                response_dictionary[ 'results_count' ] = results_count
-                response_dictionary[ 'reliability_names_results_label' ] = reliability_names_results_label
-                response_dictionary[ 'rnr_class' ] = Reliability_Names_Results
-                #response_dictionary[ 'output_string' ] = str( disagreement_flag_list )
+                # downloads
+                download_query_string = urlencode( { "reliability_names_results_label" : reliability_names_results_label } )
+                response_dictionary[ "results_csv_url" ] = reverse( "context_analysis-reliability-names-results-csv" ) + "?" + download_query_string
+                response_dictionary[ "results_json_url" ] = reverse( "context_analysis-reliability-names-results-json" ) + "?" + download_query_string
 
             else:
+                
+                # no matches for label.
+                response_dictionary[ 'output_string' ] = "ERROR - no Reliability_Names_Results found for label " + str( reliability_names_results_label )
+
+            #-- END check to see if any matching results --#
             
-                # ERROR - nothing returned from attempt to get queryset (would expect empty query set)
-                response_dictionary[ 'output_string' ] = "ERROR - no QuerySet returned from call to filter().  This is odd."
-            
-            #-- END check to see if query set is None --#
+            # seed response dictionary.
+            response_dictionary[ 'results_count' ] = results_count
+            response_dictionary[ 'reliability_names_results_label' ] = reliability_names_results_label
+            response_dictionary[ 'rnr_class' ] = Reliability_Names_Results
 
         else:
 
@@ -1314,3 +1193,84 @@ def reliability_names_results_view( request_IN ):
     return response_OUT
 
 #-- END view method reliability_names_results_view() --#
+
+
+@login_required
+def reliability_names_results_csv( request_IN ):
+
+    '''
+    Returns the Reliability_Names_Results for the label in GET parameter
+        "reliability_names_results_label" as a CSV file, one row per coder
+        pair, from the cached results matrix (see
+        Reliability_Names_Results.get_results_matrix()).
+    '''
+
+    # return reference
+    response_OUT = None
+
+    # declare variables
+    me = "reliability_names_results_csv"
+    reliability_names_results_label = ""
+    results_matrix_dict = None
+    csv_writer = None
+    row_info = None
+    value_row = None
+
+    # get matrix for label.
+    reliability_names_results_label = request_IN.GET.get( "reliability_names_results_label", "" )
+    results_matrix_dict = Reliability_Names_Results.get_results_matrix( reliability_names_results_label )
+
+    # write rows, values as loaded (NULL as empty cell).
+    response_OUT = HttpResponse( content_type = "text/csv" )
+    response_OUT[ "Content-Disposition" ] = 'attachment; filename="reliability_names_results-' + slugify( reliability_names_results_label ) + '.csv"'
+    csv_writer = csv.writer( response_OUT )
+    csv_writer.writerow( Reliability_Names_Results.ROW_INFO_COLUMN_NAME_LIST + Reliability_Names_Results.METRIC_COLUMN_NAME_LIST )
+    for row_info, value_row in zip( results_matrix_dict[ Reliability_Names_Results.RESULTS_MATRIX_KEY_ROW_INFO_LIST ], results_matrix_dict[ Reliability_Names_Results.RESULTS_MATRIX_KEY_VALUE_ROW_LIST ] ):
+
+        csv_writer.writerow( list( row_info ) + list( value_row ) )
+
+    #-- END loop over rows --#
+
+    return response_OUT
+
+#-- END view method reliability_names_results_csv() --#
+
+
+@login_required
+def reliability_names_results_json( request_IN ):
+
+    '''
+    Returns the Reliability_Names_Results for the label in GET parameter
+        "reliability_names_results_label" as JSON - label, column lists, one
+        dictionary per coder pair, and averages - from the cached results
+        matrix (see Reliability_Names_Results.get_results_matrix()).
+    '''
+
+    # return reference
+    response_OUT = None
+
+    # declare variables
+    me = "reliability_names_results_json"
+    reliability_names_results_label = ""
+    results_matrix_dict = None
+    sum_dictionary = None
+    average_dictionary = None
+    response_data = None
+
+    # get matrix for label.
+    reliability_names_results_label = request_IN.GET.get( "reliability_names_results_label", "" )
+    results_matrix_dict = Reliability_Names_Results.get_results_matrix( reliability_names_results_label )
+    sum_dictionary, average_dictionary = Reliability_Names_Results.calculate_results_sums_and_averages( results_matrix_dict )
+
+    # build response
+    response_data = {}
+    response_data[ "label" ] = reliability_names_results_label
+    response_data[ "row_info_column_list" ] = Reliability_Names_Results.ROW_INFO_COLUMN_NAME_LIST
+    response_data[ "metric_column_list" ] = Reliability_Names_Results.METRIC_COLUMN_NAME_LIST
+    response_data[ "results_list" ] = Reliability_Names_Results.build_results_row_list( results_matrix_dict )
+    response_data[ "average_dictionary" ] = average_dictionary
+    response_OUT = JsonResponse( response_data )
+
+    return response_OUT
+
+#-- END view method reliability_names_results_json() --#